@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# Copyright 2025 LibreLane Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""
+Regenerates ``librelane/manifest.py``, which maps the IDs of built-in steps,
+the names of built-in flows and the IDs of design formats registered outside of
+``librelane.state`` to the modules that register them, allowing them to be
+imported on demand.
+"""
+import os
+import sys
+import json
+import importlib
+
+import click
+
+__file_dir__ = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(__file_dir__))
+sys.path.insert(0, REPO_ROOT)
+
+STEP_MODULES = [
+    "librelane.steps.checker",
+    "librelane.steps.pyosys",
+    "librelane.steps.yosys",
+    "librelane.steps.openroad",
+    "librelane.steps.odb",
+    "librelane.steps.magic",
+    "librelane.steps.netgen",
+    "librelane.steps.klayout",
+    "librelane.steps.misc",
+    "librelane.steps.verilator",
+]
+FLOW_MODULES = ["librelane.flows.builtins"]
+
+
+def generate() -> dict:
+    from librelane.flows import Flow
+    from librelane.steps import Step
+    from librelane.state import DesignFormat
+
+    # Read the registries directly: listing would load plugins and the
+    # (possibly outdated) manifest itself
+    step_registry = Step.factory._StepFactory__registry  # type: ignore
+    flow_registry = Flow.factory._FlowFactory__registry  # type: ignore
+    format_registry = DesignFormat.factory._registry
+
+    # Design formats don't know the module they were registered in, so they
+    # are attributed to the first module whose import registers them
+    design_formats = {}
+    for module in STEP_MODULES + FLOW_MODULES:
+        registered_before = set(format_registry)
+        importlib.import_module(module)
+        for name in format_registry:
+            if name not in registered_before:
+                design_formats[name] = module
+
+    return {
+        "steps": {
+            cls.id: cls.__module__
+            for cls in step_registry.values()
+            if cls.__module__.startswith("librelane.")
+        },
+        "flows": {
+            name: cls.__module__
+            for name, cls in flow_registry.items()
+            if cls.__module__.startswith("librelane.")
+        },
+        "design_formats": design_formats,
+    }
+
+
+HEADER = """\
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file is generated by .github/scripts/update_manifest.py. Do not edit.
+"""
+
+
+def serialize(manifest: dict) -> str:
+    result = HEADER
+    for kind, entries in manifest.items():
+        result += f"\n{kind} = {{\n"
+        for name, module in entries.items():
+            result += f"    {json.dumps(name)}: {json.dumps(module)},\n"
+        result += "}\n"
+    return result
+
+
+@click.command()
+@click.option(
+    "--check",
+    is_flag=True,
+    default=False,
+    help="Exit with a non-zero code if the manifest is outdated instead of writing it.",
+)
+def update_manifest(check: bool):
+    """
+    Regenerates the registry manifest of built-in steps and flows.
+    """
+    manifest_path = os.path.join(REPO_ROOT, "librelane", "manifest.py")
+    serialized = serialize(generate())
+    if check:
+        with open(manifest_path, encoding="utf8") as f:
+            if f.read() != serialized:
+                print(
+                    f"{manifest_path} is outdated. Run '{sys.argv[0]}' to update it.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+        return
+    with open(manifest_path, "w", encoding="utf8") as f:
+        f.write(serialized)
+
+
+if __name__ == "__main__":
+    update_manifest()
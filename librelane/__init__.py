@@ -33,6 +33,14 @@ using their module name as follows:
         A dictionary of detected LibreLane plugins, with the module name as a key and
         the module version as a version.
 """
-from .plugins import discovered_plugins
 from .__version__ import __version__
 from .env_info import env_info_cli
+
+
+def __getattr__(name: str):
+    # Plugins are discovered and imported on first access
+    if name == "discovered_plugins":
+        from .plugins import load_plugins
+
+        return load_plugins()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
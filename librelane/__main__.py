@@ -47,7 +47,7 @@ from .logging import (
 )
 from . import common
 from .container import run_in_container
-from .plugins import discovered_plugins
+from .plugins import load_plugins
 from .common.cli import formatter_settings
 from .config import Config, InvalidConfig, PassedDirectoryError
 from .flows import Flow, SequentialFlow, FlowException, FlowError, cloup_flow_opts
@@ -66,6 +66,7 @@ def run(
     frm: Optional[str],
     to: Optional[str],
     skip: Tuple[str, ...],
+    auto_resume: bool,
     overwrite: bool,
     reproducible: Optional[str],
     with_initial_state: Optional[State],
@@ -180,6 +181,7 @@ def run(
             reproducible=reproducible,
             _force_run_dir=_force_run_dir,
             overwrite=overwrite,
+            auto_resume=auto_resume,
         )
     except FlowException as e:
         err(f"The flow has encountered an unexpected error:\n{e}")
@@ -218,6 +220,7 @@ def print_version(ctx: click.Context, param: click.Parameter, value: bool):
 
     print(message)
 
+    discovered_plugins = load_plugins()
     if len(discovered_plugins) > 0:
         print("Discovered plugins:")
         for name, module in discovered_plugins.items():
@@ -273,6 +276,7 @@ def run_included_example(
             to=None,
             reproducible=None,
             skip=(),
+            auto_resume=False,
             with_initial_state=None,
             config_override_strings=[],
             _force_run_dir=None,
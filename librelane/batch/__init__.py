@@ -0,0 +1,27 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The Batch Module
+----------------
+
+Runs the flows of many designs concurrently in one invocation, e.g. for
+regression testing, with the PDK and all steps and flows loaded once and
+a shared budget of cores and memory.
+
+Each design gets a run directory and a log file under the output directory,
+its final metrics are written as ``{pdk}-{scl}-{name}.metrics.json`` (the
+format used by ``python3 -m librelane.common.metrics compare-multiple``), and
+the outcomes of all designs are written to ``summary.json``.
+"""
+from .runner import BatchDesign, BatchResult, BatchRunner
@@ -0,0 +1,169 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sys
+import datetime
+from functools import partial
+from typing import Optional, Sequence, Tuple
+
+import click
+from cloup import command, option, option_group
+
+from .runner import BatchDesign, BatchRunner
+from ..logging import err, info
+from ..common import _get_process_limit
+from ..common.cli import formatter_settings
+from ..flows import cloup_flow_opts
+
+o = partial(option, show_default=True)
+
+GIB = 1024**3
+
+
+@command(
+    no_args_is_help=True,
+    formatter_settings=formatter_settings,
+)
+@o(
+    "-o",
+    "--output",
+    "output_dir",
+    type=click.Path(file_okay=False, dir_okay=True),
+    default=os.path.join(
+        os.getcwd(),
+        datetime.datetime.now().astimezone().strftime("BATCH_%Y-%m-%d_%H-%M-%S"),
+    ),
+    help="The directory to store run directories, logs, metrics and the summary in.",
+)
+@o(
+    "--overwrite",
+    is_flag=True,
+    default=False,
+    help="Overwrite the run directories of designs, if they exist.",
+)
+@option_group(
+    "Resource budget",
+    o(
+        "-j",
+        "--jobs",
+        type=click.IntRange(min=1),
+        default=_get_process_limit(),
+        help="The total number of cores that all designs may use.",
+    ),
+    o(
+        "--cores-per-design",
+        type=click.IntRange(min=1),
+        default=None,
+        help="The minimum number of cores allotted to each design. [default: the cores split evenly between all designs]",
+        show_default=False,
+    ),
+    o(
+        "--memory-per-design",
+        type=float,
+        default=None,
+        help="The memory, in GiB, that each design is expected to use at most. If set, fewer designs are run concurrently so they fit in the memory budget.",
+    ),
+    o(
+        "--memory-budget",
+        type=float,
+        default=None,
+        help="The total memory, in GiB, that all designs may use. [default: the total system memory]",
+        show_default=False,
+    ),
+)
+@cloup_flow_opts(
+    run_options=False,
+    jobs=False,
+)
+def cli(
+    output_dir: str,
+    overwrite: bool,
+    jobs: int,
+    cores_per_design: Optional[int],
+    memory_per_design: Optional[float],
+    memory_budget: Optional[float],
+    flow_name: Optional[str],
+    config_override_strings: Sequence[str],
+    frm: Optional[str],
+    to: Optional[str],
+    skip: Tuple[str, ...],
+    auto_resume: bool,
+    pdk_root: str,
+    pdk: str,
+    scl: Optional[str],
+    pad: Optional[str],
+    config_files: Sequence[str],
+):
+    """
+    Runs the flows of multiple designs concurrently, one per configuration
+    file, sharing the loaded PDK and a budget of cores and memory.
+    """
+    if len(config_files) == 0:
+        err("No config file(s) have been provided.")
+        sys.exit(1)
+
+    try:
+        designs = BatchDesign.from_config_files(config_files)
+    except ValueError as e:
+        err(e)
+        sys.exit(1)
+
+    flow_argv = ["--manual-pdk", "--pdk-root", pdk_root, "--pdk", pdk]
+    if scl is not None:
+        flow_argv += ["--scl", scl]
+    if pad is not None:
+        flow_argv += ["--pad", pad]
+    if flow_name is not None:
+        flow_argv += ["--flow", flow_name]
+    for override in config_override_strings:
+        flow_argv += ["--override-config", override]
+    if frm is not None:
+        flow_argv += ["--from", frm]
+    if to is not None:
+        flow_argv += ["--to", to]
+    for step in skip:
+        flow_argv += ["--skip", step]
+    if auto_resume:
+        flow_argv.append("--auto-resume")
+    if overwrite:
+        flow_argv.append("--overwrite")
+
+    runner = BatchRunner(
+        designs,
+        output_dir,
+        flow_argv,
+        pdk_root=pdk_root,
+        pdk=pdk,
+        scl=scl,
+        pad=pad,
+        jobs=jobs,
+        cores_per_design=cores_per_design,
+        memory_per_design=(
+            int(memory_per_design * GIB) if memory_per_design is not None else None
+        ),
+        memory_budget=int(memory_budget * GIB) if memory_budget is not None else None,
+    )
+    info(
+        f"Running {len(designs)} design(s), up to {runner.max_parallel} at a time, in '{runner.output_dir}'…"
+    )
+    results = runner.run()
+    failed = [result.name for result in results if not result.passed]
+    if len(failed):
+        err(f"{len(failed)} of {len(results)} design(s) failed: {', '.join(failed)}")
+        sys.exit(2)
+    info(f"All {len(results)} design(s) passed.")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,329 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sys
+import json
+import time
+import multiprocessing
+import multiprocessing.connection
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from ..config import Config
+from ..common import get_latest_file, mkdirp, set_toolbox_cache_dir
+from ..logging import err, info, options, success, warn
+
+
+@dataclass
+class BatchDesign:
+    """
+    A design to run as part of a batch.
+
+    :param name: A unique name for the design, used to name its run directory
+        and metrics file.
+    :param config_file: The path to the design's configuration file.
+    """
+
+    name: str
+    config_file: str
+
+    @classmethod
+    def from_config_files(Self, config_files: Sequence[str]) -> List["BatchDesign"]:
+        """
+        Names designs after the directories of their configuration files, or
+        the directory and the configuration file's name if a directory has more
+        than one of the configuration files.
+
+        Dashes are replaced with underscores, as the names are used in metrics
+        file names in the format ``{pdk}-{scl}-{name}.metrics.json``.
+
+        :raises ValueError: If two configuration files would share a name.
+        """
+        directories: Dict[str, int] = {}
+        for config_file in config_files:
+            directory = os.path.dirname(os.path.abspath(config_file))
+            directories[directory] = directories.get(directory, 0) + 1
+
+        designs: List[BatchDesign] = []
+        names: Dict[str, str] = {}
+        for config_file in config_files:
+            directory = os.path.dirname(os.path.abspath(config_file))
+            name = os.path.basename(directory)
+            if directories[directory] > 1:
+                stem = os.path.basename(config_file).split(".", maxsplit=1)[0]
+                name = f"{name}_{stem}"
+            name = name.replace("-", "_")
+            if existing := names.get(name):
+                raise ValueError(
+                    f"Configuration files '{existing}' and '{config_file}' would both be named '{name}'."
+                )
+            names[name] = config_file
+            designs.append(Self(name, config_file))
+        return designs
+
+
+@dataclass
+class BatchResult:
+    """
+    The outcome of running one design as part of a batch.
+
+    :param name: The name of the design.
+    :param config_file: The path to the design's configuration file.
+    :param run_dir: The run directory of the design.
+    :param exit_code: The exit code of the flow, as returned by the ``librelane``
+        commandline interface.
+    :param cores: The number of cores allotted to the flow.
+    :param elapsed_seconds: The wall-clock time taken by the flow.
+    :param metrics_file: The path to the final metrics of the design, if any
+        were generated.
+    """
+
+    name: str
+    config_file: str
+    run_dir: str
+    exit_code: int
+    cores: int
+    elapsed_seconds: float
+    metrics_file: Optional[str]
+
+    @property
+    def passed(self) -> bool:
+        return self.exit_code == 0
+
+
+_RunningDesign = Tuple[BatchDesign, multiprocessing.process.BaseProcess, int, float]
+
+
+def _run_design(argv: List[str], log_path: str, cores: int):
+    from ..server.server import invoke
+
+    log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.dup2(log_fd, 1)
+    os.dup2(log_fd, 2)
+    os.close(log_fd)
+    os.environ["_OPENLANE_MAX_CORES"] = str(cores)
+    sys.exit(invoke("flow", argv))
+
+
+class BatchRunner(object):
+    """
+    Runs the flows of many designs concurrently under a shared CPU and memory
+    budget.
+
+    Steps, flows and the PDK are loaded once and inherited by a process forked
+    for each design, and :class:`librelane.common.Toolbox` artifacts are shared
+    between designs via a cache directory.
+
+    Designs are started in order whenever enough cores (and memory) are free.
+    Each design is allotted at least ``cores_per_design`` cores, but once fewer
+    designs remain than could run concurrently, the remaining designs share the
+    idle cores.
+
+    :param designs: The designs to run.
+    :param output_dir: The directory to create run directories, logs, metrics
+        and the summary in.
+    :param flow_argv: Arguments passed to the ``librelane`` commandline
+        interface for every design, before the run directory, the number of
+        jobs and the configuration file.
+    :param pdk_root: The PDK root to preload the PDK from.
+    :param pdk: The PDK to preload.
+    :param scl: The standard cell library to preload.
+    :param pad: The pad cell library to preload.
+    :param jobs: The total number of cores all designs may use.
+    :param cores_per_design: The minimum number of cores allotted to each
+        design. If unset, the cores are split evenly between all designs.
+    :param memory_per_design: The memory, in bytes, each design is expected to
+        use at most. If set, fewer designs may run concurrently.
+    :param memory_budget: The total memory, in bytes, all designs may use. Only
+        used with ``memory_per_design``.
+    """
+
+    def __init__(
+        self,
+        designs: Sequence[BatchDesign],
+        output_dir: str,
+        flow_argv: Sequence[str],
+        *,
+        pdk_root: str,
+        pdk: str,
+        scl: Optional[str] = None,
+        pad: Optional[str] = None,
+        jobs: int,
+        cores_per_design: Optional[int] = None,
+        memory_per_design: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+    ):
+        self.designs = list(designs)
+        self.output_dir = os.path.abspath(output_dir)
+        self.flow_argv = list(flow_argv)
+        self.pdk_root = pdk_root
+        self.pdk = pdk
+        self.scl = scl
+        self.pad = pad
+        self.jobs = max(1, jobs)
+        self.cores_per_design = min(
+            self.jobs,
+            cores_per_design or max(1, self.jobs // max(1, len(self.designs))),
+        )
+
+        self.max_parallel = max(1, self.jobs // self.cores_per_design)
+        if memory_per_design is not None:
+            if memory_budget is None:
+                import psutil
+
+                memory_budget = psutil.virtual_memory().total
+            self.max_parallel = min(
+                self.max_parallel, max(1, memory_budget // memory_per_design)
+            )
+
+    def warm_up(self):
+        """
+        Imports all steps and flows and evaluates the PDK configuration, so
+        processes forked for each design inherit them.
+        """
+        from ..flows import Flow
+        from ..steps import Step
+        from .. import __main__  # noqa: F401
+
+        Step.factory.list()
+        Flow.factory.list()
+        try:
+            Config.preload_pdk(self.pdk_root, self.pdk, self.scl, self.pad)
+        except Exception as e:
+            warn(f"Failed to preload the PDK configuration for '{self.pdk}': {e}")
+
+    def run(self) -> List[BatchResult]:
+        """
+        Runs all designs, then writes the metrics of each design as
+        ``{pdk}-{scl}-{name}.metrics.json`` and a consolidated ``summary.json``
+        to the output directory.
+
+        :returns: The results, in the same order as the designs.
+        """
+        runs_dir = os.path.join(self.output_dir, "runs")
+        logs_dir = os.path.join(self.output_dir, "logs")
+        mkdirp(runs_dir)
+        mkdirp(logs_dir)
+
+        options.set_show_progress_bar(False)
+        set_toolbox_cache_dir(os.path.join(self.output_dir, "toolbox"))
+        self.warm_up()
+
+        context = multiprocessing.get_context("fork")
+        pending: Deque[BatchDesign] = deque(self.designs)
+        running: Dict[int, _RunningDesign] = {}
+        results: Dict[str, BatchResult] = {}
+        free_cores = self.jobs
+
+        while len(pending) or len(running):
+            while len(pending) and len(running) < self.max_parallel:
+                if len(running) and free_cores < self.cores_per_design:
+                    break
+                # Divide free cores between the designs that can start now
+                slots = min(len(pending), self.max_parallel - len(running))
+                cores = max(self.cores_per_design, free_cores // slots)
+                design = pending.popleft()
+                run_dir = os.path.join(runs_dir, design.name)
+                mkdirp(run_dir)
+                argv = [
+                    *self.flow_argv,
+                    "--jobs",
+                    str(cores),
+                    "--force-run-dir",
+                    run_dir,
+                    design.config_file,
+                ]
+                process = context.Process(
+                    target=_run_design,
+                    args=(argv, os.path.join(logs_dir, f"{design.name}.log"), cores),
+                    name=design.name,
+                )
+                process.start()
+                info(f"Started '{design.name}' with {cores} core(s).")
+                running[process.sentinel] = (design, process, cores, time.time())
+                free_cores -= cores
+
+            for sentinel in multiprocessing.connection.wait(list(running)):
+                assert isinstance(sentinel, int)
+                design, finished, cores, start_time = running.pop(sentinel)
+                finished.join()
+                free_cores += cores
+                result = self.__collect(
+                    design,
+                    os.path.join(runs_dir, design.name),
+                    finished.exitcode or 0,
+                    cores,
+                    time.time() - start_time,
+                )
+                results[design.name] = result
+                remaining = len(self.designs) - len(results)
+                if result.passed:
+                    success(f"'{design.name}' passed ({remaining} remaining).")
+                else:
+                    err(
+                        f"'{design.name}' failed with exit code {result.exit_code} ({remaining} remaining)."
+                    )
+
+        ordered = [results[design.name] for design in self.designs]
+        with open(
+            os.path.join(self.output_dir, "summary.json"), "w", encoding="utf8"
+        ) as f:
+            json.dump(
+                {
+                    "passed": sum(result.passed for result in ordered),
+                    "failed": sum(not result.passed for result in ordered),
+                    "designs": [asdict(result) for result in ordered],
+                },
+                f,
+                indent=2,
+            )
+        return ordered
+
+    def __collect(
+        self,
+        design: BatchDesign,
+        run_dir: str,
+        exit_code: int,
+        cores: int,
+        elapsed_seconds: float,
+    ) -> BatchResult:
+        metrics_file = None
+        resolved_path = os.path.join(run_dir, "resolved.json")
+        state_path = get_latest_file(run_dir, "state_out.json")
+        if state_path is not None and os.path.isfile(resolved_path):
+            try:
+                with open(resolved_path, encoding="utf8") as f:
+                    resolved = json.load(f)
+                with open(state_path, encoding="utf8") as f:
+                    metrics = json.load(f)["metrics"]
+                metrics_file = os.path.join(
+                    self.output_dir,
+                    f"{resolved['PDK']}-{resolved['STD_CELL_LIBRARY']}-{design.name}.metrics.json",
+                )
+                with open(metrics_file, "w", encoding="utf8") as f:
+                    json.dump(metrics, f)
+            except (OSError, KeyError, json.JSONDecodeError) as e:
+                warn(f"Failed to extract the metrics of '{design.name}': {e}")
+                metrics_file = None
+
+        return BatchResult(
+            name=design.name,
+            config_file=design.config_file,
+            run_dir=run_dir,
+            exit_code=exit_code,
+            cores=cores,
+            elapsed_seconds=round(elapsed_seconds, 3),
+            metrics_file=metrics_file,
+        )
@@ -45,6 +45,7 @@ from .misc import (
     get_latest_file,
     process_list_file,
     count_occurences,
+    hash_verilog_files,
     _get_process_limit,
 )
 from .types import (
@@ -56,7 +57,7 @@ from .types import (
     AnyPath,
     ScopedFile,
 )
-from .toolbox import Toolbox
+from .toolbox import Toolbox, set_toolbox_cache_dir
 from .drc import DRC, Violation, BoundingBox
 from . import cli
 from .tpe import get_tpe, set_tpe
@@ -209,6 +209,78 @@ Metric(
     higher_is_better=False,
     dont_aggregate=["iter"],
 )
+Metric(
+    "route__wirelength__p50",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+    dont_aggregate=["iter"],
+)
+Metric(
+    "route__wirelength__p90",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+    dont_aggregate=["iter"],
+)
+Metric(
+    "route__wirelength__p99",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+    dont_aggregate=["iter"],
+)
+Metric(
+    "route__net__count",
+    aggregator=sum_aggregator,
+    dont_aggregate=["fanout", "wirelength_um"],
+)
+Metric(
+    "route__net__routed__count",
+    aggregator=sum_aggregator,
+)
+Metric(
+    "route__net__hpwl",
+    aggregator=sum_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "route__net__hpwl__p50",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "route__net__hpwl__p90",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "route__net__hpwl__p99",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "route__net__hpwl__max",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "route__net__fanout__p50",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "route__net__fanout__p90",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "route__net__fanout__p99",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "route__net__fanout__max",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+)
 Metric(
     "route__antenna_violation__count",
     aggregator=sum_aggregator,
@@ -310,6 +382,12 @@ Metric(
     higher_is_better=False,
     critical=True,
 )
+Metric(
+    "equivalence__partition_fail__count",
+    aggregator=sum_aggregator,
+    higher_is_better=False,
+    critical=True,
+)
 Metric(
     "design__lvs_error__count",
     aggregator=sum_aggregator,
@@ -352,3 +430,36 @@ Metric(
     higher_is_better=False,
     critical=True,
 )
+
+# Resource Usage
+Metric(
+    "resource__runtime",
+    aggregator=sum_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "resource__cpu_time",
+    aggregator=sum_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "resource__peak_memory_rss",
+    aggregator=max_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "resource__read_bytes",
+    aggregator=sum_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "resource__write_bytes",
+    aggregator=sum_aggregator,
+    higher_is_better=False,
+)
+Metric(
+    "resource__cpu_utilization",
+    aggregator=max_aggregator,
+    higher_is_better=True,
+    dont_aggregate=["step"],
+)
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
+import sys
 import textwrap
 from enum import IntEnum
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import (
+    Container,
+    FrozenSet,
     List,
     Mapping,
     Tuple,
@@ -45,6 +49,73 @@ class TableVerbosity(IntEnum):
     ALL = 4
 
 
+_ParsedMetricName = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_parsed_metric_names: Dict[str, _ParsedMetricName] = {}
+_parsed_metric_names_max = 1 << 18
+
+
+def _parse_metric_name(metric_name: str) -> _ParsedMetricName:
+    """
+    A memoized version of :func:`parse_metric_modifiers` returning immutable
+    values, as the same metric names are parsed repeatedly across steps.
+
+    The base part and the modifier keys are interned, as they are repeated
+    across a large number of metrics and used as dictionary keys.
+
+    :param metric_name: The name of the metric as generated by a utility.
+    :returns: A tuple of the base part, then the modifiers as key-value pairs.
+    """
+    if parsed := _parsed_metric_names.get(metric_name):
+        return parsed
+
+    if ":" not in metric_name:
+        parsed = (sys.intern(metric_name), ())
+    else:
+        mn_mut = metric_name.split("__")
+        modifiers = {}
+        while ":" in mn_mut[-1]:
+            key, value = mn_mut.pop().split(":", maxsplit=1)
+            modifiers[sys.intern(key)] = value
+        parsed = (sys.intern("__".join(mn_mut)), tuple(reversed(modifiers.items())))
+
+    if len(_parsed_metric_names) >= _parsed_metric_names_max:
+        _parsed_metric_names.clear()
+    _parsed_metric_names[metric_name] = parsed
+    return parsed
+
+
+def _parse_metric_names(metric_names: List[str]) -> List[_ParsedMetricName]:
+    """
+    Bulk version of :func:`_parse_metric_name`, where names that have already
+    been parsed are looked up without calling into Python code.
+    """
+    parsed: List[Optional[_ParsedMetricName]] = list(
+        map(_parsed_metric_names.get, metric_names)
+    )
+    if None in parsed:
+        for i, entry in enumerate(parsed):
+            if entry is None:
+                parsed[i] = _parse_metric_name(metric_names[i])
+    return parsed  # type: ignore
+
+
+@lru_cache(maxsize=1 << 16)
+def _get_aggregation_levels(metric_name: str) -> Tuple[str, ...]:
+    """
+    :returns: The names of the metrics a metric is aggregated into, i.e., the
+        base part followed by the name with each modifier but the last
+        applied.
+    """
+    base, modifiers = _parse_metric_name(metric_name)
+    levels = []
+    level = base
+    for key, value in modifiers:
+        levels.append(level)
+        level += f"__{key}:{value}"
+    return tuple(levels)
+
+
 def parse_metric_modifiers(metric_name: str) -> Tuple[str, Mapping[str, str]]:
     """
     Parses a metric name into a base and modifiers as specified in
@@ -54,16 +125,61 @@ def parse_metric_modifiers(metric_name: str) -> Tuple[str, Mapping[str, str]]:
     :returns: A tuple of the base part as a string, then the modifiers as
         a key-value mapping.
     """
-    mn_mut = metric_name.split("__")
-    modifiers = {}
-    while ":" in mn_mut[-1]:
-        key, value = mn_mut.pop().split(":", maxsplit=1)
-        modifiers[key] = value
-    return "__".join(mn_mut), {k: modifiers[k] for k in reversed(modifiers)}
+    base, modifiers = _parse_metric_name(metric_name)
+    return base, dict(modifiers)
+
+
+class MetricTable(object):
+    """
+    A columnar representation of a set of metrics, where each metric is a row
+    with its name parsed according to the METRICS2.1 naming convention.
+
+    Constructing a table parses every metric name exactly once, after which
+    metrics can be selected in bulk by their base metric instead of processing
+    them one name at a time.
+
+    :param metrics: A mapping of strings to values of metrics.
+
+    :ivar names: The full names of the metrics.
+    :ivar bases: The base part of each metric's name.
+    :ivar modifiers: The modifiers of each metric as key-value pairs.
+    :ivar values: The values of the metrics.
+    """
+
+    names: List[str]
+    bases: List[str]
+    modifiers: List[Tuple[Tuple[str, str], ...]]
+    values: List[Any]
+
+    def __init__(self, metrics: Mapping[str, Any]) -> None:
+        self.names = list(metrics.keys())
+        self.values = list(metrics.values())
+        self.bases, self.modifiers = [], []
+        if len(self.names):
+            columns = zip(*_parse_metric_names(self.names))
+            self.bases, self.modifiers = map(list, columns)  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def get_base_names(self) -> List[str]:
+        """
+        :returns: The unique base metric names in this table, in the order they
+            were first encountered.
+        """
+        return list(dict.fromkeys(self.bases))
+
+    def get_rows(self, bases: Container[str]) -> List[int]:
+        """
+        :param bases: The base metric names to select.
+        :returns: The indices of all rows with one of the selected base metric
+            names, in order.
+        """
+        return [i for i, base in enumerate(self.bases) if base in bases]
 
 
 def aggregate_metrics(
-    input: Mapping[str, Any],
+    input: Union[Mapping[str, Any], MetricTable],
     aggregator_by_metric: Optional[
         Mapping[str, Union[MetricAggregator, Metric]]
     ] = None,
@@ -72,7 +188,8 @@ def aggregate_metrics(
     Takes a set of metrics generated according to the METRICS2.1 naming
     convention.
 
-    :param input: A mapping of strings to values of metrics.
+    :param input: A mapping of strings to values of metrics, or a
+        :class:`MetricTable` thereof.
     :param aggregator_by_metric: A mapping of metric names to either:
         - A tuple of the initial accumulator and reducer to aggregate the values from all modifier metrics
         - A :class:`Metric` class
@@ -82,35 +199,37 @@ def aggregate_metrics(
     if aggregator_by_metric is None:
         aggregator_by_metric = Metric.by_name
 
-    aggregated: Dict[str, Any] = {}
-    for name, value in input.items():
-        metric_name, modifiers = parse_metric_modifiers(name)
-        if len(modifiers) < 1:
-            # No modifiers = final aggregate, don't double-represent in sums
-            continue
+    table = input if isinstance(input, MetricTable) else MetricTable(input)
 
-        modifier_names = list(modifiers.keys())
+    aggregator_by_base: Dict[str, Tuple[MetricAggregator, FrozenSet[str]]] = {}
+    for base in table.get_base_names():
         dont_aggregate: Iterable[str] = []
-        entry = aggregator_by_metric.get(metric_name)
+        entry = aggregator_by_metric.get(base)
         if isinstance(entry, Metric):
             dont_aggregate = entry.dont_aggregate or []
             entry = entry.aggregator
-
-        if entry is None:
+        if entry is not None:
+            aggregator_by_base[base] = (entry, frozenset(dont_aggregate))
+
+    # Values are gathered for each aggregate metric, then reduced all at once
+    values_by_level: Dict[str, Tuple[MetricAggregator, List[Any]]] = {}
+    for i in table.get_rows(aggregator_by_base):
+        aggregator, dont_aggregate = aggregator_by_base[table.bases[i]]
+        if dont_aggregate and any(k in dont_aggregate for k, _ in table.modifiers[i]):
             continue
 
-        if len(set(modifier_names).intersection(set(dont_aggregate))):
-            continue
-
-        metric_name_so_far = metric_name
-        for modifier in modifier_names:
-            start, aggregation_fn = entry
-            current = aggregated.get(metric_name_so_far) or start
-            aggregated[metric_name_so_far] = aggregation_fn([current, value])
-            metric_name_so_far += f"__{modifier}:{modifiers[modifier]}"
+        # No modifiers = no levels, i.e., the value is a final aggregate and is
+        # not double-represented in sums
+        value = table.values[i]
+        for level in _get_aggregation_levels(table.names[i]):
+            if level_entry := values_by_level.get(level):
+                level_entry[1].append(value)
+            else:
+                values_by_level[level] = (aggregator, [value])
 
-    final_values = dict(input)
-    final_values.update(aggregated)
+    final_values = dict(zip(table.names, table.values))
+    for level, ((start, aggregation_fn), values) in values_by_level.items():
+        final_values[level] = aggregation_fn([start, *values])
     return final_values
 
 
@@ -248,7 +367,7 @@ class MetricDiff(object):
     def from_metrics(
         Self,
         gold: dict,
-        new: dict,
+        new: Union[dict, MetricTable],
         significant_figures: int,
         filter: Filter = Filter(["*"]),
     ) -> "MetricDiff":
@@ -256,24 +375,31 @@ class MetricDiff(object):
         Creates a :class:`MetricDiff` object from two sets of metrics.
 
         :param gold: The "gold-standard" metrics to compare against
-        :param new: The metrics being evaluated
+        :param new: The metrics being evaluated, or a :class:`MetricTable`
+            thereof
         :param filter: A :class:`Filter` for the names of the metrics to include
             or exclude certain metrics.
         :returns: The aggregate of the differences between gold and good
         """
 
-        def generator(g, n):
-            for metric in filter.filter(sorted(n.keys())):
-                if metric not in g:
+        table = new if isinstance(new, MetricTable) else MetricTable(new)
+        rows = [i for i in table.get_rows(Metric.by_name) if table.names[i] in gold]
+        rows.sort(key=table.names.__getitem__)
+
+        def generator():
+            for i in rows:
+                metric = table.names[i]
+                if not filter.match(metric):
                     continue
-                base_metric, modifiers = parse_metric_modifiers(metric)
-                lhs_value, rhs_value = g[metric], n[metric]
+                lhs_value, rhs_value = gold[metric], table.values[i]
                 if type(lhs_value) != type(rhs_value):
                     lhs_value = type(rhs_value)(lhs_value)
 
-                if metric_object := Metric.by_name.get(base_metric):
-                    yield metric_object.compare(
-                        lhs_value, rhs_value, significant_figures, modifiers=modifiers
-                    )
+                yield Metric.by_name[table.bases[i]].compare(
+                    lhs_value,
+                    rhs_value,
+                    significant_figures,
+                    modifiers=dict(table.modifiers[i]),
+                )
 
-        return MetricDiff(generator(gold, new))
+        return MetricDiff(generator())
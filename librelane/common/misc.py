@@ -20,6 +20,7 @@ import os
 import re
 import glob
 import gzip
+import hashlib
 import yaml
 import shutil
 import typing
@@ -33,18 +34,21 @@ from typing import (
     Generator,
     Iterable,
     List,
+    TYPE_CHECKING,
     Optional,
+    Set,
     SupportsFloat,
     TypeVar,
     Union,
 )
 
-import httpx
-
 from ..__version__ import __version__
 from .types import AnyPath, Path
 from ..logging import err
 
+if TYPE_CHECKING:
+    import httpx
+
 T = TypeVar("T")
 
 
@@ -380,7 +384,7 @@ def get_latest_file(in_path: Union[str, os.PathLike], filename: str) -> Optional
     return latest_json
 
 
-def get_httpx_session(token: Optional[str] = None) -> httpx.Client:
+def get_httpx_session(token: Optional[str] = None) -> "httpx.Client":
     """
     Creates an ``httpx`` session client that follows redirects and has the
     User-Agent header set to ``librelane/{__version__}``.
@@ -389,6 +393,8 @@ def get_httpx_session(token: Optional[str] = None) -> httpx.Client:
         Authorization: Bearer {token}, is included.
     :returns: The created client
     """
+    import httpx
+
     session = httpx.Client(follow_redirects=True)
     headers_raw = {"User-Agent": f"librelane/{__version__}"}
     if token is not None and token.strip() != "":
@@ -422,6 +428,59 @@ def process_list_file(from_file: AnyPath) -> List[str]:
     return excluded_cells
 
 
+verilog_include_rx = re.compile(r'^\s*`include\s+"([^"]+)"', re.MULTILINE)
+
+
+def hash_verilog_files(
+    files: Iterable[str],
+    include_dirs: Iterable[str],
+    relative_includes: bool,
+) -> str:
+    """
+    Hashes the content of Verilog files and, recursively, the files they
+    include.
+
+    Includes are resolved like Verilator would, i.e., relative to the
+    including file (if ``relative_includes`` is set), then the include
+    directories, then the current working directory. Includes that cannot be
+    resolved are hashed by name.
+
+    :param files: The Verilog files.
+    :param include_dirs: The include directories.
+    :param relative_includes: Whether includes are resolved relative to the
+        including file first.
+    :returns: A hexadecimal SHA-256 digest
+    """
+    include_dirs = list(include_dirs)
+    result = hashlib.sha256()
+    visited: Set[str] = set()
+    queue = [os.path.abspath(file) for file in files]
+    while len(queue):
+        file = queue.pop(0)
+        if file in visited:
+            continue
+        visited.add(file)
+        result.update(file.encode("utf8") + b"\0")
+        if not os.path.isfile(file):
+            continue
+        with open(file, "rb") as f:
+            content = f.read()
+        result.update(hashlib.sha256(content).digest())
+        for included in verilog_include_rx.findall(
+            content.decode("utf8", errors="replace")
+        ):
+            candidates = [os.path.join(dir, included) for dir in include_dirs]
+            if relative_includes:
+                candidates.insert(0, os.path.join(os.path.dirname(file), included))
+            candidates.append(included)
+            resolved = next(
+                (candidate for candidate in candidates if os.path.isfile(candidate)),
+                included,
+            )
+            queue.append(os.path.abspath(resolved))
+    return result.hexdigest()
+
+
 def _get_process_limit() -> int:
     return int(os.getenv("_OPENLANE_MAX_CORES", os.cpu_count() or 1))
 
@@ -15,6 +15,7 @@ import os
 import re
 import uuid
 import shutil
+import hashlib
 import tempfile
 import subprocess
 from enum import IntEnum
@@ -47,6 +48,20 @@ from ..state import DesignFormat
 from ..common import Filter
 from ..logging import debug, warn, err
 
+_shared_cache_dir: Optional[str] = None
+
+
+def set_toolbox_cache_dir(cache_dir: Optional[str]):
+    """
+    Sets a directory in which all subsequently created :class:`Toolbox` objects
+    store their artifacts, allowing flows (including ones running in other
+    processes) to share them.
+
+    :param cache_dir: The directory, or ``None`` to disable sharing.
+    """
+    global _shared_cache_dir
+    _shared_cache_dir = cache_dir
+
 
 class Toolbox(object):
     """
@@ -54,12 +69,18 @@ class Toolbox(object):
 
     The toolbox may create artifacts that are cached to avoid constant re-creation
     between steps.
+
+    :param tmp_dir: The directory to create artifacts in.
+    :param cache_dir: If set, artifacts are created in this directory instead,
+        named after their inputs, and are reused by any toolbox using the same
+        directory. Defaults to the value set by :func:`set_toolbox_cache_dir`.
     """
 
-    def __init__(self, tmp_dir: str) -> None:
+    def __init__(self, tmp_dir: str, cache_dir: Optional[str] = None) -> None:
         # Only create before use, otherwise users will end up with
         # "librelane_run/tmp" created in their PWD because of the global toolbox
         self.tmp_dir = tmp_dir
+        self.cache_dir = cache_dir or _shared_cache_dir
 
         self.remove_cells_from_lib = lru_cache(16, True)(self.remove_cells_from_lib)  # type: ignore
         self.create_blackbox_model = lru_cache(16, True)(self.create_blackbox_model)  # type: ignore
@@ -377,68 +398,154 @@ class Toolbox(object):
             from the files.
         :returns: A path to the lib file with the removed cells.
         """
-        mkdirp(self.tmp_dir)
+        excluded_cells_filter = Filter(excluded_cells)
+
+        out_paths = []
+        for file in input_lib_files:
+            out_paths.append(
+                self.__create_artifact(
+                    ["remove_cells_from_lib", file, *sorted(excluded_cells)],
+                    [file],
+                    ".lib",
+                    lambda out_path: self.__remove_cells(
+                        file, excluded_cells_filter, out_path
+                    ),
+                )
+            )
+
+        return out_paths
+
+    def __create_artifact(
+        self,
+        key: Sequence[str],
+        input_files: Iterable[str],
+        suffix: str,
+        create: Callable[[str], Optional[bool]],
+    ) -> str:
+        """
+        Creates an artifact using ``create``, which writes it to the path it is
+        passed.
+
+        If a cache directory is set, the artifact is looked up in it by ``key``
+        and the size and modification time of ``input_files`` first, and is
+        atomically moved into it after creation otherwise. Artifacts are not
+        moved into the cache if ``create`` raises, writes nothing or returns
+        ``False`` to mark the artifact as degraded, e.g. because a tool was
+        unavailable.
+        """
+        if self.cache_dir is None:
+            mkdirp(self.tmp_dir)
+            out_path = os.path.join(self.tmp_dir, f"{uuid.uuid4().hex}{suffix}")
+            create(out_path)
+            return out_path
 
+        hash = hashlib.sha256()
+        for element in key:
+            hash.update(element.encode("utf8") + b"\0")
+        for file in input_files:
+            try:
+                stat = os.stat(file)
+                hash.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode("utf8"))
+            except OSError:
+                pass
+        mkdirp(self.cache_dir)
+        cached_path = os.path.join(self.cache_dir, f"{hash.hexdigest()}{suffix}")
+        if os.path.exists(cached_path):
+            debug(f"Reusing cached artifact at '{cached_path}'…")
+            return cached_path
+        out_path = os.path.join(self.cache_dir, f"{uuid.uuid4().hex}.tmp{suffix}")
+        try:
+            cacheable = create(out_path) is not False
+            if cacheable and os.path.exists(out_path):
+                os.replace(out_path, cached_path)
+                return cached_path
+            mkdirp(self.tmp_dir)
+            uncached_path = os.path.join(self.tmp_dir, f"{uuid.uuid4().hex}{suffix}")
+            if os.path.exists(out_path):
+                shutil.move(out_path, uncached_path)
+            return uncached_path
+        finally:
+            try:
+                os.unlink(out_path)
+            except FileNotFoundError:
+                pass
+
+    def __remove_cells(
+        self,
+        input_lib_file: str,
+        excluded_cells_filter: Filter,
+        out_path: str,
+    ):
         class State(IntEnum):
             initial = 0
             cell = 10
             excluded_cell = 11
 
         cell_start_rx = re.compile(r"(\s*)cell\s*\(\"?(.*?)\"?\)\s*\{")
-        out_paths = []
-
-        excluded_cells_filter = Filter(excluded_cells)
 
-        for file in input_lib_files:
-            input_lib_stream = gzopen(file)
-            # can't be gzip -- abc cannot read gzipped lib files
-            out_path = os.path.join(self.tmp_dir, f"{uuid.uuid4().hex}.lib")
-
-            state = State.initial
-            brace_count = 0
-            output_file_handle = open(out_path, "w")
-            write = lambda x: print(x, file=output_file_handle, end="")
-            for line in input_lib_stream:
-                if state == State.initial:
-                    cell_m = cell_start_rx.search(line)
-                    if cell_m is not None:
-                        whitespace = cell_m[1]
-                        cell_name = cell_m[2]
-                        if excluded_cells_filter.match(cell_name):
-                            state = State.excluded_cell
-                            write(f"{whitespace}/* removed {cell_name} */\n")
-                        else:
-                            state = State.cell
-                            write(line)
-                        brace_count = 1
+        input_lib_stream = gzopen(input_lib_file)
+        # can't be gzip -- abc cannot read gzipped lib files
+        state = State.initial
+        brace_count = 0
+        output_file_handle = open(out_path, "w")
+        write = lambda x: print(x, file=output_file_handle, end="")
+        for line in input_lib_stream:
+            if state == State.initial:
+                cell_m = cell_start_rx.search(line)
+                if cell_m is not None:
+                    whitespace = cell_m[1]
+                    cell_name = cell_m[2]
+                    if excluded_cells_filter.match(cell_name):
+                        state = State.excluded_cell
+                        write(f"{whitespace}/* removed {cell_name} */\n")
                     else:
+                        state = State.cell
                         write(line)
-                elif state in [State.cell, State.excluded_cell]:
-                    if "{" in line:
-                        brace_count += 1
-                    if "}" in line:
-                        brace_count -= 1
-                    if state == State.cell:
-                        write(line)
-                    if brace_count == 0:
-                        state = State.initial
-
-            output_file_handle.close()
-
-            out_paths.append(out_path)
-
-        return out_paths
+                    brace_count = 1
+                else:
+                    write(line)
+            elif state in [State.cell, State.excluded_cell]:
+                if "{" in line:
+                    brace_count += 1
+                if "}" in line:
+                    brace_count -= 1
+                if state == State.cell:
+                    write(line)
+                if brace_count == 0:
+                    state = State.initial
+
+        output_file_handle.close()
 
     def create_blackbox_model(
         self,
         input_models: Union[frozenset, Tuple[str, ...]],
         defines: FrozenSet[str],
     ) -> str:
-        mkdirp(self.tmp_dir)
-        out_path = os.path.join(self.tmp_dir, f"{uuid.uuid4().hex}.bb.v")
+        if isinstance(input_models, frozenset):
+            input_models = tuple(sorted(input_models))
+        return self.__create_artifact(
+            ["create_blackbox_model", *input_models, "", *sorted(defines)],
+            input_models,
+            ".bb.v",
+            lambda out_path: self.__create_blackbox_model(
+                input_models, defines, out_path
+            ),
+        )
+
+    def __create_blackbox_model(
+        self,
+        input_models: Union[frozenset, Tuple[str, ...]],
+        defines: FrozenSet[str],
+        out_path: str,
+    ) -> bool:
+        """
+        :returns: Whether the models were fully processed, i.e., they are not
+            degraded because of a missing or failing Yosys or invalid blocks.
+        """
         debug(f"Creating cell models for {input_models} at '{out_path}'…")
         bad_yosys_line = re.compile(r"^\s+(\w+|(\\\S+?))\s*\(.*\).*;")
 
+        processed = True
         stack: List[Literal["specify", "primitive"]] = []
         with open(out_path, "w", encoding="utf8") as out:
             for model in input_models:
@@ -469,6 +576,7 @@ class Toolbox(object):
                     print("", file=out)
                 except ValueError as e:
                     err(f"Failed to pre-process input models for linting: {e}")
+                    processed = False
 
         yosys = shutil.which("yosys") or shutil.which("yowasp-yosys")
 
@@ -476,7 +584,7 @@ class Toolbox(object):
             warn(
                 "yosys and yowasp-yosys not found in PATH. This may trigger issues with blackboxing."
             )
-            return out_path
+            return False
 
         commands = ""
         for define in list(defines):
@@ -504,8 +612,10 @@ class Toolbox(object):
             err(f"Failed to pre-process input models for linting with Yosys: {e}")
             err(open(output_log_path, "r", encoding="utf8").read())
             err("Will attempt to load models into linter as-is.")
-
-        return out_path
+            return False
+        finally:
+            output_log.close()
+        return processed
 
     def get_lib_voltage(
         self,
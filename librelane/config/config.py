@@ -207,6 +207,12 @@ class Config(GenericImmutableDict[str, Any]):
     """
 
     current_interactive: ClassVar[Optional["Config"]] = None
+    evaluated_pdks: ClassVar[List[Tuple[str, str, Optional[str], Optional[str]]]] = []
+    """
+    The ``(pdk_root, pdk, scl, pad)`` arguments of every PDK configuration
+    evaluated by this process, in order. Any of them can be passed to
+    :meth:`preload_pdk` to evaluate them again.
+    """
     meta: Meta
 
     def __init__(
@@ -822,11 +828,34 @@ class Config(GenericImmutableDict[str, Any]):
 
         return os.path.abspath(pdk_root)
 
+    @classmethod
+    def preload_pdk(
+        Self,
+        pdk_root: Optional[str],
+        pdk: str,
+        scl: Optional[str] = None,
+        pad: Optional[str] = None,
+    ):
+        """
+        Evaluates the configuration files of a PDK ahead of time. The result is
+        cached and reused when configurations using the same PDK, SCL and pad
+        library are loaded by this process or processes forked from it.
+
+        :param pdk_root: The PDK root. If ``None``, Ciel's default is used.
+        :param pdk: The name of the PDK.
+        :param scl: The standard cell library. If ``None``, the PDK's default
+            standard cell library is used.
+        :param pad: The pad cell library. If ``None``, the PDK's default pad
+            cell library is used (if it exists).
+        """
+        Self.__get_pdk_raw(Self.__resolve_pdk_root(pdk_root), pdk, scl, pad)
+
     @staticmethod
-    @lru_cache(1, True)
+    @lru_cache(8, True)
     def __get_pdk_raw(
         pdk_root: str, pdk: str, scl: Optional[str], pad: Optional[str]
     ) -> Tuple[GenericImmutableDict[str, Any], str, str, Optional[str]]:
+        arguments = (pdk_root, pdk, scl, pad)
         pdk_config: GenericDict[str, Any] = GenericDict(
             {
                 SpecialKeys.pdk_root: pdk_root,
@@ -924,6 +953,7 @@ class Config(GenericImmutableDict[str, Any]):
                 )
             )
 
+        Config.evaluated_pdks.append(arguments)
         return GenericImmutableDict(full_env), pdkpath, scl, pad
 
     @staticmethod
@@ -21,7 +21,6 @@ import pathlib
 import subprocess
 from typing import List, NoReturn, Sequence, Optional, Union, Tuple
 
-import httpx
 import semver
 
 from .common import mkdirp
@@ -103,6 +102,8 @@ def remote_manifest_exists(image: str) -> bool:
         err(f"Unknown registry '{registry}'.")
         return False
 
+    import httpx
+
     try:
         httpx.Client(follow_redirects=True).get(
             url, headers={"Accept": "application/json"}
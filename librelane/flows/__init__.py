@@ -18,7 +18,20 @@ The Flow Module
 An API for implementing new flows using the LibreLane infrastructure, as well
 as a number of built-in flows.
 """
+import importlib
+from typing import TYPE_CHECKING
+
 from .flow import FlowError, FlowException, FlowProgressBar, Flow
 from .sequential import SequentialFlow
-from . import builtins
 from .cli import cloup_flow_opts
+
+# Built-in flows are only imported when first accessed, either through this
+# module or through ``Flow.factory``.
+if TYPE_CHECKING:
+    from . import builtins
+
+
+def __getattr__(name: str):
+    if name == "builtins":
+        return importlib.import_module(".builtins", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
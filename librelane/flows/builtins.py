@@ -17,3 +17,4 @@ from .classic import Classic, VHDLClassic
 from .chip import Chip
 from .misc import OpenInKLayout, OpenInOpenROAD
 from .synth_explore import SynthesisExploration
+from .explore import DesignSpaceExploration
@@ -92,6 +92,7 @@ class Classic(SequentialFlow):
         Checker.DisconnectedPins,
         Odb.ReportWireLength,
         Checker.WireLength,
+        Odb.ReportNetStatistics,
         OpenROAD.FillInsertion,
         Odb.CellFrequencyTables,
         OpenROAD.RCX,
@@ -200,6 +201,12 @@ class Classic(SequentialFlow):
             "Enables parasitics extraction using the OpenROAD.RCX step.",
             default=True,
         ),
+        Variable(
+            "RUN_NET_STATISTICS",
+            bool,
+            "Enables reporting statistics of the wire length, fanout and HPWL of all nets using the Odb.ReportNetStatistics step.",
+            default=True,
+        ),
         Variable(
             "RUN_IRDROP_REPORT",
             bool,
@@ -277,6 +284,7 @@ class Classic(SequentialFlow):
         "Odb.HeuristicDiodeInsertion": ["RUN_HEURISTIC_DIODE_INSERTION"],
         "OpenROAD.RepairAntennas": ["RUN_ANTENNA_REPAIR"],
         "OpenROAD.DetailedRouting": ["RUN_DRT"],
+        "Odb.ReportNetStatistics": ["RUN_NET_STATISTICS"],
         "OpenROAD.FillInsertion": ["RUN_FILL_INSERTION"],
         "OpenROAD.STAPostPNR": ["RUN_MCSTA"],
         "OpenROAD.IRDropReport": ["RUN_IRDROP_REPORT"],
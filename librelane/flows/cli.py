@@ -48,6 +48,21 @@ from ..logging import set_log_level, verbose, err, options, LogLevels
 from ..state import State, InvalidState
 
 
+class _FlowChoice(Choice):
+    """
+    A :class:`cloup.Choice` of all registered flows, evaluated only when the
+    choices are first needed, so as not to import every flow (and plugin)
+    when constructing commandline interfaces.
+    """
+
+    def __init__(self, case_sensitive: bool = True) -> None:
+        self.case_sensitive = case_sensitive
+
+    @property
+    def choices(self):  # type: ignore[override]
+        return tuple(Flow.factory.list())
+
+
 class Option(CloupOption):
     """
     A slight modification of cloup.Option that consumes the environment
@@ -241,6 +256,7 @@ def cloup_flow_opts(
         * ``frm`` §: ``Optional[str]``: Start from a step with this ID. Supported by sequential flows.
         * ``to`` §: ``Optional[str]``: Stop at a step with this id. Supported by sequential flows.
         * ``skip`` §: ``Iterable[str]``: Skip these steps. Supported by sequential flows.
+        * ``auto_resume`` §: ``bool``: Reuse the results of concluded steps in an existing run. Supported by sequential flows.
     * Sequential flow reproducible (if parameter ``sequential_flow_reproducible`` is ``True``)
         * ``reproducible`` §: ``str``: Create a reproducible for a step with is ID, aborting the flow afterwards. Supported by sequential flows.
     * Flow run options (if parameter ``run_options`` is ``True``):
@@ -277,7 +293,7 @@ def cloup_flow_opts(
                     "-f",
                     "--flow",
                     "flow_name",
-                    type=Choice(Flow.factory.list(), case_sensitive=False),
+                    type=_FlowChoice(case_sensitive=False),
                     default=None,
                     help="The built-in LibreLane flow to use for this run",
                 ),
@@ -389,6 +405,12 @@ def cloup_flow_opts(
                     multiple=True,
                     help="Skip these steps. Supported by sequential flows.",
                 ),
+                o(
+                    "--auto-resume",
+                    is_flag=True,
+                    default=False,
+                    help="When using an existing run, reuse the results of steps that concluded with the same configuration and inputs and whose outputs are intact, discard those of interrupted steps, then continue from the first step that did not conclude. Supported by sequential flows.",
+                ),
             )(f)
         if sequential_flow_reproducible:
             f = o(
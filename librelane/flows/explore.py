@@ -0,0 +1,317 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import os
+import json
+import itertools
+from decimal import Decimal
+from dataclasses import dataclass, field
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import rich
+import rich.table
+
+from .flow import Flow, FlowError, FlowException
+from .classic import Classic
+from ..state import State
+from ..config import Config, Variable
+from ..common import GenericDict, GenericDictEncoder, slugify
+from ..logging import options, console, success, warn
+from ..steps import Step, StepError, DeferredStepError
+
+OverrideValue = Union[bool, Decimal, str]
+
+
+@dataclass
+class _Point:
+    overrides: Dict[str, Any]
+    config: Config
+    path: Tuple[str, ...] = ()
+    state: Optional[Future[State]] = None
+    step_dirs: List[str] = field(default_factory=list)
+
+
+@Flow.factory.register()
+class DesignSpaceExploration(Classic):
+    """
+    Runs the steps of the :class:`Classic` flow for a number of points in the
+    design space, each being a set of configuration overrides, then shows
+    chosen metrics for every point in a tabulated format.
+
+    Points are specified using ``DSE_POINTS``, ``DSE_GRID`` or both.
+
+    Executions of steps are shared between points: points form a tree where
+    a step is run only once for all points that have the same configuration
+    for that step and all steps before it, and branches only at the first step
+    where their configurations differ. For example, points that only differ in
+    ``GRT_*`` variables share synthesis, floorplanning and placement. Branches
+    are run in parallel.
+
+    Steps that raise deferred errors do not stop the exploration of the points
+    that share them, but mark these points as failed.
+
+    The results are also written to ``summary.rpt`` and ``exploration.json``
+    in the run directory, the latter including the step directories for each
+    point.
+
+    Other sequential flows' steps may be explored by subclassing this flow and
+    overriding :attr:`Steps`, :attr:`gating_config_vars` and
+    :attr:`config_vars` accordingly.
+    """
+
+    config_vars = Classic.config_vars + [
+        Variable(
+            "DSE_POINTS",
+            Optional[List[Dict[str, OverrideValue]]],
+            "A list of points to explore, each a dictionary of configuration variables to override.",
+        ),
+        Variable(
+            "DSE_GRID",
+            Optional[Dict[str, List[OverrideValue]]],
+            "A dictionary of configuration variables to lists of values. Every combination of these values is explored as a point, in addition to those in DSE_POINTS.",
+        ),
+        Variable(
+            "DSE_METRICS",
+            List[str],
+            "The metrics to compare the points by.",
+            default=[
+                "design__instance__count",
+                "design__instance__area",
+                "design__instance__utilization",
+                "timing__setup__ws",
+                "timing__hold__ws",
+                "route__wirelength",
+                "route__drc_errors",
+                "power__total",
+            ],
+        ),
+    ]
+
+    def __get_points(self) -> List[Dict[str, Any]]:
+        points: List[Dict[str, Any]] = list(self.config["DSE_POINTS"] or [])
+        if grid := self.config["DSE_GRID"]:
+            keys = list(grid.keys())
+            for values in itertools.product(*[grid[key] for key in keys]):
+                points.append(dict(zip(keys, values)))
+        if len(points) == 0:
+            raise FlowException("No points to explore: set DSE_POINTS or DSE_GRID.")
+
+        variables = {
+            variable.name: variable for variable in self.get_all_config_variables()
+        }
+        for point in points:
+            for key in point:
+                if key not in variables:
+                    raise FlowException(
+                        f"Unknown configuration variable '{key}' in exploration point {point}."
+                    )
+                if key.startswith("DSE_"):
+                    raise FlowException(
+                        f"Exploration variable '{key}' cannot be overridden by a point."
+                    )
+
+        # Like --override-config, values are validated and coerced to the types
+        # of their variables, so points are checked before anything is run
+        validated: List[Dict[str, Any]] = []
+        for point in points:
+            warnings: List[str] = []
+            errors: List[str] = []
+            overrides: Dict[str, Any] = {}
+            for key, value in point.items():
+                try:
+                    _, overrides[key] = variables[key].compile(
+                        GenericDict({key: value}),
+                        warnings,
+                        values_so_far=self.config,
+                        permissive_typing=True,
+                    )
+                except ValueError as e:
+                    errors.append(str(e))
+            for warning in warnings:
+                warn(warning)
+            if len(errors):
+                raise FlowException(
+                    f"Invalid exploration point {point}: " + " ".join(errors)
+                )
+            validated.append(overrides)
+        return validated
+
+    def run(
+        self,
+        initial_state: State,
+        frm: Optional[str] = None,
+        to: Optional[str] = None,
+        skip: Optional[Iterable[str]] = None,
+        reproducible: Optional[str] = None,
+        auto_resume: bool = False,
+        **kwargs,
+    ) -> Tuple[State, List[Step]]:
+        assert self.run_dir is not None
+        if frm or to or skip or reproducible or auto_resume:
+            raise FlowException(
+                f"Flow control options are not supported by the '{self.name}' flow."
+            )
+        step_list: List[Step] = []
+        points = [
+            _Point(overrides, self.config.copy(**overrides))
+            for overrides in self.__get_points()
+        ]
+
+        self.progress_bar.set_max_stage_count(1)
+        self.progress_bar.start_stage("Design Space Exploration")
+        condensed_mode_bk = options.get_condensed_mode()
+        options.set_condensed_mode(True)
+        try:
+            initial_future: Future[State] = Future()
+            initial_future.set_result(initial_state)
+            for point in points:
+                point.state = initial_future
+
+            gating_cvars = self._expand_gating_config_vars()
+            # Maps paths in the tree to the futures and directories of the steps
+            # at these paths
+            nodes: Dict[Tuple[str, ...], Tuple[Future[State], str]] = {}
+            deferred_errors: Dict[Tuple[str, ...], str] = {}
+            ordinal = 0
+
+            # All points are advanced one step at a time, so the steps of parallel
+            # branches are queued for execution alongside one another
+            for cls in self.Steps:
+                for point in points:
+                    if any(
+                        not point.config[var] for var in gating_cvars.get(cls.id, [])
+                    ):
+                        continue
+                    step = cls(config=point.config, state_in=point.state)
+                    point.path = point.path + (self.__key(step),)
+                    if point.path not in nodes:
+                        ordinal += 1
+                        step_dir = os.path.join(
+                            self.run_dir, f"{ordinal}-{slugify(step.id)}"
+                        )
+                        future = self.__pass_deferred(
+                            step,
+                            self.start_step_async(step, step_dir=step_dir),
+                            point.path,
+                            deferred_errors,
+                        )
+                        nodes[point.path] = (future, step_dir)
+                        step_list.append(step)
+                    point.state, step_dir = nodes[point.path]
+                    point.step_dirs.append(step_dir)
+
+            results: List[Dict[str, Any]] = []
+            for point in points:
+                assert point.state is not None
+                result: Dict[str, Any] = {
+                    "overrides": point.overrides,
+                    "status": "passed",
+                    "errors": [],
+                    "metrics": {},
+                    "step_dirs": [
+                        os.path.relpath(step_dir, self.run_dir)
+                        for step_dir in point.step_dirs
+                    ],
+                }
+                try:
+                    state = point.state.result()
+                    for metric in self.config["DSE_METRICS"]:
+                        if metric in state.metrics:
+                            result["metrics"][metric] = state.metrics[metric]
+                except StepError as e:
+                    result["status"] = "failed"
+                    result["errors"].append(str(e))
+                for i in range(1, len(point.path) + 1):
+                    if error := deferred_errors.get(point.path[:i]):
+                        result["status"] = "failed"
+                        result["errors"].append(error)
+                results.append(result)
+        finally:
+            options.set_condensed_mode(condensed_mode_bk)
+        self.progress_bar.end_stage()
+
+        self.__report(results)
+        with open(
+            os.path.join(self.run_dir, "exploration.json"), "w", encoding="utf8"
+        ) as f:
+            json.dump(results, f, cls=GenericDictEncoder, indent=4)
+
+        if all(result["status"] == "failed" for result in results):
+            raise FlowError("All explored points have failed.")
+
+        success("Flow complete.")
+        return (initial_state, step_list)
+
+    @staticmethod
+    def __key(step: Step) -> str:
+        # Points may gate different steps, so different steps can be at the
+        # same depth of the tree
+        config = json.dumps(
+            step.config.to_raw_dict(include_meta=False),
+            cls=GenericDictEncoder,
+            sort_keys=True,
+        )
+        return f"{step.id}:{config}"
+
+    @staticmethod
+    def __pass_deferred(
+        step: Step,
+        future: Future[State],
+        path: Tuple[str, ...],
+        deferred_errors: Dict[Tuple[str, ...], str],
+    ) -> Future[State]:
+        # Like SequentialFlow, steps after one with a deferred error continue
+        # from its input state
+        result: Future[State] = Future()
+
+        def done(future: Future[State]):
+            try:
+                result.set_result(future.result())
+            except DeferredStepError as e:
+                deferred_errors[path] = str(e)
+                result.set_result(step.state_in.result())
+            except BaseException as e:
+                result.set_exception(e)
+
+        future.add_done_callback(done)
+        return result
+
+    def __report(self, results: List[Dict[str, Any]]):
+        assert self.run_dir is not None
+        table = rich.table.Table()
+        table.add_column("#")
+        table.add_column("Overrides")
+        table.add_column("Status")
+        for metric in self.config["DSE_METRICS"]:
+            table.add_column(metric)
+        for i, result in enumerate(results):
+            overrides = ", ".join(
+                f"{key}={value}" for key, value in result["overrides"].items()
+            )
+            status = "[green]Passed" if result["status"] == "passed" else "[red]Failed"
+            table.add_row(
+                str(i),
+                overrides,
+                status,
+                *[
+                    str(result["metrics"].get(metric, "N/A"))
+                    for metric in self.config["DSE_METRICS"]
+                ],
+            )
+
+        console.print(table)
+        with open(os.path.join(self.run_dir, "summary.rpt"), "w", encoding="utf8") as f:
+            rich.console.Console(file=f, width=160).print(table)
@@ -14,6 +14,7 @@
 from __future__ import annotations
 import os
 import glob
+import json
 import shutil
 import fnmatch
 import logging
@@ -36,6 +37,8 @@ from typing import (
     Union,
 )
 
+import rich.table
+import rich.console
 from rich.progress import (
     Progress,
     TextColumn,
@@ -49,10 +52,13 @@ from librelane.common.types import Path
 
 from ..config import Config, Variable, universal_flow_config_variables, AnyConfigs
 from ..state import State, DesignFormat
-from ..steps import Step, StepNotFound
+from ..steps import Step, StepNotFound, get_step_executor
+from ..plugins import import_all, import_builtin, is_plugin_override, load_plugins
 from ..logging import (
     LevelFilter,
+    LogLevels,
     console,
+    get_log_level,
     info,
     warn,
     verbose,
@@ -68,6 +74,8 @@ from ..common import (
     slugify,
     Toolbox,
     get_latest_file,
+    format_size,
+    format_elapsed_time,
 )
 
 
@@ -526,6 +534,7 @@ class Flow(ABC):
         _no_load_previous_steps: bool = False,
         *,
         overwrite: bool = False,
+        auto_resume: bool = False,
         **kwargs,
     ) -> State:
         """
@@ -534,7 +543,7 @@ class Flow(ABC):
         :param with_initial_state: An optional initial state object to use.
             If not provided:
 
-            * If resuming a previous run, the latest ``state_out.json`` (by filesystem modification date)
+            * If resuming a previous run without ``auto_resume``, the latest ``state_out.json`` (by filesystem modification date)
 
             * If not, an empty state object is created.
 
@@ -551,6 +560,15 @@ class Flow(ABC):
             also be raised.
         :param overwrite: If true and a run with the desired tag was found, the
             contents will be deleted instead of appended.
+        :param auto_resume: If true and a run with the desired tag was found,
+            steps that concluded in that run with the same configuration and
+            inputs, and whose outputs were not modified since, are not run again
+            and their results are reused. Directories of steps that were
+            interrupted are discarded, and the flow continues from the first
+            step that did not conclude.
+
+            This relies on the run journal written by flows supporting it, such
+            as :class:`SequentialFlow`, and is ignored by other flows.
 
         :returns: ``(success, state_list)``
         """
@@ -619,7 +637,7 @@ class Flow(ABC):
                 except ValueError:
                     continue
 
-                if not _no_load_previous_steps:
+                if not (_no_load_previous_steps or auto_resume):
                     try:
                         self.step_objects.append(
                             Step.load_finished(
@@ -638,7 +656,7 @@ class Flow(ABC):
                 starting_ordinal = max(starting_ordinal, extracted_ordinal + 1)
 
             # Extract Maximum State
-            if with_initial_state is None:
+            if with_initial_state is None and not auto_resume:
                 if latest_json := get_latest_file(self.run_dir, "state_out.json"):
                     verbose(f"Using state at '{latest_json}'.")
 
@@ -680,6 +698,8 @@ class Flow(ABC):
                 self.name, starting_ordinal=starting_ordinal
             )
             self.progress_bar.start()
+            if auto_resume:
+                kwargs["auto_resume"] = True
             final_state, step_objects = self.run(
                 initial_state=initial_state,
                 starting_ordinal=starting_ordinal,
@@ -693,6 +713,14 @@ class Flow(ABC):
             return final_state
         finally:
             self.progress_bar.end()
+            try:
+                self._write_resource_usage()
+            except Exception as e:
+                warn(f"Failed to write the resource usage of the run: {e}")
+            try:
+                self._write_profile()
+            except Exception as e:
+                warn(f"Failed to write the profile of the run: {e}")
             for registered_handlers in handlers:
                 deregister_additional_handler(registered_handlers)
             if len(warning_handler.warnings):
@@ -700,6 +728,209 @@ class Flow(ABC):
                 for record in warning_handler.warnings.values():
                     warn(f"{record}")
 
+    def _write_resource_usage(self):
+        """
+        Aggregates the ``*.process_stats.json`` files written by
+        :meth:`Step.run_subprocess` across the whole run directory into a
+        single ``resource_usage.json`` file at the root of the run directory.
+
+        Subprocesses are sorted by CPU time, descending.
+        """
+        if self.run_dir is None:
+            return
+
+        subprocesses = []
+        for stats_path in glob.glob(
+            os.path.join(self.run_dir, "**", "*.process_stats.json"),
+            recursive=True,
+        ):
+            try:
+                with open(stats_path, encoding="utf8") as f:
+                    summary = json.load(f).get("summary")
+            except (OSError, ValueError):
+                continue
+            if summary is None:
+                # Written by an older version of LibreLane
+                continue
+            subprocesses.append(
+                {
+                    "path": os.path.relpath(stats_path, self.run_dir),
+                    **summary,
+                }
+            )
+        if len(subprocesses) == 0:
+            return
+        subprocesses.sort(key=lambda x: x["cpu_time"], reverse=True)
+
+        runtime = sum(entry["runtime"] for entry in subprocesses)
+        cpu_time = sum(entry["cpu_time"] for entry in subprocesses)
+        total = {
+            "subprocess_count": len(subprocesses),
+            "runtime": runtime,
+            "cpu_time": cpu_time,
+            "cpu_utilization": cpu_time / runtime if runtime > 0 else 0.0,
+            "peak_memory_rss": max(entry["peak_memory_rss"] for entry in subprocesses),
+            "peak_threads": max(entry["peak_threads"] for entry in subprocesses),
+            "read_bytes": sum(entry["read_bytes"] for entry in subprocesses),
+            "write_bytes": sum(entry["write_bytes"] for entry in subprocesses),
+        }
+        with open(
+            os.path.join(self.run_dir, "resource_usage.json"), "w", encoding="utf8"
+        ) as f:
+            json.dump({"total": total, "subprocesses": subprocesses}, f, indent=4)
+
+    __profile_keys = ["id", "status", "start", "end", "pid", "thread", "thread_id"]
+    __subprocess_keys = ["command", "start", "end", "cpu_time", "peak_memory_rss"]
+
+    def _write_profile(self, top: int = 10):
+        """
+        Collects the ``profile.json`` files written by :meth:`Step.start` in
+        the step directories of the run and writes:
+
+        * ``profile.json`` at the root of the run directory in the
+          `Chrome Trace Event format <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_,
+          which may be opened using ``chrome://tracing`` or
+          `Perfetto <https://ui.perfetto.dev>`_. Steps are shown on the thread
+          they ran on, and subprocesses are nested under their steps.
+        * ``profile.rpt``, tables of the steps with the highest wall and CPU
+          times, which are also printed if the log level is ``VERBOSE`` or
+          lower.
+
+        :param top: The number of steps to include in each table
+        """
+        if self.run_dir is None:
+            return
+
+        run_profile_path = os.path.join(self.run_dir, "profile.json")
+        profiles = []
+        for entry in os.listdir(self.run_dir):
+            ordinal = entry.split("-", maxsplit=1)[0]
+            if not ("-" in entry and ordinal.isdigit()):
+                continue
+            profile_path = os.path.join(self.run_dir, entry, "profile.json")
+            try:
+                with open(profile_path, encoding="utf8") as f:
+                    profile = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(profile, dict) or any(
+                key not in profile for key in self.__profile_keys
+            ):
+                continue
+            profile["subprocesses"] = [
+                sp
+                for sp in profile.get("subprocesses") or []
+                if isinstance(sp, dict)
+                and all(key in sp for key in self.__subprocess_keys)
+            ]
+            profile["step_dir"] = entry
+            profile["cpu_time"] = sum(sp["cpu_time"] for sp in profile["subprocesses"])
+            profiles.append(profile)
+        if len(profiles) == 0:
+            return
+
+        def us(timestamp: float) -> float:
+            return round((timestamp - epoch) * 1e6, 3)
+
+        epoch = min(profile["start"] for profile in profiles)
+        events: List[dict] = []
+        threads_seen = set()
+        for profile in sorted(profiles, key=lambda x: x["start"]):
+            pid, tid = profile["pid"], profile["thread_id"]
+            if (pid, tid) not in threads_seen:
+                threads_seen.add((pid, tid))
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": tid,
+                        "args": {"name": profile["thread"]},
+                    }
+                )
+            events.append(
+                {
+                    "name": profile["id"],
+                    "cat": "step",
+                    "ph": "X",
+                    "ts": us(profile["start"]),
+                    "dur": us(profile["end"]) - us(profile["start"]),
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {
+                        "status": profile["status"],
+                        "step_dir": profile["step_dir"],
+                        "cpu_time": profile["cpu_time"],
+                    },
+                }
+            )
+            for sp in profile["subprocesses"]:
+                events.append(
+                    {
+                        "name": sp["command"],
+                        "cat": "subprocess",
+                        "ph": "X",
+                        "ts": us(sp["start"]),
+                        "dur": us(sp["end"]) - us(sp["start"]),
+                        "pid": pid,
+                        "tid": tid,
+                        "args": {
+                            k: sp[k]
+                            for k in sp
+                            if k not in ["command", "start", "end", "log_path"]
+                        },
+                    }
+                )
+        for pid in set(pid for pid, _ in threads_seen):
+            events.append(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "args": {"name": self.name},
+                }
+            )
+        with open(run_profile_path, "w", encoding="utf8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+        tables = []
+        for title, key in [("Wall Time", "wall_time"), ("CPU Time", "cpu_time")]:
+            table = rich.table.Table(title=f"Top Steps by {title}")
+            table.add_column("Step")
+            table.add_column("Wall Time")
+            table.add_column("CPU Time")
+            table.add_column("Subprocesses")
+            table.add_column("Peak Memory (RSS)")
+            table.add_column("Status")
+            for profile in profiles:
+                profile["wall_time"] = profile["end"] - profile["start"]
+            for profile in sorted(profiles, key=lambda x: x[key], reverse=True)[:top]:
+                subprocesses = profile["subprocesses"]
+                peak_rss = max(
+                    (sp["peak_memory_rss"] for sp in subprocesses), default=0
+                )
+                table.add_row(
+                    profile["step_dir"],
+                    format_elapsed_time(profile["wall_time"]),
+                    format_elapsed_time(profile["cpu_time"]),
+                    str(len(subprocesses)),
+                    format_size(int(peak_rss)),
+                    (
+                        profile["status"]
+                        if profile["status"] == "success"
+                        else f"[red]{profile['status']}"
+                    ),
+                )
+            tables.append(table)
+
+        with open(os.path.join(self.run_dir, "profile.rpt"), "w", encoding="utf8") as f:
+            file_console = rich.console.Console(file=f, width=160)
+            for table in tables:
+                file_console.print(table)
+        if get_log_level() <= LogLevels.VERBOSE:
+            for table in tables:
+                console.print(table)
+
     @protected
     @abstractmethod
     def run(
@@ -753,16 +984,25 @@ class Flow(ABC):
                 step_dir=self.dir_for_step(step),
             )
 
+        If a :class:`librelane.steps.StepExecutor` accepting the step is set
+        using :func:`librelane.steps.set_step_executor`, the step is submitted to
+        it instead.
 
         See :meth:`Step.start` for more info.
 
         :param step: The step object to run
         :param args: Arguments to `step.start`
-        :param kwargs: Keyword arguments to `step.start`
+        :param kwargs: Keyword arguments to `step.start`. If ``step_dir`` is
+            passed, it is used instead of :meth:`dir_for_step`.
         """
 
         kwargs["toolbox"] = self.toolbox
-        kwargs["step_dir"] = self.dir_for_step(step)
+        if kwargs.get("step_dir") is None:
+            kwargs["step_dir"] = self.dir_for_step(step)
+
+        executor = get_step_executor()
+        if executor is not None and executor.accepts(step):
+            return executor.submit(step, *args, **kwargs).result()
 
         return step.start(*args, **kwargs)
 
@@ -785,7 +1025,12 @@ class Flow(ABC):
         """
 
         kwargs["toolbox"] = self.toolbox
-        kwargs["step_dir"] = self.dir_for_step(step)
+        if kwargs.get("step_dir") is None:
+            kwargs["step_dir"] = self.dir_for_step(step)
+
+        executor = get_step_executor()
+        if executor is not None and executor.accepts(step):
+            return executor.submit(step, *args, **kwargs)
 
         return get_tpe().submit(step.start, *args, **kwargs)
 
@@ -1026,7 +1271,9 @@ class Flow(ABC):
                 name = cls.__name__
                 if registered_name is not None:
                     name = registered_name
-                Self.__registry[name] = cls
+                existing = Self.__registry.get(name)
+                if existing is None or not is_plugin_override(existing, cls):
+                    Self.__registry[name] = cls
                 return cls
 
             return decorator
@@ -1036,8 +1283,16 @@ class Flow(ABC):
             """
             Retrieves a Flow type from the registry using a lookup string.
 
+            Plugins are loaded first, so they may override built-in flows.
+            Built-in flows that have not been registered yet are then imported
+            using the registry manifest.
+
             :param name: The registered name of the Flow. Case-sensitive.
             """
+            load_plugins()
+            if found := Self.__registry.get(name):
+                return found
+            import_builtin("flows", name)
             return Self.__registry.get(name)
 
         @classmethod
@@ -1045,6 +1300,7 @@ class Flow(ABC):
             """
             :returns: A list of strings representing all registered flows.
             """
+            import_all("flows")
             return list(Self.__registry.keys())
 
     factory = FlowFactory
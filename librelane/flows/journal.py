@@ -0,0 +1,243 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+import time
+import shutil
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..common import GenericDictEncoder, Path
+from ..logging import debug, verbose, warn
+from ..state import State
+from ..steps import Step
+
+
+def _hash_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _hash_str(string: str) -> str:
+    return hashlib.sha256(string.encode("utf8")).hexdigest()
+
+
+class RunJournal(object):
+    """
+    A write-ahead journal of the steps run in a run directory, stored as
+    ``journal.jsonl`` at its root.
+
+    A ``started`` record is appended before each step starts and a
+    ``finished`` record once the step's ``state_out.json`` has been written,
+    holding the content hashes of the state and of all files the step created
+    in its directory. Each record is flushed to disk before the flow proceeds,
+    so after a crash or an interruption, the journal can tell apart steps that
+    concluded from those that did not, and whether the outputs of the former
+    were modified since.
+
+    A truncated final record, i.e., one that was being written when the run
+    was interrupted, is ignored.
+
+    :param run_dir: The run directory.
+    """
+
+    filename = "journal.jsonl"
+
+    def __init__(self, run_dir: str):
+        self.run_dir = run_dir
+        self.path = os.path.join(run_dir, self.filename)
+
+    def read(self) -> List[Dict[str, Any]]:
+        """
+        :returns: The records of the journal in the order they were written.
+        """
+        records = []
+        try:
+            with open(self.path, encoding="utf8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        debug(f"Ignoring truncated record in '{self.path}'.")
+        except FileNotFoundError:
+            pass
+        return records
+
+    def __append(self, record: Dict[str, Any]):
+        record["time"] = time.time()
+        with open(self.path, "a", encoding="utf8") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def fingerprint(step: Step) -> Dict[str, str]:
+        """
+        :returns: Hashes of the configuration and the input state of a step
+            object, which must match for previous results to be reused.
+        """
+        config = step.config.to_raw_dict()
+        return {
+            "config": _hash_str(
+                json.dumps(config, cls=GenericDictEncoder, sort_keys=True)
+            ),
+            "state_in": _hash_str(step.state_in.result().dumps()),
+        }
+
+    def started(self, step: Step, step_dir: str):
+        """
+        Records that a step object is about to start in ``step_dir``.
+        """
+        self.__append(
+            {
+                "event": "started",
+                "step": step.id,
+                "step_dir": os.path.relpath(step_dir, self.run_dir),
+                **self.fingerprint(step),
+            }
+        )
+
+    def finished(self, step: Step):
+        """
+        Records that a step object has concluded, hashing its outputs.
+        """
+        assert step.step_dir is not None and step.state_out is not None
+        step_dir = os.path.abspath(step.step_dir)
+        outputs = {}
+        for path in self.__get_created_files(step.state_out, step_dir):
+            outputs[os.path.relpath(path, self.run_dir)] = self.__describe(path)
+        self.__append(
+            {
+                "event": "finished",
+                "step": step.id,
+                "step_dir": os.path.relpath(step_dir, self.run_dir),
+                **self.fingerprint(step),
+                "state_out": _hash_file(os.path.join(step_dir, "state_out.json")),
+                "outputs": outputs,
+            }
+        )
+
+    @staticmethod
+    def __get_created_files(state: State, step_dir: str) -> Iterable[str]:
+        paths: List[str] = []
+
+        def visitor(key, value, top_key, save_directory, depth):
+            if isinstance(value, Path):
+                path = os.path.abspath(value)
+                if path.startswith(step_dir + os.sep):
+                    paths.append(path)
+
+        state._walk(state, "", visitor)
+        return sorted(set(paths))
+
+    @staticmethod
+    def __describe(path: str) -> Dict[str, Any]:
+        stat = os.stat(path)
+        return {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": _hash_file(path),
+        }
+
+    def __verify(self, record: Dict[str, Any]) -> bool:
+        step_dir = os.path.join(self.run_dir, record["step_dir"])
+        try:
+            if _hash_file(os.path.join(step_dir, "state_out.json")) != record.get(
+                "state_out"
+            ):
+                return False
+            for path, expected in record.get("outputs", {}).items():
+                path = os.path.join(self.run_dir, path)
+                stat = os.stat(path)
+                if stat.st_size != expected["size"]:
+                    return False
+                if stat.st_mtime_ns == expected["mtime_ns"]:
+                    # Unchanged since it was hashed
+                    continue
+                if _hash_file(path) != expected["sha256"]:
+                    return False
+        except OSError:
+            return False
+        return True
+
+    def get_finished(self, step: Step) -> Optional[str]:
+        """
+        Finds a previous run of a step object with the same configuration and
+        input state whose outputs are intact.
+
+        Files with the same size and modification time they had when recorded
+        are not hashed again.
+
+        :returns: The step directory of the latest such run, if one exists.
+        """
+        fingerprint = self.fingerprint(step)
+        for record in reversed(self.read()):
+            if record.get("event") != "finished" or record.get("step") != step.id:
+                continue
+            if any(record.get(key) != value for key, value in fingerprint.items()):
+                continue
+            if self.__verify(record):
+                return os.path.join(self.run_dir, record["step_dir"])
+            verbose(
+                f"Outputs of '{step.id}' in '{record['step_dir']}' were modified or removed."
+            )
+        return None
+
+    def get_unfinished(self, step: Step) -> Optional[str]:
+        """
+        Finds a previous run of a step object with the same configuration and
+        input state that started but never concluded, e.g. due to an
+        interruption.
+
+        :returns: The step directory of the latest such run, if it still exists.
+        """
+        fingerprint = self.fingerprint(step)
+        unfinished = self.__get_unfinished_records()
+        for record in reversed(unfinished):
+            if record.get("step") != step.id:
+                continue
+            if any(record.get(key) != value for key, value in fingerprint.items()):
+                continue
+            step_dir = os.path.join(self.run_dir, record["step_dir"])
+            if os.path.isdir(step_dir):
+                return step_dir
+        return None
+
+    def __get_unfinished_records(self) -> List[Dict[str, Any]]:
+        started: Dict[str, Dict[str, Any]] = {}
+        for record in self.read():
+            step_dir = record["step_dir"]
+            if record.get("event") == "started":
+                started[step_dir] = record
+            elif record.get("event") == "finished":
+                started.pop(step_dir, None)
+        return list(started.values())
+
+    def discard_unfinished(self, keep: Iterable[str] = ()):
+        """
+        Deletes the directories of steps that started but never concluded.
+
+        :param keep: IDs of steps whose directories are to be kept regardless.
+        """
+        keep_set = set(keep)
+        for record in self.__get_unfinished_records():
+            if record.get("step") in keep_set:
+                continue
+            step_dir = os.path.join(self.run_dir, record["step_dir"])
+            if os.path.isdir(step_dir):
+                warn(f"Discarding incomplete step directory '{record['step_dir']}'…")
+                shutil.rmtree(step_dir)
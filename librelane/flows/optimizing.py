@@ -13,22 +13,32 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import List, Tuple
-from concurrent.futures import Future
+import os
+from decimal import Decimal
+from typing import Dict, List, Optional, Set, Tuple
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, wait
 
-from .flow import Flow
+import rich
+import rich.table
+
+from .flow import Flow, FlowError, FlowException
+from .pruning import Pruner, pruning_variables
 from ..state import State
-from ..config import Config
+from ..config import Variable
 from ..steps import Step, Yosys, OpenROAD, StepError
-from ..logging import get_log_level, set_log_level, LogLevels, success, info
+from ..logging import get_log_level, set_log_level, LogLevels, success, info, console
 
 
 #   "Optimizing" is a custom demo flow to show what's possible with non-sequential Flows in LibreLan
 #   It works across two steps:
 #   * The Synthesis Exploration - tries multiple synthesis strategies in *parallel*.
-#       The best-performing strategy in terms of minimizing the area makes it to the next stage.
-#   * Floorplanning and Placement - tries FP and placement with a high utilization.
-#       If the high utilization fails, a lower is fallen back to as a suggestion.
+#       Strategies violating EXPLORE_CONSTRAINTS or dominated by another in
+#       terms of EXPLORE_OBJECTIVES are cancelled early, and the Pareto-optimal
+#       strategy that is best in the first objective makes it to the next stage.
+#   * Floorplanning and Placement - tries FP and placement with a number of
+#       core utilizations in *parallel*. The highest utilization that succeeds
+#       makes it to the output, and attempts at lower utilizations are cancelled
+#       as soon as a higher one succeeds.
 @Flow.factory.register()
 class Optimizing(Flow):
     Steps = [
@@ -40,6 +50,16 @@ class Optimizing(Flow):
         OpenROAD.GlobalPlacement,
     ]
 
+    config_vars = [
+        Variable(
+            "FP_CORE_UTIL_SWEEP",
+            List[Decimal],
+            "The core utilizations to attempt floorplanning and placement with, in percent. The highest one for which global placement succeeds is used.",
+            default=[99, 90, 80, 70, 60, 50, 40],
+        ),
+        *pruning_variables,
+    ]
+
     def run(
         self,
         initial_state: State,
@@ -49,131 +69,217 @@ class Optimizing(Flow):
 
         self.set_max_stage_count(2)
 
-        synthesis_futures: List[Tuple[Config, Future[State]]] = []
+        pruner = Pruner.from_config(self.config)
         self.start_stage("Synthesis Exploration")
 
         log_level_bk = get_log_level()
         set_log_level(LogLevels.ERROR)
-
-        for strategy in ["AREA 0", "AREA 2", "DELAY 1"]:
-            config = self.config.copy(SYNTH_STRATEGY=strategy)
-
-            synth_step = Yosys.Synthesis(
-                config,
-                id=f"synthesis-{strategy}",
+        try:
+            # The design is elaborated once, then all strategies start from the
+            # elaborated RTLIL checkpoint
+            elaboration_step = Yosys.Synthesis(
+                self.config.copy(
+                    SYNTH_ELABORATE_ONLY=True,
+                    YOSYS_ELABORATION_CHECKPOINT=True,
+                ),
+                id="elaboration",
+                long_name="Elaboration",
                 state_in=initial_state,
                 flow=self,
             )
-            synth_future = self.start_step_async(synth_step)
-            step_list.append(synth_step)
+            elaboration_future = self.start_step_async(elaboration_step)
+            step_list.append(elaboration_step)
 
-            sdc_step = OpenROAD.CheckSDCFiles(
-                config,
-                id=f"sdc-{strategy}",
-                state_in=synth_future,
-                flow=self,
-            )
-            sdc_future = self.start_step_async(sdc_step)
-            step_list.append(sdc_step)
+            for strategy in ["AREA 0", "AREA 2", "DELAY 1"]:
+                config = self.config.copy(
+                    SYNTH_STRATEGY=strategy,
+                    YOSYS_ELABORATION_CHECKPOINT=True,
+                )
 
-            sta_step = OpenROAD.STAPrePNR(
-                config,
-                state_in=sdc_future,
-                id=f"sta-{strategy}",
-                flow=self,
-            )
+                synth_step = Yosys.Synthesis(
+                    config,
+                    id=f"synthesis-{strategy}",
+                    state_in=elaboration_future,
+                    flow=self,
+                )
+                synth_future = self.start_step_async(synth_step)
+                step_list.append(synth_step)
+
+                sdc_step = OpenROAD.CheckSDCFiles(
+                    config,
+                    id=f"sdc-{strategy}",
+                    state_in=synth_future,
+                    flow=self,
+                )
+                sdc_future = self.start_step_async(sdc_step)
+                step_list.append(sdc_step)
+
+                sta_step = OpenROAD.STAPrePNR(
+                    config,
+                    state_in=sdc_future,
+                    id=f"sta-{strategy}",
+                    flow=self,
+                )
 
-            step_list.append(sta_step)
-            sta_future = self.start_step_async(sta_step)
+                step_list.append(sta_step)
+                sta_future = self.start_step_async(sta_step)
 
-            synthesis_futures.append((config, sta_future))
+                pruner.add_branch(
+                    strategy,
+                    [
+                        (synth_step, synth_future),
+                        (sdc_step, sdc_future),
+                        (sta_step, sta_future),
+                    ],
+                )
 
-        synthesis_states: List[Tuple[Config, State]] = [
-            (config, future.result()) for config, future in synthesis_futures
-        ]
+            pruner.wait()
+        finally:
+            set_log_level(log_level_bk)
 
         self.end_stage()
-        set_log_level(log_level_bk)
-
-        min_strat = synthesis_states[0][0]["SYNTH_STRATEGY"]
-        min_config = synthesis_states[0][0]
-        min_area_state = synthesis_states[0][1]
-        for config, state in synthesis_states[1:]:
-            strategy = config["SYNTH_STRATEGY"]
-            if (
-                state.metrics["design__instance__area"]
-                < min_area_state.metrics["design__instance__area"]
-            ):
-                min_area_state = state
-                min_strat = strategy
-                min_config = config
-
-        info(f"Using result from '{min_strat}…")
+
+        assert self.run_dir is not None
+        pruner.write_report(os.path.join(self.run_dir, "pareto.json"))
+        for branch in pruner.branches:
+            info(f"{branch.name}: {pruner.get_status_string(branch)}")
+        best_branch = pruner.get_best()
+        if best_branch is None or best_branch.state is None:
+            raise FlowError(
+                "No synthesis strategy succeeded and satisfied EXPLORE_CONSTRAINTS."
+            )
+        min_strat = best_branch.name
+        min_config = self.config.copy(SYNTH_STRATEGY=min_strat)
+        min_area_state = best_branch.state
+
+        info(f"Using result from '{min_strat}'…")
 
         self.start_stage("Floorplanning and Placement")
 
-        fp_config = min_config.copy(FP_CORE_UTIL=99)
-        fp = OpenROAD.Floorplan(
-            fp_config,
-            state_in=min_area_state,
-            id="fp_highutl",
-            long_name="Floorplanning (High Util)",
-            flow=self,
-        )
-        self.start_step(fp)
-        step_list.append(fp)
+        utilizations = sorted(set(self.config["FP_CORE_UTIL_SWEEP"]), reverse=True)
+        if len(utilizations) == 0:
+            raise FlowException("FP_CORE_UTIL_SWEEP must not be empty.")
+
+        branches: List[Tuple[Decimal, List[Step], Future[State]]] = []
+        set_log_level(LogLevels.ERROR)
         try:
-            io = OpenROAD.IOPlacement(
-                fp_config,
-                state_in=fp.state_out,
-                id="io-highutl",
-                long_name="I/O Placement (High Util)",
-                flow=self,
-            )
-            self.start_step(io)
-            step_list.append(io)
-            gpl = OpenROAD.GlobalPlacement(
-                fp_config,
-                state_in=io.state_out,
-                id="gpl-highutil",
-                long_name="Global Placement (High Util)",
-                flow=self,
-            )
-            self.start_step(gpl)
-            step_list.append(gpl)
-        except StepError:
-            info("High utilization failed- attempting low utilization…")
-            fp_config = min_config.copy(FP_CORE_UTIL=40)
-            fp = OpenROAD.Floorplan(
-                fp_config,
-                state_in=min_area_state,
-                id="fp-lowutl",
-                long_name="Floorplanning (Low Util)",
-                flow=self,
-            )
-            self.start_step(fp)
-            step_list.append(fp)
-            io = OpenROAD.IOPlacement(
-                fp_config,
-                state_in=fp.state_out,
-                id="io-lowutl",
-                long_name="I/O Placement (Low Util)",
-                flow=self,
-            )
-            self.start_step(io)
-            step_list.append(io)
-            gpl = OpenROAD.GlobalPlacement(
-                fp_config,
-                state_in=io.state_out,
-                id="gpl-lowutl",
-                long_name="Global Placement (Low Util)",
-                flow=self,
+            for util in utilizations:
+                fp_config = min_config.copy(FP_CORE_UTIL=util)
+                fp = OpenROAD.Floorplan(
+                    fp_config,
+                    state_in=min_area_state,
+                    id=f"fp-{util}",
+                    long_name=f"Floorplanning ({util}% Util)",
+                )
+                fp_future = self.start_step_async(fp)
+                io = OpenROAD.IOPlacement(
+                    fp_config,
+                    state_in=fp_future,
+                    id=f"io-{util}",
+                    long_name=f"I/O Placement ({util}% Util)",
+                )
+                io_future = self.start_step_async(io)
+                gpl = OpenROAD.GlobalPlacement(
+                    fp_config,
+                    state_in=io_future,
+                    id=f"gpl-{util}",
+                    long_name=f"Global Placement ({util}% Util)",
+                )
+                gpl_future = self.start_step_async(gpl)
+                branches.append((util, [fp, io, gpl], gpl_future))
+
+            # Branches are sorted by descending utilization: once one succeeds,
+            # lower ones can no longer yield a better result and are cancelled,
+            # and once all higher ones have concluded, it is the best result.
+            results: Dict[Decimal, Optional[State]] = {}
+            cancelled: Set[Decimal] = set()
+            best: Optional[Tuple[Decimal, List[Step], State]] = None
+            pending = {future: i for i, (_, _, future) in enumerate(branches)}
+            while len(pending):
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = pending.pop(future)
+                    util, steps, _ = branches[i]
+                    try:
+                        state = future.result()
+                    except (StepError, CancelledError):
+                        results[util] = None
+                        continue
+                    results[util] = state
+                    if best is None or util > best[0]:
+                        best = (util, steps, state)
+                    for lower_util, lower_steps, lower_future in branches[i + 1 :]:
+                        if lower_future not in pending:
+                            continue
+                        cancelled.add(lower_util)
+                        for step in lower_steps:
+                            step.cancel()
+                if best is not None and all(
+                    branches[i][0] < best[0] for i in pending.values()
+                ):
+                    break
+            # Let cancelled branches wind down
+            wait(pending)
+            for future, i in pending.items():
+                try:
+                    results[branches[i][0]] = future.result()
+                except (StepError, CancelledError):
+                    results[branches[i][0]] = None
+        except BaseException:
+            # Do not leave the remaining branches running in the background
+            for _, steps, _ in branches:
+                for step in steps:
+                    step.cancel()
+            raise
+        finally:
+            set_log_level(log_level_bk)
+
+        self.__print_sweep(results, cancelled)
+
+        if best is None:
+            raise FlowError(
+                f"Floorplanning and placement failed at all utilizations: {utilizations}"
             )
-            self.start_step(gpl)
-            step_list.append(gpl)
+        best_util, best_steps, final_state = best
+        info(f"Using result at {best_util}% utilization…")
+        step_list += best_steps
 
         self.end_stage()
 
         success("Flow complete.")
-        assert gpl.state_out is not None  # We should be done with the execution by now
-        return (gpl.state_out, step_list)
+        return (final_state, step_list)
+
+    def __print_sweep(
+        self,
+        results: Dict[Decimal, Optional[State]],
+        cancelled: Set[Decimal],
+    ):
+        table = rich.table.Table()
+        table.add_column("FP_CORE_UTIL")
+        table.add_column("Status")
+        table.add_column("Instance Utilization")
+        table.add_column("Core Area (µm²)")
+        table.add_column("Estimated Wirelength (µm)")
+        best_util = max(
+            (util for util, state in results.items() if state is not None),
+            default=None,
+        )
+        for util in sorted(results, reverse=True):
+            state = results[util]
+            if state is None:
+                status = "[yellow]Cancelled" if util in cancelled else "[red]Failed"
+                table.add_row(str(util), status, "", "", "")
+                continue
+            color = "[green]" if util == best_util else ""
+            table.add_row(
+                f"{color}{util}",
+                f"{color}Passed",
+                str(state.metrics.get("design__instance__utilization", "N/A")),
+                str(state.metrics.get("design__core__area", "N/A")),
+                str(state.metrics.get("route__wirelength__estimated", "N/A")),
+            )
+
+        console.print(table)
+        assert self.run_dir is not None
+        with open(os.path.join(self.run_dir, "summary.rpt"), "w", encoding="utf8") as f:
+            rich.console.Console(file=f, width=160).print(table)
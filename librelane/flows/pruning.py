@@ -0,0 +1,367 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Metric-driven pruning of the branches of exploration flows.
+
+Branches are chains of steps started asynchronously by a flow. As each step of
+a branch concludes, the metrics it publishes are checked against
+user-provided constraints and objectives, and branches that are infeasible or
+dominated by another branch are cancelled before their later steps start.
+
+Constraints and objectives are expressions with the same syntax as ``expr::``
+configuration values, except ``$`` references metrics instead of
+configuration variables, e.g. ``$timing__setup__ws`` or
+``10000 - $design__instance__area``.
+
+A metric is assumed to no longer change in a branch once it is published, so
+only explore steps that do not affect previously published metrics.
+"""
+from __future__ import annotations
+
+import json
+from functools import partial
+from dataclasses import dataclass, field
+from decimal import Decimal
+from threading import Lock
+from concurrent.futures import CancelledError, Future, wait
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from ..state import State
+from ..config import Config, Variable
+from ..config.preprocessor import Expr
+from ..logging import verbose
+from ..steps import Step, StepError
+
+pruning_variables = [
+    Variable(
+        "EXPLORE_OBJECTIVES",
+        Dict[str, Literal["min", "max"]],
+        "A mapping of expressions of metrics, e.g. `$design__instance__area`, to whether they are to be minimized or maximized. A branch that is no better than another in any objective and worse in at least one is dominated. When a single result is used, the Pareto-optimal branch that is best in the first objective is selected, with later objectives breaking ties.",
+        default={"$design__instance__area": "min", "$timing__setup__ws": "max"},
+    ),
+    Variable(
+        "EXPLORE_CONSTRAINTS",
+        Optional[List[str]],
+        "A list of expressions of metrics that must not be negative for a branch to be feasible, e.g. `$timing__setup__ws` to reject branches with setup violations or `5000 - $design__instance__count` to reject branches with more than 5000 instances.",
+    ),
+    Variable(
+        "EXPLORE_PRUNE",
+        bool,
+        "Cancels the remaining steps of branches as soon as they are found to be infeasible or dominated.",
+        default=True,
+    ),
+]
+
+
+def _evaluate(expression: str, metrics: Mapping[str, Any]) -> Optional[Decimal]:
+    for token in Expr.tokenize(expression):
+        if token.type == Expr.Token.Type.VAR and token.value not in metrics:
+            return None
+    return Expr.evaluate(expression, metrics)
+
+
+@dataclass
+class Objective:
+    """
+    :param expression: An expression of metrics.
+    :param maximize: Whether the expression is to be maximized as opposed to
+        minimized.
+    """
+
+    expression: str
+    maximize: bool
+
+    def key(self, value: Decimal) -> Decimal:
+        """
+        :returns: A key that is lower for better values.
+        """
+        return -value if self.maximize else value
+
+
+@dataclass
+class Branch:
+    """
+    A branch of an exploration flow.
+
+    :param name: The name of the branch.
+    :param steps: The steps of the branch and the futures of their output
+        states, in order.
+    :param status: One of ``running``, ``complete``, ``failed``,
+        ``infeasible`` or ``dominated``.
+    :param reason: Why the branch failed, is infeasible or is dominated.
+    :param metrics: The latest metrics published by the branch.
+    :param values: The values of the objectives, once all are available.
+    :param state: The final state of the branch, if all of its steps
+        succeeded.
+    """
+
+    name: str
+    steps: List[Tuple[Step, Future[State]]]
+    status: str = "running"
+    reason: Optional[str] = None
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    values: Optional[Tuple[Decimal, ...]] = None
+    state: Optional[State] = None
+
+    def cancel(self):
+        for step, future in self.steps:
+            if not future.done():
+                step.cancel()
+
+
+class Pruner(object):
+    """
+    Follows the branches of an exploration flow, classifies them using
+    constraints and objectives and, optionally, cancels infeasible and
+    dominated branches.
+
+    :param objectives: A mapping of expressions to ``min`` or ``max``.
+    :param constraints: Expressions that must not be negative.
+    :param prune: Whether to cancel the remaining steps of branches that are
+        infeasible or dominated.
+    """
+
+    def __init__(
+        self,
+        objectives: Mapping[str, Literal["min", "max"]],
+        constraints: Optional[Sequence[str]] = None,
+        prune: bool = True,
+    ) -> None:
+        self.objectives = [
+            Objective(expression, direction == "max")
+            for expression, direction in objectives.items()
+        ]
+        self.constraints = list(constraints or [])
+        self.prune = prune
+        for expression in [*objectives, *self.constraints]:
+            try:
+                Expr.tokenize(expression)
+            except SyntaxError as e:
+                raise ValueError(f"Invalid expression '{expression}': {e}") from None
+
+        self.branches: List[Branch] = []
+        self.__processed: Set[Future[State]] = set()
+        self.__lock = Lock()
+
+    @classmethod
+    def from_config(Self, config: Config) -> "Pruner":
+        """
+        :param config: A configuration with the variables in
+            ``pruning_variables``.
+        """
+        return Self(
+            config["EXPLORE_OBJECTIVES"],
+            config["EXPLORE_CONSTRAINTS"],
+            config["EXPLORE_PRUNE"],
+        )
+
+    def add_branch(
+        self,
+        name: str,
+        steps: Sequence[Tuple[Step, Future[State]]],
+    ) -> Branch:
+        """
+        Starts following a branch.
+
+        :param name: The name of the branch.
+        :param steps: The steps of the branch and the futures of their output
+            states, in order.
+        :returns: The branch object
+        """
+        branch = Branch(name, list(steps))
+        with self.__lock:
+            self.branches.append(branch)
+        for _, future in branch.steps:
+            future.add_done_callback(partial(self.__on_done, branch))
+        return branch
+
+    def wait(self):
+        """
+        Waits for all steps of all branches to conclude, including cancelled
+        ones.
+        """
+        for branch in list(self.branches):
+            wait([future for _, future in branch.steps])
+            # Done callbacks may run after waiters are notified
+            for _, future in branch.steps:
+                self.__on_done(branch, future)
+
+    def __on_done(self, branch: Branch, future: Future[State]):
+        to_cancel: List[Branch] = []
+        with self.__lock:
+            if future in self.__processed:
+                return
+            self.__processed.add(future)
+            try:
+                state = future.result()
+            except (StepError, CancelledError) as e:
+                if branch.status in ["running", "complete"]:
+                    branch.status = "failed"
+                    branch.reason = str(e) or type(e).__name__
+                return
+            branch.metrics = dict(state.metrics)
+            if future is branch.steps[-1][1]:
+                branch.state = state
+                if branch.status == "running":
+                    branch.status = "complete"
+            to_cancel = self.__classify(branch)
+        if not self.prune:
+            return
+        for pruned in to_cancel:
+            verbose(f"Pruning '{pruned.name}': {pruned.reason}.")
+            pruned.cancel()
+
+    def __classify(self, branch: Branch) -> List[Branch]:
+        if branch.status not in ["running", "complete"]:
+            return []
+        try:
+            for constraint in self.constraints:
+                value = _evaluate(constraint, branch.metrics)
+                if value is not None and value < 0:
+                    branch.status = "infeasible"
+                    branch.reason = f"'{constraint}' is {value}"
+                    return [branch]
+            if branch.values is None:
+                values = []
+                for objective in self.objectives:
+                    value = _evaluate(objective.expression, branch.metrics)
+                    if value is None:
+                        return []
+                    values.append(value)
+                branch.values = tuple(values)
+        except (TypeError, ValueError, ArithmeticError) as e:
+            branch.status = "infeasible"
+            branch.reason = f"failed to evaluate an expression: {e}"
+            return [branch]
+
+        others = [
+            other
+            for other in self.branches
+            if other is not branch
+            and other.values is not None
+            and other.status in ["running", "complete"]
+        ]
+        for other in others:
+            if self.dominates(other, branch):
+                branch.status = "dominated"
+                branch.reason = f"dominated by '{other.name}'"
+                return [branch]
+        dominated = []
+        for other in others:
+            if self.dominates(branch, other):
+                other.status = "dominated"
+                other.reason = f"dominated by '{branch.name}'"
+                dominated.append(other)
+        return dominated
+
+    def dominates(self, a: Branch, b: Branch) -> bool:
+        """
+        :returns: Whether branch ``a`` is no worse than branch ``b`` in all
+            objectives and better in at least one.
+        """
+        assert a.values is not None and b.values is not None
+        a_keys = [o.key(v) for o, v in zip(self.objectives, a.values)]
+        b_keys = [o.key(v) for o, v in zip(self.objectives, b.values)]
+        return all(x <= y for x, y in zip(a_keys, b_keys)) and a_keys != b_keys
+
+    def get_pareto_front(self) -> List[Branch]:
+        """
+        :returns: The complete, feasible branches that are not dominated by
+            any other.
+        """
+        candidates = [
+            branch
+            for branch in self.branches
+            if branch.values is not None
+            and branch.state is not None
+            and branch.status in ["complete", "dominated"]
+        ]
+        return [
+            branch
+            for branch in candidates
+            if not any(self.dominates(other, branch) for other in candidates)
+        ]
+
+    def get_best(self) -> Optional[Branch]:
+        """
+        :returns: The branch on the Pareto front that is best in the first
+            objective, with later objectives breaking ties, or ``None`` if no
+            branch is complete and feasible.
+        """
+        front = self.get_pareto_front()
+        if len(front) == 0:
+            return None
+        return min(
+            front,
+            key=lambda branch: [
+                o.key(v) for o, v in zip(self.objectives, branch.values or ())
+            ],
+        )
+
+    def get_status_string(self, branch: Branch) -> str:
+        """
+        :returns: A rich-formatted description of the status of a branch.
+        """
+        if branch in self.get_pareto_front():
+            return "[green]Pareto-optimal"
+        elif branch.status == "dominated":
+            return f"[yellow]Dominated ({branch.reason})"
+        elif branch.status == "infeasible":
+            return f"[yellow]Infeasible ({branch.reason})"
+        elif branch.status == "failed":
+            return "[red]Failed"
+        return branch.status.capitalize()
+
+    def write_report(self, path: str):
+        """
+        Writes the objectives, constraints and the classification of every
+        branch to a JSON file.
+        """
+        front = self.get_pareto_front()
+        report = {
+            "objectives": {
+                o.expression: "max" if o.maximize else "min" for o in self.objectives
+            },
+            "constraints": self.constraints,
+            "pareto_front": [branch.name for branch in front],
+            "branches": [
+                {
+                    "name": branch.name,
+                    "status": branch.status,
+                    "reason": branch.reason,
+                    "pareto_optimal": branch in front,
+                    "values": (
+                        None
+                        if branch.values is None
+                        else {
+                            o.expression: str(v)
+                            for o, v in zip(self.objectives, branch.values)
+                        }
+                    ),
+                }
+                for branch in self.branches
+            ],
+        }
+        with open(path, "w", encoding="utf8") as f:
+            json.dump(report, f, indent=4)
@@ -30,9 +30,10 @@ from deprecated.sphinx import deprecated
 from rapidfuzz import process, fuzz, utils
 
 from .flow import Flow, FlowException, FlowError
+from .journal import RunJournal
 from ..common import Filter
 from ..state import State
-from ..logging import info, success, debug
+from ..logging import info, success, debug, verbose
 from ..steps import (
     Step,
     StepError,
@@ -270,6 +271,21 @@ class SequentialFlow(Flow):
                 target.Steps[i] = step.with_id(id)
             ids_used.add(id)
 
+    def _expand_gating_config_vars(self) -> Dict[str, List[str]]:
+        """
+        :returns: :attr:`gating_config_vars` with wildcards resolved against
+            the IDs of the steps in this flow.
+        """
+        step_ids = [cls.id for cls in reversed(self.Steps)]
+        gating_cvars_expanded: Dict[str, List[str]] = {}
+        for key, value in self.gating_config_vars.items():
+            if key in step_ids:
+                gating_cvars_expanded[key] = value
+                continue
+            for id in Filter([key]).filter(step_ids):
+                gating_cvars_expanded[id] = value
+        return gating_cvars_expanded
+
     def run(
         self,
         initial_state: State,
@@ -277,9 +293,11 @@ class SequentialFlow(Flow):
         to: Optional[str] = None,
         skip: Optional[Iterable[str]] = None,
         reproducible: Optional[str] = None,
+        auto_resume: bool = False,
         **kwargs,
     ) -> Tuple[State, List[Step]]:
         debug(f"Starting run ▶ '{self.run_dir}'")
+        assert self.run_dir is not None
         step_ids = {cls.id.lower(): cls.id for cls in reversed(self.Steps)}
         skipped_ids: List[str] = []
 
@@ -341,13 +359,14 @@ class SequentialFlow(Flow):
         executing = frm is None
         deferred_errors = []
 
-        gating_cvars_expanded: Dict[str, List[str]] = {}
-        for key, value in self.gating_config_vars.items():
-            if key in step_ids.values():
-                gating_cvars_expanded[key] = value
-                continue
-            for id in Filter([key]).filter(step_ids.values()):
-                gating_cvars_expanded[id] = value
+        gating_cvars_expanded = self._expand_gating_config_vars()
+
+        journal = RunJournal(self.run_dir)
+        resuming = auto_resume
+        if auto_resume:
+            journal.discard_unfinished(
+                keep=[cls.id for cls in self.Steps if cls.resumable]
+            )
 
         current_state = initial_state
         for cls in self.Steps:
@@ -377,13 +396,32 @@ class SequentialFlow(Flow):
                     )
                 )
                 break
+            elif resuming and (step_dir := journal.get_finished(step)):
+                info(
+                    f"Reusing the results of step '{step.name}' at '{os.path.relpath(step_dir)}'…"
+                )
+                with open(os.path.join(step_dir, "state_out.json")) as f:
+                    current_state = State.loads(f.read())
+                step.step_dir = step_dir
+                step.state_out = current_state
+                step_list.append(step)
+                increment_ordinal = False
             else:
+                step_kwargs = {}
+                if resuming:
+                    resuming = False
+                    if cls.resumable and (step_dir := journal.get_unfinished(step)):
+                        verbose(
+                            f"Resuming step '{step.name}' at '{os.path.relpath(step_dir)}'…"
+                        )
+                        step_kwargs["step_dir"] = step_dir
                 step_list.append(step)
                 try:
-                    current_state = step.start(
-                        toolbox=self.toolbox,
-                        step_dir=self.dir_for_step(step),
+                    journal.started(
+                        step, step_kwargs.get("step_dir", self.dir_for_step(step))
                     )
+                    current_state = self.start_step(step, **step_kwargs)
+                    journal.finished(step)
                 except StepException as e:
                     raise FlowException(str(e)) from None
                 except DeferredStepError as e:
@@ -396,7 +434,6 @@ class SequentialFlow(Flow):
             if to_resolved and to_resolved == step.id:
                 executing = False
 
-        assert self.run_dir is not None
         debug(f"Run concluded ▶ '{self.run_dir}'")
         final_views_path = os.path.join(self.run_dir, "final")
         try:
@@ -17,15 +17,14 @@ import os
 
 import rich
 import rich.table
-from concurrent.futures import Future
 from typing import Dict, List, Tuple
 
 from .flow import Flow
+from .pruning import Pruner, pruning_variables
 from ..state import State
-from ..config import Config
-from ..logging import success
+from ..logging import info, success
 from ..logging import options, console
-from ..steps import Step, Yosys, OpenROAD, StepError
+from ..steps import Step, Yosys, OpenROAD
 
 
 # "Synthesis Exploration" is a non-seqeuential flow that tries all synthesis
@@ -56,6 +55,11 @@ class SynthesisExploration(Flow):
 
     You can then update your config file with the best ``SYNTH_STRATEGY`` for your
     use-case so it can be used with other flows.
+
+    The strategies on the Pareto front of ``EXPLORE_OBJECTIVES`` are marked in
+    an additional column and listed in ``pareto.json``. Strategies violating
+    ``EXPLORE_CONSTRAINTS`` or dominated by another strategy are cancelled
+    as soon as their metrics show it.
     """
 
     Steps = [
@@ -64,6 +68,8 @@ class SynthesisExploration(Flow):
         OpenROAD.STAPrePNR,
     ]
 
+    config_vars = pruning_variables
+
     def run(
         self,
         initial_state: State,
@@ -73,11 +79,25 @@ class SynthesisExploration(Flow):
 
         self.progress_bar.set_max_stage_count(1)
 
-        synth_futures: List[Tuple[Config, Future[State]]] = []
+        pruner = Pruner.from_config(self.config)
         self.progress_bar.start_stage("Synthesis Exploration")
 
         options.set_condensed_mode(True)
 
+        # The design is elaborated once, then all strategies start from the
+        # elaborated RTLIL checkpoint
+        elaboration_step = Yosys.Synthesis(
+            self.config.copy(
+                SYNTH_ELABORATE_ONLY=True,
+                YOSYS_ELABORATION_CHECKPOINT=True,
+            ),
+            id="elaboration",
+            long_name="Elaboration",
+            state_in=initial_state,
+        )
+        elaboration_future = self.start_step_async(elaboration_step)
+        step_list.append(elaboration_step)
+
         for strategy in [
             "AREA 0",
             "AREA 1",
@@ -89,12 +109,15 @@ class SynthesisExploration(Flow):
             "DELAY 3",
             "DELAY 4",
         ]:
-            config = self.config.copy(SYNTH_STRATEGY=strategy)
+            config = self.config.copy(
+                SYNTH_STRATEGY=strategy,
+                YOSYS_ELABORATION_CHECKPOINT=True,
+            )
 
             synth_step = Yosys.Synthesis(
                 config,
                 id=f"synthesis-{strategy}",
-                state_in=initial_state,
+                state_in=elaboration_future,
             )
             synth_future = self.start_step_async(synth_step)
             step_list.append(synth_step)
@@ -116,34 +139,42 @@ class SynthesisExploration(Flow):
             step_list.append(sta_step)
             sta_future = self.start_step_async(sta_step)
 
-            synth_futures.append((config, sta_future))
+            pruner.add_branch(
+                strategy,
+                [
+                    (synth_step, synth_future),
+                    (sdc_step, sdc_future),
+                    (sta_step, sta_future),
+                ],
+            )
 
+        pruner.wait()
         results: Dict[
             str, Tuple[Decimal, Decimal, Decimal, Decimal, Decimal] | None
         ] = {}
-        for config, future in synth_futures:
-            strategy = config["SYNTH_STRATEGY"]
-            results[strategy] = None
-            try:
-                state = future.result()
-                results[strategy] = (
+        statuses: Dict[str, str] = {}
+        for branch in pruner.branches:
+            results[branch.name] = None
+            statuses[branch.name] = pruner.get_status_string(branch)
+            if state := branch.state:
+                results[branch.name] = (
                     state.metrics["design__instance__count"],
                     state.metrics["design__instance__area"],
                     state.metrics["timing__setup_r2r__ws"],
                     state.metrics["timing__setup__ws"],
                     state.metrics["timing__setup__tns"],
                 )
-            except StepError:
-                pass  # None == failure
         self.progress_bar.end_stage()
         options.set_condensed_mode(False)
 
         successful_results = {k: v for k, v in results.items() if v is not None}
-        min_gates = min(map(lambda x: x[0], successful_results.values()))
-        min_area = min(map(lambda x: x[1], successful_results.values()))
-        max_r2r_slack = max(map(lambda x: x[2], successful_results.values()))
-        max_slack = max(map(lambda x: x[3], successful_results.values()))
-        max_tns = max(map(lambda x: x[4], successful_results.values()))
+        min_gates = min(map(lambda x: x[0], successful_results.values()), default=None)
+        min_area = min(map(lambda x: x[1], successful_results.values()), default=None)
+        max_r2r_slack = max(
+            map(lambda x: x[2], successful_results.values()), default=None
+        )
+        max_slack = max(map(lambda x: x[3], successful_results.values()), default=None)
+        max_tns = max(map(lambda x: x[4], successful_results.values()), default=None)
 
         table = rich.table.Table()
         table.add_column("SYNTH_STRATEGY")
@@ -152,12 +183,14 @@ class SynthesisExploration(Flow):
         table.add_column("Worst R2R Setup Slack (ns)")
         table.add_column("Worst Setup Slack (ns)")
         table.add_column("Total -ve Setup Slack (ns)")
+        table.add_column("Status")
         for key, result in results.items():
-            gates_s = "[red]Failed"
-            area_s = "[red]Failed"
-            r2r_slack_s = "[red]Failed"
-            slack_s = "[red]Failed"
-            tns_s = "[red]Failed"
+            placeholder = "[red]Failed" if statuses[key] == "[red]Failed" else "-"
+            gates_s = placeholder
+            area_s = placeholder
+            r2r_slack_s = placeholder
+            slack_s = placeholder
+            tns_s = placeholder
             if result is not None:
                 gates, area, r2r_slack, slack, tns = result
                 gates_s = f"{'[green]' if gates == min_gates else ''}{gates}"
@@ -167,10 +200,15 @@ class SynthesisExploration(Flow):
                 )
                 slack_s = f"{'[green]' if slack == max_slack else ''}{slack}"
                 tns_s = f"{'[green]' if tns == max_tns else ''}{tns}"
-            table.add_row(key, gates_s, area_s, r2r_slack_s, slack_s, tns_s)
+            table.add_row(
+                key, gates_s, area_s, r2r_slack_s, slack_s, tns_s, statuses[key]
+            )
 
         console.print(table)
         assert self.run_dir is not None
+        pruner.write_report(os.path.join(self.run_dir, "pareto.json"))
+        front = [branch.name for branch in pruner.get_pareto_front()]
+        info(f"Pareto-optimal strategies: {', '.join(front) or 'none'}")
         file_console = rich.console.Console(
             file=open(os.path.join(self.run_dir, "summary.rpt"), "w", encoding="utf8"),
             width=160,
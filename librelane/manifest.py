@@ -0,0 +1,149 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file is generated by .github/scripts/update_manifest.py. Do not edit.
+
+steps = {
+    "Checker.NetlistAssignStatements": "librelane.steps.checker",
+    "Checker.YosysUnmappedCells": "librelane.steps.checker",
+    "Checker.YosysSynthChecks": "librelane.steps.checker",
+    "Checker.TrDRC": "librelane.steps.checker",
+    "Checker.MagicDRC": "librelane.steps.checker",
+    "Checker.IllegalOverlap": "librelane.steps.checker",
+    "Checker.DisconnectedPins": "librelane.steps.checker",
+    "Checker.WireLength": "librelane.steps.checker",
+    "Checker.XOR": "librelane.steps.checker",
+    "Checker.LVS": "librelane.steps.checker",
+    "Checker.PowerGridViolations": "librelane.steps.checker",
+    "Checker.LintErrors": "librelane.steps.checker",
+    "Checker.LintWarnings": "librelane.steps.checker",
+    "Checker.LintTimingConstructs": "librelane.steps.checker",
+    "Checker.KLayoutDRC": "librelane.steps.checker",
+    "Checker.KLayoutDensity": "librelane.steps.checker",
+    "Checker.KLayoutAntenna": "librelane.steps.checker",
+    "Checker.SetupViolations": "librelane.steps.checker",
+    "Checker.MaxCapViolations": "librelane.steps.checker",
+    "Checker.MaxSlewViolations": "librelane.steps.checker",
+    "Checker.HoldViolations": "librelane.steps.checker",
+    "Yosys.JsonHeader": "librelane.steps.pyosys",
+    "Yosys.Synthesis": "librelane.steps.pyosys",
+    "Yosys.Resynthesis": "librelane.steps.pyosys",
+    "Yosys.VHDLSynthesis": "librelane.steps.pyosys",
+    "Yosys.EQY": "librelane.steps.yosys",
+    "OpenROAD.CheckSDCFiles": "librelane.steps.openroad",
+    "OpenROAD.STAMidPNR": "librelane.steps.openroad",
+    "OpenROAD.CheckMacroInstances": "librelane.steps.openroad",
+    "OpenROAD.STAPrePNR": "librelane.steps.openroad",
+    "OpenROAD.STAPostPNR": "librelane.steps.openroad",
+    "OpenROAD.Floorplan": "librelane.steps.openroad",
+    "OpenROAD.PadRing": "librelane.steps.openroad",
+    "OpenROAD.IOPlacement": "librelane.steps.openroad",
+    "OpenROAD.TapEndcapInsertion": "librelane.steps.openroad",
+    "OpenROAD.UnplaceAll": "librelane.steps.openroad",
+    "OpenROAD.GeneratePDN": "librelane.steps.openroad",
+    "OpenROAD.GlobalPlacement": "librelane.steps.openroad",
+    "OpenROAD.GlobalPlacementSkipIO": "librelane.steps.openroad",
+    "OpenROAD.DetailedPlacement": "librelane.steps.openroad",
+    "OpenROAD.CheckAntennas": "librelane.steps.openroad",
+    "OpenROAD.GlobalRouting": "librelane.steps.openroad",
+    "OpenROAD.RepairAntennas": "librelane.steps.openroad",
+    "OpenROAD.DetailedRouting": "librelane.steps.openroad",
+    "OpenROAD.LayoutSTA": "librelane.steps.openroad",
+    "OpenROAD.FillInsertion": "librelane.steps.openroad",
+    "OpenROAD.RCX": "librelane.steps.openroad",
+    "OpenROAD.IRDropReport": "librelane.steps.openroad",
+    "OpenROAD.CutRows": "librelane.steps.openroad",
+    "OpenROAD.WriteCDL": "librelane.steps.openroad",
+    "OpenROAD.CTS": "librelane.steps.openroad",
+    "OpenROAD.RepairDesignPostGPL": "librelane.steps.openroad",
+    "OpenROAD.RepairDesign": "librelane.steps.openroad",
+    "OpenROAD.RepairDesignPostGRT": "librelane.steps.openroad",
+    "OpenROAD.ResizerTimingPostCTS": "librelane.steps.openroad",
+    "OpenROAD.ResizerTimingPostGRT": "librelane.steps.openroad",
+    "OpenROAD.DEFtoODB": "librelane.steps.openroad",
+    "OpenROAD.OpenGUI": "librelane.steps.openroad",
+    "OpenROAD.DumpRCValues": "librelane.steps.openroad",
+    "Odb.CheckMacroAntennaProperties": "librelane.steps.odb",
+    "Odb.CheckDesignAntennaProperties": "librelane.steps.odb",
+    "Odb.ApplyDEFTemplate": "librelane.steps.odb",
+    "Odb.SetPowerConnections": "librelane.steps.odb",
+    "Odb.WriteVerilogHeader": "librelane.steps.odb",
+    "Odb.ManualMacroPlacement": "librelane.steps.odb",
+    "Odb.ReportWireLength": "librelane.steps.odb",
+    "Odb.ReportNetStatistics": "librelane.steps.odb",
+    "Odb.ReportDisconnectedPins": "librelane.steps.odb",
+    "Odb.AddRoutingObstructions": "librelane.steps.odb",
+    "Odb.RemoveRoutingObstructions": "librelane.steps.odb",
+    "Odb.AddPDNObstructions": "librelane.steps.odb",
+    "Odb.RemovePDNObstructions": "librelane.steps.odb",
+    "Odb.CustomIOPlacement": "librelane.steps.odb",
+    "Odb.PortDiodePlacement": "librelane.steps.odb",
+    "Odb.DiodesOnPorts": "librelane.steps.odb",
+    "Odb.FuzzyDiodePlacement": "librelane.steps.odb",
+    "Odb.HeuristicDiodeInsertion": "librelane.steps.odb",
+    "Odb.CellFrequencyTables": "librelane.steps.odb",
+    "Odb.ManualGlobalPlacement": "librelane.steps.odb",
+    "Odb.InsertECOBuffers": "librelane.steps.odb",
+    "Odb.InsertECODiodes": "librelane.steps.odb",
+    "Magic.WriteLEF": "librelane.steps.magic",
+    "Magic.StreamOut": "librelane.steps.magic",
+    "Magic.Filler": "librelane.steps.magic",
+    "Magic.DRC": "librelane.steps.magic",
+    "Magic.SpiceExtraction": "librelane.steps.magic",
+    "Magic.OpenGUI": "librelane.steps.magic",
+    "Magic.RCX": "librelane.steps.magic",
+    "Netgen.LVS": "librelane.steps.netgen",
+    "KLayout.Render": "librelane.steps.klayout",
+    "KLayout.StreamOut": "librelane.steps.klayout",
+    "KLayout.XOR": "librelane.steps.klayout",
+    "KLayout.DRC": "librelane.steps.klayout",
+    "KLayout.LVS": "librelane.steps.klayout",
+    "KLayout.SealRing": "librelane.steps.klayout",
+    "KLayout.Filler": "librelane.steps.klayout",
+    "KLayout.Density": "librelane.steps.klayout",
+    "KLayout.Antenna": "librelane.steps.klayout",
+    "KLayout.OpenGUI": "librelane.steps.klayout",
+    "Misc.LoadBaseSDC": "librelane.steps.misc",
+    "Misc.ReportManufacturability": "librelane.steps.misc",
+    "Verilator.Lint": "librelane.steps.verilator",
+}
+
+flows = {
+    "Optimizing": "librelane.flows.optimizing",
+    "Classic": "librelane.flows.classic",
+    "VHDLClassic": "librelane.flows.classic",
+    "Chip": "librelane.flows.chip",
+    "OpenInKLayout": "librelane.flows.misc",
+    "OpenInOpenROAD": "librelane.flows.misc",
+    "OpenInMagic": "librelane.flows.misc",
+    "SynthesisExploration": "librelane.flows.synth_explore",
+    "DesignSpaceExploration": "librelane.flows.explore",
+}
+
+design_formats = {
+    "json_h": "librelane.steps.pyosys",
+    "JSON_HEADER": "librelane.steps.pyosys",
+    "rtlil": "librelane.steps.pyosys",
+    "RTLIL": "librelane.steps.pyosys",
+    "odb": "librelane.steps.openroad",
+    "ODB": "librelane.steps.openroad",
+    "openroad_lef": "librelane.steps.openroad",
+    "OPENROAD_LEF": "librelane.steps.openroad",
+    "mag": "librelane.steps.magic",
+    "MAG": "librelane.steps.magic",
+    "mag_gds": "librelane.steps.magic",
+    "MAG_GDS": "librelane.steps.magic",
+    "klayout_gds": "librelane.steps.klayout",
+    "KLAYOUT_GDS": "librelane.steps.klayout",
+}
@@ -11,11 +11,145 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+"""
+Discovery of LibreLane plugins and lazy loading of built-in steps and flows.
+
+Plugins are discovered using the ``librelane.plugins`` entry point group, e.g.
+in a plugin's ``pyproject.toml``:
+
+.. code-block:: toml
+
+    [project.entry-points."librelane.plugins"]
+    my_plugin = "librelane_plugin_my_plugin"
+
+Top-level modules named ``librelane_plugin_*`` (or ``openlane_plugin_*``) are
+also discovered for compatibility, but this requires scanning every entry of
+``sys.path`` and is thus slower.
+
+Plugins are discovered and imported on the first lookup of a step, flow or
+design format, so they may override built-in ones, while the modules of
+built-in steps and flows are only imported when they are looked up. An
+override registered by a plugin is kept even if the built-in module it
+overrides is imported afterwards.
+"""
 import pkgutil
 import importlib
+import importlib.metadata
+from types import ModuleType
+from typing import Dict, Iterable, Optional, Set
+
+ENTRY_POINT_GROUP = "librelane.plugins"
+LEGACY_PREFIXES = ("librelane_plugin_", "openlane_plugin_")
+
+_discovered_plugins: Optional[Dict[str, ModuleType]] = None
+_plugin_modules: Set[str] = set()
+_manifest: Optional[Dict[str, Dict[str, str]]] = None
+
+
+def _get_entry_point_modules() -> Iterable[str]:
+    for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+        yield entry_point.module
+
+
+def _get_legacy_modules() -> Iterable[str]:
+    for _, name, _ in pkgutil.iter_modules():
+        if name.startswith(LEGACY_PREFIXES):
+            yield name
+
+
+def load_plugins() -> Dict[str, ModuleType]:
+    """
+    Discovers and imports all LibreLane plugins, registering their steps and
+    flows. Subsequent calls return the same result without rediscovering.
+
+    :returns: A dictionary of plugin module names to modules.
+    """
+    global _discovered_plugins
+    if _discovered_plugins is None:
+        # Assigned before importing so lookups during a plugin's import don't
+        # attempt to load plugins again
+        _discovered_plugins = {}
+        try:
+            names = [*_get_entry_point_modules(), *_get_legacy_modules()]
+            _plugin_modules.update(names)
+            for name in names:
+                if name not in _discovered_plugins:
+                    _discovered_plugins[name] = importlib.import_module(name)
+        except BaseException:
+            _discovered_plugins = None
+            raise
+    return _discovered_plugins
+
+
+def is_plugin_override(existing: type, cls: type) -> bool:
+    """
+    :param existing: A step or flow type already registered under a name.
+    :param cls: A step or flow type being registered under the same name.
+    :returns: Whether ``existing`` is a plugin's override of the built-in
+        ``cls``, whose module is only being imported now, in which case the
+        override should be kept.
+    """
+
+    def is_plugin(module: str) -> bool:
+        return any(
+            module == name or module.startswith(f"{name}.") for name in _plugin_modules
+        )
+
+    return is_plugin(existing.__module__) and cls.__module__.startswith("librelane.")
+
+
+def get_manifest() -> Dict[str, Dict[str, str]]:
+    """
+    :returns: The registry manifest of built-in steps, flows and design
+        formats, a dictionary with the keys ``steps``, ``flows`` and
+        ``design_formats``, each mapping a registered name to the module that
+        registers it.
+
+        Step IDs in the manifest are lowercase, as step lookups are
+        case-insensitive.
+    """
+    global _manifest
+    if _manifest is None:
+        from . import manifest
+
+        _manifest = {
+            "steps": {id.lower(): module for id, module in manifest.steps.items()},
+            "flows": manifest.flows,
+            "design_formats": manifest.design_formats,
+        }
+    return _manifest
+
+
+def import_builtin(kind: str, name: str) -> bool:
+    """
+    Imports the module registering a built-in step, flow or design format, if
+    one exists.
+
+    :param kind: ``steps``, ``flows`` or ``design_formats``.
+    :param name: The registered name of the step or flow. Must be lowercase
+        for steps.
+    :returns: Whether a module was found in the manifest.
+    """
+    module = get_manifest()[kind].get(name)
+    if module is None:
+        return False
+    importlib.import_module(module)
+    return True
+
+
+def import_all(kind: str):
+    """
+    Imports all modules registering built-in steps, flows or design formats,
+    then loads all plugins.
+
+    :param kind: ``steps``, ``flows`` or ``design_formats``.
+    """
+    for module in dict.fromkeys(get_manifest()[kind].values()):
+        importlib.import_module(module)
+    load_plugins()
+
 
-discovered_plugins = {
-    name: importlib.import_module(name)
-    for finder, name, ispkg in pkgutil.iter_modules()
-    if name.startswith("librelane_plugin_") or name.startswith("openlane_plugin_")
-}
+def __getattr__(name: str):
+    if name == "discovered_plugins":
+        return load_plugins()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
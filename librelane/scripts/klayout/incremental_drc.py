@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Helpers for incremental DRC: computing the windows to check from the XOR
+differences against a previously DRC-clean layout, then filtering the
+violations found in these windows.
+"""
+import json
+
+from klayout.rdb import ReportDatabase
+import klayout.db as kdb
+import click
+
+from merge_drc_reports import copy_categories
+
+
+def get_value_bbox(value):
+    for check, get in [
+        ("is_box", "box"),
+        ("is_polygon", "polygon"),
+        ("is_path", "path"),
+        ("is_edge", "edge"),
+        ("is_edge_pair", "edge_pair"),
+    ]:
+        if getattr(value, check)():
+            shape = getattr(value, get)()
+            return shape if check == "is_box" else shape.bbox()
+    return None
+
+
+def to_boxes(region):
+    """
+    :returns: The bounding boxes of the polygons in a region, merged until no
+        two overlap.
+    """
+    boxes = [polygon.bbox() for polygon in region.merged().each()]
+    while True:
+        merged = [polygon.bbox() for polygon in kdb.Region(boxes).merged().each()]
+        if len(merged) == len(boxes):
+            return merged
+        boxes = merged
+
+
+@click.group()
+def cli():
+    pass
+
+
+@cli.command()
+@click.option("--xor-report", required=True, help="The XOR report database")
+@click.option("--input", "input_gds", required=True, help="The new layout")
+@click.option("--top", "top_name", required=True, help="The top cell")
+@click.option("--halo", type=float, required=True, help="In µm")
+@click.option("--max-area", type=float, required=True, help="In %")
+@click.option("--output-gds", required=True)
+@click.option("--output-json", required=True)
+def windows(xor_report, input_gds, top_name, halo, max_area, output_gds, output_json):
+    """
+    Computes the regions in which violations are reported (the differences
+    enlarged by the halo) and the windows to clip the layout to for DRC (the
+    differences enlarged by twice the halo, so that violations caused by
+    clipping are outside of these regions).
+
+    The layout is only clipped if the regions cover at most ``max_area``
+    percent of the layout.
+    """
+    layout = kdb.Layout()
+    layout.read(input_gds)
+    top = layout.cell(top_name)
+    dbu = layout.dbu
+
+    database = ReportDatabase("XOR")
+    database.load(xor_report)
+    changed = kdb.Region()
+    for item in database.each_item():
+        for value in item.each_value():
+            if bbox := get_value_bbox(value):
+                changed.insert(bbox.to_itype(dbu))
+
+    halo_dbu = round(halo / dbu)
+    core = changed.sized(halo_dbu).merged()
+    clip_boxes = to_boxes(changed.sized(2 * halo_dbu))
+    total_area = top.bbox().area()
+    ratio = core.area() / total_area if total_area else 1
+    incremental = ratio * 100 <= max_area
+
+    if incremental and len(clip_boxes):
+        layout.rename_cell(top.cell_index(), f"{top_name}__full")
+        windowed_top = layout.create_cell(top_name)
+        for box in clip_boxes:
+            clipped = layout.clip(top.cell_index(), box)
+            windowed_top.insert(kdb.CellInstArray(clipped, kdb.Trans()))
+        options = kdb.SaveLayoutOptions()
+        options.select_cell(windowed_top.cell_index())
+        layout.write(output_gds, options)
+
+    with open(output_json, "w", encoding="utf8") as f:
+        json.dump(
+            {
+                "incremental": incremental,
+                "ratio": ratio,
+                "dbu": dbu,
+                "windows": [str(box.to_dtype(dbu)) for box in clip_boxes],
+                "core": [str(polygon.to_dtype(dbu)) for polygon in core.each()],
+            },
+            f,
+        )
+
+    print(f"Changed area: {ratio * 100:.3f}% of the layout")
+    print(f"%OL_METRIC_F klayout__drc_changed_area__ratio {ratio}")
+    print(f"%OL_METRIC_I klayout__drc_window__count {len(clip_boxes)}")
+
+
+@cli.command()
+@click.option("--input", "input_rdb", help="The DRC report database of the windows")
+@click.option("--windows", "windows_json", required=True)
+@click.option("--top", "top_name", required=True, help="The top cell")
+@click.option("--output", required=True)
+def filter(input_rdb, windows_json, top_name, output):
+    """
+    Writes the violations of the windows that interact with the changed
+    regions. Violations elsewhere were found in the previously DRC-clean
+    layout as well, or are artifacts of clipping.
+    """
+    with open(windows_json, encoding="utf8") as f:
+        windows = json.load(f)
+    dbu = windows["dbu"]
+    core_region = kdb.Region()
+    for polygon in windows["core"]:
+        core_region.insert(kdb.DPolygon.from_s(polygon).to_itype(dbu))
+
+    result = ReportDatabase("DRC")
+    result.top_cell_name = top_name
+    if input_rdb is None:
+        result.save(output)
+        return
+
+    database = ReportDatabase("Database")
+    database.load(input_rdb)
+    result.generator = database.generator
+    result.original_file = database.original_file
+
+    category_ids = {}
+    for category, copy in copy_categories(database, result):
+        category_ids[category.rdb_id()] = copy.rdb_id()
+    cell_ids = {}
+    for cell in database.each_cell():
+        copy = result.cell_by_qname(cell.qname())
+        if copy is None:
+            copy = result.create_cell(cell.name(), cell.variant())
+        cell_ids[cell.rdb_id()] = copy.rdb_id()
+
+    kept = 0
+    for item in database.each_item():
+        bboxes = [get_value_bbox(value) for value in item.each_value()]
+        bboxes = [bbox for bbox in bboxes if bbox is not None]
+        if len(bboxes) and all(
+            core_region.interacting(kdb.Region(bbox.to_itype(dbu))).is_empty()
+            for bbox in bboxes
+        ):
+            continue
+        copy = result.create_item(
+            cell_ids[item.cell_id()], category_ids[item.category_id()]
+        )
+        for value in item.each_value():
+            copy.add_value(value)
+        kept += 1
+
+    print(f"Kept {kept}/{database.num_items()} violations.")
+    result.save(output)
+
+
+if __name__ == "__main__":
+    cli()
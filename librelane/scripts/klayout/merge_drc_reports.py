@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from klayout.rdb import ReportDatabase
+import click
+
+
+def copy_categories(source, destination, source_parent=None, parent=None):
+    categories = (
+        source.each_category()
+        if source_parent is None
+        else source_parent.each_sub_category()
+    )
+    for category in categories:
+        copy = destination.category_by_path(category.path())
+        if copy is None and parent is None:
+            copy = destination.create_category(category.name())
+        elif copy is None:
+            copy = destination.create_category(parent, category.name())
+        copy.description = category.description
+        yield category, copy
+        yield from copy_categories(source, destination, category, copy)
+
+
+@click.command()
+@click.option("--output", required=True, help="The merged report database")
+@click.argument("inputs", nargs=-1)
+def cli(output, inputs):
+    """
+    Merges KLayout report databases, e.g. from DRC rule groups run separately.
+
+    Categories with the same path are merged, and items with the same
+    category, cell and values, e.g. from rules run by more than one group, are
+    only included once.
+    """
+    merged = ReportDatabase("DRC")
+    seen = set()
+    for input in inputs:
+        database = ReportDatabase("Database")
+        database.load(input)
+        if merged.top_cell_name == "":
+            merged.top_cell_name = database.top_cell_name
+            merged.generator = database.generator
+            merged.original_file = database.original_file
+
+        category_ids = {}
+        for category, copy in copy_categories(database, merged):
+            category_ids[category.rdb_id()] = copy.rdb_id()
+
+        cell_ids = {}
+        for cell in database.each_cell():
+            copy = merged.cell_by_qname(cell.qname())
+            if copy is None:
+                copy = merged.create_cell(cell.name(), cell.variant())
+            cell_ids[cell.rdb_id()] = copy.rdb_id()
+
+        duplicates = 0
+        for item in database.each_item():
+            cell_id = cell_ids[item.cell_id()]
+            category_id = category_ids[item.category_id()]
+            key = (
+                category_id,
+                cell_id,
+                tuple(sorted(str(value) for value in item.each_value())),
+            )
+            if key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
+            copy = merged.create_item(cell_id, category_id)
+            for value in item.each_value():
+                copy.add_value(value)
+
+        print(
+            f"Merged {database.num_items() - duplicates} items from '{input}' ({duplicates} duplicates skipped)."
+        )
+
+    merged.save(output)
+
+
+if __name__ == "__main__":
+    cli()
@@ -38,6 +38,16 @@ if { $::env(MAGIC_EXT_USE_GDS) } {
 # annotate stdcell port order
 read_pdk_spice
 
+if { [info exists ::env(_MAGIC_EXT_MACRO_SPICE)] } {
+    # macros extracted separately: annotate their port order and abstract them
+    foreach {cell spice_file} $::env(_MAGIC_EXT_MACRO_SPICE) {
+        puts "> spice read $spice_file"
+        readspice $spice_file
+        load $cell
+        property LEFview true
+    }
+}
+
 if { [info exists ::env(MAGIC_EXT_ABSTRACT_CELLS)] } {
     set cells [cellname list allcells]
     set matching_cells ""
@@ -13,7 +13,7 @@
 # limitations under the License.
 import sys
 from dataclasses import dataclass
-from typing import Dict, Literal, Optional, Sequence, Union
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
 
 import odb
 import utl
@@ -127,27 +127,33 @@ class Module(object):
                 )
             return critical_disconnected_pins
 
-    def __init__(self, object: Union[odb.dbBlock, odb.dbInst]) -> None:
+    def __init__(
+        self,
+        object: Union[odb.dbBlock, odb.dbInst],
+        ports: Optional[Dict[str, Port]] = None,
+    ) -> None:
         self.name = object.getName()
-        self.ports: Dict[str, Port] = {}
-        terminals = (
-            object.getBTerms()
-            if isinstance(object, odb.dbBlock)
-            else object.getITerms()
-        )
+        if ports is None:
+            ports = {}
+            terminals = (
+                object.getBTerms()
+                if isinstance(object, odb.dbBlock)
+                else object.getITerms()
+            )
+            for terminal in terminals:
+                ports[terminal.getName()] = Port(
+                    terminal.getIoType(),
+                    signal_type=terminal.getSigType(),
+                    connected=is_connected(terminal),
+                )
+        self.ports = ports
         power_found = False
         ground_found = True
-        for terminal in terminals:
-            signal_type = terminal.getSigType()
-            if signal_type == "POWER":
+        for port in self.ports.values():
+            if port.signal_type == "POWER":
                 power_found = True
-            elif signal_type == "GROUND":
+            elif port.signal_type == "GROUND":
                 ground_found = True
-            self.ports[terminal.getName()] = Port(
-                terminal.getIoType(),
-                signal_type=terminal.getSigType(),
-                connected=is_connected(terminal),
-            )
         if not power_found:
             print(
                 f"[ERROR] Macro/instance {object.getName()} has no power pins- add it to IGNORE_DISCONNECTED_MODULES if this is intentional",
@@ -181,10 +187,8 @@ class Module(object):
             else self._port_stats.instance_critical_disconnected_pin_count
         )
 
-    def write_disconnected_pins(self, full_table: Table, critical_table: Table):
-        if self.disconnected_pin_count == 0:
-            return
-        row = (
+    def get_row(self) -> Tuple[str, str, str, str, str]:
+        return (
             self.name,
             "\n".join(
                 [
@@ -215,10 +219,94 @@ class Module(object):
                 ]
             ),
         )
-        full_table.add_row(*row)
-        if self.critical_disconnected_pin_count == 0:
+
+
+class MasterTemplate(object):
+    """
+    The pin names and types of a master, which are identical for all of its
+    instances, so they need only be queried once per master rather than once
+    per instance.
+
+    Instance terminals are always enumerated in the same order for instances
+    of the same master, so the template is created from the terminals of the
+    first instance encountered and matched positionally thereafter.
+    """
+
+    def __init__(self, instance: odb.dbInst) -> None:
+        self.pins: List[Tuple[str, str, Optional[str]]] = []
+        power_found = False
+        for iterm in instance.getITerms():
+            signal_type = iterm.getSigType()
+            if signal_type == "POWER":
+                power_found = True
+            self.pins.append(
+                (iterm.getMTerm().getName(), iterm.getIoType(), signal_type)
+            )
+        # An instance of a master without power pins is always reported
+        self.always_report = not power_found
+
+    def get_connections(self, instance: odb.dbInst) -> List[bool]:
+        return [iterm.getNet() is not None for iterm in instance.getITerms()]
+
+    def create_module(self, instance: odb.dbInst, connections: List[bool]) -> Module:
+        instance_name = instance.getName()
+        ports = {
+            f"{instance_name}/{name}": Port(io_type, signal_type, connected)
+            for (name, io_type, signal_type), connected in zip(self.pins, connections)
+        }
+        return Module(instance, ports)
+
+
+class TableWriter(object):
+    """
+    Writes rows of a table to a file in chunks of ``chunk_size`` rows, so the
+    table is never held in memory in its entirety.
+
+    Column widths are fixed so that consecutive chunks line up. The file is
+    only created if at least one row is written.
+    """
+
+    columns = [
+        ("Macro/Instance", 2),
+        ("Power Pins", 1),
+        ("Disconnected", 1),
+        ("Signal Pins", 1),
+        ("Disconnected", 1),
+    ]
+
+    def __init__(self, path: str, chunk_size: int = 1000) -> None:
+        self.path = path
+        self.console: Optional[Console] = None
+        self.chunk_size = chunk_size
+        self.row_count = 0
+        self.table = self._create_table()
+
+    def _create_table(self) -> Table:
+        table = Table(title="", show_lines=True, expand=True)
+        for name, ratio in self.columns:
+            table.add_column(name, ratio=ratio, overflow="fold")
+        return table
+
+    def add_row(self, *row: str):
+        self.table.add_row(*row)
+        self.row_count += 1
+        if self.table.row_count >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.table.row_count == 0:
             return
-        critical_table.add_row(*row)
+        if self.console is None:
+            self.console = Console(
+                file=open(self.path, "w", encoding="utf8"), width=160
+            )
+        self.console.print(self.table)
+        self.table = self._create_table()
+
+    def close(self):
+        self.flush()
+        if self.console is not None:
+            self.console.file.close()
 
 
 @click.command()
@@ -245,15 +333,9 @@ def main(
     db = reader.db
     block = db.getChip().getBlock()
     instances = block.getInsts()
-    full_table = Table(
-        "Macro/Instance",
-        "Power Pins",
-        "Disconnected",
-        "Signal Pins",
-        "Disconnected",
-        title="",
-        show_lines=True,
-    )
+    full_table: Optional[TableWriter] = None
+    if full_table_path := write_full_table_to:
+        full_table = TableWriter(full_table_path)
     critical_table = Table(
         "Macro/Instance",
         "Power Pins",
@@ -264,23 +346,38 @@ def main(
     )
 
     disconnected_pin_count, critical_disconnected_pin_count = (0, 0)
+
+    def report(module: Module):
+        nonlocal disconnected_pin_count, critical_disconnected_pin_count
+        disconnected_pin_count += module.disconnected_pin_count
+        critical_disconnected_pin_count += module.critical_disconnected_pin_count
+        if module.disconnected_pin_count == 0:
+            return
+        row = module.get_row()
+        if full_table is not None:
+            full_table.add_row(*row)
+        if module.critical_disconnected_pin_count != 0:
+            critical_table.add_row(*row)
+
     if block.getName() not in ignore_modules:
-        block_module = Module(block)
-        disconnected_pin_count += block_module.disconnected_pin_count
-        critical_disconnected_pin_count += block_module.critical_disconnected_pin_count
-        block_module.write_disconnected_pins(full_table, critical_table)
+        report(Module(block))
 
+    templates: Dict[str, MasterTemplate] = {}
     for instance in instances:
-        if instance.getMaster().getName() in ignore_modules:
+        master_name = instance.getMaster().getName()
+        if master_name in ignore_modules:
             continue
         if instance.getName().startswith("clkload"):  # TritonCTS dummy clock loads
             continue
-        instance_module = Module(instance)
-        disconnected_pin_count += instance_module.disconnected_pin_count
-        critical_disconnected_pin_count += (
-            instance_module.critical_disconnected_pin_count
-        )
-        instance_module.write_disconnected_pins(full_table, critical_table)
+        template = templates.get(master_name)
+        if template is None:
+            template = MasterTemplate(instance)
+            templates[master_name] = template
+        connections = template.get_connections(instance)
+        if all(connections) and not template.always_report:
+            # Fully connected: nothing to count, report or warn about
+            continue
+        report(template.create_module(instance, connections))
 
     print(
         f"Found {disconnected_pin_count} disconnected pin(s), of which {critical_disconnected_pin_count} are critical."
@@ -288,12 +385,8 @@ def main(
 
     if critical_table.row_count > 0:
         rich.print(critical_table)
-    if full_table.row_count > 0:
-        if full_table_path := write_full_table_to:
-            console = Console(
-                file=open(full_table_path, "w", encoding="utf8"), width=160
-            )
-            console.print(full_table)
+    if full_table is not None:
+        full_table.close()
 
     utl.metric_integer("design__disconnected_pin__count", disconnected_pin_count)
     utl.metric_integer(
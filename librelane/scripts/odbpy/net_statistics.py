@@ -0,0 +1,118 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+from array import array
+from decimal import Decimal
+from typing import List
+
+import utl
+
+from reader import click, click_odb, OdbReader
+from net_statistics_utils import get_metrics
+
+
+@click.command()
+@click.option(
+    "-R",
+    "--report-out",
+    required=True,
+    help="Path to write the per-net statistics to, as a JSON object of columns.",
+)
+@click.option(
+    "--csv-out",
+    default=None,
+    help="Path to optionally write a CSV file of nets with a wire length at or above --csv-threshold to.",
+)
+@click.option(
+    "--csv-threshold",
+    type=Decimal,
+    default=Decimal(0),
+    help="Wire length in microns at or above which nets are written to --csv-out.",
+)
+@click_odb
+def main(
+    report_out,
+    csv_out,
+    csv_threshold,
+    reader: OdbReader,
+):
+    block = reader.block
+    dbunits = reader.dbunits
+
+    names: List[str] = []
+    fanouts = array("q")
+    hpwls = array("q")
+    wire_lengths = array("q")
+    routed = array("b")
+
+    # Single pass over the nets: everything else is done on the columns
+    for net in block.getNets():
+        if net.getSigType() in ["POWER", "GROUND"]:
+            continue
+        names.append(net.getName())
+        terminal_count = net.getITermCount() + net.getBTermCount()
+        fanouts.append(max(terminal_count - 1, 0))
+        if terminal_count >= 2:
+            bbox = net.getTermBBox()
+            hpwls.append(bbox.dx() + bbox.dy())
+        else:
+            hpwls.append(0)
+        wire = net.getWire()
+        if wire is None:
+            wire_lengths.append(0)
+            routed.append(0)
+        else:
+            wire_lengths.append(wire.getLength())
+            routed.append(1)
+
+    with open(report_out, "w", encoding="utf8") as f:
+        json.dump(
+            {
+                "dbu_per_micron": dbunits,
+                "columns": {
+                    "net": names,
+                    "fanout": fanouts.tolist(),
+                    "hpwl": hpwls.tolist(),
+                    "wire_length": wire_lengths.tolist(),
+                    "routed": routed.tolist(),
+                },
+            },
+            f,
+            separators=(",", ":"),
+        )
+
+    if csv_out is not None:
+        threshold_dbu = csv_threshold * dbunits
+        with open(csv_out, "w", encoding="utf8") as f:
+            print("net,length_um,hpwl_um,fanout", file=f)
+            indices = [
+                i
+                for i, length in enumerate(wire_lengths)
+                if routed[i] and length >= threshold_dbu
+            ]
+            indices.sort(key=lambda i: wire_lengths[i], reverse=True)
+            for i in indices:
+                length_um = Decimal(wire_lengths[i]) / Decimal(dbunits)
+                hpwl_um = Decimal(hpwls[i]) / Decimal(dbunits)
+                print(f"{names[i]},{length_um},{hpwl_um},{fanouts[i]}", file=f)
+
+    for name, value in get_metrics(fanouts, hpwls, wire_lengths, routed, dbunits):
+        if isinstance(value, int):
+            utl.metric_integer(name, value)
+        else:
+            utl.metric_float(name, value)
+
+
+if __name__ == "__main__":
+    main()
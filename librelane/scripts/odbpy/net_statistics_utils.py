@@ -0,0 +1,134 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Reduction of per-net statistics to metrics, kept separate from
+``net_statistics.py`` so it can be used without OpenROAD.
+"""
+from decimal import Decimal
+from typing import List, Sequence, Tuple, Union
+
+PERCENTILES = [50, 90, 99]
+
+
+def percentile(sorted_values: Sequence[int], p: int) -> int:
+    """
+    Nearest-rank percentile of an already-sorted sequence. Returns ``0`` for
+    empty sequences.
+    """
+    if len(sorted_values) == 0:
+        return 0
+    rank = -(-p * len(sorted_values) // 100)  # ceil
+    return sorted_values[max(rank, 1) - 1]
+
+
+def power_of_two_bins(sorted_values: Sequence[int]) -> List[Tuple[str, int]]:
+    """
+    Histogram of non-negative integers into bins ``0``, ``1``, ``2-3``,
+    ``4-7``, … up to the bin containing the largest value.
+    """
+    if len(sorted_values) == 0:
+        return []
+    result = []
+    consumed = 0
+    lo, hi = 0, 0
+    while consumed < len(sorted_values):
+        count = 0
+        while consumed < len(sorted_values) and sorted_values[consumed] <= hi:
+            count += 1
+            consumed += 1
+        label = str(lo) if lo == hi else f"{lo}-{hi}"
+        result.append((label, count))
+        lo = hi + 1
+        hi = 2 * lo - 1
+    return result
+
+
+def decade_bins(sorted_values: Sequence[int], dbunits: int) -> List[Tuple[str, int]]:
+    """
+    Histogram of lengths in database units into half-open bins of ``0-10``,
+    ``10-100``, ``100-1000``, … microns up to the bin containing the largest
+    value.
+    """
+    if len(sorted_values) == 0:
+        return []
+    result = []
+    consumed = 0
+    lo_um, hi_um = 0, 10
+    while consumed < len(sorted_values):
+        count = 0
+        while (
+            consumed < len(sorted_values) and sorted_values[consumed] < hi_um * dbunits
+        ):
+            count += 1
+            consumed += 1
+        result.append((f"{lo_um}-{hi_um}", count))
+        lo_um, hi_um = hi_um, hi_um * 10
+    return result
+
+
+def to_microns(value: int, dbunits: int) -> float:
+    return float(Decimal(value) / Decimal(dbunits))
+
+
+def get_metrics(
+    fanouts: Sequence[int],
+    hpwls: Sequence[int],
+    wire_lengths: Sequence[int],
+    routed: Sequence[int],
+    dbunits: int,
+) -> List[Tuple[str, Union[int, float]]]:
+    """
+    :param fanouts: The fanout of each net.
+    :param hpwls: The terminal bounding-box HPWL of each net in database units.
+    :param wire_lengths: The routed wire length of each net in database units.
+    :param routed: Whether each net is routed.
+    :param dbunits: Database units per micron.
+    :returns: A list of metric names and values. Values are integers for
+        counts and fanouts, and floats for lengths in microns.
+    """
+    sorted_fanouts = sorted(fanouts)
+    sorted_hpwls = sorted(hpwls)
+    sorted_wire_lengths = sorted(
+        length for length, is_routed in zip(wire_lengths, routed) if is_routed
+    )
+
+    metrics: List[Tuple[str, Union[int, float]]] = [
+        ("route__net__count", len(fanouts)),
+        ("route__net__routed__count", len(sorted_wire_lengths)),
+    ]
+    for p in PERCENTILES:
+        metrics += [
+            (
+                f"route__wirelength__p{p}",
+                to_microns(percentile(sorted_wire_lengths, p), dbunits),
+            ),
+            (
+                f"route__net__hpwl__p{p}",
+                to_microns(percentile(sorted_hpwls, p), dbunits),
+            ),
+            (f"route__net__fanout__p{p}", percentile(sorted_fanouts, p)),
+        ]
+    metrics += [
+        ("route__net__hpwl", to_microns(sum(sorted_hpwls), dbunits)),
+        (
+            "route__net__hpwl__max",
+            to_microns(percentile(sorted_hpwls, 100), dbunits),
+        ),
+        ("route__net__fanout__max", percentile(sorted_fanouts, 100)),
+    ]
+    for label, count in power_of_two_bins(sorted_fanouts):
+        metrics.append((f"route__net__count__fanout:{label}", count))
+    for label, count in decade_bins(sorted_wire_lengths, dbunits):
+        metrics.append((f"route__net__count__wirelength_um:{label}", count))
+    return metrics
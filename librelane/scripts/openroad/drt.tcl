@@ -21,17 +21,32 @@ proc drt_run {i args} {
             file rename -force $snapshot $::env(STEP_DIR)/$directory/[file tail $snapshot]
         }
     }
+    if { $::env(DRT_CHECKPOINTS) } {
+        # Superseded by the odb of the completed run
+        foreach snapshot [glob -nocomplain $::env(STEP_DIR)/checkpoints/drt_iter*.odb] {
+            file delete -force $snapshot
+        }
+    }
     foreach drc_file [glob -nocomplain $::env(STEP_DIR)/$directory/*.drc] {
         file copy -force $drc_file $::env(STEP_DIR)/[file tail $drc_file]
     }
-    write_db $::env(STEP_DIR)/$directory/$::env(DESIGN_NAME).odb
+    # Written atomically, as its existence marks the run as complete when
+    # resuming
+    set odb_path $::env(STEP_DIR)/$directory/$::env(DESIGN_NAME).odb
+    write_db $odb_path.tmp
+    file rename -force $odb_path.tmp $odb_path
 }
 
 source $::env(SCRIPTS_DIR)/openroad/common/io.tcl
+
+set resuming [info exists ::env(_DRT_RESUME_ODB)]
+if { $resuming } {
+    set ::env(CURRENT_ODB) $::env(_DRT_RESUME_ODB)
+}
 read_current_odb
 
-# Create NDRs
-if { [info exists ::env(NON_DEFAULT_RULES)] } {
+# Create NDRs (already part of the database when resuming)
+if { !$resuming && [info exists ::env(NON_DEFAULT_RULES)] } {
     dict for {ndr_name values} $::env(NON_DEFAULT_RULES) {
         puts "Creating NDR for $ndr_name:"
         dict with values {
@@ -54,7 +69,7 @@ if { [info exists ::env(NON_DEFAULT_RULES)] } {
 }
 
 # Assign NDRs to nets
-if { [info exists ::env(DRT_ASSIGN_NDR)] } {
+if { !$resuming && [info exists ::env(DRT_ASSIGN_NDR)] } {
     dict for {net_regex ndr_name} $::env(DRT_ASSIGN_NDR) {
         puts "\[INFO\] Assigning NDR '$ndr_name' to nets matching '$net_regex'"
         if { $net_regex != {^$} } {
@@ -77,6 +92,10 @@ if { $::env(DRT_SAVE_SNAPSHOTS) } {
     set_debug_level DRT snapshot 1
     set drc_report_iter_step_arg "-drc_report_iter_step 1"
     detailed_route_debug -snapshot_dir "$::env(STEP_DIR)"
+} elseif { $::env(DRT_CHECKPOINTS) } {
+    set_debug_level DRT snapshot 1
+    file mkdir $::env(STEP_DIR)/checkpoints
+    detailed_route_debug -snapshot_dir "$::env(STEP_DIR)/checkpoints"
 }
 if { [info exists ::env(DRT_SAVE_DRC_REPORT_ITERS)] } {
     set drc_report_iter_step_arg "-drc_report_iter_step $::env(DRT_SAVE_DRC_REPORT_ITERS)"
@@ -85,11 +104,22 @@ if { [info exists ::env(DRT_SAVE_DRC_REPORT_ITERS)] } {
 set i 0
 
 set drt_args [list]
-lappend drt_args -droute_end_iter $::env(DRT_OPT_ITERS)
 lappend drt_args -or_seed 42
 lappend drt_args -verbose 1
 lappend drt_args {*}$drc_report_iter_step_arg
-drt_run $i {*}$drt_args
+
+if { !$resuming } {
+    drt_run $i -droute_end_iter $::env(DRT_OPT_ITERS) {*}$drt_args
+} elseif { [info exists ::env(_DRT_RESUME_ITERS)] } {
+    set i $::env(_DRT_RESUME_RUN)
+    set remaining_iters $::env(_DRT_RESUME_ITERS)
+    puts "\[INFO\] Resuming detailed routing run $i with $remaining_iters remaining iterations…"
+    drt_run $i -droute_end_iter $remaining_iters {*}$drt_args
+} else {
+    set i $::env(_DRT_RESUME_RUN)
+    puts "\[INFO\] Resuming detailed routing after completed run $i…"
+}
+lappend drt_args -droute_end_iter $::env(DRT_OPT_ITERS)
 
 incr i
 
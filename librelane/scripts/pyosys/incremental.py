@@ -0,0 +1,271 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Per-module incremental synthesis for designs synthesized with their hierarchy
+kept.
+
+Before synthesis, each module of the elaborated design is hashed along with
+the interfaces of the modules it instantiates and everything else affecting
+its synthesis. Modules with a synthesized netlist in the cache are replaced
+by blackbox stubs with the same interface, so only modules that changed are
+synthesized. After synthesis, new netlists are stored in the cache and cached
+netlists are spliced back into the design, so the written netlist and
+statistics cover the whole design.
+
+The top module is always synthesized.
+"""
+import os
+import re
+import json
+import uuid
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+ignored_config_keys = {
+    # Captured by the elaborated modules themselves
+    "VERILOG_FILES",
+    "VERILOG_DEFINES",
+    "VERILOG_INCLUDE_DIRS",
+    "VERILOG_POWER_DEFINE",
+    "SYNTH_PARAMETERS",
+    "USE_SLANG",
+    "SLANG_ARGUMENTS",
+    "VHDL_FILES",
+    "GHDL_ARGUMENTS",
+    # No effect on the netlist
+    "YOSYS_LOG_LEVEL",
+    "YOSYS_ELABORATION_CHECKPOINT",
+    "SYNTH_SHOW",
+    "SYNTH_INCREMENTAL_CACHE_DIR",
+}
+
+cell_rx = re.compile(r"^\s+cell (\S+) ")
+port_rx = re.compile(r"^\s+wire\b.*\s(?:input|output|inout) \d+\s")
+# Auto-generated names, e.g. $add$adder.v:4$12 or $add$adder.v:4$12_Y, end
+# with an index that is global to the design
+auto_name_rx = re.compile(r"(?<!\S)(\$\S*\$)(\d+)(?=(?:_\w+)?(?:\s|$))")
+library_attributes = ("attribute \\blackbox ", "attribute \\whitebox ")
+
+
+class Module(object):
+    """
+    A module in an RTLIL dump.
+
+    :param name: The name of the module.
+    :param lines: The lines of the module, including the module attributes
+        preceding it and the final ``end``.
+    """
+
+    def __init__(self, name: str, lines: List[str]) -> None:
+        self.name = name
+        self.lines = lines
+
+    @property
+    def text(self) -> str:
+        return "".join(f"{line}\n" for line in self.lines)
+
+    @property
+    def is_library(self) -> bool:
+        return any(line.startswith(library_attributes) for line in self.lines)
+
+    @property
+    def normalized_text(self) -> str:
+        """
+        The text of the module with the indices of auto-generated names
+        renumbered in order of appearance, so it does not change when other
+        modules of the design do.
+        """
+        indices: Dict[str, str] = {}
+
+        def renumber(match: re.Match) -> str:
+            index = indices.setdefault(match[2], str(len(indices) + 1))
+            return f"{match[1]}{index}"
+
+        return "".join(f"{auto_name_rx.sub(renumber, line)}\n" for line in self.lines)
+
+    def get_cell_types(self) -> List[str]:
+        return sorted(
+            {match[1] for line in self.lines if (match := cell_rx.match(line))}
+        )
+
+    def get_stub(self) -> "Module":
+        """
+        :returns: A blackbox module with the same name and ports.
+        """
+        attributes = [line for line in self.lines if line.startswith("attribute ")]
+        ports = [line for line in self.lines if port_rx.match(line)]
+        return Module(
+            self.name,
+            [
+                *attributes,
+                "attribute \\blackbox 1",
+                f"module {self.name}",
+                *ports,
+                "end",
+            ],
+        )
+
+
+def split_rtlil(text: str) -> Tuple[List[str], Dict[str, Module]]:
+    """
+    :param text: An RTLIL dump.
+    :returns: The lines preceding the first module (e.g. ``autoidx``) and the
+        modules by name, in order.
+    """
+    header: List[str] = []
+    modules: Dict[str, Module] = {}
+    pending: List[str] = []
+    current: Optional[Module] = None
+    for line in text.splitlines():
+        if current is not None:
+            current.lines.append(line)
+            if line == "end":
+                modules[current.name] = current
+                current = None
+        elif line.startswith("module "):
+            current = Module(line[len("module ") :].strip(), [*pending, line])
+            pending = []
+        elif line.startswith("attribute "):
+            pending.append(line)
+        elif len(modules) == 0:
+            header.append(line)
+    return header, modules
+
+
+def join_rtlil(header: List[str], modules: Iterable[Module]) -> str:
+    return "".join(f"{line}\n" for line in header) + "".join(
+        module.text for module in modules
+    )
+
+
+def hash_files(paths: Iterable[str]) -> Dict[str, str]:
+    result = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            result[path] = hashlib.sha256(f.read()).hexdigest()
+    return result
+
+
+def get_synthesis_key(config: Dict[str, Any], libs: List[str], version: str) -> str:
+    """
+    :returns: A hash of everything affecting the synthesis of any module other
+        than its own content: the configuration, the liberty files and mapping
+        files used, and the Yosys version.
+    """
+    relevant = {k: v for k, v in config.items() if k not in ignored_config_keys}
+    mapping_files = [
+        value
+        for key, value in relevant.items()
+        if key.startswith("SYNTH_")
+        and (key.endswith("_MAP") or key == "SYNTH_EXTRA_MAPPING_FILE")
+        and isinstance(value, str)
+        and os.path.isfile(value)
+    ]
+    key = {
+        "config": relevant,
+        "files": hash_files([*libs, *mapping_files]),
+        "version": version,
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf8")).hexdigest()
+
+
+class IncrementalSynthesis(object):
+    """
+    :param cache_dir: The directory storing synthesized modules.
+    :param key: The value returned by :func:`get_synthesis_key`.
+    :param work_dir: A directory to write temporary RTLIL dumps to.
+    """
+
+    def __init__(self, cache_dir: str, key: str, work_dir: str) -> None:
+        self.cache_dir = cache_dir
+        self.key = key
+        self.work_dir = work_dir
+        self.top: Optional[str] = None
+        self.hashes: Dict[str, str] = {}
+        self.cached: Dict[str, str] = {}
+
+    def __dump(self, d) -> str:
+        path = os.path.join(self.work_dir, "incremental.il")
+        d.run_pass("write_rtlil", path)
+        with open(path, encoding="utf8") as f:
+            return f.read()
+
+    def __load(self, d, text: str):
+        path = os.path.join(self.work_dir, "incremental.il")
+        with open(path, "w", encoding="utf8") as f:
+            f.write(text)
+        d.run_pass("design", "-reset")
+        d.run_pass("read_rtlil", path)
+
+    def get_module_hashes(self, modules: Dict[str, Module]) -> Dict[str, str]:
+        """
+        :returns: The hashes of all modules that are not library cells, each
+            covering the module, the interfaces of the modules it instantiates
+            and the synthesis key.
+        """
+        interfaces = {
+            name: hashlib.sha256(module.get_stub().text.encode("utf8")).hexdigest()
+            for name, module in modules.items()
+        }
+        result = {}
+        for name, module in modules.items():
+            if module.is_library:
+                continue
+            hash = hashlib.sha256(self.key.encode("utf8"))
+            hash.update(module.normalized_text.encode("utf8"))
+            for cell_type in module.get_cell_types():
+                hash.update(interfaces.get(cell_type, cell_type).encode("utf8"))
+            result[name] = hash.hexdigest()
+        return result
+
+    def stub_cached_modules(self, d, top: str) -> int:
+        """
+        Replaces the modules with cached netlists with blackbox stubs.
+
+        :returns: The number of modules replaced.
+        """
+        self.top = f"\\{top}"
+        header, modules = split_rtlil(self.__dump(d))
+        self.hashes = self.get_module_hashes(modules)
+        for name, hash in self.hashes.items():
+            if name == self.top:
+                continue
+            cached_path = os.path.join(self.cache_dir, f"{hash}.il")
+            if os.path.isfile(cached_path):
+                self.cached[name] = cached_path
+                modules[name] = modules[name].get_stub()
+        if len(self.cached):
+            self.__load(d, join_rtlil(header, modules.values()))
+        return len(self.cached)
+
+    def splice(self, d):
+        """
+        Stores newly synthesized modules in the cache, then replaces the
+        stubs with the cached netlists.
+        """
+        header, modules = split_rtlil(self.__dump(d))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for name, module in list(modules.items()):
+            if cached_path := self.cached.get(name):
+                with open(cached_path, encoding="utf8") as f:
+                    _, cached_modules = split_rtlil(f.read())
+                modules[name] = cached_modules[name]
+            elif name != self.top and (hash := self.hashes.get(name)):
+                cached_path = os.path.join(self.cache_dir, f"{hash}.il")
+                tmp_path = f"{cached_path}.{uuid.uuid4().hex}.tmp"
+                with open(tmp_path, "w", encoding="utf8") as f:
+                    f.write(module.text)
+                os.replace(tmp_path, cached_path)
+        if len(self.cached):
+            self.__load(d, join_rtlil(header, modules.values()))
@@ -51,29 +51,35 @@ def json_header(
     )
 
     d = ys.Design()
-    d.add_blackbox_models(
-        blackbox_models,
-        includes=includes,
-        defines=defines,
-    )
-    d.read_verilog_files(
-        config["VERILOG_FILES"],
-        top=config["DESIGN_NAME"],
-        synth_parameters=config["SYNTH_PARAMETERS"] or [],
-        includes=includes,
-        defines=defines,
-        use_slang=config["USE_SLANG"],
-        slang_arguments=config["SLANG_ARGUMENTS"] or [],
-    )
-    d.run_pass(
-        "hierarchy",
-        "-check",
-        "-top",
-        config["DESIGN_NAME"],
-        "-nokeep_prints",
-        "-nokeep_asserts",
-    )
-    d.run_pass("rename", "-top", config["DESIGN_NAME"])
+    if checkpoint_in := extra.get("checkpoint_in"):
+        ys.log(f"[INFO] Reading elaborated design from '{checkpoint_in}'…")
+        d.run_pass("read_rtlil", checkpoint_in)
+    else:
+        d.add_blackbox_models(
+            blackbox_models,
+            includes=includes,
+            defines=defines,
+        )
+        d.read_verilog_files(
+            config["VERILOG_FILES"],
+            top=config["DESIGN_NAME"],
+            synth_parameters=config["SYNTH_PARAMETERS"] or [],
+            includes=includes,
+            defines=defines,
+            use_slang=config["USE_SLANG"],
+            slang_arguments=config["SLANG_ARGUMENTS"] or [],
+        )
+        d.run_pass(
+            "hierarchy",
+            "-check",
+            "-top",
+            config["DESIGN_NAME"],
+            "-nokeep_prints",
+            "-nokeep_asserts",
+        )
+        d.run_pass("rename", "-top", config["DESIGN_NAME"])
+        if checkpoint_out := extra.get("checkpoint_out"):
+            d.write_checkpoint(checkpoint_out, extra["checkpoint_key"])
     d.run_pass("proc")
     d.run_pass("flatten")
     d.run_pass("opt_clean", "-purge")
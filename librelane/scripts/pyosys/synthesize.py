@@ -40,6 +40,7 @@ import click
 
 from ys_common import ys, yosys_version_at_least
 from construct_abc_script import ABCScriptCreator
+from incremental import IncrementalSynthesis, get_synthesis_key
 
 
 def librelane_proc(d: ys.Design, report_dir: str):
@@ -270,7 +271,9 @@ def synthesize(
     report_dir = os.path.join(step_dir, "reports")
     os.makedirs(report_dir, exist_ok=True)
 
-    d.add_blackbox_models(blackbox_models, includes=includes, defines=defines)
+    checkpoint_in = extra.get("checkpoint_in")
+    if checkpoint_in is None:
+        d.add_blackbox_models(blackbox_models, includes=includes, defines=defines)
 
     clock_period = config["CLOCK_PERIOD"] * 1000  # ns -> ps
 
@@ -283,7 +286,10 @@ def synthesize(
 
     ys.log(f"[INFO] Using SDC file '{sdc_path}' for ABC…")
 
-    if len(inputs):
+    if checkpoint_in is not None:
+        ys.log(f"[INFO] Reading elaborated design from '{checkpoint_in}'…")
+        d.run_pass("read_rtlil", checkpoint_in)
+    elif len(inputs):
         d.read_verilog_files(
             inputs,
             top=config["DESIGN_NAME"],
@@ -322,6 +328,8 @@ def synthesize(
         "-nokeep_asserts",
     )
     d.run_pass("rename", "-top", config["DESIGN_NAME"])
+    if checkpoint_out := extra.get("checkpoint_out"):
+        d.write_checkpoint(checkpoint_out, extra["checkpoint_key"])
     d.run_pass("select", "-module", config["DESIGN_NAME"])
     if config["SYNTH_SHOW"]:
         d.run_pass(
@@ -361,6 +369,23 @@ def synthesize(
         d.run_pass("write_json", f"{output}.json")
         exit(0)
 
+    incremental: Optional[IncrementalSynthesis] = None
+    if cache_dir := config.get("SYNTH_INCREMENTAL_CACHE_DIR"):
+        if config["SYNTH_HIERARCHY_MODE"] != "keep":
+            ys.log_warning(
+                "SYNTH_INCREMENTAL_CACHE_DIR is only used when SYNTH_HIERARCHY_MODE is 'keep': synthesizing all modules…"
+            )
+        else:
+            incremental = IncrementalSynthesis(
+                cache_dir,
+                get_synthesis_key(config, libs, ys.Globals.yosys_version_str),
+                step_dir,
+            )
+            cached = incremental.stub_cached_modules(d, config["DESIGN_NAME"])
+            ys.log(
+                f"[INFO] Reusing {cached}/{len(incremental.hashes)} synthesized modules from '{cache_dir}'…"
+            )
+
     if config["SYNTH_TRISTATE_MAP"] is not None:
         d.run_pass("tribuf")
 
@@ -451,7 +476,7 @@ def synthesize(
 
     script_creator = ABCScriptCreator(config)
 
-    def run_strategy(d):
+    def run_strategy(d, incremental: Optional[IncrementalSynthesis] = None):
         abc_script = script_creator.generate_abc_script(
             step_dir,
             config["SYNTH_STRATEGY"],
@@ -489,6 +514,9 @@ def synthesize(
         if config["SYNTH_DIRECT_WIRE_BUFFERING"]:
             d.run_pass("insbuf", "-buf", *config["SYNTH_BUFFER_CELL"].split("/"))
 
+        if incremental is not None:
+            incremental.splice(d)
+
         d.tee("check", o=os.path.join(report_dir, "chk.rpt"))
         d.tee("stat", "-json", *lib_arguments, o=os.path.join(report_dir, "stat.json"))
         d.tee("stat", *lib_arguments, o=os.path.join(report_dir, "stat.rpt"))
@@ -519,7 +547,7 @@ def synthesize(
         )
         d.run_pass("write_json", f"{output}.json")
 
-    run_strategy(d)
+    run_strategy(d, incremental)
 
     if config["SYNTH_HIERARCHY_MODE"] == "deferred_flatten":
         # Resynthesize, flattening
@@ -18,6 +18,7 @@
 import os
 import re
 import sys
+import shutil
 from typing import Iterable, List, Optional, Tuple, Union
 
 try:
@@ -177,3 +178,19 @@ def _Design_add_blackbox_models(
 
 
 ys.Design.add_blackbox_models = _Design_add_blackbox_models  # type: ignore
+
+
+def _Design_write_checkpoint(self, path: str, key: str):
+    """
+    Writes the design as RTLIL, prefixed with a comment containing the key of
+    the inputs it was elaborated from.
+    """
+    tmp_path = f"{path}.tmp"
+    self.run_pass("write_rtlil", tmp_path)
+    with open(path, "w", encoding="utf8") as out, open(tmp_path, encoding="utf8") as f:
+        out.write(f"# librelane-elaboration-key: {key}\n")
+        shutil.copyfileobj(f, out)
+    os.unlink(tmp_path)
+
+
+ys.Design.write_checkpoint = _Design_write_checkpoint  # type: ignore
@@ -0,0 +1,31 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The Server Module
+-----------------
+
+A long-lived LibreLane server that keeps the Python interpreter, all steps,
+flows and plugins and evaluated PDK configurations loaded, so that many short
+flow or step invocations (e.g. from a build system or a design-space
+exploration script) do not each pay for start-up.
+
+The server is started using ``librelane.server serve`` and jobs are submitted
+using ``librelane.server submit``, which accepts the same arguments as
+``librelane`` (or ``librelane.steps`` with ``--step``).
+
+Only the client and the wire protocol are imported by this module;
+:class:`librelane.server.server.Server` is imported on demand.
+"""
+from .protocol import Job, SOCKET_ENV, get_default_socket_path
+from .client import submit, ServerUnavailable
@@ -0,0 +1,134 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sys
+import signal
+import socket
+
+import click
+
+from .client import ServerUnavailable, submit as submit_job
+from .protocol import SOCKET_ENV, Job, get_default_socket_path
+
+socket_option = click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=get_default_socket_path,
+    show_default=f"${SOCKET_ENV} or $XDG_RUNTIME_DIR/librelane-$UID.sock",
+    help="The path of the server's Unix domain socket.",
+)
+
+
+@click.group
+def cli():
+    pass
+
+
+@click.command()
+@socket_option
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default=True,
+    help="The maximum number of jobs to run concurrently. Further jobs wait until one concludes.",
+)
+def serve(socket_path: str, jobs: int):
+    """
+    Starts a LibreLane server listening on a Unix domain socket.
+    """
+    from .server import Server
+    from ..logging import err, info
+
+    if os.path.exists(socket_path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(socket_path)
+        else:
+            err(f"A server is already listening on '{socket_path}'.")
+            sys.exit(1)
+        finally:
+            probe.close()
+
+    server = Server(socket_path, max_jobs=jobs)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        info("Loading steps, flows and plugins…")
+        server.warm_up()
+        info(f"Listening on '{socket_path}'.")
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+
+
+@click.command(
+    context_settings={
+        "ignore_unknown_options": True,
+        "allow_interspersed_args": False,
+    }
+)
+@socket_option
+@click.option(
+    "--step",
+    is_flag=True,
+    help="Run the arguments using the librelane.steps commandline interface instead of the librelane commandline interface.",
+)
+@click.option(
+    "--fallback/--no-fallback",
+    default=False,
+    show_default=True,
+    help="If no server is listening, run the job in a new process instead of failing.",
+)
+@click.argument("args", nargs=-1, type=click.UNPROCESSED)
+def submit(socket_path: str, step: bool, fallback: bool, args: tuple):
+    """
+    Submits a job to a running LibreLane server and streams its output.
+
+    ARGS are passed to the librelane (or librelane.steps) commandline
+    interface as-is. Use -- before them if they include --help.
+    """
+    job = Job(
+        kind="step" if step else "flow",
+        argv=list(args),
+        cwd=os.getcwd(),
+        env=dict(os.environ),
+    )
+    try:
+        code = submit_job(job, socket_path, sys.stdout.buffer)
+    except ServerUnavailable as e:
+        if fallback:
+            module = "librelane.steps" if step else "librelane"
+            os.execv(sys.executable, [sys.executable, "-m", module, *args])
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+    except ConnectionError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    sys.exit(code)
+
+
+cli.add_command(serve)
+cli.add_command(submit)
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,58 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import socket
+from typing import BinaryIO
+
+from .protocol import EXIT, OUTPUT, Job, decode_exit, recv_frame
+
+
+class ServerUnavailable(ConnectionError):
+    """
+    Raised when no LibreLane server is listening on the requested socket.
+    """
+
+    pass
+
+
+def submit(job: Job, socket_path: str, output: BinaryIO) -> int:
+    """
+    Submits a job to a running LibreLane server, writing its output to
+    ``output`` as it arrives.
+
+    If interrupted, the connection is closed, which cancels the job.
+
+    :param job: The job to submit.
+    :param socket_path: The path to the server's Unix domain socket.
+    :param output: A binary stream to write the job's output to.
+    :returns: The exit code of the job.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ServerUnavailable(
+                f"No LibreLane server is listening on '{socket_path}'."
+            ) from e
+        sock.sendall(job.dumps())
+        while frame := recv_frame(sock):
+            kind, payload = frame
+            if kind == OUTPUT:
+                output.write(payload)
+                output.flush()
+            elif kind == EXIT:
+                return decode_exit(payload)
+        raise ConnectionError("The server closed the connection unexpectedly.")
+    finally:
+        sock.close()
@@ -0,0 +1,125 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The wire protocol between the LibreLane server and its clients.
+
+This module only uses the standard library so clients start quickly.
+
+A client sends a single job request as a line of JSON, after which the server
+sends a sequence of frames: a one-byte frame kind, a four-byte big-endian
+payload length, then the payload.
+"""
+import os
+import json
+import socket
+import struct
+import tempfile
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Literal, Optional, Tuple
+
+SOCKET_ENV = "LIBRELANE_SERVER_SOCKET"
+
+OUTPUT = b"o"
+"""Frame kind for output of the job. The payload is raw bytes."""
+
+EXIT = b"x"
+"""Frame kind sent once the job has concluded. The payload is the exit code as
+a four-byte big-endian signed integer."""
+
+_header = struct.Struct(">cI")
+_exit_code = struct.Struct(">i")
+
+JobKind = Literal["flow", "step"]
+
+
+def get_default_socket_path() -> str:
+    """
+    :returns: The value of the environment variable ``LIBRELANE_SERVER_SOCKET``
+        if set, otherwise ``librelane-{uid}.sock`` in ``$XDG_RUNTIME_DIR`` (or
+        the temporary directory if unset).
+    """
+    if path := os.getenv(SOCKET_ENV):
+        return path
+    directory = os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(directory, f"librelane-{os.getuid()}.sock")
+
+
+@dataclass
+class Job:
+    """
+    A request to run a LibreLane commandline interface on the server.
+
+    :param kind: ``flow`` for the ``librelane`` CLI or ``step`` for the
+        ``librelane.steps`` CLI.
+    :param argv: The commandline arguments, excluding the program name.
+    :param cwd: The working directory to run the job in.
+    :param env: The environment variables to run the job with.
+    """
+
+    kind: JobKind
+    argv: List[str]
+    cwd: str
+    env: Dict[str, str] = field(default_factory=dict)
+
+    def dumps(self) -> bytes:
+        return json.dumps(asdict(self)).encode("utf8") + b"\n"
+
+    @classmethod
+    def loads(Self, line: bytes) -> "Job":
+        raw = json.loads(line)
+        if raw.get("kind") not in ("flow", "step"):
+            raise ValueError(f"Invalid job kind '{raw.get('kind')}'.")
+        return Self(
+            kind=raw["kind"],
+            argv=[str(arg) for arg in raw["argv"]],
+            cwd=str(raw["cwd"]),
+            env={str(k): str(v) for k, v in raw.get("env", {}).items()},
+        )
+
+
+def send_frame(sock: socket.socket, kind: bytes, payload: bytes):
+    sock.sendall(_header.pack(kind, len(payload)) + payload)
+
+
+def send_exit(sock: socket.socket, code: int):
+    send_frame(sock, EXIT, _exit_code.pack(code))
+
+
+def _recv_exactly(sock: socket.socket, count: int) -> Optional[bytes]:
+    result = b""
+    while len(result) < count:
+        chunk = sock.recv(count - len(result))
+        if len(chunk) == 0:
+            return None
+        result += chunk
+    return result
+
+
+def recv_frame(sock: socket.socket) -> Optional[Tuple[bytes, bytes]]:
+    """
+    :returns: A tuple of the frame kind and the payload, or ``None`` if the
+        connection was closed.
+    """
+    header = _recv_exactly(sock, _header.size)
+    if header is None:
+        return None
+    kind, length = _header.unpack(header)
+    payload = _recv_exactly(sock, length)
+    if payload is None:
+        return None
+    return kind, payload
+
+
+def decode_exit(payload: bytes) -> int:
+    return _exit_code.unpack(payload)[0]
@@ -0,0 +1,227 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sys
+import shlex
+import signal
+import socket
+import _thread
+import threading
+import traceback
+import socketserver
+import multiprocessing
+from typing import List, Optional, Tuple
+
+import click
+
+from .protocol import OUTPUT, Job, JobKind, send_exit, send_frame
+from ..config import Config
+from ..logging import info, verbose, warn
+
+PDKArguments = Tuple[str, str, Optional[str], Optional[str]]
+
+
+def invoke(kind: JobKind, argv: List[str]) -> int:
+    """
+    Runs the ``librelane`` (for ``flow``) or ``librelane.steps`` (for
+    ``step``) commandline interface in this process.
+
+    :param kind: The kind of job.
+    :param argv: The commandline arguments, excluding the program name.
+    :returns: The exit code
+    """
+    if kind == "flow":
+        from ..__main__ import cli
+
+        command, prog_name = cli, "librelane"
+    else:
+        from ..steps.__main__ import cli
+
+        command, prog_name = cli, "librelane.steps"
+
+    try:
+        result = command.main(
+            args=argv,
+            prog_name=prog_name,
+            standalone_mode=False,
+        )
+        return result if isinstance(result, int) else 0
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        print("Aborted!", file=sys.stderr)
+        return 1
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except KeyboardInterrupt:
+        return 130
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    server: "Server"
+
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            job = Job.loads(line)
+        except (ValueError, KeyError, TypeError) as e:
+            send_frame(self.request, OUTPUT, f"Invalid job request: {e}\n".encode())
+            send_exit(self.request, 1)
+            return
+        self.server.run_job(job, self.request)
+
+
+class Server(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """
+    A long-lived server that accepts LibreLane flow and step jobs over a Unix
+    domain socket.
+
+    Imports of all steps, flows and plugins are done once when the server
+    starts. Each job then runs in a process forked from the server, so it
+    starts with these imports already done and with any state left behind by
+    other jobs discarded. PDK configurations evaluated by jobs are reported
+    back to the server and evaluated once more there, so later jobs using the
+    same PDK inherit them.
+
+    The socket is only accessible by the user running the server.
+
+    :param socket_path: The path to create the Unix domain socket at.
+    :param max_jobs: The maximum number of jobs to run concurrently. Further
+        connections wait until a job finishes.
+    """
+
+    def __init__(self, socket_path: str, max_jobs: int):
+        self.max_children = max_jobs
+        self.__evaluated_pdks: multiprocessing.SimpleQueue = (
+            multiprocessing.SimpleQueue()
+        )
+        super().__init__(socket_path, _JobHandler)
+
+    def server_bind(self):
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def warm_up(self):
+        """
+        Imports all steps, flows, design formats, plugins and commandline
+        interfaces.
+        """
+        from ..flows import Flow
+        from ..steps import Step
+        from ..state import DesignFormat
+        from .. import __main__  # noqa: F401
+        from ..steps import __main__ as steps_main  # noqa: F401
+
+        Step.factory.list()
+        Flow.factory.list()
+        DesignFormat.factory.list()
+        try:
+            import ciel  # noqa: F401
+        except ImportError:
+            pass
+
+    def service_actions(self):
+        super().service_actions()
+        while not self.__evaluated_pdks.empty():
+            pdks: List[PDKArguments] = self.__evaluated_pdks.get()
+            for pdk_root, pdk, scl, pad in pdks:
+                verbose(f"Preloading PDK configuration for '{pdk}' ({pdk_root})…")
+                try:
+                    Config.preload_pdk(pdk_root, pdk, scl, pad)
+                except Exception as e:
+                    warn(f"Failed to preload PDK configuration for '{pdk}': {e}")
+
+    def run_job(self, job: Job, sock: socket.socket):
+        """
+        Runs a job in the current (forked) process, streaming its output to
+        ``sock`` and finally sending its exit code.
+
+        If the client disconnects before the job concludes, the job is
+        interrupted.
+        """
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        info(f"Running {job.kind} job in '{job.cwd}': {shlex.join(job.argv)}")
+        inherited_pdk_count = len(Config.evaluated_pdks)
+
+        os.chdir(job.cwd)
+        os.environ.clear()
+        os.environ.update(job.env)
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        read_fd, write_fd = os.pipe()
+        devnull_fd = os.open(os.devnull, os.O_RDWR)
+        os.dup2(devnull_fd, 0)
+        os.dup2(write_fd, 1)
+        os.dup2(write_fd, 2)
+        os.close(write_fd)
+        for stream in [sys.stdout, sys.stderr]:
+            if hasattr(stream, "reconfigure"):
+                stream.reconfigure(line_buffering=True)
+
+        done = threading.Event()
+
+        def relay():
+            connected = True
+            with open(read_fd, "rb", buffering=0) as f:
+                while chunk := f.read(65536):
+                    if not connected:
+                        continue
+                    try:
+                        send_frame(sock, OUTPUT, chunk)
+                    except OSError:
+                        connected = False
+                        _thread.interrupt_main()
+
+        def watch():
+            try:
+                while sock.recv(4096):
+                    pass
+            except OSError:
+                pass
+            if not done.is_set():
+                _thread.interrupt_main()
+
+        relay_thread = threading.Thread(target=relay, daemon=True)
+        relay_thread.start()
+        threading.Thread(target=watch, daemon=True).start()
+
+        try:
+            code = invoke(job.kind, job.argv)
+        except KeyboardInterrupt:
+            code = 130
+        done.set()
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(devnull_fd, 1)
+        os.dup2(devnull_fd, 2)
+        relay_thread.join()
+
+        try:
+            send_exit(sock, code)
+        except OSError:
+            pass
+
+        if new_pdks := Config.evaluated_pdks[inherited_pdk_count:]:
+            self.__evaluated_pdks.put(new_pdks)
@@ -20,9 +20,15 @@ from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional, ClassVar
 from deprecated.sphinx import deprecated
 
+from ..plugins import import_all, import_builtin, load_plugins
+
 
 class DFMetaclass(type):
     def __getattr__(Self, key: str):
+        # Only look up design formats once the class is fully constructed
+        # (i.e. not while @dataclass is looking for default values)
+        if key.startswith("__") or "__dataclass_fields__" not in Self.__dict__:
+            raise AttributeError(key)
         if df := Self.factory.get(key):
             return df
         raise AttributeError(
@@ -136,8 +142,15 @@ class DesignFormat(metaclass=DFMetaclass):
             Retrieves a DesignFormat type from the registry using a lookup
             string.
 
+            Plugins are loaded first, then design formats registered by
+            built-in steps are imported using the registry manifest.
+
             :param name: The registered name of the Step. Case-insensitive.
             """
+            load_plugins()
+            if found := Self._registry.get(name):
+                return found
+            import_builtin("design_formats", name)
             return Self._registry.get(name)
 
         @classmethod
@@ -145,6 +158,7 @@ class DesignFormat(metaclass=DFMetaclass):
             """
             :returns: A list of IDs of all registered DesignFormat.
             """
+            import_all("design_formats")
             return [cls.id for cls in Self._registry.values()]
 
     factory: ClassVar = DesignFormatFactory
@@ -19,10 +19,14 @@ The Step Module
 This modules includes various functions for importing and/or generating LibreLane
 configuration objects. Configuration objects are the primary input to a flow.
 """
+import importlib
+from typing import TYPE_CHECKING
+
 from .step import (
     StepError,
     DeferredStepError,
     StepException,
+    StepCancelled,
     StepNotFound,
     Step,
     OutputProcessor,
@@ -31,31 +35,77 @@ from .step import (
     ViewsUpdate,
 )
 from .tclstep import TclStep
-from . import checker as Checker
-
-# You'll notice some TclStep subclasses are exposed separately-
-# this is for documentation.
-from . import yosys as Yosys
-from .yosys import YosysStep
-
+from .executor import (
+    StepExecutor,
+    ProcessStepExecutor,
+    get_step_executor,
+    set_step_executor,
+)
 from .openroad_alerts import (
     OpenROADAlert,
     OpenROADOutputProcessor,
     SupportsOpenROADAlerts,
 )
 
-from . import openroad as OpenROAD
-from .openroad import OpenROADStep
+# The modules implementing built-in steps are only imported when first
+# accessed, either as attributes of this module or through ``Step.factory``.
+#
+# You'll notice some TclStep subclasses are exposed separately-
+# this is for documentation.
+if TYPE_CHECKING:
+    from . import checker as Checker
+
+    from . import yosys as Yosys
+    from .yosys import YosysStep
+
+    from . import openroad as OpenROAD
+    from .openroad import OpenROADStep
+
+    from . import odb as Odb
+    from .odb import OdbpyStep, ECOBuffer, ECODiode
+
+    from . import magic as Magic
+    from .magic import MagicStep
+
+    from . import netgen as Netgen
+    from .netgen import NetgenStep
+
+    from . import klayout as KLayout
+    from . import misc as Misc
+    from . import verilator as Verilator
+
+_lazy_modules = {
+    "Checker": "checker",
+    "Yosys": "yosys",
+    "OpenROAD": "openroad",
+    "Odb": "odb",
+    "Magic": "magic",
+    "Netgen": "netgen",
+    "KLayout": "klayout",
+    "Misc": "misc",
+    "Verilator": "verilator",
+}
+_lazy_attributes = {
+    "YosysStep": "yosys",
+    "OpenROADStep": "openroad",
+    "OdbpyStep": "odb",
+    "ECOBuffer": "odb",
+    "ECODiode": "odb",
+    "MagicStep": "magic",
+    "NetgenStep": "netgen",
+}
 
-from . import odb as Odb
-from .odb import OdbpyStep, ECOBuffer, ECODiode
 
-from . import magic as Magic
-from .magic import MagicStep
+def __getattr__(name: str):
+    if submodule := _lazy_modules.get(name):
+        value = importlib.import_module(f".{submodule}", __name__)
+    elif submodule := _lazy_attributes.get(name):
+        value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-from . import netgen as Netgen
-from .netgen import NetgenStep
 
-from . import klayout as KLayout
-from . import misc as Misc
-from . import verilator as Verilator
+def __dir__():
+    return sorted([*globals(), *_lazy_modules, *_lazy_attributes])
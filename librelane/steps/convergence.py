@@ -0,0 +1,310 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Output processors that follow the progress of iterative tools, such as
+routers, placers and timing repair, as their output is streamed.
+
+Every iteration reported by the tool is recorded in a CSV file in the report
+directory as it arrives and, once the subprocess concludes, as metrics of the
+form ``{metric}__pass:{pass}__iter:{iteration}``. A new pass starts whenever
+the iteration count goes back, e.g., when detailed routing is re-run after
+antenna repair.
+
+The subprocess can also be aborted early if the tool does not seem to
+converge, which is configured using the variables created by
+:func:`convergence_variables`.
+"""
+import os
+import re
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+from .step import OutputProcessor, StepError
+from ..config import Variable
+
+
+class ConvergenceAborted(StepError):
+    """
+    Raised when a subprocess is aborted by a
+    :class:`ConvergenceOutputProcessor` because its abort policy was violated.
+    """
+
+    pass
+
+
+def convergence_variables(prefix: str, quantity: str) -> List[Variable]:
+    """
+    Creates the configuration variables for the abort policies of a
+    :class:`ConvergenceOutputProcessor`.
+
+    :param prefix: The prefix of the variable names, e.g. ``DRT``.
+    :param quantity: A description of the quantity tracked, used in the
+        variables' descriptions.
+    :returns: The variables
+    """
+    return [
+        Variable(
+            f"{prefix}_ABORT_STALL_ITERS",
+            Optional[int],
+            f"If set, aborts if {quantity} did not improve by at least {prefix}_ABORT_STALL_IMPROVEMENT over this many iterations.",
+        ),
+        Variable(
+            f"{prefix}_ABORT_STALL_IMPROVEMENT",
+            Decimal,
+            f"The minimum improvement of {quantity} over {prefix}_ABORT_STALL_ITERS iterations, relative to the value at the start of these iterations.",
+            default=1,
+            units="%",
+        ),
+        Variable(
+            f"{prefix}_ABORT_LIMIT",
+            Optional[Tuple[int, Decimal]],
+            f"An iteration and a value, in that order. If set, aborts if {quantity} is still worse than the value at or after the iteration.",
+        ),
+    ]
+
+
+class ConvergenceOutputProcessor(OutputProcessor[Dict[str, Any]]):
+    """
+    An abstract output processor that follows a quantity reported by a tool
+    every number of iterations, where a value of zero is considered converged.
+
+    Subclasses implement :meth:`parse`. Lines are never consumed.
+
+    If an abort policy is violated, :class:`ConvergenceAborted` is raised, and
+    the subprocess is terminated by :meth:`Step.run_subprocess`.
+
+    :cvar metric: The base name of the metrics to record.
+    :cvar quantity: A human-readable name of the quantity.
+    :cvar config_prefix: The prefix of the variables created by
+        :func:`convergence_variables` in the configuration of the step.
+    :cvar higher_is_better: Whether the quantity is improving as it increases
+        towards zero (e.g. negative slack), as opposed to decreasing towards
+        zero (e.g. violations).
+    """
+
+    key = "convergence_metrics"
+
+    metric: ClassVar[str] = NotImplemented
+    quantity: ClassVar[str] = NotImplemented
+    config_prefix: ClassVar[str] = NotImplemented
+    higher_is_better: ClassVar[bool] = False
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        config = self.step.config
+        self.stall_iters: Optional[int] = config.get(
+            f"{self.config_prefix}_ABORT_STALL_ITERS"
+        )
+        self.stall_improvement: Decimal = config.get(
+            f"{self.config_prefix}_ABORT_STALL_IMPROVEMENT", Decimal(1)
+        )
+        self.limit: Optional[Tuple[int, Decimal]] = config.get(
+            f"{self.config_prefix}_ABORT_LIMIT"
+        )
+
+        self.metrics: Dict[str, Any] = {}
+        self.current_pass = 0
+        self.samples: List[Tuple[int, Decimal]] = []
+        self.csv_path = os.path.join(self.report_dir, f"{self.metric}.convergence.csv")
+        with open(self.csv_path, "w", encoding="utf8") as f:
+            f.write("pass,iteration,value,time\n")
+
+    def parse(self, line: str) -> Optional[Tuple[int, Decimal]]:
+        """
+        :param line: A line of output
+        :returns: The iteration and the value of the quantity reported by the
+            line, if any.
+        """
+        raise NotImplementedError()
+
+    def process_line(self, line: str) -> bool:
+        sample = self.parse(line)
+        if sample is not None:
+            self.add_sample(*sample)
+        return False
+
+    def distance(self, value: Decimal) -> Decimal:
+        """
+        :returns: How far a value is from convergence.
+        """
+        if self.higher_is_better:
+            return max(Decimal(0), -value)
+        return max(Decimal(0), value)
+
+    def add_sample(self, iteration: int, value: Decimal):
+        """
+        Records the value of the quantity at an iteration, then checks the
+        abort policies.
+
+        :raises ConvergenceAborted: If an abort policy is violated.
+        """
+        if len(self.samples) and iteration <= self.samples[-1][0]:
+            self.current_pass += 1
+            self.samples = []
+        self.samples.append((iteration, value))
+        self.metrics[f"{self.metric}__pass:{self.current_pass}__iter:{iteration}"] = (
+            value
+        )
+        with open(self.csv_path, "a", encoding="utf8") as f:
+            f.write(f"{self.current_pass},{iteration},{value},{time.time()}\n")
+
+        if self.limit is not None:
+            limit_iteration, limit_value = self.limit
+            if iteration >= limit_iteration and self.distance(value) > self.distance(
+                limit_value
+            ):
+                self.abort(
+                    f"{self.quantity} is {value} at iteration {iteration}, worse than the limit of {limit_value} from iteration {limit_iteration}"
+                )
+
+        if self.stall_iters is not None:
+            reference = None
+            for sample in self.samples:
+                if sample[0] > iteration - self.stall_iters:
+                    break
+                reference = sample
+            if reference is not None:
+                before = self.distance(reference[1])
+                if before != 0:
+                    improvement = (before - self.distance(value)) / before * 100
+                    if improvement < self.stall_improvement:
+                        self.abort(
+                            f"{self.quantity} went from {reference[1]} at iteration {reference[0]} to {value} at iteration {iteration}, an improvement of less than {self.stall_improvement}%"
+                        )
+
+    def abort(self, reason: str):
+        raise ConvergenceAborted(
+            f"{self.step.name}: Aborted as the tool does not seem to converge: {reason}."
+        )
+
+    def result(self) -> Dict[str, Any]:
+        """
+        :returns: The recorded values as metrics.
+        """
+        return self.metrics
+
+
+def _to_decimal(value: str) -> Optional[Decimal]:
+    try:
+        return Decimal(value.strip().rstrip("%"))
+    except InvalidOperation:
+        return None
+
+
+class TableConvergenceOutputProcessor(ConvergenceOutputProcessor):
+    """
+    A :class:`ConvergenceOutputProcessor` for tools that report progress as
+    tables delimited by ``|``, where the first column of the header is
+    ``Iter`` or ``Iteration``, e.g. OpenROAD's global placement and timing repair.
+
+    Any OpenROAD message prefix (e.g. ``[INFO GPL-0100]``) is ignored.
+
+    :cvar column: The header of the column containing the quantity.
+    """
+
+    column: ClassVar[str] = NotImplemented
+
+    message_prefix_rx = re.compile(r"^\[[A-Z]+ [A-Z]+-\d+\]\s*")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.column_index: Optional[int] = None
+
+    def parse(self, line: str) -> Optional[Tuple[int, Decimal]]:
+        if "|" not in line:
+            return None
+        cells = self.message_prefix_rx.sub("", line).split("|")
+        first = cells[0].strip()
+        if first in ("Iter", "Iteration"):
+            self.column_index = None
+            headers = [cell.strip() for cell in cells]
+            if self.column in headers:
+                self.column_index = headers.index(self.column)
+            return None
+        if (
+            self.column_index is None
+            or not first.isdigit()
+            or len(cells) <= self.column_index
+        ):
+            return None
+        value = _to_decimal(cells[self.column_index])
+        if value is None:
+            return None
+        return int(first), value
+
+
+class DetailedRoutingConvergence(ConvergenceOutputProcessor):
+    """
+    Follows the number of violations after each iteration of OpenROAD's
+    detailed router.
+    """
+
+    metric = "route__drc_errors"
+    quantity = "The number of DRC violations"
+    config_prefix = "DRT"
+    prefixes = ("[INFO DRT-0195]", "[INFO DRT-0199]")
+
+    iteration_rx = re.compile(r"Start (\d+)\w* optimization iteration")
+    violations_rx = re.compile(r"Number of violations = (\d+)")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.iteration: Optional[int] = None
+
+    def parse(self, line: str) -> Optional[Tuple[int, Decimal]]:
+        if match := self.iteration_rx.search(line):
+            self.iteration = int(match[1])
+        elif self.iteration is not None and (match := self.violations_rx.search(line)):
+            return self.iteration, Decimal(match[1])
+        return None
+
+
+class GlobalPlacementConvergence(TableConvergenceOutputProcessor):
+    """
+    Follows the overflow during OpenROAD's Nesterov global placement, in either
+    the tabulated or the older ``[NesterovSolve] Iter: …`` formats.
+    """
+
+    metric = "global_place__overflow"
+    quantity = "The overflow"
+    config_prefix = "PL"
+    column = "Overflow"
+
+    legacy_rx = re.compile(r"^\[NesterovSolve\] Iter:\s*(\d+) overflow:\s*([\d.]+)")
+
+    def parse(self, line: str) -> Optional[Tuple[int, Decimal]]:
+        if match := self.legacy_rx.match(line):
+            return int(match[1]), Decimal(match[2])
+        return super().parse(line)
+
+
+class RepairTimingConvergence(TableConvergenceOutputProcessor):
+    """
+    Follows the worst negative slack during OpenROAD's timing repair. Setup
+    and hold repair are recorded as separate passes.
+    """
+
+    metric = "timing__repair__ws"
+    quantity = "The worst slack"
+    column = "WNS"
+    higher_is_better = True
+
+
+class ResizerTimingPostCTSConvergence(RepairTimingConvergence):
+    config_prefix = "PL_RESIZER_TIMING"
+
+
+class ResizerTimingPostGRTConvergence(RepairTimingConvergence):
+    config_prefix = "GRT_RESIZER_TIMING"
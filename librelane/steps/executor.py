@@ -0,0 +1,224 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Step executors run the steps of a flow somewhere other than the thread of the
+flow itself, e.g., on other machines.
+
+An executor is installed globally using :func:`set_step_executor`, after which
+:meth:`librelane.flows.Flow.start_step` and
+:meth:`librelane.flows.Flow.start_step_async` submit all steps it accepts to it.
+
+Executors for batch or cluster systems may be implemented by subclassing
+:class:`StepExecutor`. A step may be run elsewhere by writing its inputs to a
+step directory using :meth:`Step._write_inputs`, recreating it from that
+directory using :meth:`Step.load`, running it using :meth:`Step.start` with
+the same step directory, then making the step directory (including
+``state_out.json``) available on the machine running the flow again.
+:class:`ProcessStepExecutor` does so using local worker processes over the
+(trivially shared) local filesystem.
+"""
+import os
+import multiprocessing
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple, Type
+
+from .step import (
+    DeferredStepError,
+    Step,
+    StepError,
+    StepException,
+    StepSignalled,
+)
+from ..state import State
+from ..common import Filter, Toolbox, get_tpe
+from ..logging import get_log_level, options, set_log_level, verbose
+
+
+class StepExecutor(ABC):
+    """
+    An abstract base class for objects that run steps on behalf of flows.
+    """
+
+    def accepts(self, step: Step) -> bool:
+        """
+        :param step: A step about to be started by a flow.
+        :returns: Whether this executor should run the step. Steps that are
+            not accepted are run in-process as usual.
+        """
+        return True
+
+    @abstractmethod
+    def submit(
+        self,
+        step: Step,
+        toolbox: Toolbox,
+        step_dir: str,
+        **kwargs,
+    ) -> Future[State]:
+        """
+        Starts running a step.
+
+        :param step: The step to run. Its input state may not yet be realized.
+        :param toolbox: The flow's toolbox.
+        :param step_dir: The step directory to use.
+        :param kwargs: Keyword arguments to :meth:`Step.start`.
+        :returns: A future realized with the output state of the step once it
+            concludes. ``step.step_dir`` and ``step.state_out`` must be set
+            before it is realized.
+        """
+        raise NotImplementedError()
+
+    def shutdown(self):
+        """
+        Releases any resources held by the executor.
+        """
+        pass
+
+
+_executor: Optional[StepExecutor] = None
+
+
+def set_step_executor(executor: Optional[StepExecutor]):
+    """
+    Sets the executor used by flows to run steps.
+
+    :param executor: The executor, or ``None`` to run all steps in-process.
+    """
+    global _executor
+    _executor = executor
+
+
+def get_step_executor() -> Optional[StepExecutor]:
+    """
+    :returns: The executor used by flows to run steps, if one is set.
+    """
+    return _executor
+
+
+_errors: Dict[str, Type[StepError]] = {
+    Error.__name__: Error
+    for Error in [StepError, DeferredStepError, StepException, StepSignalled]
+}
+
+
+def _initialize_worker(log_level: int, condensed: bool, show_progress_bar: bool):
+    set_log_level(log_level)
+    options.set_condensed_mode(condensed)
+    options.set_show_progress_bar(show_progress_bar)
+
+
+def _run_in_worker(
+    step_dir: str,
+    pdk_root: str,
+    tmp_dir: str,
+    cache_dir: Optional[str],
+) -> Optional[Tuple[str, str]]:
+    try:
+        step = Step.load(
+            os.path.join(step_dir, "config.json"),
+            os.path.join(step_dir, "state_in.json"),
+            pdk_root,
+        )
+        step.start(toolbox=Toolbox(tmp_dir, cache_dir), step_dir=step_dir)
+    except StepError as e:
+        return type(e).__name__, str(e)
+    except Exception as e:
+        return StepException.__name__, f"{type(e).__name__}: {e}"
+    return None
+
+
+class ProcessStepExecutor(StepExecutor):
+    """
+    A reference :class:`StepExecutor` that runs steps in a pool of local worker
+    processes, communicating with them only through the step directory, like
+    an executor for remote machines with a shared filesystem would.
+
+    Workers are started on first use and reused for subsequent steps, and
+    inherit the log level of the flow.
+
+    :param step_ids: Wildcards of the IDs of steps to run in workers, e.g.
+        ``["OpenROAD.DetailedRouting", "Magic.*"]``. All other steps run
+        in-process.
+    :param max_workers: The maximum number of steps to run concurrently.
+    """
+
+    def __init__(
+        self,
+        step_ids: Iterable[str] = ("*",),
+        max_workers: Optional[int] = None,
+    ):
+        self.filter = Filter(list(step_ids))
+        self.max_workers = max_workers
+        self.__pool: Optional[ProcessPoolExecutor] = None
+
+    def accepts(self, step: Step) -> bool:
+        return self.filter.match(step.id)
+
+    def submit(
+        self,
+        step: Step,
+        toolbox: Toolbox,
+        step_dir: str,
+        **kwargs,
+    ) -> Future[State]:
+        if len(kwargs):
+            verbose(
+                f"Keyword arguments to '{step.id}' are ignored when running in a worker process: {', '.join(kwargs)}"
+            )
+        return get_tpe().submit(self.__run, step, toolbox, step_dir)
+
+    def shutdown(self):
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+
+    def __get_pool(self) -> ProcessPoolExecutor:
+        if self.__pool is None:
+            self.__pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+                initargs=(
+                    get_log_level(),
+                    options.get_condensed_mode(),
+                    options.get_show_progress_bar(),
+                ),
+            )
+        return self.__pool
+
+    def __run(self, step: Step, toolbox: Toolbox, step_dir: str) -> State:
+        step_dir = os.path.abspath(step_dir)
+        step._write_inputs(step_dir)
+        verbose(f"Submitting '{step.id}' to a worker process…")
+        error = (
+            self.__get_pool()
+            .submit(
+                _run_in_worker,
+                step_dir,
+                step.config["PDK_ROOT"],
+                os.path.abspath(toolbox.tmp_dir),
+                toolbox.cache_dir,
+            )
+            .result()
+        )
+        if error is not None:
+            name, message = error
+            raise _errors.get(name, StepException)(message)
+
+        step.step_dir = step_dir
+        step.toolbox = toolbox
+        with open(os.path.join(step_dir, "state_out.json"), encoding="utf8") as f:
+            step.state_out = State.loads(f.read())
+        return step.state_out
@@ -17,13 +17,17 @@
 # limitations under the License.
 import os
 import sys
+import json
 import site
 import shlex
 import shutil
+import hashlib
 import subprocess
 from os.path import abspath
+from decimal import Decimal
 from base64 import b64encode
 from tempfile import NamedTemporaryFile
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, Optional, List, Literal, Sequence, Tuple, Union
 
 from .step import ViewsUpdate, MetricsUpdate, Step, StepError, StepException
@@ -82,6 +86,56 @@ class KLayoutStep(Step):
         env["PYTHONPATH"] = ":".join(python_path_elements)
         return super().run_subprocess(cmd, log_to, silent, report_dir, env, **kwargs)
 
+    def run_xor(
+        self,
+        layout_a: Path,
+        layout_b: Path,
+        output: str,
+        threads: int,
+        ignored: str = "",
+        tile_size: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Runs an XOR operation on two GDSII streams with the same top cell,
+        writing the differences per layer to a report database.
+
+        :param output: The path to write the report database to.
+        :param threads: The number of threads to use.
+        :param ignored: A semicolon-delimited list of layers to ignore.
+        :param tile_size: The size of the tiles to parallelize the XOR
+            operation with, in µm.
+        :param \\*\\*kwargs: Passed on to :meth:`run_subprocess`.
+        :returns: The result of :meth:`run_subprocess`. The generated metrics
+            include ``design__xor_difference__count``.
+        """
+        tile_size_options = []
+        if tile_size:
+            tile_size_options += ["--tile-size", str(tile_size)]
+
+        return self.run_subprocess(
+            [
+                "ruby",
+                os.path.join(
+                    get_script_dir(),
+                    "klayout",
+                    "xor.drc",
+                ),
+                "--output",
+                abspath(output),
+                "--top",
+                self.config["DESIGN_NAME"],
+                "--threads",
+                threads,
+                "--ignore",
+                ignored,
+                abspath(layout_a),
+                abspath(layout_b),
+            ]
+            + tile_size_options,
+            **kwargs,
+        )
+
     def get_cli_args(
         self,
         *,
@@ -393,33 +447,16 @@ class XOR(KLayoutStep):
 
         kwargs, env = self.extract_env(kwargs)
 
-        tile_size_options = []
-        if tile_size := self.config["KLAYOUT_XOR_TILE_SIZE"]:
-            tile_size_options += ["--tile-size", str(tile_size)]
-
         thread_count = self.config["KLAYOUT_XOR_THREADS"] or _get_process_limit()
         info(f"Running XOR with {thread_count} threads…")
 
-        subprocess_result = self.run_subprocess(
-            [
-                "ruby",
-                os.path.join(
-                    get_script_dir(),
-                    "klayout",
-                    "xor.drc",
-                ),
-                "--output",
-                abspath(os.path.join(self.step_dir, "xor.xml")),
-                "--top",
-                self.config["DESIGN_NAME"],
-                "--threads",
-                thread_count,
-                "--ignore",
-                ignored,
-                abspath(layout_a),
-                abspath(layout_b),
-            ]
-            + tile_size_options,
+        subprocess_result = self.run_xor(
+            layout_a,
+            layout_b,
+            os.path.join(self.step_dir, "xor.xml"),
+            thread_count,
+            ignored,
+            self.config["KLAYOUT_XOR_TILE_SIZE"],
             env=env,
         )
 
@@ -468,6 +505,30 @@ class DRC(KLayoutStep):
             "Specifies the number of threads to be used in KLayout DRC."
             + "If unset, this will be equal to your machine's thread count.",
         ),
+        Variable(
+            "KLAYOUT_DRC_GROUPS",
+            Optional[Dict[str, Dict[str, str]]],
+            'Rule groups to run as separate KLayout processes in parallel, dividing `KLAYOUT_DRC_THREADS` between them. Each group is a dictionary of options overriding `KLAYOUT_DRC_DEFINES` for that group, e.g. for sky130: `{"feol": {"beol": "false"}, "beol": {"feol": "false", "offgrid": "false", "seal": "false", "floating_metal": "false"}}`. Groups should not share rules: the report databases of all groups are merged into a single report, where violations reported by more than one group are only counted once.',
+        ),
+        Variable(
+            "KLAYOUT_DRC_INCREMENTAL_DIR",
+            Optional[str],
+            "If set, layouts found to be DRC-clean are stored in this directory, keyed by the design name, the runset and its options. Later runs XOR the layout against the stored one and only check windows around the differences, unless the differences exceed `KLAYOUT_DRC_INCREMENTAL_MAX_AREA`. Rules with an interaction range larger than `KLAYOUT_DRC_INCREMENTAL_HALO`, such as density rules, should be disabled using `KLAYOUT_DRC_DEFINES` when using this.",
+        ),
+        Variable(
+            "KLAYOUT_DRC_INCREMENTAL_HALO",
+            Decimal,
+            "The distance around changed regions within which violations are reported in incremental DRC. Windows are clipped at twice this distance so violations caused by clipping are not reported.",
+            default=Decimal(10),
+            units="µm",
+        ),
+        Variable(
+            "KLAYOUT_DRC_INCREMENTAL_MAX_AREA",
+            Decimal,
+            "The maximum area of the changed regions, including the halo, as a percentage of the layout's area for DRC to be limited to windows around them. Otherwise, DRC is run on the entire layout.",
+            default=Decimal(10),
+            units="%",
+        ),
     ]
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
@@ -483,56 +544,39 @@ class DRC(KLayoutStep):
 
         return {}, metrics_updates
 
-    def run_generic(self, state_in: State, **kwargs) -> MetricsUpdate:
-        kwargs, env = self.extract_env(kwargs)
-
-        if not self.config["KLAYOUT_DRC_RUNSET"]:
-            self.warn(
-                f"KLAYOUT_DRC_RUNSET is unset. KLayout.DRC may not be supported for the {self.config['PDK']} PDK. This step will be skipped."
-            )
-            return {}
-
-        drc_script_path = self.config["KLAYOUT_DRC_RUNSET"]
-
-        reports_dir = os.path.join(self.step_dir, "reports")
-        mkdirp(reports_dir)
-        lyrdb_report = os.path.join(reports_dir, "drc.klayout.lyrdb")
-        json_report = os.path.join(reports_dir, "drc.klayout.json")
-
-        input_view = state_in[DesignFormat.GDS]
-        assert isinstance(input_view, Path)
-
+    def run_runset(
+        self,
+        input_view: Path,
+        defines: Dict[str, str],
+        thread_defines: List[str],
+        threads: int,
+        lyrdb_report: str,
+        env: Dict[str, Any],
+        log_to: Optional[str] = None,
+        silent: bool = False,
+    ):
+        """
+        Runs the DRC runset in a single KLayout process.
+
+        :param defines: Variables to pass to the runset.
+        :param thread_defines: The names of the variables the runset reads
+            the number of threads from.
+        :param threads: The number of threads to use.
+        """
         opts = []
-        if self.config["KLAYOUT_DRC_DEFINES"]:
-            for k, v in self.config["KLAYOUT_DRC_DEFINES"].items():
-                opts.extend(
-                    [
-                        "-rd",
-                        f"{k}={v}",
-                    ]
-                )
-
-        threads = self.config["KLAYOUT_DRC_THREADS"] or str(_get_process_limit())
-        if threads != "1":
-            opts.extend(
-                [
-                    "-rd",
-                    f"thr={threads}",
-                    # Use "threads" if possible
-                    "-rd",
-                    f"threads={threads}",
-                ]
-            )
-
-        info(f"Running KLayout DRC with {threads} threads…")
+        for k, v in defines.items():
+            opts.extend(["-rd", f"{k}={v}"])
+        for define in thread_defines:
+            opts.extend(["-rd", f"{define}={threads}"])
 
+        # Not pya script - DRC script is not part of LibreLane
         self.run_subprocess(
             [
                 "klayout",
                 "-b",
                 "-zz",
                 "-r",
-                drc_script_path,
+                self.config["KLAYOUT_DRC_RUNSET"],
                 "-rd",
                 f"input={abspath(input_view)}",
                 "-rd",
@@ -540,104 +584,102 @@ class DRC(KLayoutStep):
                 "-rd",
                 f"report={abspath(lyrdb_report)}",
                 *opts,
-            ]
-        )
-
-        subprocess_result = self.run_pya_script(
-            [
-                "python3",
-                os.path.join(
-                    get_script_dir(),
-                    "klayout",
-                    "xml_drc_report_to_json.py",
-                ),
-                f"--xml-file={abspath(lyrdb_report)}",
-                f"--json-file={abspath(json_report)}",
-                "--metric=klayout__drc_error__count",
             ],
             env=env,
-            log_to=os.path.join(self.step_dir, "xml_drc_report_to_json.log"),
+            log_to=log_to,
+            silent=silent,
         )
-        return subprocess_result["generated_metrics"]
 
-    def run_sky130(self, state_in: State, **kwargs) -> MetricsUpdate:
-        kwargs, env = self.extract_env(kwargs)
-        reports_dir = os.path.join(self.step_dir, "reports")
-        mkdirp(reports_dir)
-        drc_script_path = self.config["KLAYOUT_DRC_RUNSET"]
-        lyrdb_report = os.path.join(reports_dir, "drc.klayout.lyrdb")
-        json_report = os.path.join(reports_dir, "drc.klayout.json")
-        feol = str(self.config["KLAYOUT_DRC_DEFINES"]["feol"]).lower()
-        beol = str(self.config["KLAYOUT_DRC_DEFINES"]["beol"]).lower()
-        floating_metal = str(
-            self.config["KLAYOUT_DRC_DEFINES"]["floating_metal"]
-        ).lower()
-        offgrid = str(self.config["KLAYOUT_DRC_DEFINES"]["offgrid"]).lower()
-        seal = str(self.config["KLAYOUT_DRC_DEFINES"]["seal"]).lower()
-        threads = self.config["KLAYOUT_DRC_THREADS"] or _get_process_limit()
-        info(f"Running KLayout DRC with {threads} threads…")
-
-        input_view = state_in[DesignFormat.GDS]
-        assert isinstance(input_view, Path)
+    def __get_reference_key(self, defines: Dict[str, str]) -> str:
+        key: Dict[str, Any] = {
+            "pdk": self.config["PDK"],
+            "defines": defines,
+            "groups": self.config["KLAYOUT_DRC_GROUPS"],
+        }
+        if runset := self.config["KLAYOUT_DRC_RUNSET"]:
+            key["runset"] = hashlib.sha256(open(runset, "rb").read()).hexdigest()
+        return hashlib.sha256(
+            json.dumps(key, sort_keys=True).encode("utf8")
+        ).hexdigest()
 
-        # Not pya script - DRC script is not part of LibreLane
-        self.run_subprocess(
-            [
-                "klayout",
-                "-b",
-                "-zz",
-                "-r",
-                drc_script_path,
-                "-rd",
-                f"input={abspath(input_view)}",
-                "-rd",
-                f"topcell={self.config['DESIGN_NAME']}",
-                "-rd",
-                f"report={abspath(lyrdb_report)}",
-                "-rd",
-                f"feol={feol}",
-                "-rd",
-                f"beol={beol}",
-                "-rd",
-                f"floating_metal={floating_metal}",
-                "-rd",
-                f"offgrid={offgrid}",
-                "-rd",
-                f"seal={seal}",
-                "-rd",
-                f"threads={threads}",
-            ],
+    def get_drc_windows(
+        self,
+        input_view: Path,
+        reference: str,
+        threads: int,
+        env: Dict[str, Any],
+    ) -> Tuple[bool, MetricsUpdate]:
+        """
+        Compares the layout against a previously DRC-clean layout using XOR,
+        then clips the layout to windows around the differences if they are
+        small enough, writing ``incremental/windows.gds`` and
+        ``incremental/windows.json``.
+
+        :returns: Whether DRC may be limited to the windows, and the metrics
+            of the comparison.
+        """
+        incremental_dir = os.path.join(self.step_dir, "incremental")
+        mkdirp(incremental_dir)
+        xor_report = os.path.join(incremental_dir, "xor.xml")
+
+        info(f"Comparing against the DRC-clean layout at '{reference}'…")
+        self.run_xor(
+            Path(reference),
+            input_view,
+            xor_report,
+            threads,
             env=env,
+            log_to=os.path.join(self.step_dir, "xor.log"),
         )
-
+        windows_json = os.path.join(incremental_dir, "windows.json")
         subprocess_result = self.run_pya_script(
             [
                 "python3",
                 os.path.join(
                     get_script_dir(),
                     "klayout",
-                    "xml_drc_report_to_json.py",
+                    "incremental_drc.py",
                 ),
-                f"--xml-file={abspath(lyrdb_report)}",
-                f"--json-file={abspath(json_report)}",
-                "--metric=klayout__drc_error__count",
+                "windows",
+                f"--xor-report={abspath(xor_report)}",
+                f"--input={abspath(input_view)}",
+                f"--top={self.config['DESIGN_NAME']}",
+                f"--halo={self.config['KLAYOUT_DRC_INCREMENTAL_HALO']}",
+                f"--max-area={self.config['KLAYOUT_DRC_INCREMENTAL_MAX_AREA']}",
+                f"--output-gds={abspath(os.path.join(incremental_dir, 'windows.gds'))}",
+                f"--output-json={abspath(windows_json)}",
             ],
             env=env,
-            log_to=os.path.join(self.step_dir, "xml_drc_report_to_json.log"),
+            log_to=os.path.join(self.step_dir, "incremental_drc_windows.log"),
         )
-        return subprocess_result["generated_metrics"]
-
-    def run_gf180mcu(self, state_in: State, **kwargs) -> MetricsUpdate:
-        kwargs, env = self.extract_env(kwargs)
-
-        if not self.config["KLAYOUT_DRC_RUNSET"]:
-            self.warn(
-                f"KLAYOUT_DRC_RUNSET is unset. KLayout.DRC may not be supported for the {self.config['PDK']} PDK. This step will be skipped."
-            )
-            return {}
-
-        drc_script_path = self.config["KLAYOUT_DRC_RUNSET"]
+        with open(windows_json, encoding="utf8") as f:
+            incremental = json.load(f)["incremental"]
+        return incremental, subprocess_result["generated_metrics"]
 
+    def run_drc(
+        self,
+        state_in: State,
+        defines: Dict[str, str],
+        thread_defines: List[str],
+        env: Dict[str, Any],
+    ) -> MetricsUpdate:
+        """
+        Runs the DRC runset, then converts the resulting report database to
+        JSON.
+
+        If ``KLAYOUT_DRC_GROUPS`` is set, each rule group is run as a separate
+        KLayout process in parallel, with the threads divided between them,
+        and the resulting report databases are merged before conversion.
+
+        If ``KLAYOUT_DRC_INCREMENTAL_DIR`` is set and has a previously
+        DRC-clean version of the layout, the runset is only run on windows
+        around the differences (see :meth:`get_drc_windows`) and only
+        violations near the differences are reported.
+
+        :param defines: Variables to pass to the runset.
+        :param thread_defines: The names of the variables the runset reads
+            the number of threads from.
+        """
         reports_dir = os.path.join(self.step_dir, "reports")
         mkdirp(reports_dir)
         lyrdb_report = os.path.join(reports_dir, "drc.klayout.lyrdb")
@@ -646,44 +688,119 @@ class DRC(KLayoutStep):
         input_view = state_in[DesignFormat.GDS]
         assert isinstance(input_view, Path)
 
-        opts = []
-        if self.config["KLAYOUT_DRC_DEFINES"]:
-            for k, v in self.config["KLAYOUT_DRC_DEFINES"].items():
-                opts.extend(
-                    [
-                        "-rd",
-                        f"{k}={v}",
-                    ]
+        threads = self.config["KLAYOUT_DRC_THREADS"] or _get_process_limit()
+        groups = self.config["KLAYOUT_DRC_GROUPS"] or {}
+
+        metrics_updates: MetricsUpdate = {}
+        reference: Optional[str] = None
+        incremental = False
+        if incremental_dir := self.config["KLAYOUT_DRC_INCREMENTAL_DIR"]:
+            reference = os.path.join(
+                incremental_dir,
+                f"{self.config['DESIGN_NAME']}.{self.__get_reference_key(defines)}.gds",
+            )
+            if os.path.isfile(reference):
+                incremental, metrics_updates = self.get_drc_windows(
+                    input_view, reference, threads, env
+                )
+                if not incremental:
+                    info(
+                        "The changed regions exceed KLAYOUT_DRC_INCREMENTAL_MAX_AREA. Running DRC on the entire layout…"
+                    )
+            else:
+                info(
+                    "No DRC-clean version of this layout was found. Running DRC on the entire layout…"
                 )
 
-        threads = self.config["KLAYOUT_DRC_THREADS"] or str(_get_process_limit())
-        if threads != "1":
-            opts.extend(
-                [
-                    "-rd",
-                    f"thr={threads}",
-                ]
+        drc_input = input_view
+        runset_report = lyrdb_report
+        windows_json = os.path.join(self.step_dir, "incremental", "windows.json")
+        if incremental:
+            drc_input = Path(os.path.join(self.step_dir, "incremental", "windows.gds"))
+            runset_report = os.path.join(reports_dir, "drc.windows.klayout.lyrdb")
+            info(
+                f"Running DRC on {metrics_updates['klayout__drc_window__count']} window(s) around the changed regions…"
             )
 
-        info(f"Running KLayout DRC with {threads} threads…")
+        if incremental and not os.path.exists(drc_input):
+            info("The layout is unchanged.")
+        elif len(groups) == 0:
+            info(f"Running KLayout DRC with {threads} threads…")
+            self.run_runset(
+                drc_input,
+                defines,
+                thread_defines,
+                threads,
+                runset_report,
+                env,
+            )
+        else:
+            group_threads = max(1, threads // len(groups))
+            info(
+                f"Running KLayout DRC for {len(groups)} rule groups with {group_threads} threads each…"
+            )
+            group_reports = []
+            futures: List[Future] = []
+            with ThreadPoolExecutor(max_workers=min(threads, len(groups))) as tpe:
+                for name, group_defines in groups.items():
+                    group_report = os.path.join(
+                        reports_dir, f"drc.{name}.klayout.lyrdb"
+                    )
+                    group_reports.append(group_report)
+                    futures.append(
+                        tpe.submit(
+                            self.run_runset,
+                            drc_input,
+                            {**defines, **group_defines},
+                            thread_defines,
+                            group_threads,
+                            group_report,
+                            env,
+                            log_to=os.path.join(
+                                self.step_dir, f"klayout-drc-{name}.log"
+                            ),
+                            silent=True,
+                        )
+                    )
+                for future in futures:
+                    future.result()
 
-        # Not pya script - DRC script is not part of OpenLane
-        self.run_subprocess(
-            [
-                "klayout",
-                "-b",
-                "-zz",
-                "-r",
-                drc_script_path,
-                "-rd",
-                f"input={abspath(input_view)}",
-                "-rd",
-                f"topcell={self.config['DESIGN_NAME']}",
-                "-rd",
-                f"report={abspath(lyrdb_report)}",
-                *opts,
-            ]
-        )
+            self.run_pya_script(
+                [
+                    "python3",
+                    os.path.join(
+                        get_script_dir(),
+                        "klayout",
+                        "merge_drc_reports.py",
+                    ),
+                    f"--output={abspath(runset_report)}",
+                    *[abspath(report) for report in group_reports],
+                ],
+                env=env,
+                log_to=os.path.join(self.step_dir, "merge_drc_reports.log"),
+            )
+
+        if incremental:
+            input_options = []
+            if os.path.exists(runset_report):
+                input_options.append(f"--input={abspath(runset_report)}")
+            self.run_pya_script(
+                [
+                    "python3",
+                    os.path.join(
+                        get_script_dir(),
+                        "klayout",
+                        "incremental_drc.py",
+                    ),
+                    "filter",
+                    *input_options,
+                    f"--windows={abspath(windows_json)}",
+                    f"--top={self.config['DESIGN_NAME']}",
+                    f"--output={abspath(lyrdb_report)}",
+                ],
+                env=env,
+                log_to=os.path.join(self.step_dir, "incremental_drc_filter.log"),
+            )
 
         subprocess_result = self.run_pya_script(
             [
@@ -700,76 +817,73 @@ class DRC(KLayoutStep):
             env=env,
             log_to=os.path.join(self.step_dir, "xml_drc_report_to_json.log"),
         )
-        return subprocess_result["generated_metrics"]
+        metrics_updates.update(subprocess_result["generated_metrics"])
+
+        if (
+            reference is not None
+            and metrics_updates.get("klayout__drc_error__count") == 0
+        ):
+            mkdirp(os.path.dirname(reference))
+            tmp_path = f"{reference}.{os.getpid()}.tmp"
+            shutil.copyfile(input_view, tmp_path)
+            os.replace(tmp_path, reference)
+        return metrics_updates
 
-    def run_ihp_sg13g2(self, state_in: State, **kwargs) -> MetricsUpdate:
+    def run_generic(self, state_in: State, **kwargs) -> MetricsUpdate:
         kwargs, env = self.extract_env(kwargs)
 
-        drc_script_path = self.config["KLAYOUT_DRC_RUNSET"]
+        if not self.config["KLAYOUT_DRC_RUNSET"]:
+            self.warn(
+                f"KLAYOUT_DRC_RUNSET is unset. KLayout.DRC may not be supported for the {self.config['PDK']} PDK. This step will be skipped."
+            )
+            return {}
 
-        reports_dir = os.path.join(self.step_dir, "reports")
-        mkdirp(reports_dir)
-        lyrdb_report = os.path.join(reports_dir, "drc.klayout.lyrdb")
-        json_report = os.path.join(reports_dir, "drc.klayout.json")
+        return self.run_drc(
+            state_in,
+            self.config["KLAYOUT_DRC_DEFINES"] or {},
+            # Use "threads" if possible
+            ["thr", "threads"],
+            env,
+        )
 
-        input_view = state_in[DesignFormat.GDS]
-        assert isinstance(input_view, Path)
+    def run_sky130(self, state_in: State, **kwargs) -> MetricsUpdate:
+        kwargs, env = self.extract_env(kwargs)
+        defines = {
+            key: str(self.config["KLAYOUT_DRC_DEFINES"][key]).lower()
+            for key in ["feol", "beol", "floating_metal", "offgrid", "seal"]
+        }
+        return self.run_drc(
+            state_in,
+            defines,
+            ["threads"],
+            env,
+        )
 
-        opts = []
-        if self.config["KLAYOUT_DRC_DEFINES"]:
-            for k, v in self.config["KLAYOUT_DRC_DEFINES"].items():
-                opts.extend(
-                    [
-                        "-rd",
-                        f"{k}={v}",
-                    ]
-                )
+    def run_gf180mcu(self, state_in: State, **kwargs) -> MetricsUpdate:
+        kwargs, env = self.extract_env(kwargs)
 
-        threads = self.config["KLAYOUT_DRC_THREADS"] or str(_get_process_limit())
-        if threads != "1":
-            opts.extend(
-                [
-                    "-rd",
-                    f"thr={threads}",
-                ]
+        if not self.config["KLAYOUT_DRC_RUNSET"]:
+            self.warn(
+                f"KLAYOUT_DRC_RUNSET is unset. KLayout.DRC may not be supported for the {self.config['PDK']} PDK. This step will be skipped."
             )
+            return {}
 
-        info(f"Running KLayout DRC with {threads} threads…")
-
-        # Not pya script - DRC script is not part of OpenLane
-        self.run_subprocess(
-            [
-                "klayout",
-                "-b",
-                "-zz",
-                "-r",
-                drc_script_path,
-                "-rd",
-                f"input={abspath(input_view)}",
-                "-rd",
-                f"topcell={self.config['DESIGN_NAME']}",
-                "-rd",
-                f"report={abspath(lyrdb_report)}",
-                *opts,
-            ]
+        return self.run_drc(
+            state_in,
+            self.config["KLAYOUT_DRC_DEFINES"] or {},
+            ["thr"],
+            env,
         )
 
-        subprocess_result = self.run_pya_script(
-            [
-                "python3",
-                os.path.join(
-                    get_script_dir(),
-                    "klayout",
-                    "xml_drc_report_to_json.py",
-                ),
-                f"--xml-file={abspath(lyrdb_report)}",
-                f"--json-file={abspath(json_report)}",
-                "--metric=klayout__drc_error__count",
-            ],
-            env=env,
-            log_to=os.path.join(self.step_dir, "xml_drc_report_to_json.log"),
+    def run_ihp_sg13g2(self, state_in: State, **kwargs) -> MetricsUpdate:
+        kwargs, env = self.extract_env(kwargs)
+
+        return self.run_drc(
+            state_in,
+            self.config["KLAYOUT_DRC_DEFINES"] or {},
+            ["thr"],
+            env,
         )
-        return subprocess_result["generated_metrics"]
 
 
 @Step.factory.register()
@@ -17,13 +17,16 @@
 # limitations under the License.
 import os
 import re
+import json
 import shutil
+import hashlib
 import subprocess
 from os.path import abspath
 from signal import SIGKILL
 from decimal import Decimal
 from abc import abstractmethod
-from typing import Any, Literal, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Literal, List, Optional, Tuple
 
 from .step import (
     DefaultOutputProcessor,
@@ -37,9 +40,17 @@ from .step import (
 from .tclstep import TclStep
 from ..state import DesignFormat, State
 
-from ..config import Variable
-from ..common import get_script_dir, DRC as DRCObject, Path, mkdirp, count_occurences
-from ..logging import warn
+from ..config import Variable, Macro
+from ..common import (
+    get_script_dir,
+    DRC as DRCObject,
+    Path,
+    TclUtils,
+    mkdirp,
+    count_occurences,
+    _get_process_limit,
+)
+from ..logging import info, warn
 
 
 DesignFormat(
@@ -558,6 +569,48 @@ class DRC(MagicStep):
         return views_updates, metrics_updates
 
 
+spice_subckt_rx = re.compile(
+    r"^\.subckt\s+(\S+).*?^\.ends\b[^\n]*\n?", re.M | re.S | re.I
+)
+
+
+def merge_macro_spice(netlist: str, macro_netlists: Dict[str, str]) -> str:
+    """
+    Replaces the black-box entries of macros in a SPICE netlist extracted by
+    Magic with subcircuits extracted separately.
+
+    :param netlist: The SPICE netlist, in which the macros were extracted as
+        abstract views.
+    :param macro_netlists: The SPICE netlists of the macros, by macro name.
+    :returns: The SPICE netlist with the subcircuits of the macros (and the
+        subcircuits they instantiate) defined. Subcircuits already defined in
+        ``netlist`` are not defined again.
+    """
+
+    def remove_blackbox(match: re.Match) -> str:
+        if match[1] in macro_netlists:
+            return ""
+        return match[0]
+
+    netlist = re.sub(
+        r"^\* Black-box entry subcircuit for (\S+) abstract view\n",
+        "",
+        netlist,
+        flags=re.M,
+    )
+    netlist = spice_subckt_rx.sub(remove_blackbox, netlist)
+
+    defined = {match[1] for match in spice_subckt_rx.finditer(netlist)}
+    definitions = ""
+    for macro_netlist in macro_netlists.values():
+        for match in spice_subckt_rx.finditer(macro_netlist):
+            if match[1] in defined:
+                continue
+            defined.add(match[1])
+            definitions += match[0]
+    return definitions + netlist
+
+
 @Step.factory.register()
 class SpiceExtraction(MagicStep):
     """
@@ -570,6 +623,11 @@ class SpiceExtraction(MagicStep):
     Also, the metrics will be updated with ``magic__illegal_overlap__count``. You can use
     `the relevant checker <#Checker.IllegalOverlap>`_ to quit if that number is
     nonzero.
+
+    If ``MAGIC_EXT_MACRO_CACHE_DIR`` is set when extracting from GDS, each
+    macro is extracted on its own, once for every distinct GDS, then abstracted
+    while extracting the top level. The subcircuits of the macros are then
+    merged into the final SPICE netlist.
     """
 
     id = "Magic.SpiceExtraction"
@@ -620,11 +678,110 @@ class SpiceExtraction(MagicStep):
             "If Magic provides more feedback items than this threshold, conversion to KLayout databases is skipped (as something has gone horribly wrong.)",
             default=10000,
         ),
+        Variable(
+            "MAGIC_EXT_MACRO_CACHE_DIR",
+            Optional[str],
+            "If set and `MAGIC_EXT_USE_GDS` is enabled, macros with exactly one GDS view are extracted separately and their SPICE netlists are stored in this directory, keyed by the macro's GDS, the Magic technology and startup files, the cell SPICE models and the extraction options. The top level is then extracted with these macros abstracted, and their cached subcircuits are merged into the final SPICE netlist.",
+        ),
     ]
 
     def get_script_path(self):
         return os.path.join(get_script_dir(), "magic", "extract_spice.tcl")
 
+    def __get_macro_key(self, module: str, gds: str) -> str:
+        files = [
+            gds,
+            str(self.config["MAGIC_TECH"]),
+            str(self.config["MAGICRC"]),
+            *[str(model) for model in self.config["CELL_SPICE_MODELS"] or []],
+        ]
+        key = {
+            "module": module,
+            "files": [
+                hashlib.sha256(open(file, "rb").read()).hexdigest() for file in files
+            ],
+            "config": {
+                variable: self.config[variable]
+                for variable in [
+                    "MAGIC_EXT_ABSTRACT_CELLS",
+                    "MAGIC_EXT_UNIQUE",
+                    "MAGIC_EXT_SHORT_RESISTOR",
+                ]
+            },
+        }
+        return hashlib.sha256(
+            json.dumps(key, sort_keys=True).encode("utf8")
+        ).hexdigest()
+
+    def extract_macro(self, module: str, gds: str, env: Dict[str, Any]) -> str:
+        """
+        Extracts a macro's GDS on its own.
+
+        :returns: The path to the macro's SPICE netlist.
+        """
+        macro_dir = os.path.abspath(os.path.join(self.step_dir, "macros", module))
+        mkdirp(macro_dir)
+        env = env.copy()
+        env["STEP_DIR"] = macro_dir
+        env["DESIGN_NAME"] = module
+        env["CURRENT_GDS"] = gds
+        subprocess_result = self.run_subprocess(
+            self.get_command(),
+            log_to=os.path.join(macro_dir, "magic.log"),
+            report_dir=macro_dir,
+            env=env,
+            silent=True,
+        )
+        if (
+            self.config["MAGIC_CAPTURE_ERRORS"]
+            and subprocess_result["magic_output"]["fatal_error_count"]
+        ):
+            raise StepError(
+                f"Encountered one or more fatal errors while extracting macro '{module}'."
+            )
+        return os.path.join(macro_dir, f"{module}.spice")
+
+    def extract_macros(self, state_in: State, env: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Extracts all macros with exactly one GDS view separately and in
+        parallel, reusing cached netlists where available.
+
+        :returns: The paths to the cached SPICE netlists of the macros, by
+            macro name.
+        """
+        cache_dir = self.config["MAGIC_EXT_MACRO_CACHE_DIR"]
+        macros: Dict[str, Macro] = self.config["MACROS"] or {}
+        env = self.prepare_env(env, state_in)
+
+        result: Dict[str, str] = {}
+        futures: Dict[str, Future[str]] = {}
+        with ThreadPoolExecutor(max_workers=_get_process_limit()) as tpe:
+            for module, macro in macros.items():
+                if len(macro.gds) != 1:
+                    info(
+                        f"Macro '{module}' does not have exactly one GDS view and will be extracted as part of the top level."
+                    )
+                    continue
+                key = self.__get_macro_key(module, str(macro.gds[0]))
+                result[module] = os.path.join(cache_dir, f"{key}.spice")
+                if os.path.isfile(result[module]):
+                    info(f"Reusing cached SPICE netlist for macro '{module}'…")
+                    continue
+                futures[module] = tpe.submit(
+                    self.extract_macro,
+                    module,
+                    str(macro.gds[0]),
+                    env,
+                )
+
+            for module, future in futures.items():
+                netlist = future.result()
+                mkdirp(cache_dir)
+                tmp_path = f"{result[module]}.{os.getpid()}.tmp"
+                shutil.copyfile(netlist, tmp_path)
+                os.replace(tmp_path, result[module])
+        return result
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         if self.config["MAGIC_EXT_USE_GDS"] and self.config["MAGIC_EXT_ABSTRACT"]:
             raise StepException(
@@ -635,8 +792,38 @@ class SpiceExtraction(MagicStep):
 
         env["MAGTYPE"] = "maglef" if self.config["MAGIC_EXT_ABSTRACT"] else "mag"
 
+        macro_netlists: Dict[str, str] = {}
+        if self.config["MAGIC_EXT_MACRO_CACHE_DIR"] is not None:
+            if not self.config["MAGIC_EXT_USE_GDS"]:
+                warn(
+                    "'MAGIC_EXT_MACRO_CACHE_DIR' is only used when 'MAGIC_EXT_USE_GDS' is set to 'True'. Macros will not be extracted separately."
+                )
+            else:
+                macro_netlists = self.extract_macros(state_in, env.copy())
+                env["_MAGIC_EXT_MACRO_SPICE"] = TclUtils.join(
+                    [
+                        item
+                        for module, netlist in macro_netlists.items()
+                        for item in [module, netlist]
+                    ]
+                )
+
         views_updates, metrics_updates = super().run(state_in, env=env, **kwargs)
 
+        spice = views_updates.get(DesignFormat.SPICE)
+        if len(macro_netlists) and isinstance(spice, Path):
+            with open(spice, encoding="utf8") as f:
+                netlist = f.read()
+            netlist = merge_macro_spice(
+                netlist,
+                {
+                    module: open(path, encoding="utf8").read()
+                    for module, path in macro_netlists.items()
+                },
+            )
+            with open(spice, "w", encoding="utf8") as f:
+                f.write(netlist)
+
         feedback_path = os.path.join(self.step_dir, "feedback.txt")
         with open(feedback_path, encoding="utf8") as f:
             illegal_overlap_count = count_occurences(f, "Illegal overlap")
@@ -18,19 +18,78 @@
 import os
 import re
 import json
+import hashlib
 import textwrap
 from decimal import Decimal
 from abc import abstractmethod
-from typing import List, Dict, Tuple, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Dict, Tuple, Optional
 
 from .step import ViewsUpdate, MetricsUpdate, Step
 from .tclstep import TclStep
 
-from ..common import Path, mkdirp, get_script_dir, TclUtils
-from ..config import Variable
+from ..common import Path, mkdirp, get_script_dir, TclUtils, _get_process_limit
+from ..config import Variable, Macro
+from ..logging import info
 from ..state import DesignFormat, State
 
 
+def extract_subcircuit(spice: str, name: str) -> Optional[str]:
+    """
+    :param spice: The text of a SPICE netlist.
+    :param name: The name of a subcircuit defined in the netlist.
+    :returns: The definition of the subcircuit and those of all subcircuits
+        it instantiates, directly or indirectly, in the order they appear in
+        the netlist, or ``None`` if it is not defined or is a black box
+        without any devices or instances, e.g. when extracted from LEF.
+    """
+    lines: List[str] = []
+    for line in spice.splitlines():
+        if line.startswith("+") and len(lines):
+            lines[-1] += f" {line[1:].strip()}"
+        elif line.strip() != "" and not line.startswith("*"):
+            lines.append(line.strip())
+
+    definitions: Dict[str, List[str]] = {}
+    dependencies: Dict[str, List[str]] = {}
+    current: Optional[str] = None
+    for line in lines:
+        tokens = line.split()
+        directive = tokens[0].lower()
+        if directive == ".subckt" and len(tokens) > 1:
+            current = tokens[1].lower()
+            definitions[current] = []
+            dependencies[current] = []
+        if current is None:
+            continue
+        definitions[current].append(line)
+        if directive.startswith("x"):
+            # The subcircuit is the last positional argument of an instance
+            positional = [token for token in tokens[1:] if "=" not in token]
+            if len(positional):
+                dependencies[current].append(positional[-1].lower())
+        elif directive == ".ends":
+            current = None
+
+    definition = definitions.get(name.lower())
+    if definition is None or all(line.startswith(".") for line in definition):
+        return None
+    required = set()
+    queue = [name.lower()]
+    while len(queue):
+        subcircuit = queue.pop()
+        if subcircuit in required or subcircuit not in definitions:
+            continue
+        required.add(subcircuit)
+        queue += dependencies[subcircuit]
+    return "".join(
+        f"{line}\n"
+        for subcircuit, definition in definitions.items()
+        if subcircuit in required
+        for line in definition
+    )
+
+
 def get_metrics(stats: Dict) -> Dict:
     metrics: Dict = {}
     if not stats:
@@ -137,6 +196,11 @@ class LVS(NetgenStep):
     * There are no unexpected shorts in the final layout.
     * There are no unexpected opens in the final layout.
     * All signals are connected correctly.
+
+    If ``LVS_HIERARCHICAL`` is set, each macro with both SPICE and Verilog
+    netlist views is first compared on its own, in parallel, and macros that
+    pass are then treated as blackboxes when comparing the top level. With
+    ``LVS_CACHE_DIR``, results for macros are reused until their views change.
     """
 
     id = "Netgen.LVS"
@@ -159,6 +223,17 @@ class LVS(NetgenStep):
             Optional[List[str]],
             "A list of cell names to be ignored while running LVS",
         ),
+        Variable(
+            "LVS_HIERARCHICAL",
+            bool,
+            "A flag that enables comparing each macro with a Verilog netlist view separately and in parallel before the top level, using the macro's subcircuit in the design's extracted SPICE netlist. Macros that pass are treated as blackboxes when comparing the top level.",
+            default=False,
+        ),
+        Variable(
+            "LVS_CACHE_DIR",
+            Optional[str],
+            "If set with `LVS_HIERARCHICAL`, the results of comparing macros are stored in this directory, keyed by the macro's subcircuit in the extracted SPICE netlist, its Verilog netlist views, the SPICE models and the Netgen setup, and reused by later runs instead of comparing the macro again.",
+        ),
     ]
 
     def get_command(self) -> List[str]:
@@ -167,6 +242,160 @@ class LVS(NetgenStep):
     def get_script_path(self):
         return os.path.join(self.step_dir, "lvs_script.lvs")
 
+    def __get_macro_key(
+        self,
+        macro_spice: str,
+        macro_netlists: List[str],
+        spice_files: List[str],
+    ) -> str:
+        netgen_setup_script = os.path.join(get_script_dir(), "netgen", "setup.tcl")
+        key: Dict[str, Any] = {}
+        for category, files in [
+            ("spice", [macro_spice]),
+            ("netlists", macro_netlists),
+            ("models", spice_files),
+            ("setup", [netgen_setup_script, str(self.config["NETGEN_SETUP"])]),
+        ]:
+            key[category] = [
+                hashlib.sha256(open(file, "rb").read()).hexdigest() for file in files
+            ]
+        key["config"] = {
+            "LVS_FLATTEN_CELLS": self.config["LVS_FLATTEN_CELLS"],
+            "LVS_IGNORE_CELLS": self.config["LVS_IGNORE_CELLS"],
+        }
+        return hashlib.sha256(
+            json.dumps(key, sort_keys=True).encode("utf8")
+        ).hexdigest()
+
+    def verify_macro(
+        self,
+        module: str,
+        macro_spice: str,
+        macro_netlists: List[str],
+        spice_files: List[str],
+        env: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Compares a macro's extracted SPICE netlist against its Verilog netlist.
+
+        :param macro_spice: A SPICE netlist of the macro's subcircuit, as
+            extracted by :func:`extract_subcircuit`.
+        :returns: The LVS metrics of the macro, as returned by
+            :func:`get_metrics`.
+        """
+        macro_dir = os.path.join(self.step_dir, "macros", module)
+        mkdirp(macro_dir)
+        stats_file = os.path.join(macro_dir, "lvs.netgen.rpt")
+        netgen_setup_script = os.path.join(get_script_dir(), "netgen", "setup.tcl")
+
+        netgen_commands = [f"set circuit1 [readnet spice {macro_spice}]"]
+        netgen_commands.append("set circuit2 [readnet verilog /dev/null]")
+        for lib in spice_files:
+            netgen_commands.append(f"readnet spice {lib} $circuit2")
+        for netlist in macro_netlists:
+            netgen_commands.append(f"readnet verilog {netlist} $circuit2")
+        netgen_commands.append(
+            f'lvs "$circuit1 {module}" "$circuit2 {module}" {netgen_setup_script} {stats_file} -blackbox -json'
+        )
+
+        script_path = os.path.join(macro_dir, "lvs_script.lvs")
+        with open(script_path, "w") as f:
+            print("\n".join(netgen_commands), file=f)
+        self.run_subprocess(
+            super().get_command() + [script_path],
+            log_to=os.path.join(macro_dir, "lvs.log"),
+            env=env,
+            silent=True,
+        )
+        stats_string = open(os.path.join(macro_dir, "lvs.netgen.json")).read()
+        return get_metrics(json.loads(stats_string, parse_float=Decimal))
+
+    def verify_macros(
+        self,
+        design_spice: str,
+        spice_files: List[str],
+        env: Dict[str, Any],
+    ) -> Tuple[List[str], MetricsUpdate]:
+        """
+        Compares all macros with Verilog netlist views that are present in the
+        design's extracted SPICE netlist separately and in parallel, reusing
+        cached results where available.
+
+        :param design_spice: The extracted SPICE netlist of the design.
+        :returns: The names of the macros that passed and the metrics of all
+            compared macros.
+        """
+        cache_dir = self.config["LVS_CACHE_DIR"]
+        macros: Dict[str, Macro] = self.config["MACROS"] or {}
+
+        metrics_updates: MetricsUpdate = {}
+        results: Dict[str, Dict[str, Any]] = {}
+        futures: Dict[str, Future[Dict[str, Any]]] = {}
+        cache_paths: Dict[str, str] = {}
+        with open(design_spice, encoding="utf8") as f:
+            design_spice_text = f.read()
+        with ThreadPoolExecutor(max_workers=_get_process_limit()) as tpe:
+            for module, macro in macros.items():
+                macro_netlists = [str(file) for file in (macro.pnl or macro.nl)]
+                if len(macro_netlists) == 0:
+                    info(
+                        f"Macro '{module}' lacks Verilog netlist views and will not be compared separately."
+                    )
+                    continue
+                subcircuit = extract_subcircuit(design_spice_text, module)
+                if subcircuit is None:
+                    info(
+                        f"Macro '{module}' is not a subcircuit with devices in the extracted netlist, e.g. because it was extracted from its LEF view, and will not be compared separately."
+                    )
+                    continue
+                macro_dir = os.path.join(self.step_dir, "macros", module)
+                mkdirp(macro_dir)
+                macro_spice = os.path.join(macro_dir, f"{module}.spice")
+                with open(macro_spice, "w", encoding="utf8") as f:
+                    f.write(subcircuit)
+                if cache_dir is not None:
+                    key = self.__get_macro_key(macro_spice, macro_netlists, spice_files)
+                    cache_paths[module] = os.path.join(cache_dir, f"{key}.json")
+                    if os.path.isfile(cache_paths[module]):
+                        info(f"Reusing cached LVS result for macro '{module}'…")
+                        results[module] = json.load(
+                            open(cache_paths[module], encoding="utf8"),
+                            parse_float=Decimal,
+                        )
+                        continue
+                futures[module] = tpe.submit(
+                    self.verify_macro,
+                    module,
+                    macro_spice,
+                    macro_netlists,
+                    spice_files,
+                    env,
+                )
+
+            for module, future in futures.items():
+                results[module] = future.result()
+                if cache_path := cache_paths.get(module):
+                    mkdirp(cache_dir)
+                    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "w", encoding="utf8") as f:
+                        json.dump(results[module], f, default=str)
+                    os.replace(tmp_path, cache_path)
+
+        verified = []
+        for module, macro_metrics in results.items():
+            error_count = macro_metrics["design__lvs_error__count"]
+            metrics_updates[f"design__lvs_macro_error__count__macro:{module}"] = (
+                error_count
+            )
+            if error_count == 0:
+                verified.append(module)
+            else:
+                self.warn(
+                    f"LVS failed for macro '{module}' with {error_count} error(s): it will be compared as part of the top level."
+                )
+        metrics_updates["design__lvs_macro_cached__count"] = len(results) - len(futures)
+        return verified, metrics_updates
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         spice_files = []
         if self.config["CELL_SPICE_MODELS"] is None:
@@ -252,6 +481,19 @@ class LVS(NetgenStep):
         )
         netgen_commands += spice_files_commands
         netgen_commands += macros_commands
+
+        macro_metrics: MetricsUpdate = {}
+        if self.config["LVS_HIERARCHICAL"]:
+            kwargs, env = self.extract_env(kwargs)
+            verified, macro_metrics = self.verify_macros(
+                str(state_in[DesignFormat.SPICE]),
+                [str(file) for file in spice_files],
+                self.prepare_env(env, state_in),
+            )
+            for module in verified:
+                netgen_commands.append(f'model "$circuit1 {module}" blackbox')
+                netgen_commands.append(f'model "$circuit2 {module}" blackbox')
+            kwargs["env"] = env
         netgen_commands += f'lvs "$circuit1 {design_name}" "$circuit2 {design_name}" {netgen_setup_script} {stats_file} -blackbox -json'.split(
             "\n"
         )
@@ -264,5 +506,6 @@ class LVS(NetgenStep):
         stats_string = open(stats_file_json).read()
         lvs_metrics = get_metrics(json.loads(stats_string, parse_float=Decimal))
         metrics_updates.update(lvs_metrics)
+        metrics_updates.update(macro_metrics)
 
         return (views_updates, metrics_updates)
@@ -495,6 +495,51 @@ class ReportWireLength(OdbpyStep):
         ]
 
 
+@Step.factory.register()
+class ReportNetStatistics(OdbpyStep):
+    """
+    Collects the wire length, fanout and half-perimeter wire length (HPWL) of
+    every signal net in the design, reporting their percentiles and histograms
+    as metrics, e.g. ``route__wirelength__p99``,
+    ``route__net__fanout__p99`` and ``route__net__count__fanout:4-7``.
+
+    The per-net values are written to ``net_statistics.json`` as a JSON object
+    of equal-length columns in database units. A human-readable CSV of the
+    longest nets may optionally be written as well.
+    """
+
+    id = "Odb.ReportNetStatistics"
+    name = "Report Net Statistics"
+    outputs = []
+
+    config_vars = [
+        Variable(
+            "NET_STATISTICS_CSV_THRESHOLD",
+            Optional[Decimal],
+            "If set, nets with a wire length at or above this value are written to a CSV file, sorted by length. If set to `None`, no CSV file is written.",
+            units="µm",
+        ),
+    ]
+
+    def get_script_path(self):
+        return os.path.join(get_script_dir(), "odbpy", "net_statistics.py")
+
+    def get_command(self) -> List[str]:
+        command = super().get_command() + [
+            "--report-out",
+            os.path.join(self.step_dir, "net_statistics.json"),
+        ]
+        threshold = self.config["NET_STATISTICS_CSV_THRESHOLD"]
+        if threshold is not None:
+            command += [
+                "--csv-out",
+                os.path.join(self.step_dir, "net_statistics.csv"),
+                "--csv-threshold",
+                str(threshold),
+            ]
+        return command
+
+
 @Step.factory.register()
 class ReportDisconnectedPins(OdbpyStep):
     """
@@ -19,6 +19,9 @@ import io
 import os
 import re
 import json
+import shutil
+import hashlib
+import threading
 import subprocess
 import textwrap
 import pathlib
@@ -51,6 +54,7 @@ from ..common import (
     Filter,
     TclUtils,
     DRC as DRCObject,
+    GenericDictEncoder,
     _get_process_limit,
     aggregate_metrics,
     get_script_dir,
@@ -70,6 +74,13 @@ from .common_variables import (
     rsz_variables,
 )
 from .openroad_alerts import OpenROADAlert, OpenROADOutputProcessor
+from .convergence import (
+    DetailedRoutingConvergence,
+    GlobalPlacementConvergence,
+    ResizerTimingPostCTSConvergence,
+    ResizerTimingPostGRTConvergence,
+    convergence_variables,
+)
 from .step import (
     CompositeStep,
     DefaultOutputProcessor,
@@ -456,6 +467,7 @@ class OpenROADStep(TclStep):
         )
 
         generated_metrics = subprocess_result["generated_metrics"]
+        generated_metrics.update(subprocess_result.get("convergence_metrics") or {})
 
         views_updates: ViewsUpdate = {}
         for output in self.outputs:
@@ -1615,6 +1627,12 @@ class GlobalPlacement(_GlobalPlacement):
             "Sets overflow threshold for routability mode.",
         ),
     ]
+    config_vars += convergence_variables("PL", "the overflow")
+
+    output_processors = [
+        GlobalPlacementConvergence,
+        *_GlobalPlacement.output_processors,
+    ]
 
 
 @Step.factory.register()
@@ -1926,6 +1944,7 @@ class DetailedRouting(OpenROADStep):
 
     id = "OpenROAD.DetailedRouting"
     name = "Detailed Routing"
+    resumable = True
 
     config_vars = (
         OpenROADStep.config_vars
@@ -1949,6 +1968,12 @@ class DetailedRouting(OpenROADStep):
                 "Experimental: saves an odb snapshot of the layout each routing iteration. This increases disk usage considerably but is useful for debugging.",
                 default=False,
             ),
+            Variable(
+                "DRT_CHECKPOINTS",
+                bool,
+                "Periodically keeps an odb snapshot of the latest completed routing iteration in the step directory, so detailed routing can be resumed from it if interrupted. Unlike DRT_SAVE_SNAPSHOTS, older snapshots and per-iteration DRC reports are not kept.",
+                default=False,
+            ),
             Variable(
                 "DRT_ANTENNA_REPAIR_ITERS",
                 int,
@@ -1991,16 +2016,92 @@ class DetailedRouting(OpenROADStep):
                 "Specify which nets should be assigned to which non-default rule. The net name is a regular expression. Use '^name$' to match an exact name.",
             ),
         ]
+        + convergence_variables("DRT", "the number of DRC violations")
     )
 
+    output_processors = [
+        DetailedRoutingConvergence,
+        *OpenROADStep.output_processors,
+    ]
+
+    checkpoint_interval: float = 10
+    """
+    The interval, in seconds, at which new snapshots are checked for if
+    ``DRT_CHECKPOINTS`` is enabled.
+    """
+
     def get_script_path(self):
         return os.path.join(get_script_dir(), "openroad", "drt.tcl")
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
+        """
+        If a previous attempt of this step with the same configuration and
+        input was interrupted in the same step directory, routing is resumed
+        from the latest TritonRoute run that completed or, if
+        ``DRT_CHECKPOINTS`` was enabled, from the latest checkpointed iteration
+        with the remaining iteration budget.
+        """
         kwargs, env = self.extract_env(kwargs)
         env["DRT_THREADS"] = env.get("DRT_THREADS", str(_get_process_limit()))
+
+        checkpoint_dir = os.path.join(self.step_dir, "checkpoints")
+        resume_path = os.path.join(self.step_dir, "resume.json")
+        fingerprint = self.__get_fingerprint(state_in)
+        resume_point = None
+        try:
+            with open(resume_path, encoding="utf8") as f:
+                if json.load(f).get("fingerprint") == fingerprint:
+                    resume_point = self.__find_resume_point(checkpoint_dir)
+        except (OSError, ValueError):
+            pass
+
+        resumed_iterations: Optional[Tuple[int, int]] = None
+        if resume_point is None:
+            shutil.rmtree(checkpoint_dir, ignore_errors=True)
+            for run_dir in glob(os.path.join(self.step_dir, "drt-run-*")):
+                shutil.rmtree(run_dir, ignore_errors=True)
+            with open(resume_path, "w", encoding="utf8") as f:
+                json.dump({"fingerprint": fingerprint}, f)
+        else:
+            self.__remove_snapshots(checkpoint_dir)
+            odb, run, iteration = resume_point
+            env["_DRT_RESUME_ODB"] = odb
+            env["_DRT_RESUME_RUN"] = str(run)
+            if iteration is None:
+                info(f"Resuming detailed routing after completed run {run}…")
+            else:
+                env["_DRT_RESUME_ITERS"] = str(
+                    self.get_remaining_iterations(
+                        self.config["DRT_OPT_ITERS"], iteration
+                    )
+                )
+                resumed_iterations = (run, iteration + 1)
+                info(
+                    f"Resuming detailed routing run {run} after iteration {iteration}…"
+                )
+
+        stop = threading.Event()
+        checkpointer: Optional[threading.Thread] = None
+        if self.config["DRT_CHECKPOINTS"]:
+            mkdirp(checkpoint_dir)
+            snapshot_dir = (
+                self.step_dir if self.config["DRT_SAVE_SNAPSHOTS"] else checkpoint_dir
+            )
+            checkpointer = threading.Thread(
+                target=self.__checkpoint_periodically,
+                args=(snapshot_dir, checkpoint_dir, stop, resumed_iterations),
+                daemon=True,
+            )
+            checkpointer.start()
+
         info(f"Running TritonRoute with {env['DRT_THREADS']} threads…")
-        views_updates, metrics_updates = super().run(state_in, env=env, **kwargs)
+        try:
+            views_updates, metrics_updates = super().run(state_in, env=env, **kwargs)
+        finally:
+            stop.set()
+            if checkpointer is not None:
+                checkpointer.join()
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
 
         drc_paths = list(pathlib.Path(self.step_dir).rglob("*.drc*"))
         for path in drc_paths:
@@ -2016,6 +2117,137 @@ class DetailedRouting(OpenROADStep):
 
         return views_updates, metrics_updates
 
+    @staticmethod
+    def get_remaining_iterations(total: int, iteration: int) -> int:
+        """
+        :param total: The total number of iterations of a TritonRoute run,
+            i.e., ``DRT_OPT_ITERS``.
+        :param iteration: The last completed iteration of the run, counting
+            from zero across all resumptions.
+        :returns: The number of iterations left to run, at least one.
+        """
+        return max(1, total - iteration - 1)
+
+    def __get_fingerprint(self, state_in: State) -> str:
+        config = self.config.to_raw_dict()
+        config.pop("DRT_THREADS", None)
+        hash = hashlib.sha256(
+            json.dumps(config, cls=GenericDictEncoder, sort_keys=True).encode("utf8")
+        )
+        odb = str(state_in[DesignFormat.ODB])
+        stat = os.stat(odb)
+        hash.update(f"{odb}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf8"))
+        return hash.hexdigest()
+
+    def __get_runs(self) -> Dict[int, str]:
+        runs = {}
+        for run_dir in glob(os.path.join(self.step_dir, "drt-run-*")):
+            suffix = os.path.basename(run_dir)[len("drt-run-") :]
+            if suffix.isdigit():
+                runs[int(suffix)] = run_dir
+        return runs
+
+    def __find_resume_point(
+        self, checkpoint_dir: str
+    ) -> Optional[Tuple[str, int, Optional[int]]]:
+        """
+        :returns: The odb file to resume from, the index of the TritonRoute
+            run it belongs to and the last iteration of that run it includes,
+            counting from the start of the run across all resumptions, or
+            ``None`` if the run completed.
+        """
+        result: Optional[Tuple[str, int, Optional[int]]] = None
+        for run, run_dir in sorted(self.__get_runs().items()):
+            odb = os.path.join(run_dir, f"{self.config['DESIGN_NAME']}.odb")
+            if os.path.isfile(odb):
+                result = (odb, run, None)
+
+        checkpoint_odb = os.path.join(checkpoint_dir, "checkpoint.odb")
+        try:
+            with open(
+                os.path.join(checkpoint_dir, "checkpoint.json"), encoding="utf8"
+            ) as f:
+                checkpoint = json.load(f)
+            if os.path.isfile(checkpoint_odb) and (
+                result is None or checkpoint["run"] > result[1]
+            ):
+                result = (checkpoint_odb, checkpoint["run"], checkpoint["iteration"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        return result
+
+    def __checkpoint_periodically(
+        self,
+        snapshot_dir: str,
+        checkpoint_dir: str,
+        stop: threading.Event,
+        resumed_iterations: Optional[Tuple[int, int]] = None,
+    ):
+        while not stop.wait(self.checkpoint_interval):
+            try:
+                self.__checkpoint(snapshot_dir, checkpoint_dir, resumed_iterations)
+            except OSError as e:
+                debug(f"Failed to save a detailed routing checkpoint: {e}")
+
+    def __remove_snapshots(self, checkpoint_dir: str):
+        # Snapshots left behind by an interrupted run would be mistaken for
+        # those of the resumed run, which numbers its iterations from zero
+        for directory in [checkpoint_dir, self.step_dir]:
+            for snapshot in glob(os.path.join(directory, "drt_iter*.odb")):
+                os.unlink(snapshot)
+
+    def __checkpoint(
+        self,
+        snapshot_dir: str,
+        checkpoint_dir: str,
+        resumed_iterations: Optional[Tuple[int, int]] = None,
+    ):
+        """
+        :param resumed_iterations: The index of the resumed run and the
+            number of its iterations completed before resuming, if any.
+            TritonRoute numbers the iterations of a resumed run from zero, so
+            they are offset by the latter.
+        """
+        # A snapshot is only known to be completely written once TritonRoute
+        # has started writing the next one
+        snapshot_rx = re.compile(r"^drt_iter(\d+)\.odb$")
+        snapshots = []
+        for snapshot in os.listdir(snapshot_dir):
+            if match := snapshot_rx.match(snapshot):
+                snapshots.append((int(match[1]), os.path.join(snapshot_dir, snapshot)))
+        snapshots.sort()
+        if len(snapshots) < 2:
+            return
+        iteration, snapshot = snapshots[-2]
+        run = max(self.__get_runs(), default=0)
+        if resumed_iterations is not None and resumed_iterations[0] == run:
+            iteration += resumed_iterations[1]
+
+        checkpoint_json = os.path.join(checkpoint_dir, "checkpoint.json")
+        try:
+            with open(checkpoint_json, encoding="utf8") as f:
+                current = json.load(f)
+            if (current["run"], current["iteration"]) == (run, iteration):
+                return
+        except (OSError, ValueError, KeyError):
+            pass
+
+        tmp_odb = os.path.join(checkpoint_dir, "checkpoint.odb.tmp")
+        if snapshot_dir == checkpoint_dir:
+            os.replace(snapshot, tmp_odb)
+            for _, older in snapshots[:-2]:
+                os.unlink(older)
+        else:
+            shutil.copyfile(snapshot, tmp_odb)
+        os.replace(tmp_odb, os.path.join(checkpoint_dir, "checkpoint.odb"))
+        with open(f"{checkpoint_json}.tmp", "w", encoding="utf8") as f:
+            json.dump({"run": run, "iteration": iteration}, f)
+        os.replace(f"{checkpoint_json}.tmp", checkpoint_json)
+        verbose(
+            f"Saved a checkpoint of detailed routing run {run} at iteration {iteration}."
+        )
+
 
 @Step.factory.register()
 class LayoutSTA(OpenROADStep):
@@ -2784,6 +3016,13 @@ class ResizerTimingPostCTS(ResizerStep):
         ),
     ]
 
+    config_vars += convergence_variables("PL_RESIZER_TIMING", "the worst slack")
+
+    output_processors = [
+        ResizerTimingPostCTSConvergence,
+        *ResizerStep.output_processors,
+    ]
+
     def get_script_path(self):
         return os.path.join(get_script_dir(), "openroad", "rsz_timing_postcts.tcl")
 
@@ -2900,6 +3139,13 @@ class ResizerTimingPostGRT(ResizerStep):
         ),
     ]
 
+    config_vars += convergence_variables("GRT_RESIZER_TIMING", "the worst slack")
+
+    output_processors = [
+        ResizerTimingPostGRTConvergence,
+        *ResizerStep.output_processors,
+    ]
+
     def get_script_path(self):
         return os.path.join(get_script_dir(), "openroad", "rsz_timing_postgrt.tcl")
 
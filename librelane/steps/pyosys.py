@@ -22,16 +22,24 @@ import sys
 import json
 import fnmatch
 import shutil
+import hashlib
+import subprocess
 from decimal import Decimal
 from abc import abstractmethod
-from typing import List, Literal, Optional, Set, Tuple
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 
 from .step import ViewsUpdate, MetricsUpdate, Step
 
 from ..config import Variable
 from ..state import State, DesignFormat
 from ..logging import debug, verbose
-from ..common import Path, get_script_dir, process_list_file
+from ..common import (
+    GenericDictEncoder,
+    Path,
+    get_script_dir,
+    hash_verilog_files,
+    process_list_file,
+)
 
 starts_with_whitespace = re.compile(r"^\s+.+$")
 
@@ -136,6 +144,12 @@ verilog_rtl_cfg_vars = [
         Optional[List[str]],
         "Pass arguments to the Slang frontend.",
     ),
+    Variable(
+        "YOSYS_ELABORATION_CHECKPOINT",
+        bool,
+        "Saves the design after reading and elaborating the RTL as an RTLIL checkpoint. Later Yosys steps elaborating the same RTL with the same blackbox models, defines, include directories and parameters read the checkpoint instead of elaborating the design again.",
+        default=False,
+    ),
 ]
 
 DesignFormat(
@@ -145,6 +159,28 @@ DesignFormat(
     alts=["JSON_HEADER"],
 ).register()
 
+DesignFormat(
+    "rtlil",
+    "il",
+    "Elaborated RTLIL Checkpoint",
+    alts=["RTLIL"],
+).register()
+
+checkpoint_key_prefix = "# librelane-elaboration-key: "
+
+
+def get_checkpoint_key(path: str) -> Optional[str]:
+    """
+    :param path: The path to an elaborated RTLIL checkpoint.
+    :returns: The key of the inputs the checkpoint was elaborated from, or
+        ``None`` if the file is not a checkpoint created by LibreLane.
+    """
+    with open(path, encoding="utf8") as f:
+        first_line = f.readline().rstrip("\n")
+    if not first_line.startswith(checkpoint_key_prefix):
+        return None
+    return first_line[len(checkpoint_key_prefix) :]
+
 
 def _validate_icg(
     variable: Variable, input: Optional[str], warning_list_ref: List[str]
@@ -273,10 +309,62 @@ class PyosysStep(Step):
 
 
 class VerilogStep(PyosysStep):
+    """
+    :cvar power_defines: Whether the RTL is read with power and ground
+        connections.
+    :cvar elaboration_checkpoint: Whether the step's script supports reading
+        and writing elaborated RTLIL checkpoints.
+    """
+
     power_defines: bool = False
+    elaboration_checkpoint: bool = False
 
     config_vars = PyosysStep.config_vars + verilog_rtl_cfg_vars
 
+    def get_checkpoint_path(self) -> str:
+        return os.path.join(
+            self.step_dir,
+            f"{self.config['DESIGN_NAME']}.{DesignFormat.RTLIL.extension}",
+        )
+
+    def get_elaboration_key(self, blackbox_models: List[str]) -> str:
+        """
+        :param blackbox_models: The blackbox models read before the RTL.
+        :returns: A hash of all inputs affecting the elaborated design.
+        """
+        version = subprocess.check_output(
+            [self.get_yosys_path(), "-V"], encoding="utf8"
+        )
+        include_dirs = [str(dir) for dir in self.config["VERILOG_INCLUDE_DIRS"] or []]
+        key = {
+            "version": version.strip(),
+            "power_defines": self.power_defines,
+            "config": {
+                name: self.config.get(name)
+                for name in [
+                    "DESIGN_NAME",
+                    "PDK",
+                    "STD_CELL_LIBRARY",
+                    "VERILOG_DEFINES",
+                    "VERILOG_POWER_DEFINE",
+                    "VERILOG_INCLUDE_DIRS",
+                    "SYNTH_PARAMETERS",
+                    "USE_SLANG",
+                    "SLANG_ARGUMENTS",
+                ]
+            },
+            "blackbox_models": blackbox_models,
+            "sources": hash_verilog_files(
+                [str(file) for file in self.config["VERILOG_FILES"]],
+                include_dirs,
+                True,
+            ),
+            "models": hash_verilog_files(blackbox_models, include_dirs, False),
+        }
+        return hashlib.sha256(
+            json.dumps(key, cls=GenericDictEncoder, sort_keys=True).encode("utf8")
+        ).hexdigest()
+
     def get_command(self, state_in: State) -> List[str]:
         cmd = super().get_command(state_in)
 
@@ -343,12 +431,33 @@ class VerilogStep(PyosysStep):
             frozenset([str(lib) for lib in scl_lib_list]),
             excluded_cells=frozenset(excluded_cells),
         )
+        extra: Dict[str, Any] = {
+            "blackbox_models": blackbox_models,
+            "libs_synth": libs_synth,
+        }
+        if self.elaboration_checkpoint and self.config["YOSYS_ELABORATION_CHECKPOINT"]:
+            key = self.get_elaboration_key(blackbox_models)
+            checkpoint = state_in.get(DesignFormat.RTLIL)
+            if checkpoint is not None and get_checkpoint_key(str(checkpoint)) == key:
+                verbose(f"Reading elaborated design from '{checkpoint}'…")
+                extra["checkpoint_in"] = str(checkpoint)
+            else:
+                extra["checkpoint_out"] = self.get_checkpoint_path()
+                extra["checkpoint_key"] = key
+
         extra_path = os.path.join(self.step_dir, "extra.json")
         with open(extra_path, "w") as f:
-            json.dump({"blackbox_models": blackbox_models, "libs_synth": libs_synth}, f)
+            json.dump(extra, f)
         cmd.extend(["--extra-in", extra_path])
         return cmd
 
+    def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
+        views_updates, metrics_updates = super().run(state_in, **kwargs)
+        checkpoint_path = self.get_checkpoint_path()
+        if self.elaboration_checkpoint and os.path.isfile(checkpoint_path):
+            views_updates[DesignFormat.RTLIL] = Path(checkpoint_path)
+        return views_updates, metrics_updates
+
 
 @Step.factory.register()
 class JsonHeader(VerilogStep):
@@ -362,12 +471,13 @@ class JsonHeader(VerilogStep):
     name = "Generate JSON Header"
     long_name = "Generate JSON Header"
 
-    inputs = []
-    outputs = [DesignFormat.JSON_HEADER]
+    inputs = [DesignFormat.RTLIL.mkOptional()]
+    outputs = [DesignFormat.JSON_HEADER, DesignFormat.RTLIL]
 
     config_vars = PyosysStep.config_vars + verilog_rtl_cfg_vars
 
     power_defines = True
+    elaboration_checkpoint = True
 
     def get_script_path(self) -> str:
         return os.path.join(get_script_dir(), "pyosys", "json_header.py")
@@ -554,6 +664,11 @@ class SynthesisCommon(VerilogStep):
             "If true, vectors with the shape [0:0] are converted to normal wires in the netlist. If disabled, even one-width pins will be suffixed [0] in the layout when imported by most PnR tools.",
             default=True,
         ),
+        Variable(
+            "SYNTH_INCREMENTAL_CACHE_DIR",
+            Optional[str],
+            "If set and `SYNTH_HIERARCHY_MODE` is 'keep', the synthesized netlist of each module is stored in this directory, keyed by the elaborated module, the interfaces of the modules it instantiates, the synthesis configuration, the liberty and mapping files and the Yosys version. Later runs reuse the netlists of unchanged modules instead of synthesizing them again. The top module is always synthesized.",
+        ),
         # Variable(
         #     "SYNTH_SDC_FILE",
         #     Optional[Path],
@@ -634,8 +749,13 @@ class Synthesis(SynthesisCommon):
     id = "Yosys.Synthesis"
     name = "Synthesis"
 
+    inputs = [DesignFormat.RTLIL.mkOptional()]
+    outputs = [DesignFormat.NETLIST, DesignFormat.RTLIL]
+
     config_vars = SynthesisCommon.config_vars + verilog_rtl_cfg_vars
 
+    elaboration_checkpoint = True
+
 
 @Step.factory.register()
 class Resynthesis(SynthesisCommon):
@@ -13,10 +13,13 @@
 # limitations under the License.
 from __future__ import annotations
 
+import io
 import os
+import csv
 import sys
 import json
 import time
+import codecs
 import psutil
 import shutil
 import textwrap
@@ -25,13 +28,15 @@ import subprocess
 from signal import Signals
 from decimal import Decimal
 from io import TextIOWrapper
-from threading import Thread
+from threading import Thread, Event, current_thread, get_ident
 from inspect import isabstract
 from itertools import zip_longest
 from abc import abstractmethod, ABC
 from concurrent.futures import Future
 from typing import (
+    IO,
     Any,
+    Iterator,
     List,
     Callable,
     Optional,
@@ -40,6 +45,7 @@ from typing import (
     Tuple,
     Sequence,
     Dict,
+    Mapping,
     ClassVar,
     Type,
     Generic,
@@ -68,6 +74,7 @@ from ..common import (
     copy_recursive,
     format_size,
     format_elapsed_time,
+    aggregate_metrics,
 )
 from .. import logging
 from ..logging import (
@@ -79,6 +86,7 @@ from ..logging import (
     debug,
 )
 from ..__version__ import __version__
+from ..plugins import import_all, import_builtin, is_plugin_override, load_plugins
 
 
 VT = TypeVar("VT")
@@ -97,9 +105,15 @@ class OutputProcessor(ABC, Generic[VT]):
         not.
     :cvar key: The fixed key to be added to the return value of
         ``run_subprocess``. Must be implemented by subclasses.
+    :cvar prefixes: An optional tuple of line prefixes. If set, only lines
+        starting with one of these prefixes are passed to :meth:`process_line`,
+        and all other lines are passed on to later output processors without
+        invoking this one. Processors that need to see every line should keep
+        the default value of ``None``.
     """
 
     key: ClassVar[str] = NotImplemented
+    prefixes: ClassVar[Optional[Tuple[str, ...]]] = None
 
     def __init__(self, step: Step, report_dir: str, silent: bool) -> None:
         self.step = step
@@ -117,6 +131,10 @@ class OutputProcessor(ABC, Generic[VT]):
         :returns: ``True`` if the line is "consumed", i.e. other output
             processors are skipped. ``False`` if the line is to be passed on
             to later output processors.
+
+            Exceptions raised here terminate the subprocess, then propagate
+            to the caller of ``run_subprocess``. This may be used to abort
+            subprocesses early.
         """
         pass
 
@@ -159,16 +177,21 @@ class DefaultOutputProcessor(OutputProcessor[Dict[str, Any]]):
         Always returns ``True``, so ``DefaultOutputProcessor`` should always be
         at the end of your list.
         """
-        if self.step.step_dir is not None and line.startswith(REPORT_START_LOCUS):
+        if not line.startswith(LOCUS_PREFIX):
+            # Fast path: the vast majority of lines are not commands
+            pass
+        elif self.step.step_dir is not None and line.startswith(REPORT_START_LOCUS):
             if self.current_rpt is not None:
                 self.current_rpt.close()
             report_name = line[len(REPORT_START_LOCUS) + 1 :].strip()
             report_path = os.path.join(self.report_dir, report_name)
             self.current_rpt = open(report_path, "w")
+            return True
         elif line.startswith(REPORT_END_LOCUS):
             if self.current_rpt is not None:
                 self.current_rpt.close()
             self.current_rpt = None
+            return True
         elif line.startswith(METRIC_LOCUS):
             command, name, value = line.split(" ", maxsplit=3)
             metric_type: Union[Type[str], Type[int], Type[Decimal]] = str
@@ -177,7 +200,9 @@ class DefaultOutputProcessor(OutputProcessor[Dict[str, Any]]):
             elif command.endswith("_F"):
                 metric_type = Decimal
             self.generated_metrics[name] = metric_type(value)
-        elif self.current_rpt is not None:
+            return True
+
+        if self.current_rpt is not None:
             # No echo- the timing reports especially can be very large
             # and terminal emulators will slow the flow down.
             self.current_rpt.write(line)
@@ -230,29 +255,119 @@ class StepSignalled(StepException):
     pass
 
 
+class StepCancelled(StepSignalled):
+    """
+    Raised by a step that was stopped using :meth:`Step.cancel`.
+    """
+
+    pass
+
+
 class StepNotFound(NameError):
     def __init__(self, *args: object, id: Optional[str] = None) -> None:
         super().__init__(*args)
         self.id = id
 
 
+LOCUS_PREFIX = "%OL_"
 REPORT_START_LOCUS = "%OL_CREATE_REPORT"
 REPORT_END_LOCUS = "%OL_END_REPORT"
 METRIC_LOCUS = "%OL_METRIC"
 
+SUBPROCESS_READ_CHUNK_SIZE = 1 << 16
+
+
+def _read_line_batches(
+    stream: IO[bytes],
+    log_file: IO[bytes],
+    chunk_size: int = SUBPROCESS_READ_CHUNK_SIZE,
+) -> Iterator[List[str]]:
+    """
+    Reads a binary stream in large chunks, tees the raw bytes to ``log_file``
+    and yields the complete lines found in each chunk as a batch.
+
+    Decoding is UTF-8 with universal newlines, matching what iterating over a
+    text-mode pipe would produce. A line split across two chunks is held back
+    and yielded with the next batch.
+
+    :raises UnicodeDecodeError: If the stream contains invalid UTF-8.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf8")(), translate=True
+    )
+    read = getattr(stream, "read1", stream.read)
+    partial = ""
+    while chunk := read(chunk_size):
+        log_file.write(chunk)
+        text = partial + decoder.decode(chunk)
+        lines = text.split("\n")
+        partial = lines.pop()
+        if len(lines):
+            yield [line + "\n" for line in lines]
+    partial += decoder.decode(b"", final=True)
+    if partial != "":
+        yield [partial]
+
+
 GlobalToolbox = Toolbox(os.path.join(os.getcwd(), "librelane_run", "tmp"))
 ViewsUpdate = Dict[DesignFormat, StateElement]
 MetricsUpdate = Dict[str, Any]
 
 
 class ProcessStatsThread(Thread):
-    def __init__(self, process: psutil.Popen, interval: float = 0.1):
+    """
+    Samples the resource usage of a subprocess and all of its descendants until
+    the subprocess exits or :meth:`stop` is called.
+
+    The sampling interval starts at ``interval`` and is doubled every
+    ``samples_per_interval`` samples up to ``max_interval``, so short-lived
+    processes are sampled finely while long-running ones produce a bounded
+    time series at a low overhead.
+
+    :param process: The subprocess to track
+    :param interval: The initial sampling interval in seconds
+    :param max_interval: The maximum sampling interval in seconds
+    :param samples_per_interval: The number of samples taken before the
+        interval is doubled
+    """
+
+    series_columns: ClassVar[Tuple[str, ...]] = (
+        "elapsed",
+        "processes",
+        "threads",
+        "cpu_percent",
+        "cpu_time",
+        "memory_rss",
+        "memory_vms",
+        "read_bytes",
+        "write_bytes",
+    )
+
+    default_interval: ClassVar[float] = 0.1
+    default_max_interval: ClassVar[float] = 5.0
+
+    def __init__(
+        self,
+        process: psutil.Popen,
+        interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        samples_per_interval: int = 50,
+    ):
         Thread.__init__(
             self,
         )
         self.process = process
         self.result = None
-        self.interval = interval
+        self.interval = interval or self.default_interval
+        self.max_interval = max(
+            max_interval or self.default_max_interval, self.interval
+        )
+        self.samples_per_interval = samples_per_interval
+        self.series: List[Tuple[float, ...]] = []
+        self.__stopped = Event()
+        self.__tracked: Dict[int, psutil.Process] = {}
+        self.__cpu_times: Dict[int, Tuple[float, float, float]] = {}
+        self.__io_bytes: Dict[int, Tuple[int, int]] = {}
         self.time = {
             "cpu_time_user": 0.0,
             "cpu_time_system": 0.0,
@@ -266,59 +381,178 @@ class ProcessStatsThread(Thread):
             "memory_rss": 0.0,
             "memory_vms": 0.0,
             "threads": 0.0,
+            "processes": 0.0,
         }
         self.avg_resources = {
             "cpu_percent": 0.0,
             "memory_rss": 0.0,
             "memory_vms": 0.0,
             "threads": 0.0,
+            "processes": 0.0,
+        }
+        self.io = {
+            "read_bytes": 0,
+            "write_bytes": 0,
+        }
+
+    def stop(self):
+        """
+        Stops sampling as soon as possible.
+        """
+        self.__stopped.set()
+
+    def __sample_tree(self) -> Dict[str, float]:
+        tree: List[psutil.Process] = [self.process]
+        try:
+            tree += self.process.children(recursive=True)
+        except psutil.Error:
+            pass
+
+        current: Dict[str, float] = {
+            "cpu_percent": 0.0,
+            "memory_rss": 0.0,
+            "memory_vms": 0.0,
+            "threads": 0.0,
+            "processes": 0.0,
         }
+        for candidate in tree:
+            # Process objects are kept so cpu_percent is relative to the last
+            # sample rather than the process's entire lifetime
+            proc = self.__tracked.setdefault(candidate.pid, candidate)
+            try:
+                with proc.oneshot():
+                    cpu = proc.cpu_percent()
+                    memory = proc.memory_info()
+                    cpu_time = proc.cpu_times()
+                    threads = proc.num_threads()
+                    io_counters = None
+                    if hasattr(proc, "io_counters"):
+                        try:
+                            io_counters = proc.io_counters()
+                        except psutil.AccessDenied:
+                            pass
+            except psutil.Error:
+                if proc is self.process:
+                    raise
+                # Descendant exited mid-sample: keep its last known totals
+                continue
+
+            current["cpu_percent"] += cpu
+            current["memory_rss"] += memory.rss
+            current["memory_vms"] += memory.vms
+            current["threads"] += threads
+            current["processes"] += 1
+            self.__cpu_times[proc.pid] = (
+                cpu_time.user,
+                cpu_time.system,
+                getattr(cpu_time, "iowait", 0.0),
+            )
+            if io_counters is not None:
+                self.__io_bytes[proc.pid] = (
+                    io_counters.read_bytes,
+                    io_counters.write_bytes,
+                )
+
+        self.time["cpu_time_user"] = sum(t[0] for t in self.__cpu_times.values())
+        self.time["cpu_time_system"] = sum(t[1] for t in self.__cpu_times.values())
+        if sys.platform == "linux":
+            self.time["cpu_time_iowait"] = sum(t[2] for t in self.__cpu_times.values())
+        self.io["read_bytes"] = sum(b[0] for b in self.__io_bytes.values())
+        self.io["write_bytes"] = sum(b[1] for b in self.__io_bytes.values())
+        return current
 
     def run(self):
         try:
-            count = 1
+            count = 0
+            interval = self.interval
+            samples_at_interval = 0
             status = self.process.status()
             now = datetime.datetime.now()
             while status not in [psutil.STATUS_ZOMBIE, psutil.STATUS_DEAD]:
-                with self.process.oneshot():
-                    cpu = self.process.cpu_percent()
-                    memory = self.process.memory_info()
-                    cpu_time = self.process.cpu_times()
-                    threads = self.process.num_threads()
-
-                    runtime = datetime.datetime.now() - now
-                    self.time["runtime"] = runtime.total_seconds()
-                    self.time["cpu_time_user"] = cpu_time.user
-                    self.time["cpu_time_system"] = cpu_time.system
-                    if sys.platform == "linux":
-                        self.time["cpu_time_iowait"] = cpu_time.iowait  # type: ignore
-
-                    current: Dict[str, float] = {}
-                    current["cpu_percent"] = cpu
-                    current["memory_rss"] = memory.rss
-                    current["memory_vms"] = memory.vms
-                    current["threads"] = threads
-
-                    for key in self.peak_resources.keys():
-                        self.peak_resources[key] = max(
-                            current[key], self.peak_resources[key]
-                        )
+                current = self.__sample_tree()
 
-                        # moving average
-                        self.avg_resources[key] = (
-                            (count * self.avg_resources[key]) + current[key]
-                        ) / (count + 1)
+                runtime = datetime.datetime.now() - now
+                self.time["runtime"] = runtime.total_seconds()
 
-                    count += 1
-                    time.sleep(self.interval)
-                    status = self.process.status()
+                for key in self.peak_resources.keys():
+                    self.peak_resources[key] = max(
+                        current[key], self.peak_resources[key]
+                    )
+
+                    # moving average
+                    self.avg_resources[key] = (
+                        (count * self.avg_resources[key]) + current[key]
+                    ) / (count + 1)
+
+                self.series.append(
+                    (
+                        self.time["runtime"],
+                        current["processes"],
+                        current["threads"],
+                        current["cpu_percent"],
+                        self.time["cpu_time_user"] + self.time["cpu_time_system"],
+                        current["memory_rss"],
+                        current["memory_vms"],
+                        self.io["read_bytes"],
+                        self.io["write_bytes"],
+                    )
+                )
+
+                count += 1
+                samples_at_interval += 1
+                if (
+                    samples_at_interval >= self.samples_per_interval
+                    and interval < self.max_interval
+                ):
+                    interval = min(interval * 2, self.max_interval)
+                    samples_at_interval = 0
+                if self.__stopped.wait(interval):
+                    return
+                status = self.process.status()
         except psutil.Error as e:
-            message = e.msg
+            message = str(e)
             for normal in ["process no longer exists", "but it's a zombie"]:
                 if normal in message:
                     return
             warn(f"Process resource tracker encountered an error: {e}")
 
+    def summary(self) -> Dict[str, float]:
+        """
+        :returns: Unformatted totals suitable for aggregation across multiple
+            subprocesses.
+
+            ``cpu_utilization`` is the average number of cores kept busy, i.e.
+            CPU time divided by wall time, and ``cpu_efficiency`` normalizes it
+            by the peak number of threads in the process tree.
+        """
+        runtime = self.time["runtime"]
+        cpu_time = self.time["cpu_time_user"] + self.time["cpu_time_system"]
+        utilization = cpu_time / runtime if runtime > 0 else 0.0
+        threads = self.peak_resources["threads"]
+        efficiency = utilization / threads if threads > 0 else 0.0
+        return {
+            "runtime": runtime,
+            "cpu_time": cpu_time,
+            "cpu_utilization": utilization,
+            "cpu_efficiency": efficiency,
+            "peak_memory_rss": self.peak_resources["memory_rss"],
+            "peak_threads": threads,
+            "peak_processes": self.peak_resources["processes"],
+            "read_bytes": self.io["read_bytes"],
+            "write_bytes": self.io["write_bytes"],
+        }
+
+    def write_series(self, path: Union[str, os.PathLike]):
+        """
+        Writes the sampled time series to a CSV file.
+
+        :param path: The path of the CSV file
+        """
+        with open(path, "w", encoding="utf8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.series_columns)
+            writer.writerows(self.series)
+
     def stats_as_dict(self):
         return {
             "time": {k: format_elapsed_time(self.time[k]) for k in self.time},
@@ -338,6 +572,8 @@ class ProcessStatsThread(Thread):
                 )
                 for k in self.avg_resources
             },
+            "io": {k: format_size(int(self.io[k])) for k in self.io},
+            "summary": self.summary(),
         }
 
 
@@ -418,6 +654,11 @@ class Step(ABC):
     :cvar config_vars: A list of configuration :class:`librelane.config.Variable` objects
         to be used to alter the behavior of this Step.
 
+    :cvar resumable: Whether the step can continue its work from what is left
+        in its step directory by a previous, interrupted run, given the same
+        configuration and inputs. If true, the step directory is not discarded
+        when a flow is automatically resumed and the step is run in it again.
+
     :cvar output_processors: A default set of
         :class:`librelane.steps.OutputProcessor` classes for use with
         :meth:`run_subprocess`.
@@ -448,6 +689,14 @@ class Step(ABC):
         exists.
 
         If :meth:`start` is called again, the reference is destroyed.
+
+    :ivar subprocess_profiles:
+        Timing and resource information about every subprocess run by
+        :meth:`run_subprocess` during the last run of this step object. These
+        are also written to ``profile.json`` in the step directory along with
+        the step's own timing information.
+
+        If :meth:`start` is called again, the list is emptied.
     """
 
     # Class Variables
@@ -456,6 +705,7 @@ class Step(ABC):
     outputs: ClassVar[List[DesignFormat]] = NotImplemented
     output_processors: ClassVar[List[Type[OutputProcessor]]] = [DefaultOutputProcessor]
     config_vars: ClassVar[List[Variable]] = []
+    resumable: ClassVar[bool] = False
 
     # Instance Variables
     name: str
@@ -468,6 +718,7 @@ class Step(ABC):
     start_time: Optional[float] = None
     end_time: Optional[float] = None
     config_path: Optional[str] = None
+    subprocess_profiles: List[Dict[str, Any]]
 
     # These are mutable class variables. However, they will only be used
     # when steps are run outside of a Flow, pretty much.
@@ -541,6 +792,10 @@ class Step(ABC):
                 _config_quiet,
             )
 
+        self.subprocess_profiles = []
+        self.__cancelled = Event()
+        self.__processes: Set[psutil.Popen] = set()
+
         state_in_future: Future[State] = Future()
         if isinstance(state_in, State):
             state_in_future.set_result(state_in)
@@ -1118,6 +1373,8 @@ class Step(ABC):
             self.toolbox = toolbox
 
         state_in_result = self.state_in.result()
+        if self.cancelled:
+            raise StepCancelled(f"{self.name}: Cancelled")
 
         if not logging.options.get_condensed_mode():
             rule(f"{self.long_name}")
@@ -1139,64 +1396,147 @@ class Step(ABC):
             f"Running '{self.id}' at {link_start}'{os.path.relpath(self.step_dir)}'{link_end}…"
         )
 
-        mkdirp(self.step_dir)
-        with open(os.path.join(self.step_dir, "state_in.json"), "w") as f:
-            f.write(state_in_result.dumps())
-
-        self.config_path = os.path.join(self.step_dir, "config.json")
-        with open(self.config_path, "w") as f:
-            config_mut = self.config.to_raw_dict()
-            config_mut["meta"] = {
-                "librelane_version": __version__,
-                "step": self.__class__.get_implementation_id(),
-            }
-            f.write(json.dumps(config_mut, cls=GenericDictEncoder, indent=4))
+        self._write_inputs(self.step_dir)
 
         debug(f"Step directory ▶ '{self.step_dir}'")
         self.start_time = time.time()
 
-        for input in self.inputs:
-            value = state_in_result.get_by_df(input)
-            if value is None and not input.optional:
+        self.end_time = None
+        self.subprocess_profiles = []
+        status = "failed"
+        try:
+            for input in self.inputs:
+                value = state_in_result.get_by_df(input)
+                if value is None and not input.optional:
+                    raise StepException(
+                        f"{type(self).__name__}: missing required input '{input.id}'"
+                    ) from None
+
+            try:
+                views_updates, metrics_updates = self.run(state_in_result, **kwargs)
+            except subprocess.CalledProcessError as e:
+                if self.cancelled:
+                    raise StepCancelled(f"{self.name}: Cancelled") from None
+                if e.returncode is not None and e.returncode < 0:
+                    raise StepSignalled(
+                        f"{self.name}: Interrupted ({Signals(-e.returncode).name})"
+                    ) from None
+                else:
+                    raise StepError(
+                        f"{self.name}: subprocess {e.args} failed", underlying_error=e
+                    ) from None
+
+            metrics = GenericImmutableDict(
+                state_in_result.metrics,
+                overrides={
+                    **metrics_updates,
+                    **self.__get_resource_metrics(state_in_result.metrics),
+                },
+            )
+
+            self.state_out = state_in_result.__class__(
+                state_in_result, overrides=views_updates, metrics=metrics
+            )
+
+            try:
+                self.state_out.validate()
+            except InvalidState as e:
                 raise StepException(
-                    f"{type(self).__name__}: missing required input '{input.id}'"
+                    f"Step {self.name} generated invalid state: {e}"
                 ) from None
 
-        try:
-            views_updates, metrics_updates = self.run(state_in_result, **kwargs)
-        except subprocess.CalledProcessError as e:
-            if e.returncode is not None and e.returncode < 0:
-                raise StepSignalled(
-                    f"{self.name}: Interrupted ({Signals(-e.returncode).name})"
-                ) from None
-            else:
-                raise StepError(
-                    f"{self.name}: subprocess {e.args} failed", underlying_error=e
-                ) from None
+            with open(os.path.join(self.step_dir, "state_out.json"), "w") as f:
+                f.write(self.state_out.dumps())
 
-        metrics = GenericImmutableDict(
-            state_in_result.metrics, overrides=metrics_updates
-        )
+            self.end_time = time.time()
+            with open(os.path.join(self.step_dir, "runtime.txt"), "w") as f:
+                f.write(format_elapsed_time(self.end_time - self.start_time))
 
-        self.state_out = state_in_result.__class__(
-            state_in_result, overrides=views_updates, metrics=metrics
-        )
+            status = "success"
+            return self.state_out
+        finally:
+            self.__write_profile(status)
 
-        try:
-            self.state_out.validate()
-        except InvalidState as e:
-            raise StepException(
-                f"Step {self.name} generated invalid state: {e}"
-            ) from None
+    def _write_inputs(self, step_dir: str):
+        """
+        Writes the input state and the configuration of the step, including
+        the step's ID, to ``state_in.json`` and ``config.json`` respectively in
+        ``step_dir``, from which :meth:`load` can recreate the step.
 
-        with open(os.path.join(self.step_dir, "state_out.json"), "w") as f:
-            f.write(self.state_out.dumps())
+        The input state is awaited if it has not been realized.
+        """
+        mkdirp(step_dir)
+        with open(os.path.join(step_dir, "state_in.json"), "w") as f:
+            f.write(self.state_in.result().dumps())
 
-        self.end_time = time.time()
-        with open(os.path.join(self.step_dir, "runtime.txt"), "w") as f:
-            f.write(format_elapsed_time(self.end_time - self.start_time))
+        self.config_path = os.path.join(step_dir, "config.json")
+        with open(self.config_path, "w") as f:
+            config_mut = self.config.to_raw_dict()
+            config_mut["meta"] = {
+                "librelane_version": __version__,
+                "step": self.__class__.get_implementation_id(),
+            }
+            f.write(json.dumps(config_mut, cls=GenericDictEncoder, indent=4))
 
-        return self.state_out
+    def __get_resource_metrics(self, metrics: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        :returns: The resource usage of this step's subprocesses as metrics
+            with the modifier ``step:{id}``, added to those of earlier runs of
+            the same step, and the totals across all steps so far.
+        """
+        if len(self.subprocess_profiles) == 0:
+            return {}
+
+        resource_metrics = {
+            name: value
+            for name, value in metrics.items()
+            if name.startswith("resource__")
+        }
+        reducers: List[Tuple[str, Callable[[List[float]], float]]] = [
+            ("runtime", sum),
+            ("cpu_time", sum),
+            ("peak_memory_rss", max),
+            ("read_bytes", sum),
+            ("write_bytes", sum),
+        ]
+        for stat, reduce in reducers:
+            name = f"resource__{stat}__step:{self.id}"
+            values = [profile[stat] for profile in self.subprocess_profiles]
+            if name in resource_metrics:
+                values.append(resource_metrics[name])
+            resource_metrics[name] = reduce(values)
+
+        runtime = resource_metrics[f"resource__runtime__step:{self.id}"]
+        cpu_time = resource_metrics[f"resource__cpu_time__step:{self.id}"]
+        resource_metrics[f"resource__cpu_utilization__step:{self.id}"] = (
+            cpu_time / runtime if runtime > 0 else 0.0
+        )
+
+        resource_metrics = aggregate_metrics(resource_metrics)
+        total_runtime = resource_metrics["resource__runtime"]
+        resource_metrics["resource__cpu_utilization"] = (
+            resource_metrics["resource__cpu_time"] / total_runtime
+            if total_runtime > 0
+            else 0.0
+        )
+        return resource_metrics
+
+    def __write_profile(self, status: str):
+        assert self.start_time is not None
+        profile = {
+            "id": self.id,
+            "name": self.name,
+            "implementation_id": self.__class__.get_implementation_id(),
+            "status": status,
+            "start": self.start_time,
+            "end": self.end_time or time.time(),
+            "pid": os.getpid(),
+            "thread": current_thread().name,
+            "thread_id": get_ident(),
+            "subprocesses": self.subprocess_profiles,
+        }
+        with open(os.path.join(self.step_dir, "profile.json"), "w") as f:
+            json.dump(profile, f, indent=4)
 
     @protected
     @abstractmethod
@@ -1248,8 +1588,10 @@ class Step(ABC):
         """
         A helper function for :class:`Step` objects to run subprocesses.
 
-        The output from the subprocess is processed line-by-line by instances
-        of output processor classes.
+        The output from the subprocess is read in large binary chunks, which
+        are written verbatim to the log file. Complete lines are then processed
+        line-by-line by instances of output processor classes, skipping
+        processors whose :attr:`OutputProcessor.prefixes` do not match.
 
         :param cmd: A list of variables, representing a program and its arguments,
             similar to how you would use it in a shell.
@@ -1286,7 +1628,7 @@ class Step(ABC):
         mkdirp(report_dir)
 
         log_path = log_to or self.get_log_path()
-        log_file = open(log_path, "w")
+        log_file = open(log_path, "wb")
         cmd_str = [str(arg) for arg in cmd]
 
         with open(os.path.join(self.step_dir, "COMMANDS"), "a+") as f:
@@ -1337,40 +1679,80 @@ class Step(ABC):
         else:
             verbose(msg)
 
+        if self.cancelled:
+            raise StepCancelled(f"{self.name}: Cancelled")
+        subprocess_start = time.time()
         process = _popen_callable(
             cmd_str,
-            encoding="utf8",
             env=env,
             **kwargs,
         )
+        self.__processes.add(process)
+        if self.cancelled:
+            process.terminate()
 
         process_stats_thread = ProcessStatsThread(process)
         process_stats_thread.start()
 
-        line_buffer = RingBuffer(str, 10)
+        dispatch = [
+            (processor.prefixes, processor.process_line)
+            for processor in output_processors
+        ]
+        line_buffer_size = 10
+        line_buffer = RingBuffer(str, line_buffer_size)
         if process_stdout := process.stdout:
             try:
-                for line in process_stdout:
-                    log_file.write(line)
-                    line_buffer.push(line)
-                    for processor in output_processors:
-                        if processor.process_line(line):
-                            break
-            except UnicodeDecodeError as e:
-                raise StepException(f"Subprocess emitted non-UTF-8 output: {e}")
+                for lines in _read_line_batches(process_stdout, log_file):
+                    for line in lines:
+                        for prefixes, process_line in dispatch:
+                            if prefixes is not None and not line.startswith(prefixes):
+                                continue
+                            if process_line(line):
+                                break
+                    for line in lines[-line_buffer_size:]:
+                        line_buffer.push(line)
+            except BaseException as e:
+                # Output processors may raise to abort the subprocess, in
+                # which case it must not outlive the step
+                process.terminate()
+                try:
+                    process.wait(timeout=10)
+                except (subprocess.TimeoutExpired, psutil.TimeoutExpired):
+                    process.kill()
+                    process.wait()
+                self.__processes.discard(process)
+                process_stats_thread.stop()
+                process_stats_thread.join()
+                log_file.close()
+                if isinstance(e, UnicodeDecodeError):
+                    raise StepException(f"Subprocess emitted non-UTF-8 output: {e}")
+                raise
+        returncode = process.wait()
+        self.__processes.discard(process)
+        process_stats_thread.stop()
         process_stats_thread.join()
 
-        json_stats = f"{os.path.splitext(log_path)[0]}.process_stats.json"
-
-        with open(json_stats, "w") as f:
+        stats_prefix = os.path.splitext(log_path)[0]
+        with open(f"{stats_prefix}.process_stats.json", "w") as f:
             json.dump(
                 process_stats_thread.stats_as_dict(),
                 f,
                 indent=4,
             )
+        process_stats_thread.write_series(f"{stats_prefix}.process_stats.csv")
+        self.subprocess_profiles.append(
+            {
+                "command": os.path.basename(cmd_str[0]),
+                "pid": process.pid,
+                "start": subprocess_start,
+                "end": time.time(),
+                "returncode": returncode,
+                "log_path": os.path.abspath(log_path),
+                **process_stats_thread.summary(),
+            }
+        )
 
         result: Dict[str, Any] = {}
-        returncode = process.wait()
         log_file.close()
         result["returncode"] = returncode
         result["log_path"] = log_path
@@ -1395,6 +1777,29 @@ class Step(ABC):
 
         return result
 
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether :meth:`cancel` was called on this step object.
+        """
+        return self.__cancelled.is_set()
+
+    def cancel(self):
+        """
+        Requests that the step stop as soon as possible: subprocesses run by
+        :meth:`run_subprocess` are terminated and no new ones are started,
+        after which :meth:`start` raises :class:`StepCancelled`.
+
+        This is thread-safe, and has no effect on a step that has already
+        concluded or that is running in another process.
+        """
+        self.__cancelled.set()
+        for process in list(self.__processes):
+            try:
+                process.terminate()
+            except psutil.NoSuchProcess:
+                pass
+
     @protected
     def extract_env(self, kwargs) -> Tuple[dict, Dict[str, str]]:
         """
@@ -1468,7 +1873,9 @@ class Step(ABC):
                     raise RuntimeError(
                         f"Abstract step {cls} without property .id cannot be registered."
                     )
-                Self.__registry[cls.id.lower()] = cls
+                existing = Self.__registry.get(cls.id.lower())
+                if existing is None or not is_plugin_override(existing, cls):
+                    Self.__registry[cls.id.lower()] = cls
                 return cls
 
             return decorator
@@ -1478,15 +1885,25 @@ class Step(ABC):
             """
             Retrieves a Step type from the registry using a lookup string.
 
+            Plugins are loaded first, so they may override built-in steps.
+            Built-in steps that have not been registered yet are then imported
+            using the registry manifest.
+
             :param name: The registered name of the Step. Case-insensitive.
             """
-            return Self.__registry.get(name.lower())
+            load_plugins()
+            key = name.lower()
+            if found := Self.__registry.get(key):
+                return found
+            import_builtin("steps", key)
+            return Self.__registry.get(key)
 
         @classmethod
         def list(Self) -> List[str]:
             """
             :returns: A list of IDs of all registered names.
             """
+            import_all("steps")
             return [cls.id for cls in Self.__registry.values()]
 
     factory = StepFactory
@@ -17,12 +17,24 @@
 # limitations under the License.
 import os
 import re
-from typing import List, Optional, Set, Tuple
+import json
+import uuid
+import shutil
+import hashlib
+import subprocess
+from typing import Dict, List, Optional, Set, Tuple
 
 from .step import Step, StepException, ViewsUpdate, MetricsUpdate
 from ..config import Variable
+from ..logging import info, warn
 from ..state import DesignFormat, State
-from ..common import Path
+from ..common import (
+    GenericDictEncoder,
+    Path,
+    Toolbox,
+    hash_verilog_files,
+    mkdirp,
+)
 
 
 @Step.factory.register()
@@ -111,6 +123,11 @@ class Lint(Step):
             Optional[Path],
             "Path to a Verilator Configuration format file (`.vlt`) that is passed to the linter.",
         ),
+        Variable(
+            "LINTER_CACHE_DIR",
+            Optional[str],
+            "If set, lint results are stored in this directory, keyed by the content of all input Verilog files and models, the defines, the linter options and the Verilator version, and reused by later runs with identical inputs instead of linting again. Blackbox models are also cached in this directory.",
+        ),
     ]
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
@@ -120,25 +137,13 @@ class Lint(Step):
         extra_args = []
 
         blackboxes = []
+        headers: List[str] = []
 
         model_list: List[str] = []
         model_set: Set[str] = set()
 
-        if cell_verilog_models := self.config["CELL_VERILOG_MODELS"]:
-            blackboxes.append(
-                self.toolbox.create_blackbox_model(
-                    frozenset(cell_verilog_models),
-                    frozenset(["USE_POWER_PINS"]),
-                )
-            )
-
-        if pad_verilog_models := self.config["PAD_VERILOG_MODELS"]:
-            blackboxes.append(
-                self.toolbox.create_blackbox_model(
-                    frozenset(pad_verilog_models),
-                    frozenset(["USE_POWER_PINS"]),
-                )
-            )
+        cell_verilog_models = self.config["CELL_VERILOG_MODELS"] or []
+        pad_verilog_models = self.config["PAD_VERILOG_MODELS"] or []
 
         macro_views = self.toolbox.get_macro_views_by_priority(
             self.config,
@@ -150,7 +155,7 @@ class Lint(Step):
         )
         for view, format in macro_views:
             if format == DesignFormat.VERILOG_HEADER:
-                blackboxes.append(str(view))
+                headers.append(str(view))
             else:
                 str_view = str(view)
                 if str_view not in model_set:
@@ -174,8 +179,45 @@ class Lint(Step):
 
         defines += self.config["LINTER_DEFINES"] or self.config["VERILOG_DEFINES"] or []
 
+        toolbox = self.toolbox
+        cache_entry: Optional[str] = None
+        if (cache_dir := self.config["LINTER_CACHE_DIR"]) and (
+            key := self.__get_cache_key(
+                [
+                    *map(str, cell_verilog_models),
+                    *map(str, pad_verilog_models),
+                    *headers,
+                    *model_list,
+                ],
+                defines,
+            )
+        ):
+            cache_entry = os.path.join(cache_dir, key)
+            if os.path.isdir(cache_entry):
+                info(f"Reusing lint results from '{cache_entry}'…")
+                return views_updates, self.__restore(cache_entry)
+            toolbox = Toolbox(toolbox.tmp_dir, os.path.join(cache_dir, "blackboxes"))
+
+        if len(cell_verilog_models):
+            blackboxes.append(
+                toolbox.create_blackbox_model(
+                    frozenset(cell_verilog_models),
+                    frozenset(["USE_POWER_PINS"]),
+                )
+            )
+
+        if len(pad_verilog_models):
+            blackboxes.append(
+                toolbox.create_blackbox_model(
+                    frozenset(pad_verilog_models),
+                    frozenset(["USE_POWER_PINS"]),
+                )
+            )
+
+        blackboxes += headers
+
         if len(model_list):
-            bb_path = self.toolbox.create_blackbox_model(
+            bb_path = toolbox.create_blackbox_model(
                 tuple(model_list),
                 frozenset(defines),
             )
@@ -185,15 +227,15 @@ class Lint(Step):
         with open(vlt_file, "w") as f:
             f.write("`verilator_config\n")
             if disable_warnings := self.config["LINTER_DISABLE_WARNINGS"]:
-                for warn in disable_warnings:
-                    f.write(f"lint_off -rule {warn}\n")
+                for warning in disable_warnings:
+                    f.write(f"lint_off -rule {warning}\n")
 
             for blackbox in blackboxes:
                 if disable_warnings_bb := self.config[
                     "LINTER_DISABLE_WARNINGS_BLACKBOX"
                 ]:
-                    for warn in disable_warnings_bb:
-                        f.write(f'lint_off -rule {warn} -file "{blackbox}"\n')
+                    for warning in disable_warnings_bb:
+                        f.write(f'lint_off -rule {warning} -file "{blackbox}"\n')
 
         extra_args.append("--Wno-fatal")
 
@@ -263,7 +305,77 @@ class Lint(Step):
         )
         metrics_updates.update({"design__lint_warning__count": warnings_count})
         metrics_updates.update({"design__inferred_latch__count": latch_count})
+
+        if cache_entry is not None:
+            self.__store(cache_entry, metrics_updates)
+
         return views_updates, metrics_updates
 
+    def __get_cache_key(self, models: List[str], defines: List[str]) -> Optional[str]:
+        try:
+            version = subprocess.check_output(
+                ["verilator", "--version"],
+                encoding="utf8",
+                stderr=subprocess.STDOUT,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            # Linting itself reports a missing or broken Verilator
+            warn(f"Could not get the Verilator version, not caching lint results: {e}")
+            return None
+        options = {
+            variable.name: self.config.get(variable.name)
+            for variable in self.config_vars
+            if variable.name != "LINTER_CACHE_DIR"
+        }
+        include_dirs = [str(dir) for dir in self.config["VERILOG_INCLUDE_DIRS"] or []]
+        key = {
+            "version": version.strip(),
+            "design_name": self.config["DESIGN_NAME"],
+            "defines": defines,
+            "options": options,
+            "sources": hash_verilog_files(
+                [str(file) for file in self.config["VERILOG_FILES"]],
+                include_dirs,
+                self.config["LINTER_RELATIVE_INCLUDES"],
+            ),
+            "models": hash_verilog_files(models, include_dirs, False),
+            "vlt": hash_verilog_files(
+                [str(vlt) for vlt in [self.config["LINTER_VLT"]] if vlt is not None],
+                [],
+                False,
+            ),
+        }
+        return hashlib.sha256(
+            json.dumps(key, cls=GenericDictEncoder, sort_keys=True).encode("utf8")
+        ).hexdigest()
+
+    def __cached_files(self) -> Dict[str, str]:
+        return {
+            "lint.log": self.get_log_path(),
+            "_waivers_output.vlt": os.path.join(self.step_dir, "_waivers_output.vlt"),
+        }
+
+    def __store(self, cache_entry: str, metrics: MetricsUpdate):
+        tmp_entry = f"{cache_entry}.{uuid.uuid4().hex}.tmp"
+        mkdirp(tmp_entry)
+        for name, path in self.__cached_files().items():
+            if os.path.isfile(path):
+                shutil.copy(path, os.path.join(tmp_entry, name))
+        with open(os.path.join(tmp_entry, "metrics.json"), "w", encoding="utf8") as f:
+            json.dump(metrics, f, cls=GenericDictEncoder)
+        try:
+            os.rename(tmp_entry, cache_entry)
+        except OSError:
+            # Another run stored the same results first
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+    def __restore(self, cache_entry: str) -> MetricsUpdate:
+        for name, path in self.__cached_files().items():
+            cached_path = os.path.join(cache_entry, name)
+            if os.path.isfile(cached_path):
+                shutil.copy(cached_path, path)
+        with open(os.path.join(cache_entry, "metrics.json"), encoding="utf8") as f:
+            return json.load(f)
+
     def layout_preview(self) -> Optional[str]:
         return None
@@ -16,13 +16,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import re
+import json
+import time
+import hashlib
 import textwrap
 import subprocess
 from abc import abstractmethod
-from typing import List, Literal, Optional, Set, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Literal, Optional, Set, Tuple
 
 from .tclstep import TclStep
-from .step import ViewsUpdate, MetricsUpdate, Step
+from .step import ViewsUpdate, MetricsUpdate, Step, StepError
 from .pyosys import (
     PyosysStep,
     JsonHeader,
@@ -34,13 +39,27 @@ from .pyosys import (
 from ..config import Variable, Config
 from ..state import State, DesignFormat
 from ..logging import info
-from ..common import Path, Toolbox, TclUtils, process_list_file
+from ..common import (
+    Path,
+    Toolbox,
+    TclUtils,
+    hash_verilog_files,
+    mkdirp,
+    process_list_file,
+    _get_process_limit,
+)
 
 # Re-export for back-compat
 JsonHeader
 Synthesis
 VHDLSynthesis
 
+_verilog_module_rx = re.compile(
+    r"^module\s+(\\\S+|[A-Za-z_][\w$]*).*?^endmodule", re.M | re.S
+)
+_verilog_identifier_rx = re.compile(r"\\\S+|[A-Za-z_][\w$]*")
+_verilog_port_rx = re.compile(r"^\s*(?:input|output|inout)\b[^;]*;", re.M)
+
 
 # This is now only used by EQY since we moved our Yosys scripts to Python.
 def _generate_read_deps(
@@ -252,6 +271,11 @@ class EQY(Step):
 
     Currently, you are expected to provide your own EQY script if you want this
     to work properly.
+
+    If ``EQY_PARTITION_MODE`` is ``module``, each module of the netlist that
+    also exists in the RTL is checked separately and in parallel, with the
+    other such modules it instantiates treated as blackboxes. Results of
+    partitions proven equivalent can be cached using ``EQY_CACHE_DIR``.
     """
 
     id = "Yosys.EQY"
@@ -281,9 +305,207 @@ class EQY(Step):
                 "Attempt to run EQY even if the PDK's Verilog models are supported by this step. Will likely result in a failure.",
                 default=False,
             ),
+            Variable(
+                "EQY_PARTITION_MODE",
+                Literal["output", "module"],
+                "How the generated EQY script partitions the design. 'output' checks the flattened design at once, with EQY partitioning it by output. 'module' additionally checks each module in the netlist that also exists in the RTL separately, treating the other such modules it instantiates as blackboxes. 'module' requires the hierarchy to be kept during synthesis, see `SYNTH_HIERARCHY_MODE`.",
+                default="output",
+            ),
+            Variable(
+                "EQY_SAT_DEPTH",
+                int,
+                "The depth of the 'sat' strategy in the generated EQY script, which is always attempted first.",
+                default=5,
+            ),
+            Variable(
+                "EQY_SBY_ENGINES",
+                List[str],
+                "SymbiYosys engines to attempt, in order, for partitions the 'sat' strategy could not prove in the generated EQY script. Each engine is a separate 'sby' strategy.",
+                default=["abc pdr -rfi", "smtbmc bitwuzla"],
+            ),
+            Variable(
+                "EQY_SBY_DEPTH",
+                int,
+                "The depth of the 'sby' strategies in the generated EQY script. Ignored by unbounded engines such as 'abc pdr'.",
+                default=2,
+            ),
+            Variable(
+                "EQY_THREADS",
+                Optional[int],
+                "The maximum number of EQY jobs to run at once, divided among partitions checked in parallel. If unset, the flow's job count is used.",
+            ),
+            Variable(
+                "EQY_CACHE_DIR",
+                Optional[str],
+                "If set, partitions proven equivalent are recorded in this directory, keyed by the RTL, the partition's netlist, the PDK models and the generated EQY script, and are not checked again by later runs with identical inputs. Not used with `EQY_SCRIPT`.",
+            ),
         ]
     )
 
+    def get_partitions(self, netlist: str) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        :param netlist: The path to the gate-level netlist.
+        :returns: A dictionary of partitions, each being a top module to check,
+            mapped to the text of the netlist it is checked against and the
+            modules it instantiates that are checked as separate partitions.
+
+            The text includes the modules flattened into the partition and the
+            ports of the modules that are not.
+        """
+        text = open(netlist, encoding="utf8").read()
+        design_name = self.config["DESIGN_NAME"]
+        if self.config["EQY_PARTITION_MODE"] != "module":
+            return {design_name: (text, [])}
+
+        modules = {match[1]: match[0] for match in _verilog_module_rx.finditer(text)}
+        # Derived modules (e.g. parameterized) have no equivalent in the RTL,
+        # so they are flattened into the partitions instantiating them
+        partitions = {
+            name for name in modules if name == design_name or not name.startswith("\\")
+        }
+
+        def get_instantiated(name: str) -> Set[str]:
+            return {
+                token
+                for token in _verilog_identifier_rx.findall(modules[name])
+                if token in modules and token != name
+            }
+
+        result = {}
+        for partition in partitions:
+            texts = [modules[partition]]
+            separate = set()
+            visited = {partition}
+            queue = list(get_instantiated(partition))
+            while len(queue):
+                current = queue.pop(0)
+                if current in visited:
+                    continue
+                visited.add(current)
+                if current in partitions:
+                    separate.add(current)
+                    texts += _verilog_port_rx.findall(modules[current])
+                else:
+                    texts.append(modules[current])
+                    queue += get_instantiated(current)
+            result[partition] = ("\n".join(texts), sorted(separate))
+        return result
+
+    def get_eqy_script(
+        self,
+        netlist: str,
+        processed_pdk: str,
+        top: str,
+        blackboxes: List[str],
+        partition_dir: str,
+    ) -> str:
+        strategies = f"""
+            [strategy sat]
+            use sat
+            depth {self.config["EQY_SAT_DEPTH"]}
+            """
+        for i, engine in enumerate(self.config["EQY_SBY_ENGINES"]):
+            strategies += f"""
+            [strategy sby{i}]
+            use sby
+            depth {self.config["EQY_SBY_DEPTH"]}
+            engine {engine}
+            """
+        blackbox_command = ""
+        if len(blackboxes):
+            blackbox_command = f"blackbox {' '.join(blackboxes)}"
+        return (
+            textwrap.dedent(
+                """
+            [script]
+            {dep_commands}
+            blackbox
+
+            [gold]
+            read_verilog -formal -sv {files}
+
+            [gate]
+            read_verilog -formal -sv {processed_pdk} {nl}
+
+            [script]
+            hierarchy -top {design_name}
+            {blackbox_command}
+            proc
+            prep -top {design_name} -flatten
+
+            memory -nomap
+            async2sync
+
+            [gold]
+            write_verilog {partition_dir}/gold.v
+
+            [gate]
+            write_verilog {partition_dir}/gate.v
+            """
+            ).format(
+                design_name=top,
+                dep_commands=_generate_read_deps(self.config, self.toolbox, tcl=False),
+                files=TclUtils.join(
+                    [str(file) for file in self.config["VERILOG_FILES"]]
+                ),
+                nl=netlist,
+                processed_pdk=processed_pdk,
+                blackbox_command=blackbox_command,
+                partition_dir=partition_dir,
+            )
+            + textwrap.dedent(strategies)
+        )
+
+    def __get_cache_key(
+        self,
+        gold_hash: str,
+        gate_text: str,
+        processed_pdk: str,
+        script: str,
+        netlist: str,
+        partition_dir: str,
+    ) -> str:
+        key = {
+            "gold": gold_hash,
+            "gate": hashlib.sha256(gate_text.encode("utf8")).hexdigest(),
+            "pdk": hashlib.sha256(open(processed_pdk, "rb").read()).hexdigest(),
+            # Paths in the script differ from one run to the next
+            "script": script.replace(netlist, "")
+            .replace(partition_dir, "")
+            .replace(self.toolbox.tmp_dir, ""),
+        }
+        return hashlib.sha256(
+            json.dumps(key, sort_keys=True).encode("utf8")
+        ).hexdigest()
+
+    def run_partition(
+        self,
+        partition: str,
+        script: str,
+        partition_dir: str,
+        threads: int,
+        silent: bool,
+    ) -> Tuple[bool, float]:
+        """
+        Runs EQY on a single partition.
+
+        :returns: Whether the partition was proven equivalent and the time it
+            took in seconds.
+        """
+        eqy_script_path = os.path.join(partition_dir, f"{partition}.eqy")
+        with open(eqy_script_path, "w", encoding="utf8") as f:
+            f.write(script)
+        work_dir = os.path.join(partition_dir, "scratch")
+
+        start = time.perf_counter()
+        subprocess_result = self.run_subprocess(
+            ["eqy", "-j", str(threads), "-f", eqy_script_path, "-d", work_dir],
+            log_to=os.path.join(partition_dir, "eqy.log"),
+            silent=silent,
+            check=False,
+        )
+        return subprocess_result["returncode"] == 0, time.perf_counter() - start
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         processed_pdk = os.path.join(self.step_dir, "formal_pdk.v")
 
@@ -307,71 +529,103 @@ class EQY(Step):
             )
             return {}, {}
 
-        eqy_script_path = os.path.join(
-            self.step_dir, f"{self.config['DESIGN_NAME']}.eqy"
+        netlist = str(state_in[DesignFormat.NETLIST])
+        partitions: Dict[str, Tuple[str, List[str]]]
+        if eqy_script := self.config["EQY_SCRIPT"]:
+            partitions = {self.config["DESIGN_NAME"]: ("", [])}
+        else:
+            partitions = self.get_partitions(netlist)
+
+        threads = self.config["EQY_THREADS"] or _get_process_limit()
+        parallel = min(threads, len(partitions))
+        threads_per_partition = max(1, threads // parallel)
+        cache_dir = self.config["EQY_CACHE_DIR"]
+        gold_hash = hash_verilog_files(
+            [str(file) for file in self.config["VERILOG_FILES"]],
+            [str(dir) for dir in self.config["VERILOG_INCLUDE_DIRS"] or []],
+            True,
         )
 
-        with open(eqy_script_path, "w", encoding="utf8") as f:
-            if eqy_script := self.config["EQY_SCRIPT"]:
-                for line in open(eqy_script, "r", encoding="utf8"):
-                    f.write(line)
-            else:
-                script = textwrap.dedent(
-                    """
-                    [script]
-                    {dep_commands}
-                    blackbox
-
-                    [gold]
-                    read_verilog -formal -sv {files}
-
-                    [gate]
-                    read_verilog -formal -sv {processed_pdk} {nl}
-
-                    [script]
-                    hierarchy -top {design_name}
-                    proc
-                    prep -top {design_name} -flatten
-
-                    memory -nomap
-                    async2sync
-
-                    [gold]
-                    write_verilog {step_dir}/gold.v
-                    
-                    [gate]
-                    write_verilog {step_dir}/gate.v
-
-                    [strategy sat]
-                    use sat
-                    depth 5
-
-                    [strategy pdr]
-                    use sby
-                    engine abc pdr -rfi
-
-                    [strategy bitwuzla]
-                    use sby
-                    depth 2
-                    engine smtbmc bitwuzla
-                    """
-                ).format(
-                    design_name=self.config["DESIGN_NAME"],
-                    dep_commands=_generate_read_deps(
-                        self.config, self.toolbox, tcl=False
-                    ),
-                    files=TclUtils.join(
-                        [str(file) for file in self.config["VERILOG_FILES"]]
-                    ),
-                    nl=state_in[DesignFormat.NETLIST],
-                    processed_pdk=processed_pdk,
-                    step_dir=self.step_dir,
+        metrics_updates: MetricsUpdate = {}
+        failed = []
+        cached = 0
+        futures: Dict[str, Future[Tuple[bool, float]]] = {}
+        cache_paths: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=parallel) as tpe:
+            for partition, (gate_text, blackboxes) in partitions.items():
+                if len(partitions) == 1:
+                    partition_dir = self.step_dir
+                else:
+                    partition_dir = os.path.join(
+                        self.step_dir, re.sub(r"[^\w.-]", "_", partition)
+                    )
+                    mkdirp(partition_dir)
+
+                if eqy_script is not None:
+                    script = open(eqy_script, "r", encoding="utf8").read()
+                else:
+                    script = self.get_eqy_script(
+                        netlist,
+                        processed_pdk,
+                        partition,
+                        blackboxes,
+                        partition_dir,
+                    )
+
+                if cache_dir is not None and eqy_script is None:
+                    key = self.__get_cache_key(
+                        gold_hash,
+                        gate_text,
+                        processed_pdk,
+                        script,
+                        netlist,
+                        partition_dir,
+                    )
+                    cache_paths[partition] = os.path.join(cache_dir, f"{key}.json")
+                    if os.path.isfile(cache_paths[partition]):
+                        info(f"Reusing cached equivalence result for '{partition}'…")
+                        cached += 1
+                        metrics_updates[
+                            f"equivalence__partition__pass__partition:{partition}"
+                        ] = 1
+                        metrics_updates[
+                            f"equivalence__partition__runtime__partition:{partition}"
+                        ] = 0
+                        continue
+
+                futures[partition] = tpe.submit(
+                    self.run_partition,
+                    partition,
+                    script,
+                    partition_dir,
+                    threads_per_partition,
+                    len(partitions) > 1,
                 )
-                f.write(script)
-        work_dir = os.path.join(self.step_dir, "scratch")
 
-        subprocess_result = self.run_subprocess(
-            ["eqy", "-f", eqy_script_path, "-d", work_dir]
-        )
+            for partition, future in futures.items():
+                passed, runtime = future.result()
+                metrics_updates[
+                    f"equivalence__partition__pass__partition:{partition}"
+                ] = int(passed)
+                metrics_updates[
+                    f"equivalence__partition__runtime__partition:{partition}"
+                ] = round(runtime, 3)
+                if not passed:
+                    failed.append(partition)
+                elif cache_path := cache_paths.get(partition):
+                    mkdirp(cache_dir)
+                    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "w", encoding="utf8") as f:
+                        json.dump({"partition": partition, "runtime": runtime}, f)
+                    os.replace(tmp_path, cache_path)
+
+        metrics_updates["equivalence__partition__count"] = len(partitions)
+        metrics_updates["equivalence__partition_cached__count"] = cached
+        metrics_updates["equivalence__partition_fail__count"] = len(failed)
+
+        if len(failed):
+            raise StepError(
+                f"Could not prove equivalence of {len(failed)} partition(s): {', '.join(sorted(failed))}. Check the EQY logs in '{self.step_dir}'."
+            )
 
-        return {}, subprocess_result["generated_metrics"]
+        return {}, metrics_updates
@@ -0,0 +1,149 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sys
+import json
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+
+def test_design_names(tmp_path):
+    from librelane.batch import BatchDesign
+
+    for config in ["spm/config.json", "my-design/config.json", "aes/config.json"]:
+        (tmp_path / config).parent.mkdir(exist_ok=True)
+    designs = BatchDesign.from_config_files(
+        [
+            str(tmp_path / "spm" / "config.json"),
+            str(tmp_path / "my-design" / "config.json"),
+            str(tmp_path / "aes" / "config.json"),
+            str(tmp_path / "aes" / "small.json"),
+        ]
+    )
+    assert [design.name for design in designs] == [
+        "spm",
+        "my_design",
+        "aes_config",
+        "aes_small",
+    ], "designs were named incorrectly"
+
+    with pytest.raises(ValueError, match="would both be named"):
+        BatchDesign.from_config_files(
+            [str(tmp_path / "a-b" / "config.json"), str(tmp_path / "a_b" / "c.json")]
+        )
+
+
+def fake_run_design(argv, log_path, cores):
+    run_dir = argv[argv.index("--force-run-dir") + 1]
+    config_file = argv[-1]
+    name = os.path.basename(os.path.dirname(config_file))
+    with open(os.path.join(run_dir, "resolved.json"), "w", encoding="utf8") as f:
+        json.dump({"PDK": "sky130A", "STD_CELL_LIBRARY": "sky130_fd_sc_hd"}, f)
+    os.makedirs(os.path.join(run_dir, "01-step"), exist_ok=True)
+    with open(
+        os.path.join(run_dir, "01-step", "state_out.json"), "w", encoding="utf8"
+    ) as f:
+        json.dump(
+            {"metrics": {"cores": cores, "jobs": argv[argv.index("--jobs") + 1]}}, f
+        )
+    with open(log_path, "w", encoding="utf8") as f:
+        f.write(" ".join(argv))
+    sys.exit(1 if name == "failing" else 0)
+
+
+def test_batch_runner(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    from librelane.batch import runner, BatchDesign, BatchRunner
+
+    monkeypatch.setattr(runner, "_run_design", fake_run_design)
+    monkeypatch.setattr(BatchRunner, "warm_up", lambda self: None)
+
+    config_files = []
+    for name in ["a", "b", "failing"]:
+        (tmp_path / name).mkdir()
+        config_files.append(str(tmp_path / name / "config.json"))
+
+    batch = BatchRunner(
+        BatchDesign.from_config_files(config_files),
+        str(tmp_path / "out"),
+        ["--manual-pdk"],
+        pdk_root="/pdks",
+        pdk="sky130A",
+        jobs=8,
+        cores_per_design=2,
+        memory_per_design=4,
+        memory_budget=6,
+    )
+    assert batch.max_parallel == 1, "memory budget did not limit parallelism"
+
+    results = batch.run()
+    assert [result.name for result in results] == [
+        "a",
+        "b",
+        "failing",
+    ], "results are not in the order of the designs"
+    assert [result.passed for result in results] == [
+        True,
+        True,
+        False,
+    ], "exit codes were not collected"
+    assert [result.cores for result in results] == [
+        8,
+        8,
+        8,
+    ], "cores were not split between the designs that could run"
+
+    metrics_file = tmp_path / "out" / "sky130A-sky130_fd_sc_hd-failing.metrics.json"
+    assert json.loads(metrics_file.read_text(encoding="utf8")) == {
+        "cores": 8,
+        "jobs": "8",
+    }, "metrics were not extracted"
+
+    summary = json.loads((tmp_path / "out" / "summary.json").read_text("utf8"))
+    assert (summary["passed"], summary["failed"]) == (2, 1), "summary is incorrect"
+
+
+def test_batch_runner_core_split(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    from librelane.batch import runner, BatchDesign, BatchRunner
+
+    monkeypatch.setattr(runner, "_run_design", fake_run_design)
+    monkeypatch.setattr(BatchRunner, "warm_up", lambda self: None)
+
+    config_files = []
+    for name in ["a", "b", "c"]:
+        (tmp_path / name).mkdir()
+        config_files.append(str(tmp_path / name / "config.json"))
+
+    batch = BatchRunner(
+        BatchDesign.from_config_files(config_files),
+        str(tmp_path / "out"),
+        ["--manual-pdk"],
+        pdk_root="/pdks",
+        pdk="sky130A",
+        jobs=8,
+        cores_per_design=2,
+        memory_per_design=4,
+        memory_budget=8,
+    )
+    assert batch.max_parallel == 2, "memory budget did not limit parallelism"
+
+    results = batch.run()
+    assert [result.cores for result in results[:2]] == [
+        4,
+        4,
+    ], "cores were not split between the designs that could run"
+    # Depending on how many designs finished by then, the last one gets the
+    # cores of one or both
+    assert results[2].cores in [4, 8], "cores of finished designs were not reused"
@@ -0,0 +1,297 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Runs the benchmark suite and compares results between commits.
+
+Results for commits are stored as baselines in ``.benchmarks/`` at the root of
+the repository and reused on subsequent comparisons.
+
+Usage examples::
+
+    # Run the suite on the working tree and store it as a named baseline
+    python3 -m test.benchmarks run --save before-refactor
+
+    # Compare a stored baseline, a commit or a results file with the working
+    # tree (or another one of these)
+    python3 -m test.benchmarks compare before-refactor
+    python3 -m test.benchmarks compare main HEAD --threshold 0.05
+"""
+import os
+import sys
+import json
+import shutil
+import subprocess
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+import click
+import cloup
+import rich.table
+import rich.console
+
+from librelane.common.cli import formatter_settings
+
+__file_dir__ = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(__file_dir__))
+BASELINE_DIR = os.path.join(REPO_ROOT, ".benchmarks")
+WORKING_TREE = "WORKTREE"
+
+
+def _git(*args: str, cwd: str = REPO_ROOT) -> str:
+    return subprocess.check_output(["git", *args], cwd=cwd, encoding="utf8").strip()
+
+
+def _run_suite(
+    ref: Optional[str],
+    out_path: str,
+    scale: float,
+    pytest_args: Tuple[str, ...] = (),
+):
+    """
+    Runs the benchmark suite against ``ref``, or against the working tree if
+    ``ref`` is ``None``.
+
+    Commits are checked out into a temporary ``git worktree``. The *current*
+    benchmark suite is copied into it, so commits that predate the suite (or
+    an older version thereof) are measured using the same benchmarks.
+    """
+    cmd = [
+        sys.executable,
+        "-m",
+        "pytest",
+        "-o",
+        "addopts=",
+        "-p",
+        "no:cacheprovider",
+        "-m",
+        "benchmark",
+        "-q",
+        "test/benchmarks",
+        "--benchmark-json",
+        os.path.abspath(out_path),
+        "--benchmark-scale",
+        str(scale),
+        *pytest_args,
+    ]
+    if ref is None:
+        subprocess.check_call(cmd, cwd=REPO_ROOT)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="librelane_bench_") as d:
+        worktree = os.path.join(d, "worktree")
+        _git("worktree", "add", "--detach", worktree, ref)
+        try:
+            shutil.rmtree(os.path.join(worktree, "test", "benchmarks"), True)
+            shutil.copytree(
+                __file_dir__,
+                os.path.join(worktree, "test", "benchmarks"),
+                ignore=shutil.ignore_patterns("__pycache__"),
+            )
+            shutil.copy(
+                os.path.join(REPO_ROOT, "test", "conftest.py"),
+                os.path.join(worktree, "test", "conftest.py"),
+            )
+            env = os.environ.copy()
+            env["PYTHONPATH"] = os.pathsep.join(
+                [worktree] + env.get("PYTHONPATH", "").split(os.pathsep)
+            )
+            subprocess.check_call(cmd, cwd=worktree, env=env)
+        finally:
+            _git("worktree", "remove", "--force", worktree)
+
+
+def _resolve(
+    target: str,
+    scale: float,
+    rerun: bool,
+    pytest_args: Tuple[str, ...],
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Resolves ``target`` to benchmark results.
+
+    ``target`` may be :data:`WORKING_TREE`, which is always measured anew, a
+    path to a results file, the name of a baseline saved in ``.benchmarks/``
+    or any git revision.
+
+    :returns: A tuple of a human-readable label and the results
+    """
+    if target == WORKING_TREE:
+        # Always re-measured, as the working tree may have changed since
+        with tempfile.TemporaryDirectory(prefix="librelane_bench_") as d:
+            out_path = os.path.join(d, "results.json")
+            _run_suite(None, out_path, scale, pytest_args)
+            return "working tree", json.load(open(out_path, encoding="utf8"))
+
+    if os.path.isfile(target):
+        return target, json.load(open(target, encoding="utf8"))
+
+    named = os.path.join(BASELINE_DIR, f"{target}.json")
+    if os.path.isfile(named):
+        return target, json.load(open(named, encoding="utf8"))
+
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    commit = _git("rev-parse", "--verify", f"{target}^{{commit}}")
+    out_path = os.path.join(BASELINE_DIR, f"{commit}-x{scale}.json")
+    if rerun or not os.path.isfile(out_path):
+        _run_suite(commit, out_path, scale, pytest_args)
+    return f"{target} ({commit[:8]})", json.load(open(out_path, encoding="utf8"))
+
+
+@cloup.group(
+    no_args_is_help=True,
+    formatter_settings=formatter_settings,
+)
+def cli():
+    pass
+
+
+def common_opts(f):
+    f = cloup.option(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiplier for the size of synthetic benchmark inputs.",
+    )(f)
+    f = cloup.option(
+        "--pytest-arg",
+        "pytest_args",
+        multiple=True,
+        default=(),
+        help="Additional arguments to pass to pytest, e.g. '-k aggregate'.",
+    )(f)
+    return f
+
+
+@cloup.command()
+@common_opts
+@cloup.option(
+    "--save",
+    default=None,
+    help="Store the results as a named baseline in .benchmarks/ for later comparisons.",
+)
+@cloup.argument("ref", required=False, default=None)
+def run(
+    ref: Optional[str],
+    scale: float,
+    pytest_args: Tuple[str, ...],
+    save: Optional[str],
+):
+    """
+    Runs the benchmark suite against a git revision (or the working tree if
+    none is provided.)
+
+    The results are only kept if ``--save`` is passed.
+    """
+    if save is None:
+        with tempfile.TemporaryDirectory(prefix="librelane_bench_") as d:
+            _run_suite(ref, os.path.join(d, "results.json"), scale, pytest_args)
+        return
+
+    if save == WORKING_TREE:
+        raise click.BadParameter(
+            f"'{WORKING_TREE}' is reserved for the working tree.", param_hint="--save"
+        )
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    out_path = os.path.join(BASELINE_DIR, f"{save}.json")
+    _run_suite(ref, out_path, scale, pytest_args)
+    print(f"Results written to '{os.path.relpath(out_path)}'.")
+
+
+cli.add_command(run)
+
+
+@cloup.command(no_args_is_help=True)
+@common_opts
+@cloup.option(
+    "--threshold",
+    type=float,
+    default=0.1,
+    help="The relative slowdown of the median above which a benchmark is considered to have regressed.",
+)
+@cloup.option(
+    "--rerun",
+    is_flag=True,
+    default=False,
+    help="Re-run the suite for git revisions even if stored results exist.",
+)
+@cloup.argument("base")
+@cloup.argument("head", required=False, default=WORKING_TREE)
+def compare(
+    base: str,
+    head: str,
+    scale: float,
+    pytest_args: Tuple[str, ...],
+    threshold: float,
+    rerun: bool,
+):
+    """
+    Compares the benchmark results of BASE against HEAD (the working tree by
+    default.)
+
+    Each of BASE and HEAD may be a results JSON file, the name of a baseline
+    stored with ``run --save``, or a git revision.
+
+    Exits with a non-zero code if any benchmark regressed.
+    """
+    base_label, base_results = _resolve(base, scale, rerun, pytest_args)
+    head_label, head_results = _resolve(head, scale, rerun, pytest_args)
+
+    if base_results.get("scale") != head_results.get("scale"):
+        print(
+            f"Warning: comparing results at different scales ({base_results.get('scale')} vs. {head_results.get('scale')}).",
+            file=sys.stderr,
+        )
+
+    base_by_name = {b["fullname"]: b for b in base_results["benchmarks"]}
+    table = rich.table.Table()
+    table.add_column("Benchmark")
+    table.add_column(f"{base_label} (s)", justify="right")
+    table.add_column(f"{head_label} (s)", justify="right")
+    table.add_column("Ratio", justify="right")
+    regressions = 0
+    for benchmark in head_results["benchmarks"]:
+        base_benchmark = base_by_name.get(benchmark["fullname"])
+        head_median = benchmark["stats"]["median"]
+        if base_benchmark is None:
+            table.add_row(benchmark["name"], "[gray]N/A", f"{head_median:.6f}", "")
+            continue
+        base_median = base_benchmark["stats"]["median"]
+        ratio = head_median / base_median if base_median else float("inf")
+        color = "white"
+        if ratio > 1 + threshold:
+            color = "red"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            color = "green"
+        table.add_row(
+            benchmark["name"],
+            f"{base_median:.6f}",
+            f"{head_median:.6f}",
+            f"[{color}]{ratio:.2f}x",
+        )
+
+    rich.console.Console().print(table)
+    if regressions:
+        print(
+            f"{regressions} benchmark(s) regressed by more than {threshold:.0%}.",
+            file=sys.stderr,
+        )
+        exit(1)
+
+
+cli.add_command(compare)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,213 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+from _pytest.fixtures import SubRequest
+
+RESULTS_KEY = pytest.StashKey[List[Dict[str, Any]]]()
+
+
+class Benchmark(object):
+    """
+    A minimal, dependency-free equivalent of the ``benchmark`` fixture from
+    ``pytest-benchmark``.
+
+    Calling the object runs the benchmarked function repeatedly until both
+    ``min_rounds`` and ``min_time`` are satisfied, then records timing
+    statistics. :meth:`pedantic` allows a per-round ``setup`` function and a
+    fixed number of rounds for benchmarks with side effects.
+
+    The return value of the benchmarked function (for the last round) is
+    returned to the caller so results can still be asserted on.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_rounds: int,
+        min_time: float,
+    ) -> None:
+        self.name = name
+        self.min_rounds = min_rounds
+        self.min_time = min_time
+        self.extra_info: Dict[str, Any] = {}
+        self.timings: List[float] = []
+
+    def __time(self, fn: Callable, args: Tuple, kwargs: Dict) -> Tuple[float, Any]:
+        gc_enabled = gc.isenabled()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = fn(*args, **kwargs)
+            return time.perf_counter() - start, result
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def __call__(self, fn: Callable, *args, **kwargs) -> Any:
+        result = None
+        total = 0.0
+        while len(self.timings) < self.min_rounds or total < self.min_time:
+            elapsed, result = self.__time(fn, args, kwargs)
+            self.timings.append(elapsed)
+            total += elapsed
+        return result
+
+    def pedantic(
+        self,
+        fn: Callable,
+        args: Tuple = (),
+        kwargs: Optional[Dict] = None,
+        setup: Optional[Callable[[], Any]] = None,
+        rounds: int = 1,
+        warmup_rounds: int = 0,
+    ) -> Any:
+        """
+        :param setup: Called before each round, untimed. If it returns a tuple
+            of ``(args, kwargs)``, they override ``args`` and ``kwargs`` for
+            that round.
+        """
+        result = None
+        for i in range(warmup_rounds + rounds):
+            round_args, round_kwargs = args, kwargs or {}
+            if setup is not None:
+                setup_result = setup()
+                if setup_result is not None:
+                    round_args, round_kwargs = setup_result
+            elapsed, result = self.__time(fn, round_args, round_kwargs)
+            if i >= warmup_rounds:
+                self.timings.append(elapsed)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "min": min(self.timings),
+            "max": max(self.timings),
+            "mean": statistics.mean(self.timings),
+            "median": statistics.median(self.timings),
+            "stddev": (
+                statistics.stdev(self.timings) if len(self.timings) > 1 else 0.0
+            ),
+            "rounds": len(self.timings),
+        }
+
+
+def _commit_info() -> Dict[str, Any]:
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            encoding="utf8",
+            stderr=subprocess.DEVNULL,
+        ).strip()
+        dirty = (
+            subprocess.check_output(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=os.path.dirname(__file__),
+                encoding="utf8",
+                stderr=subprocess.DEVNULL,
+            ).strip()
+            != ""
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return {"id": None, "dirty": None}
+    return {"id": commit, "dirty": dirty}
+
+
+@pytest.fixture(scope="session")
+def scaled(request: SubRequest) -> Callable[[int], int]:
+    """
+    Scales a synthetic input size by ``--benchmark-scale``, allowing quick
+    smoke runs of the suite (e.g. ``--benchmark-scale 0.01``).
+    """
+    scale = request.config.getoption("--benchmark-scale")
+
+    def scaled(n: int) -> int:
+        return max(1, int(n * scale))
+
+    return scaled
+
+
+@pytest.fixture
+def benchmark(request: SubRequest):
+    config = request.config
+    current = Benchmark(
+        request.node.nodeid,
+        min_rounds=config.getoption("--benchmark-min-rounds"),
+        min_time=config.getoption("--benchmark-min-time"),
+    )
+    yield current
+    if len(current.timings) == 0:
+        return
+    config.stash.setdefault(RESULTS_KEY, []).append(
+        {
+            "name": request.node.name,
+            "fullname": current.name,
+            "stats": current.stats(),
+            "extra_info": current.extra_info,
+        }
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(RESULTS_KEY, [])
+    if len(results) == 0:
+        return
+    terminalreporter.section("benchmarks")
+    width = max(len(result["name"]) for result in results)
+    terminalreporter.write_line(
+        f"{'name':<{width}} {'min (s)':>12} {'median (s)':>12} {'stddev (s)':>12} {'rounds':>7}"
+    )
+    for result in results:
+        stats = result["stats"]
+        terminalreporter.write_line(
+            f"{result['name']:<{width}} {stats['min']:>12.6f} {stats['median']:>12.6f} {stats['stddev']:>12.6f} {stats['rounds']:>7}"
+        )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    json_path = config.getoption("--benchmark-json", None)
+    if json_path is None:
+        return
+    results = config.stash.get(RESULTS_KEY, [])
+    with open(json_path, "w", encoding="utf8") as f:
+        json.dump(
+            {
+                "machine_info": {
+                    "node": platform.node(),
+                    "machine": platform.machine(),
+                    "python_implementation": platform.python_implementation(),
+                    "python_version": platform.python_version(),
+                    "cpu_count": os.cpu_count(),
+                },
+                "commit_info": _commit_info(),
+                "scale": config.getoption("--benchmark-scale"),
+                "datetime": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": sys.executable,
+                "benchmarks": results,
+            },
+            f,
+            indent=2,
+        )
@@ -0,0 +1,242 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Generators for synthetic inputs used by the benchmark suite.
+
+All generators are deterministic so results are comparable across commits.
+"""
+import os
+import random
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Union, get_args, get_origin
+
+from librelane.common import Path
+from librelane.config import Variable
+
+DEFAULT_CORNER = "nom_tt_025C_1v80"
+CORNERS = [
+    f"{rc}_{pvt}"
+    for rc in ["nom", "min", "max"]
+    for pvt in ["tt_025C_1v80", "ss_100C_1v60", "ff_n40C_1v95"]
+]
+
+
+def write_liberty(path: str, cell_count: int, pins_per_cell: int = 4):
+    """
+    Writes a Liberty file with ``cell_count`` cells that structurally resembles
+    a standard cell library: nested groups with timing tables.
+    """
+    table = ", ".join(["0.01, 0.02, 0.03, 0.04, 0.05"] * 5)
+    with open(path, "w", encoding="utf8") as f:
+        f.write('library ("synthetic") {\n')
+        f.write('    delay_model : "table_lookup";\n')
+        f.write('    time_unit : "1ns";\n')
+        for i in range(cell_count):
+            f.write(f'    cell ("synth__cell_{i}") {{\n')
+            f.write(f"        area : {i % 50 + 1}.0;\n")
+            for pin in range(pins_per_cell):
+                direction = "output" if pin == pins_per_cell - 1 else "input"
+                f.write(f'        pin ("P{pin}") {{\n')
+                f.write(f'            direction : "{direction}";\n')
+                if direction == "output":
+                    f.write("            timing () {\n")
+                    f.write('                related_pin : "P0";\n')
+                    f.write("                cell_rise (delay_template) {\n")
+                    f.write(f'                    values ("{table}");\n')
+                    f.write("                }\n")
+                    f.write("            }\n")
+                f.write("        }\n")
+            f.write("    }\n")
+        f.write("}\n")
+
+
+def write_magic_drc_report(path: str, violation_count: int, rule_count: int = 50):
+    """
+    Writes a Magic DRC report with ``violation_count`` bounding boxes spread
+    over ``rule_count`` rules.
+    """
+    rng = random.Random(0)
+    per_rule = max(1, violation_count // rule_count)
+    with open(path, "w", encoding="utf8") as f:
+        f.write("synthetic_top\n")
+        f.write("-" * 40 + "\n")
+        for rule in range(rule_count):
+            f.write(f"Synthetic spacing < 0.{rule}um (met{rule % 5}.{rule})\n")
+            f.write("-" * 40 + "\n")
+            for _ in range(per_rule):
+                x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+                f.write(f" {x:.3f}um {y:.3f}um {x + 0.5:.3f}um {y + 0.5:.3f}um\n")
+            f.write("-" * 40 + "\n")
+
+
+def write_openroad_drc_report(path: str, violation_count: int):
+    """
+    Writes a TritonRoute DRC report with ``violation_count`` violations.
+    """
+    rng = random.Random(0)
+    kinds = ["Metal Spacing", "Short", "Cut Spacing", "Min Hole"]
+    with open(path, "w", encoding="utf8") as f:
+        for i in range(violation_count):
+            x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+            f.write(f"violation type: {kinds[i % len(kinds)]}\n")
+            f.write(f"\tsrcs: net:net{i} net:net{i + 1}\n")
+            f.write(
+                f"\tbbox = ({x:.4f}, {y:.4f}) - ({x + 0.3:.4f}, {y + 0.1:.4f}) on Layer met{i % 5 + 1}\n"
+            )
+
+
+def write_antenna_report(path: str, net_count: int, violating_ratio: float = 0.1):
+    """
+    Writes an OpenROAD antenna checker report for ``net_count`` nets, a
+    ``violating_ratio`` fraction of which are violating.
+    """
+    stride = max(1, int(1 / violating_ratio)) if violating_ratio else 0
+    with open(path, "w", encoding="utf8") as f:
+        for i in range(net_count):
+            violated = stride and i % stride == 0
+            f.write(f"Net: net{i}\n")
+            f.write(f"  Pin: _{i}_/A\n")
+            f.write("    Layer: met1\n")
+            f.write(
+                f"      Partial area ratio: {800.0 + i % 100:.2f}\n"
+                "      Required ratio:     400.00 (Gate area) "
+                + ("(VIOLATED)" if violated else "")
+                + "\n"
+            )
+            f.write("\n")
+
+
+def write_openroad_log(path: str, line_count: int, metric_every: int = 1000):
+    """
+    Writes a log resembling verbose OpenROAD output: mostly progress lines,
+    with occasional warnings and ``%OL_METRIC`` lines such as those emitted by
+    the multi-corner STA scripts.
+    """
+    with open(path, "w", encoding="utf8") as f:
+        for i in range(line_count):
+            if i % metric_every == 0:
+                corner = CORNERS[(i // metric_every) % len(CORNERS)]
+                f.write(
+                    f"%OL_METRIC_F timing__setup__ws__corner:{corner} {i / line_count:.6f}\n"
+                )
+            elif i % 997 == 0:
+                f.write(f"[WARNING DRT-0349] Synthetic warning {i}.\n")
+            else:
+                f.write(f"[INFO DRT-0195] Start {i % 64}th optimization iteration.\n")
+
+
+def make_metrics(
+    corner_count: int = len(CORNERS),
+    iteration_count: int = 64,
+    unregistered_count: int = 1000,
+) -> Dict[str, Any]:
+    """
+    :returns: A metrics dictionary resembling the accumulated metrics of a
+        full flow: every registered metric reported per corner (and, for some
+        metrics, per routing iteration), plus ``unregistered_count`` metrics
+        that have no aggregator.
+    """
+    from librelane.common.metrics import Metric
+
+    rng = random.Random(0)
+    corners = [f"corner{i}" for i in range(corner_count)]
+    metrics: Dict[str, Any] = {}
+    for name in sorted(Metric.by_name):
+        for corner in corners:
+            metrics[f"{name}__corner:{corner}"] = Decimal(f"{rng.uniform(-1, 1):.6f}")
+    for iteration in range(iteration_count):
+        metrics[f"route__drc_errors__iter:{iteration}"] = rng.randint(0, 1000)
+        for layer in range(5):
+            metrics[f"route__wirelength__iter:{iteration}__layer:met{layer}"] = (
+                rng.randint(0, 100000)
+            )
+    for i in range(unregistered_count):
+        metrics[f"synthetic__metric{i}__corner:{corners[i % corner_count]}"] = i
+    return metrics
+
+
+def _value_for(variable: Variable, file: str) -> Optional[str]:
+    def scalar(t: Any) -> Optional[str]:
+        if t is Path:
+            return file
+        if t is str:
+            return "synthetic"
+        if t is int:
+            return "1"
+        if t is Decimal or t is float:
+            return "1.0"
+        if t is bool:
+            return "0"
+        return None
+
+    t = variable.type
+    origin = get_origin(t)
+    if origin is Union:
+        return None
+    if origin in (list, List):
+        (element,) = get_args(t)
+        return scalar(element)
+    if origin in (dict, Dict):
+        _, element = get_args(t)
+        if get_origin(element) in (list, List):
+            (element,) = get_args(element)
+        element_value = scalar(element)
+        if element_value is None:
+            return None
+        return f'"*" "{element_value}"'
+    return scalar(t)
+
+
+def write_pdk(pdk_root: str, variables: Iterable[Variable]) -> str:
+    """
+    Creates a synthetic PDK named ``synthetic`` with a single standard cell
+    library ``synthetic_scl``, setting every required PDK variable in
+    ``variables`` to a placeholder value of the appropriate type.
+
+    :returns: The name of the PDK
+    """
+    pdk = "synthetic"
+    scl = "synthetic_scl"
+    config_dir = os.path.join(pdk_root, pdk, "libs.tech", "librelane")
+    os.makedirs(os.path.join(config_dir, scl), exist_ok=True)
+    placeholder = os.path.join(pdk_root, pdk, "placeholder.txt")
+    with open(placeholder, "w", encoding="utf8") as f:
+        f.write("\n")
+
+    overrides = {
+        "STD_CELL_LIBRARY": scl,
+        "DEFAULT_CORNER": DEFAULT_CORNER,
+        "STA_CORNERS": " ".join(CORNERS),
+        "TIMING_VIOLATION_CORNERS": "*tt*",
+        "PRIMARY_GDSII_STREAMOUT_TOOL": "magic",
+        "RT_MIN_LAYER": "met1",
+        "RT_MAX_LAYER": "met5",
+    }
+    values = dict(overrides)
+    for variable in variables:
+        if not variable.pdk or variable.default is not None:
+            continue
+        if variable.name in values or variable.name == "PAD_CELL_LIBRARY":
+            continue
+        value = _value_for(variable, placeholder)
+        if value is None:
+            continue
+        values[variable.name] = value
+
+    with open(os.path.join(config_dir, "config.tcl"), "w", encoding="utf8") as f:
+        for name, value in values.items():
+            f.write(f"set ::env({name}) {{{value}}}\n")
+    with open(os.path.join(config_dir, scl, "config.tcl"), "w", encoding="utf8") as f:
+        f.write("")
+    return pdk
@@ -0,0 +1,112 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict
+
+import pytest
+
+from test.benchmarks import synthetic
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def classic_env(tmp_path_factory):
+    from librelane.flows import Flow
+    from librelane.config import Variable, universal_flow_config_variables
+
+    Classic = Flow.factory.get("Classic")
+    assert Classic is not None
+
+    variables_by_name: Dict[str, Variable] = {}
+    for variable in universal_flow_config_variables + Classic.config_vars:
+        variables_by_name.setdefault(variable.name, variable)
+    for step_cls in Classic.Steps:
+        for variable in step_cls.config_vars:
+            variables_by_name.setdefault(variable.name, variable)
+
+    root = tmp_path_factory.mktemp("classic")
+    pdk_root = str(root / "pdk")
+    pdk = synthetic.write_pdk(pdk_root, variables_by_name.values())
+
+    design_dir = root / "design"
+    (design_dir / "src").mkdir(parents=True)
+    (design_dir / "src" / "spm.v").write_text("module spm(input clk); endmodule\n")
+    return {
+        "flow": Classic,
+        "pdk": pdk,
+        "pdk_root": pdk_root,
+        "design_dir": str(design_dir),
+        "config": {
+            "DESIGN_NAME": "spm",
+            "VERILOG_FILES": "dir::src/*.v",
+            "CLOCK_PORT": "clk",
+            "CLOCK_PERIOD": 10,
+        },
+    }
+
+
+def _construct_flow(classic_env):
+    return classic_env["flow"](
+        classic_env["config"],
+        design_dir=classic_env["design_dir"],
+        pdk=classic_env["pdk"],
+        pdk_root=classic_env["pdk_root"],
+    )
+
+
+def test_config_load(benchmark, classic_env):
+    flow = benchmark(_construct_flow, classic_env)
+    assert flow.config["DESIGN_NAME"] == "spm", "Configuration was not loaded"
+
+
+def test_config_dumps(benchmark, classic_env):
+    flow = _construct_flow(classic_env)
+    assert len(benchmark(flow.config.dumps)) > 0, "Configuration dump is empty"
+
+
+def test_step_construction(benchmark, classic_env):
+    from librelane.state import State
+
+    flow = _construct_flow(classic_env)
+    state_in = State()
+
+    def construct_all():
+        return [
+            step_cls(config=flow.config, state_in=state_in) for step_cls in flow.Steps
+        ]
+
+    steps = benchmark(construct_all)
+    assert len(steps) == len(flow.Steps), "Not all steps were constructed"
+
+
+def test_state_serialization(benchmark, tmp_path, scaled):
+    from librelane.common import Path
+    from librelane.state import State, DesignFormat
+
+    views = {}
+    for id in set(DesignFormat.factory.list()):
+        format = DesignFormat.factory.get(id)
+        assert format is not None
+        path = tmp_path / f"spm.{format.extension}"
+        path.write_text("\n")
+        views[id] = Path(path)
+    state = State(
+        views, metrics=synthetic.make_metrics(unregistered_count=scaled(20000))
+    )
+
+    def round_trip():
+        return State.loads(state.dumps(), validate_path=False)
+
+    restored = benchmark(round_trip)
+    assert len(restored.metrics) == len(state.metrics), "Metrics were lost"
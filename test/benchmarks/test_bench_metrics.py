@@ -0,0 +1,48 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from test.benchmarks import synthetic
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def metrics(scaled):
+    return synthetic.make_metrics(
+        corner_count=scaled(100),
+        iteration_count=scaled(64),
+        unregistered_count=scaled(100000),
+    )
+
+
+def test_aggregate_metrics(benchmark, metrics):
+    from librelane.common import aggregate_metrics
+
+    aggregated = benchmark(aggregate_metrics, metrics)
+    assert "timing__setup__ws" in aggregated, "Metrics were not aggregated"
+
+
+def test_metric_diff(benchmark, metrics):
+    from decimal import Decimal
+
+    from librelane.common.metrics import MetricDiff
+
+    new = {
+        key: (value * Decimal("1.01") if isinstance(value, Decimal) else value + 1)
+        for key, value in metrics.items()
+    }
+
+    diff = benchmark(MetricDiff.from_metrics, metrics, new, 4)
+    assert len(diff.differences) > 0, "No differences were found"
@@ -0,0 +1,106 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+import os
+
+import pytest
+
+from test.benchmarks import synthetic
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def reports(tmp_path_factory, scaled):
+    directory = tmp_path_factory.mktemp("reports")
+    paths = {
+        "liberty": str(directory / "synthetic.lib"),
+        "magic_drc": str(directory / "magic.drc.rpt"),
+        "openroad_drc": str(directory / "openroad.drc.rpt"),
+        "antenna": str(directory / "antenna.rpt"),
+    }
+    synthetic.write_liberty(paths["liberty"], scaled(5000))
+    synthetic.write_magic_drc_report(paths["magic_drc"], scaled(200000))
+    synthetic.write_openroad_drc_report(paths["openroad_drc"], scaled(100000))
+    synthetic.write_antenna_report(paths["antenna"], scaled(100000))
+    return paths
+
+
+def test_drc_from_magic(benchmark, reports):
+    from librelane.common import DRC
+
+    def parse():
+        with open(reports["magic_drc"], encoding="utf8") as f:
+            return DRC.from_magic(f)
+
+    _, count = benchmark(parse)
+    assert count > 0, "No violations were parsed"
+
+
+def test_drc_from_openroad(benchmark, reports):
+    from librelane.common import DRC
+
+    def parse():
+        with open(reports["openroad_drc"], encoding="utf8") as f:
+            return DRC.from_openroad(f, "synthetic_top")
+
+    _, count = benchmark(parse)
+    assert count > 0, "No violations were parsed"
+
+
+def test_drc_to_klayout_xml(benchmark, reports):
+    from librelane.common import DRC
+
+    with open(reports["magic_drc"], encoding="utf8") as f:
+        drc, _ = DRC.from_magic(f)
+
+    def serialize():
+        out = io.BytesIO()
+        drc.to_klayout_xml(out)
+        return out
+
+    assert len(benchmark(serialize).getvalue()) > 0, "Empty XML was generated"
+
+
+def test_remove_cells_from_lib(benchmark, reports, tmp_path):
+    from librelane.common import Toolbox
+
+    toolbox = Toolbox(str(tmp_path))
+
+    def setup():
+        toolbox.remove_cells_from_lib.cache_clear()  # type: ignore
+
+    result = benchmark.pedantic(
+        toolbox.remove_cells_from_lib,
+        args=(frozenset([reports["liberty"]]), frozenset(["synth__cell_*5"])),
+        setup=setup,
+        rounds=5,
+    )
+    with open(result[0], encoding="utf8") as f:
+        assert "/* removed synth__cell_5 */" in f.read(), "Cells were not removed"
+
+
+def test_antenna_summary(benchmark, reports, tmp_path):
+    from librelane.logging import options
+    from librelane.steps.openroad import CheckAntennas
+
+    summarize = CheckAntennas._CheckAntennas__summarize_antenna_report  # type: ignore
+    condensed = options.get_condensed_mode()
+    options.set_condensed_mode(True)
+    try:
+        summary_path = str(tmp_path / "antenna_summary.rpt")
+        benchmark(summarize, None, reports["antenna"], summary_path)
+    finally:
+        options.set_condensed_mode(condensed)
+    assert os.path.getsize(summary_path) > 0, "Summary was not written"
@@ -0,0 +1,85 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from typing import List, Type
+
+import pytest
+
+from test.benchmarks import synthetic
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def openroad_log(tmp_path_factory, scaled):
+    path = str(tmp_path_factory.mktemp("logs") / "openroad.log")
+    synthetic.write_openroad_log(path, scaled(2_000_000))
+    return path
+
+
+@pytest.fixture
+def replay_step(tmp_path):
+    from librelane.config import Config
+    from librelane.steps import Step
+    from librelane.state import State
+
+    class ReplayStep(Step):
+        """
+        Stands in for an EDA tool by replaying a pre-recorded log with
+        ``cat``, so only LibreLane's handling of the output is measured.
+        """
+
+        inputs = []
+        outputs = []
+        id = "Benchmark.Replay"
+
+        def run(self, state_in, **kwargs):
+            return {}, {}
+
+        def on_alert(self, alert):
+            return alert
+
+    step_object = ReplayStep(
+        config=Config({"DESIGN_NAME": "replay"}),
+        state_in=State(),
+        _no_filter_conf=True,
+    )
+    step_object.step_dir = str(tmp_path)
+    return step_object
+
+
+@pytest.mark.parametrize(
+    "output_processing",
+    ["default", "openroad"],
+)
+def test_run_subprocess(benchmark, replay_step, openroad_log, output_processing):
+    from librelane.steps.step import DefaultOutputProcessor, OutputProcessor
+    from librelane.steps.openroad_alerts import OpenROADOutputProcessor
+
+    processors: List[Type[OutputProcessor]] = [DefaultOutputProcessor]
+    if output_processing == "openroad":
+        processors = [OpenROADOutputProcessor, DefaultOutputProcessor]
+
+    result = benchmark.pedantic(
+        replay_step.run_subprocess,
+        args=(["cat", openroad_log],),
+        kwargs={
+            "silent": True,
+            "log_to": os.path.join(replay_step.step_dir, "replay.log"),
+            "output_processing": processors,
+        },
+        rounds=3,
+    )
+    benchmark.extra_info["lines"] = sum(1 for _ in open(openroad_log, "rb"))
+    assert len(result["generated_metrics"]) > 0, "Metrics were not parsed"
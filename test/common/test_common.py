@@ -91,6 +91,23 @@ def test_parse_metric_modifiers():
                 "flower__max__height": Decimal("8.0"),
             },
         ),
+        (
+            {
+                "timing__ws__corner:a__iter:0": 0,
+                "timing__ws__corner:a__iter:1": 5,
+                "timing__ws__corner:b": 3,
+            },
+            {
+                "timing__ws": (math.inf, min),
+            },
+            {
+                "timing__ws__corner:a__iter:0": 0,
+                "timing__ws__corner:a__iter:1": 5,
+                "timing__ws__corner:b": 3,
+                "timing__ws": 0,
+                "timing__ws__corner:a": 0,
+            },
+        ),
     ],
 )
 def test_aggregate_metrics(input, aggregators, expected):
@@ -101,6 +118,29 @@ def test_aggregate_metrics(input, aggregators, expected):
     ), "aggregate_metrics() returned unexpected output"
 
 
+def test_metric_table():
+    from librelane.common.metrics import MetricTable
+
+    table = MetricTable(
+        {
+            "timing__ws__corner:a__iter:0": 1,
+            "design__count": 2,
+            "timing__ws__corner:b": 3,
+        }
+    )
+    assert len(table) == 3, "Table has the wrong number of rows"
+    assert table.get_base_names() == [
+        "timing__ws",
+        "design__count",
+    ], "Unexpected base metric names"
+    assert table.modifiers[0] == (
+        ("corner", "a"),
+        ("iter", "0"),
+    ), "Modifiers were not parsed in order"
+    assert table.modifiers[1] == (), "Metric without modifiers has modifiers"
+    assert table.get_rows({"timing__ws"}) == [0, 2], "Rows were not selected by base"
+
+
 def test_generic_dict():
     from librelane.common import GenericDict
 
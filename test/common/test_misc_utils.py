@@ -55,3 +55,33 @@ def test_filter_all_matching():
     assert list(Filter(["*", "!c"]).get_matching_wildcards("c")) == [
         "*",
     ], "filter did not accurately return accepting wildcard"
+
+
+def test_hash_verilog_files(tmp_path):
+    from librelane.common import hash_verilog_files
+
+    (tmp_path / "inc").mkdir()
+    top = tmp_path / "top.v"
+    top.write_text('`include "defs.vh"\nmodule top; endmodule\n')
+    defs = tmp_path / "inc" / "defs.vh"
+    defs.write_text("`define WIDTH 8\n")
+    unrelated = tmp_path / "inc" / "unrelated.vh"
+    unrelated.write_text("`define DEPTH 8\n")
+
+    def get_hash():
+        return hash_verilog_files([str(top)], [str(tmp_path / "inc")], True)
+
+    initial = get_hash()
+    assert get_hash() == initial, "Hash is not deterministic"
+
+    unrelated.write_text("`define DEPTH 16\n")
+    assert get_hash() == initial, "Hash changed with a file that is not included"
+
+    defs.write_text("`define WIDTH 16\n")
+    changed = get_hash()
+    assert changed != initial, "Hash did not change with an included file"
+
+    (tmp_path / "defs.vh").write_text("`define WIDTH 32\n")
+    assert (
+        get_hash() != changed
+    ), "Includes relative to the including file were not preferred"
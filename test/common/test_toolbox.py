@@ -766,6 +766,42 @@ def test_remove_cells_from_lib(lib_trim_result):
         ), "remove_cells_from_lib produced unexpected result"
 
 
+@pytest.mark.usefixtures("_lib_mock_fs")
+def test_remove_cells_from_lib_shared_cache(lib_trim_result):
+    from librelane.common import Toolbox
+
+    excluded_cells = frozenset(
+        open("/cwd/bad_cell_list.txt", encoding="utf8").read().strip().splitlines()
+    )
+    inputs = frozenset(["/cwd/example_lib.lib", "/cwd/example_lib2.lib"])
+
+    first = Toolbox("/first", cache_dir="/cache").remove_cells_from_lib(
+        inputs, excluded_cells=excluded_cells
+    )
+    second = Toolbox("/second", cache_dir="/cache").remove_cells_from_lib(
+        inputs, excluded_cells=excluded_cells
+    )
+    assert sorted(first) == sorted(second), "artifacts were not shared via the cache"
+    assert all(
+        file.startswith("/cache/") for file in first
+    ), "artifacts were not created in the cache directory"
+    assert len(os.listdir("/cache")) == 2, "temporary artifacts were left behind"
+    for file in first:
+        contents = open(file, encoding="utf8").read()
+        assert (
+            contents.strip() in lib_trim_result
+        ), "remove_cells_from_lib produced unexpected result"
+
+    with open("/cwd/example_lib.lib", "a", encoding="utf8") as f:
+        f.write("\n")
+    third = Toolbox("/third", cache_dir="/cache").remove_cells_from_lib(
+        inputs, excluded_cells=excluded_cells
+    )
+    assert (
+        len(set(third) - set(first)) == 1
+    ), "modified input did not invalidate its cached artifact"
+
+
 @mock.patch.dict(os.environ, {"PATH": "/bin"})
 @pytest.mark.usefixtures("_chdir_tmp")
 def test_blackbox_creation_no_yosys(model_blackboxing):
@@ -784,6 +820,50 @@ def test_blackbox_creation_no_yosys(model_blackboxing):
     ), "Cleaning file for yosys didn't work as expected"
 
 
+@mock.patch.dict(os.environ, {"PATH": "/bin"})
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_blackbox_creation_no_yosys_not_cached(model_blackboxing):
+    from librelane.common import Toolbox
+
+    start, mid, _ = model_blackboxing
+    with open("start.v", "w", encoding="utf8") as f:
+        f.write(start)
+
+    first, second = [
+        Toolbox(tmp_dir, cache_dir="cache").create_blackbox_model(
+            frozenset(["start.v"]), frozenset()
+        )
+        for tmp_dir in ["first", "second"]
+    ]
+    assert first != second, "degraded blackbox model was reused"
+    assert (
+        open(first, encoding="utf8").read().strip() == mid.strip()
+    ), "degraded blackbox model was not returned"
+    assert os.listdir("cache") == [], "degraded blackbox model was cached"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_artifact_creation_failure():
+    from librelane.common import Toolbox
+
+    toolbox = Toolbox("tmp", cache_dir="cache")
+
+    def create(out_path: str):
+        with open(out_path, "w", encoding="utf8") as f:
+            f.write("partial")
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        toolbox._Toolbox__create_artifact(["failing"], [], ".txt", create)
+    assert os.listdir("cache") == [], "partial artifact was left in the cache"
+
+    out_path = toolbox._Toolbox__create_artifact(
+        ["empty"], [], ".txt", lambda out_path: None
+    )
+    assert not os.path.exists(out_path), "missing artifact was created"
+    assert os.listdir("cache") == [], "missing artifact was cached"
+
+
 @pytest.mark.skipif(
     (shutil.which("yosys") or shutil.which("yowasp-yosys")) is None,
     reason="requires yosys or yowasp-yosys",
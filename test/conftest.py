@@ -320,3 +320,29 @@ def pytest_addoption(parser):
     parser.addoption(
         "--create-reproducible-on-fail", action="store_true", default=False
     )
+    parser.addoption(
+        "--benchmark-json",
+        action="store",
+        default=None,
+        help="Write benchmark results to this JSON file.",
+    )
+    parser.addoption(
+        "--benchmark-scale",
+        action="store",
+        type=float,
+        default=1.0,
+        help="Multiplier for the size of synthetic benchmark inputs.",
+    )
+    parser.addoption(
+        "--benchmark-min-rounds",
+        action="store",
+        type=int,
+        default=5,
+    )
+    parser.addoption(
+        "--benchmark-min-time",
+        action="store",
+        type=float,
+        default=0.5,
+        help="Minimum total time in seconds to spend on each benchmark.",
+    )
@@ -0,0 +1,258 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+from decimal import Decimal
+
+import pytest
+
+from librelane.flows import flow as flow_module, sequential as sequential_flow_module
+from librelane.steps import step as step_module
+
+pytestmark = pytest.mark.all
+
+mock_variables = pytest.mock_variables
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_prefix_sharing():
+    from librelane.config import Variable
+    from librelane.steps import Step, DeferredStepError
+    from librelane.flows.explore import DesignSpaceExploration
+
+    runs = []
+
+    class Common(Step):
+        id = "Test.Common"
+        inputs = []
+        outputs = []
+
+        def run(self, state_in, **kwargs):
+            runs.append(self.id)
+            return {}, {"common": 1}
+
+    class UsesX(Step):
+        id = "Test.UsesX"
+        inputs = []
+        outputs = []
+        config_vars = [Variable("TEST_X", int, "x", default=0)]
+
+        def run(self, state_in, **kwargs):
+            runs.append(self.id)
+            assert isinstance(self.config["TEST_X"], int), "TEST_X was not coerced"
+            if self.config["TEST_X"] == 3:
+                raise DeferredStepError("x is 3")
+            return {}, {"x": self.config["TEST_X"]}
+
+    class UsesY(Step):
+        id = "Test.UsesY"
+        inputs = []
+        outputs = []
+        config_vars = [Variable("TEST_Y", Decimal, "y", default=0)]
+
+        def run(self, state_in, **kwargs):
+            runs.append(self.id)
+            return {}, {"y": self.config["TEST_Y"]}
+
+    class Dummy(DesignSpaceExploration):
+        Steps = [Common, UsesX, UsesY]
+        gating_config_vars = {}
+
+    flow = Dummy(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+            "DSE_GRID": {"TEST_X": [1, 2], "TEST_Y": [1, 2]},
+            "DSE_POINTS": [{"TEST_X": "3"}],
+            "DSE_METRICS": ["x", "y"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+    flow.start(tag="dse")
+
+    assert sorted(runs) == sorted(
+        ["Test.Common"] + ["Test.UsesX"] * 3 + ["Test.UsesY"] * 5
+    ), "steps were not shared between points with identical configurations"
+
+    with open("/cwd/runs/dse/exploration.json") as f:
+        results = json.load(f)
+    assert [result["overrides"] for result in results] == [
+        {"TEST_X": 3},
+        {"TEST_X": 1, "TEST_Y": 1},
+        {"TEST_X": 1, "TEST_Y": 2},
+        {"TEST_X": 2, "TEST_Y": 1},
+        {"TEST_X": 2, "TEST_Y": 2},
+    ], "points were not explored in order"
+    assert [result["status"] for result in results] == [
+        "failed",
+        "passed",
+        "passed",
+        "passed",
+        "passed",
+    ], "deferred errors were not attributed to the correct points"
+    assert results[3]["metrics"] == {
+        "x": 2,
+        "y": 1,
+    }, "metrics of a point were not reported correctly"
+    assert (
+        results[1]["step_dirs"][0] == results[2]["step_dirs"][0]
+    ), "points did not share the step directory of a common prefix"
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+@pytest.mark.parametrize(
+    ("point", "message"),
+    [
+        ({"TEST_UNKNOWN": 1}, "Unknown configuration variable"),
+        ({"TEST_X": "x"}, "Invalid exploration point"),
+        ({"DSE_METRICS": "x"}, "cannot be overridden"),
+    ],
+)
+def test_invalid_point(point, message):
+    from librelane.config import Variable
+    from librelane.steps import Step
+    from librelane.flows import FlowException
+    from librelane.flows.explore import DesignSpaceExploration
+
+    runs = []
+
+    class UsesX(Step):
+        id = "Test.UsesX"
+        inputs = []
+        outputs = []
+        config_vars = [Variable("TEST_X", int, "x", default=0)]
+
+        def run(self, state_in, **kwargs):
+            runs.append(self.id)
+            return {}, {}
+
+    class Dummy(DesignSpaceExploration):
+        Steps = [UsesX]
+        gating_config_vars = {}
+
+    flow = Dummy(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+            "DSE_POINTS": [{"TEST_X": 1}, point],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+    with pytest.raises(FlowException, match=message):
+        flow.start(tag="dse")
+    assert runs == [], "steps were run before all points were validated"
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_condensed_mode_restored():
+    from librelane.steps import Step
+    from librelane.logging import options
+    from librelane.flows.explore import DesignSpaceExploration
+
+    class Unexpected(Step):
+        id = "Test.Unexpected"
+        inputs = []
+        outputs = []
+
+        def run(self, state_in, **kwargs):
+            raise RuntimeError("unexpected")
+
+    class Dummy(DesignSpaceExploration):
+        Steps = [Unexpected]
+        gating_config_vars = {}
+
+    flow = Dummy(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+            "DSE_POINTS": [{"DESIGN_NAME": "OTHER"}],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+    condensed_mode = options.get_condensed_mode()
+    with pytest.raises(RuntimeError, match="unexpected"):
+        flow.start(tag="dse")
+    assert (
+        options.get_condensed_mode() == condensed_mode
+    ), "condensed mode was not restored"
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_gated_steps_not_shared():
+    from librelane.config import Variable
+    from librelane.steps import Step
+    from librelane.flows.explore import DesignSpaceExploration
+
+    runs = []
+
+    class CheckA(Step):
+        id = "Test.CheckA"
+        inputs = []
+        outputs = []
+
+        def run(self, state_in, **kwargs):
+            runs.append(self.id)
+            return {}, {"a": 1}
+
+    class CheckB(CheckA):
+        id = "Test.CheckB"
+
+        def run(self, state_in, **kwargs):
+            runs.append(self.id)
+            return {}, {"b": 1}
+
+    class Dummy(DesignSpaceExploration):
+        Steps = [CheckA, CheckB]
+        gating_config_vars = {"Test.CheckA": ["TEST_RUN_A"]}
+        config_vars = DesignSpaceExploration.config_vars + [
+            Variable("TEST_RUN_A", bool, "Runs CheckA", default=True),
+        ]
+
+    flow = Dummy(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+            "DSE_POINTS": [{"TEST_RUN_A": True}, {"TEST_RUN_A": False}],
+            "DSE_METRICS": ["a", "b"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+    flow.start(tag="dse")
+
+    assert sorted(runs) == [
+        "Test.CheckA",
+        "Test.CheckB",
+        "Test.CheckB",
+    ], "different steps with identical configurations were shared"
+    with open("/cwd/runs/dse/exploration.json") as f:
+        results = json.load(f)
+    assert [result["metrics"] for result in results] == [
+        {"a": 1, "b": 1},
+        {"b": 1},
+    ], "point reused the result of a different step"
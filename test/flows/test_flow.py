@@ -341,3 +341,57 @@ def test_run_tags(caplog: pytest.LogCaptureFixture, MockStepTuple):
         FlowException, match="already exists as a file and not a directory"
     ):
         flow.start(tag="MY_TAG3")
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow, step])
+def test_profile(MockStepTuple):
+    import json
+    from librelane.flows import SequentialFlow
+
+    StepA, StepB, _ = MockStepTuple
+
+    class DummySeq(SequentialFlow):
+        Steps = [StepB, StepA]
+
+    flow = DummySeq(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "DUMMY_VARIABLE": "PINGAS",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+    flow.start(tag="PROFILED")
+
+    with open("/cwd/runs/PROFILED/profile.json", encoding="utf8") as f:
+        trace = json.load(f)
+    step_events = [e for e in trace["traceEvents"] if e.get("cat") == "step"]
+    assert [e["name"] for e in step_events] == [
+        "Test.StepB",
+        "Test.StepA",
+    ], "Chrome trace did not include all steps in order"
+    for event in step_events:
+        assert event["args"]["status"] == "success", "Step status not recorded"
+        assert event["dur"] >= 0, "Invalid step duration"
+    assert os.path.exists(
+        "/cwd/runs/PROFILED/profile.rpt"
+    ), "Profile summary report was not written"
+
+    for directory, profile in [
+        ("99-partial", {"id": "Partial"}),
+        ("nested/01-step", {"traceEvents": []}),
+    ]:
+        os.makedirs(f"/cwd/runs/PROFILED/{directory}")
+        with open(f"/cwd/runs/PROFILED/{directory}/profile.json", "w") as f:
+            json.dump(profile, f)
+    flow._write_profile()
+    with open("/cwd/runs/PROFILED/profile.json", encoding="utf8") as f:
+        trace = json.load(f)
+    assert [e["name"] for e in trace["traceEvents"] if e.get("cat") == "step"] == [
+        "Test.StepB",
+        "Test.StepA",
+    ], "Partial or unrelated profiles were not skipped"
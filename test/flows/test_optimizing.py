@@ -0,0 +1,199 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from librelane.flows import (
+    flow as flow_module,
+    sequential as sequential_flow_module,
+    optimizing,
+)
+from librelane.steps import step as step_module
+
+pytestmark = pytest.mark.all
+
+mock_variables = pytest.mock_variables
+
+SYNTHESIS_METRICS = {
+    "AREA 0": (100, "0.1"),
+    "AREA 2": (90, "0"),
+    "DELAY 1": (120, "0.5"),
+}
+
+
+@pytest.fixture
+def stub_optimizing(monkeypatch):
+    from librelane.config import Variable
+    from librelane.common import tpe
+    from librelane.steps import Step, StepError, StepCancelled
+
+    class Pass(Step):
+        inputs = []
+        outputs = []
+
+        def run(self, state_in, **kwargs):
+            return {}, {}
+
+    class Synthesis(Pass):
+        id = "Test.Synthesis"
+        config_vars = [
+            Variable("SYNTH_STRATEGY", str, "strategy", default="AREA 0"),
+            Variable("SYNTH_ELABORATE_ONLY", bool, "elaborate", default=False),
+            Variable("YOSYS_ELABORATION_CHECKPOINT", bool, "checkpoint", default=False),
+        ]
+
+        def run(self, state_in, **kwargs):
+            if self.config["SYNTH_ELABORATE_ONLY"]:
+                return {}, {}
+            area, ws = SYNTHESIS_METRICS[self.config["SYNTH_STRATEGY"]]
+            return {}, {
+                "design__instance__area": Decimal(area),
+                "timing__setup__ws": Decimal(ws),
+            }
+
+    class CheckSDCFiles(Pass):
+        id = "Test.CheckSDCFiles"
+
+    class STAPrePNR(Pass):
+        id = "Test.STAPrePNR"
+
+    class Floorplan(Pass):
+        id = "Test.Floorplan"
+        config_vars = [Variable("FP_CORE_UTIL", Decimal, "util", default=50)]
+
+        def run(self, state_in, **kwargs):
+            if self.config["FP_CORE_UTIL"] > 80:
+                raise StepError("Utilization too high")
+            return {}, {}
+
+    class IOPlacement(Pass):
+        id = "Test.IOPlacement"
+
+    class GlobalPlacement(Pass):
+        id = "Test.GlobalPlacement"
+        config_vars = Floorplan.config_vars
+        failure = None
+
+        def run(self, state_in, **kwargs):
+            util = self.config["FP_CORE_UTIL"]
+            if util == 80:
+                if self.failure is not None:
+                    raise self.failure
+                return {}, {"design__instance__utilization": util}
+            # Lower utilizations only conclude once cancelled
+            deadline = time.time() + 30
+            while not self.cancelled and time.time() < deadline:
+                time.sleep(0.05)
+            raise StepCancelled(f"{self.name}: Cancelled")
+
+    monkeypatch.setattr(optimizing, "Yosys", SimpleNamespace(Synthesis=Synthesis))
+    monkeypatch.setattr(
+        optimizing,
+        "OpenROAD",
+        SimpleNamespace(
+            CheckSDCFiles=CheckSDCFiles,
+            STAPrePNR=STAPrePNR,
+            Floorplan=Floorplan,
+            IOPlacement=IOPlacement,
+            GlobalPlacement=GlobalPlacement,
+        ),
+    )
+
+    # Branches wait on one another, so all of them must be able to start
+    tpe_bk = tpe.get_tpe()
+    tpe.set_tpe(ThreadPoolExecutor(max_workers=32))
+
+    class Dummy(optimizing.Optimizing):
+        Steps = [
+            Synthesis,
+            CheckSDCFiles,
+            STAPrePNR,
+            Floorplan,
+            IOPlacement,
+            GlobalPlacement,
+        ]
+        gating_config_vars = {}
+
+    yield Dummy
+
+    tpe.get_tpe().shutdown()
+    tpe.set_tpe(tpe_bk)
+
+
+def create_flow(Flow):
+    return Flow(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+            "FP_CORE_UTIL_SWEEP": [90, 80, 70, 60],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_optimizing_sweep(stub_optimizing):
+    from librelane.logging import get_log_level
+
+    log_level = get_log_level()
+    flow = create_flow(stub_optimizing)
+    state = flow.start(tag="sweep")
+    assert get_log_level() == log_level, "log level was not restored"
+
+    assert state.metrics["design__instance__area"] == Decimal(
+        90
+    ), "the best synthesis strategy in the first objective was not used"
+    assert state.metrics["design__instance__utilization"] == Decimal(
+        80
+    ), "the highest successful utilization was not used"
+    assert [step.id for step in flow.step_objects][-3:] == [
+        "fp-80",
+        "io-80",
+        "gpl-80",
+    ], "steps of the selected utilization were not reported"
+
+    with open(os.path.join(flow.run_dir, "summary.rpt"), encoding="utf8") as f:
+        summary = {
+            cells[0]: cells[1]
+            for line in f
+            if len(cells := [cell.strip() for cell in line.split("│")[1:-1]]) > 1
+        }
+    assert summary == {
+        "90": "Failed",
+        "80": "Passed",
+        "70": "Cancelled",
+        "60": "Cancelled",
+    }, "lower utilizations were not cancelled once a higher one succeeded"
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_optimizing_sweep_failure(stub_optimizing):
+    from librelane.logging import get_log_level
+
+    log_level = get_log_level()
+    stub_optimizing.Steps[-1].failure = RuntimeError("unexpected")
+    flow = create_flow(stub_optimizing)
+    with pytest.raises(RuntimeError, match="unexpected"):
+        flow.start(tag="sweep")
+    assert get_log_level() == log_level, "log level was not restored"
@@ -0,0 +1,86 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+from decimal import Decimal
+from concurrent.futures import Future
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+
+class MockStep(object):
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def add_branch(pruner, name: str):
+    steps = [(MockStep(), Future()), (MockStep(), Future())]
+    pruner.add_branch(name, steps)
+    return steps
+
+
+def finish(steps, i: int, **metrics):
+    from librelane.state import State
+
+    steps[i][1].set_result(State(metrics=metrics))
+
+
+def test_pruning(tmp_path):
+    from librelane.flows.pruning import Pruner
+    from librelane.steps import StepCancelled
+
+    pruner = Pruner(
+        {"$area": "min", "$ws": "max"},
+        ["1000 - $area"],
+    )
+    fast = add_branch(pruner, "fast")
+    small = add_branch(pruner, "small")
+    big = add_branch(pruner, "big")
+    slow = add_branch(pruner, "slow")
+
+    finish(big, 0, area=Decimal(2000))
+    assert big[1][0].cancelled, "Infeasible branch was not cancelled"
+    big[1][1].set_exception(StepCancelled("cancelled"))
+
+    finish(fast, 0, area=Decimal(900))
+    finish(fast, 1, area=Decimal(900), ws=Decimal(2))
+    finish(slow, 0, area=Decimal(950))
+    assert not slow[1][0].cancelled, "Branch cancelled before its metrics were known"
+    finish(slow, 1, area=Decimal(950), ws=Decimal(1))
+    finish(small, 0, area=Decimal(500))
+    finish(small, 1, area=Decimal(500), ws=Decimal(1))
+
+    pruner.wait()
+    statuses = {branch.name: branch.status for branch in pruner.branches}
+    assert statuses == {
+        "fast": "complete",
+        "small": "complete",
+        "big": "infeasible",
+        "slow": "dominated",
+    }, "Branches were misclassified"
+    assert [branch.name for branch in pruner.get_pareto_front()] == [
+        "fast",
+        "small",
+    ], "Pareto front mismatch"
+    best = pruner.get_best()
+    assert best is not None and best.name == "small", "Wrong best branch"
+
+    report_path = tmp_path / "pareto.json"
+    pruner.write_report(str(report_path))
+    report = json.loads(report_path.read_text())
+    assert report["pareto_front"] == ["fast", "small"], "Pareto front not reported"
@@ -0,0 +1,211 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sys
+import json
+import textwrap
+import subprocess
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+
+def test_manifest_matches_registry():
+    from librelane import manifest
+    from librelane.flows import Flow
+    from librelane.steps import Step
+
+    builtin_steps = {}
+    for id in Step.factory.list():
+        Target = Step.factory.get(id)
+        assert Target is not None
+        if Target.__module__.startswith("librelane."):
+            builtin_steps[id] = Target.__module__
+    assert (
+        builtin_steps == manifest.steps
+    ), "manifest is outdated, run .github/scripts/update_manifest.py"
+
+    builtin_flows = {}
+    for name in Flow.factory.list():
+        Target = Flow.factory.get(name)
+        assert Target is not None
+        if Target.__module__.startswith("librelane."):
+            builtin_flows[name] = Target.__module__
+    assert (
+        builtin_flows == manifest.flows
+    ), "manifest is outdated, run .github/scripts/update_manifest.py"
+
+
+def test_lazy_imports():
+    script = textwrap.dedent(
+        """
+        import sys
+        import json
+
+        import librelane
+        import librelane.flows
+        import librelane.steps
+        from librelane.flows import Flow
+        from librelane.steps import Step
+        from librelane.state import DesignFormat
+
+        def loaded():
+            return sorted(
+                name
+                for name in sys.modules
+                if name.startswith(("librelane.steps.", "librelane.flows."))
+            )
+
+        result = {"initial": loaded()}
+        Step.factory.get("Verilator.Lint")
+        result["step"] = loaded()
+        DesignFormat.factory.get("mag")
+        result["design_format"] = loaded()
+        Flow.factory.get("OpenInKLayout")
+        result["flow"] = loaded()
+        print(json.dumps(result))
+        """
+    )
+    result = json.loads(
+        subprocess.check_output([sys.executable, "-c", script], encoding="utf8")
+    )
+    assert (
+        "librelane.steps.openroad" not in result["initial"]
+    ), "step modules were imported eagerly"
+    assert (
+        "librelane.flows.builtins" not in result["initial"]
+    ), "flow modules were imported eagerly"
+    assert (
+        "librelane.steps.verilator" in result["step"]
+    ), "step module was not imported on lookup"
+    assert (
+        "librelane.steps.klayout" not in result["step"]
+    ), "unrelated step module was imported on lookup"
+    assert (
+        "librelane.steps.magic" in result["design_format"]
+    ), "design format module was not imported on lookup"
+    assert (
+        "librelane.flows.misc" in result["flow"]
+    ), "flow module was not imported on lookup"
+    assert (
+        "librelane.flows.classic" not in result["flow"]
+    ), "unrelated flow module was imported on lookup"
+
+
+def test_plugin_discovery(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    from librelane import plugins
+    from librelane.flows import Flow
+    from librelane.steps import Step
+
+    plugin_module = "librelane_test_entry_point_plugin"
+    (tmp_path / f"{plugin_module}.py").write_text(
+        textwrap.dedent(
+            """
+            from librelane.steps import Step
+            from librelane.flows import Flow, SequentialFlow
+
+            __version__ = "0.0.1"
+
+            @Step.factory.register()
+            class PluginStep(Step):
+                id = "TestPlugin.Step"
+                inputs = []
+                outputs = []
+
+                def run(self, state_in, **kwargs):
+                    return {}, {}
+
+            @Flow.factory.register()
+            class PluginFlow(SequentialFlow):
+                Steps = [PluginStep]
+            """
+        ),
+        encoding="utf8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(plugins, "_discovered_plugins", None)
+    monkeypatch.setattr(plugins, "_get_entry_point_modules", lambda: [plugin_module])
+    monkeypatch.setattr(plugins, "_get_legacy_modules", lambda: [])
+
+    assert plugin_module not in sys.modules, "plugin imported before lookup"
+    PluginStep = Step.factory.get("TestPlugin.Step")
+    assert PluginStep is not None, "step in plugin not found"
+    assert Flow.factory.get("PluginFlow") is not None, "flow in plugin not found"
+    assert list(plugins.load_plugins()) == [
+        plugin_module
+    ], "plugin not in discovered plugins"
+
+
+def test_plugin_override(tmp_path):
+    plugin_module = "librelane_plugin_override_test"
+    (tmp_path / f"{plugin_module}.py").write_text(
+        textwrap.dedent(
+            """
+            from librelane.steps import Step
+            from librelane.flows import Flow, SequentialFlow
+
+            @Step.factory.register()
+            class LintOverride(Step):
+                id = "Verilator.Lint"
+                inputs = []
+                outputs = []
+
+                def run(self, state_in, **kwargs):
+                    return {}, {}
+
+            @Flow.factory.register("Classic")
+            class ClassicOverride(SequentialFlow):
+                Steps = [LintOverride]
+            """
+        ),
+        encoding="utf8",
+    )
+    script = textwrap.dedent(
+        """
+        import json
+        import importlib
+
+        from librelane.flows import Flow
+        from librelane.steps import Step
+
+        result = {
+            "step": Step.factory.get("Verilator.Lint").__module__,
+            "flow": Flow.factory.get("Classic").__module__,
+            "other": Step.factory.get("OpenROAD.DetailedRouting").__module__,
+        }
+        # Built-in modules imported after the plugin keep its overrides
+        importlib.import_module("librelane.steps.verilator")
+        importlib.import_module("librelane.flows.classic")
+        result["step_after_import"] = Step.factory.get("Verilator.Lint").__module__
+        result["flow_after_import"] = Flow.factory.get("Classic").__module__
+        print(json.dumps(result))
+        """
+    )
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(tmp_path), *filter(None, [env.get("PYTHONPATH")])]
+    )
+    result = json.loads(
+        subprocess.check_output(
+            [sys.executable, "-c", script], encoding="utf8", env=env
+        )
+    )
+    assert result == {
+        "step": plugin_module,
+        "flow": plugin_module,
+        "other": "librelane.steps.openroad",
+        "step_after_import": plugin_module,
+        "flow_after_import": plugin_module,
+    }, "plugin did not override built-in step and flow"
@@ -423,3 +423,94 @@ def test_gating_validation(MetricIncrementer):
 
         class _Test2(Dummy):
             gating_config_vars = {"Test.MetricIncrementer": ["BAD_GATING_VARIABLE"]}
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_auto_resume(MetricIncrementer):
+    import os
+
+    from librelane.common import Path
+    from librelane.flows import SequentialFlow, FlowError
+    from librelane.state import DesignFormat
+    from librelane.steps import StepError
+
+    runs = []
+
+    class NetlistWriter(MetricIncrementer):
+        id = "Test.NetlistWriter"
+        outputs = [DesignFormat.NETLIST]
+
+        def run(self, state_in, **kwargs):
+            runs.append(self.id)
+            path = os.path.join(self.step_dir, "out.nl.v")
+            with open(path, "w") as f:
+                f.write("module a; endmodule\n")
+            _, metrics = super().run(state_in, **kwargs)
+            return {DesignFormat.NETLIST: Path(path)}, metrics
+
+    class Counter(MetricIncrementer):
+        id = "Test.Counter"
+
+        def run(self, state_in, **kwargs):
+            runs.append(self.id)
+            return super().run(state_in, **kwargs)
+
+    class Flaky(MetricIncrementer):
+        id = "Test.Flaky"
+        fail = True
+
+        def run(self, state_in, **kwargs):
+            runs.append(self.id)
+            if Flaky.fail:
+                raise StepError("interrupted")
+            return super().run(state_in, **kwargs)
+
+    class Dummy(SequentialFlow):
+        Steps = [NetlistWriter, Counter, Flaky]
+
+    def start(**kwargs):
+        flow = Dummy(
+            {
+                "DESIGN_NAME": "WHATEVER",
+                "VERILOG_FILES": ["/cwd/src/a.v"],
+            },
+            design_dir="/cwd",
+            pdk="dummy",
+            scl="dummy_scl",
+            pdk_root="/pdk",
+        )
+        return flow.start(tag="resumed", **kwargs)
+
+    with pytest.raises(FlowError, match="interrupted"):
+        start()
+    run_dir = "/cwd/runs/resumed"
+    assert os.path.isdir(
+        os.path.join(run_dir, "3-test-flaky")
+    ), "failed step directory was not created"
+
+    Flaky.fail = False
+    runs.clear()
+    state = start(auto_resume=True)
+    assert runs == [
+        "Test.Flaky"
+    ], "auto-resume did not continue from the first step that did not conclude"
+    assert state.metrics["counter"] == 3, "auto-resume yielded an incorrect state"
+    assert not os.path.exists(
+        os.path.join(run_dir, "3-test-flaky")
+    ), "directory of interrupted step was not discarded"
+    assert os.path.isfile(
+        os.path.join(run_dir, "4-test-flaky", "state_out.json")
+    ), "interrupted step was not run again in a new directory"
+
+    netlist = os.path.join(run_dir, "1-test-netlistwriter", "out.nl.v")
+    with open(netlist, "w") as f:
+        f.write("module b; endmodule\n")
+    runs.clear()
+    state = start(auto_resume=True)
+    assert runs == [
+        "Test.NetlistWriter",
+        "Test.Counter",
+        "Test.Flaky",
+    ], "modified outputs did not cause steps to run again"
+    assert state.metrics["counter"] == 3, "auto-resume yielded an incorrect state"
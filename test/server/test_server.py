@@ -0,0 +1,76 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sys
+import time
+import signal
+import subprocess
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+
+@pytest.fixture
+def server_socket(tmp_path):
+    socket_path = str(tmp_path / "librelane.sock")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "librelane.server", "serve", "--socket", socket_path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while not os.path.exists(socket_path):
+            assert server.poll() is None, "server exited prematurely"
+            assert time.monotonic() < deadline, "server did not start in time"
+            time.sleep(0.1)
+        yield socket_path
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+    assert not os.path.exists(socket_path), "socket was not removed on exit"
+
+
+def submit(socket_path, *args):
+    return subprocess.run(
+        [sys.executable, "-m", "librelane.server", "submit", "--socket", socket_path]
+        + list(args),
+        capture_output=True,
+        encoding="utf8",
+    )
+
+
+def test_submit(server_socket):
+    result = submit(server_socket, "--version")
+    assert result.returncode == 0, "successful job returned a nonzero exit code"
+    assert "LibreLane v" in result.stdout, "job output was not streamed"
+
+    result = submit(server_socket, "--flow", "NoSuchFlow", "config.json")
+    assert result.returncode == 2, "usage error was not propagated"
+    assert "NoSuchFlow" in result.stdout, "error message was not streamed"
+
+    result = submit(server_socket, "--step", "--", "--help")
+    assert result.returncode == 0, "step job returned a nonzero exit code"
+    assert "librelane.steps" in result.stdout, "step job ran the wrong interface"
+
+
+def test_submit_unavailable(tmp_path):
+    result = submit(str(tmp_path / "nonexistent.sock"), "--version")
+    assert result.returncode == 1, "missing server did not fail"
+    assert "No LibreLane server" in result.stderr, "missing server not reported"
+
+    result = submit(str(tmp_path / "nonexistent.sock"), "--fallback", "--version")
+    assert result.returncode == 0, "fallback did not run the job locally"
+    assert "LibreLane v" in result.stdout, "fallback did not run the job locally"
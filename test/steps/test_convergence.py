@@ -0,0 +1,100 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sys
+import time
+import textwrap
+from decimal import Decimal
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+script = textwrap.dedent(
+    """
+    import sys
+    import time
+
+    for i, violations in enumerate([1000, 400, 300, 298, 297, 296, 296, 296]):
+        print(f"[INFO DRT-0195] Start {i}th optimization iteration.", flush=True)
+        print(f"[INFO DRT-0199]   Number of violations = {violations}.", flush=True)
+    time.sleep(float(sys.argv[1]))
+    """
+)
+
+
+def run_step(sleep: float, **config):
+    from librelane.config import Config
+    from librelane.steps import Step, DefaultOutputProcessor
+    from librelane.steps.convergence import DetailedRoutingConvergence
+    from librelane.state import State
+
+    class StepTest(Step):
+        inputs = []
+        outputs = []
+        id = "Test.ConvergenceStep"
+
+        output_processors = [DetailedRoutingConvergence, DefaultOutputProcessor]
+
+        def run(self, state_in, **kwargs):
+            result = self.run_subprocess(
+                [sys.executable, "-c", script, str(sleep)],
+                silent=True,
+            )
+            return {}, result["convergence_metrics"]
+
+    step_object = StepTest(
+        config=Config(
+            {
+                "DESIGN_NAME": "whatever",
+                "DRT_ABORT_STALL_IMPROVEMENT": Decimal(1),
+                **config,
+            }
+        ),
+        state_in=State(),
+        _no_filter_conf=True,
+    )
+    return step_object.start(step_dir=os.getcwd())
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_convergence_abort():
+    from librelane.steps.convergence import ConvergenceAborted
+
+    start = time.time()
+    with pytest.raises(
+        ConvergenceAborted, match="298 at iteration 3 to 296 at iteration 7"
+    ):
+        run_step(60, DRT_ABORT_STALL_ITERS=4)
+    assert time.time() - start < 30, "Subprocess was not terminated on abort"
+
+    with open("route__drc_errors.convergence.csv") as f:
+        rows = f.read().splitlines()
+    assert len(rows) == 9, "Samples before the abort were not recorded"
+
+    with pytest.raises(ConvergenceAborted, match="worse than the limit"):
+        run_step(60, DRT_ABORT_LIMIT=(2, Decimal(100)))
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_convergence_metrics():
+    state_out = run_step(0)
+    assert {
+        name: value
+        for name, value in state_out.metrics.items()
+        if name.startswith("route__")
+    } == {
+        f"route__drc_errors__pass:0__iter:{i}": Decimal(violations)
+        for i, violations in enumerate([1000, 400, 300, 298, 297, 296, 296, 296])
+    }, "Iteration metrics were not recorded"
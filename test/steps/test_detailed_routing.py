@@ -0,0 +1,179 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+
+@pytest.fixture
+def detailed_routing(tmp_path):
+    from librelane.config import Config
+    from librelane.state import State
+    from librelane.steps.openroad import DetailedRouting
+
+    step = DetailedRouting(
+        config=Config({"DESIGN_NAME": "spm", "DRT_OPT_ITERS": 64}),
+        state_in=State(),
+        _no_filter_conf=True,
+    )
+    step.step_dir = str(tmp_path)
+    return step
+
+
+def write_snapshots(directory, iterations):
+    os.makedirs(directory, exist_ok=True)
+    for iteration in iterations:
+        with open(os.path.join(directory, f"drt_iter{iteration}.odb"), "w") as f:
+            f.write(str(iteration))
+
+
+def test_checkpoint(detailed_routing, tmp_path):
+    checkpoint_dir = str(tmp_path / "checkpoints")
+    os.makedirs(tmp_path / "drt-run-0")
+    write_snapshots(checkpoint_dir, [0, 1])
+    detailed_routing._DetailedRouting__checkpoint(checkpoint_dir, checkpoint_dir)
+
+    with open(os.path.join(checkpoint_dir, "checkpoint.json")) as f:
+        assert json.load(f) == {
+            "run": 0,
+            "iteration": 0,
+        }, "incomplete snapshot was checkpointed"
+    with open(os.path.join(checkpoint_dir, "checkpoint.odb")) as f:
+        assert f.read() == "0", "wrong snapshot was checkpointed"
+    assert sorted(os.listdir(checkpoint_dir)) == [
+        "checkpoint.json",
+        "checkpoint.odb",
+        "drt_iter1.odb",
+    ], "checkpointed snapshot was not moved"
+
+    assert detailed_routing._DetailedRouting__find_resume_point(checkpoint_dir) == (
+        os.path.join(checkpoint_dir, "checkpoint.odb"),
+        0,
+        0,
+    ), "checkpoint was not read back"
+
+
+def test_checkpoint_resumed(detailed_routing, tmp_path):
+    checkpoint_dir = str(tmp_path / "checkpoints")
+    os.makedirs(tmp_path / "drt-run-0")
+    # Resumed after iteration 9, i.e., with ten iterations complete
+    write_snapshots(checkpoint_dir, [4, 5])
+    detailed_routing._DetailedRouting__checkpoint(
+        checkpoint_dir, checkpoint_dir, (0, 10)
+    )
+    with open(os.path.join(checkpoint_dir, "checkpoint.json")) as f:
+        assert json.load(f) == {
+            "run": 0,
+            "iteration": 14,
+        }, "iteration was not counted from the start of the run"
+
+    # Later runs, e.g. after antenna repair, start from scratch
+    os.makedirs(tmp_path / "drt-run-1")
+    detailed_routing._DetailedRouting__remove_snapshots(checkpoint_dir)
+    write_snapshots(checkpoint_dir, [0, 1])
+    detailed_routing._DetailedRouting__checkpoint(
+        checkpoint_dir, checkpoint_dir, (0, 10)
+    )
+    with open(os.path.join(checkpoint_dir, "checkpoint.json")) as f:
+        assert json.load(f) == {
+            "run": 1,
+            "iteration": 0,
+        }, "iteration of a later run was offset"
+
+
+def test_resume_point(detailed_routing, tmp_path):
+    checkpoint_dir = str(tmp_path / "checkpoints")
+    find_resume_point = detailed_routing._DetailedRouting__find_resume_point
+    assert find_resume_point(checkpoint_dir) is None, "resumed without a run"
+
+    os.makedirs(checkpoint_dir)
+    with open(os.path.join(checkpoint_dir, "checkpoint.odb"), "w") as f:
+        f.write("")
+    with open(os.path.join(checkpoint_dir, "checkpoint.json"), "w") as f:
+        json.dump({"run": 0, "iteration": 20}, f)
+    assert find_resume_point(checkpoint_dir) == (
+        os.path.join(checkpoint_dir, "checkpoint.odb"),
+        0,
+        20,
+    ), "mid-run checkpoint was not used"
+
+    completed_odb = str(tmp_path / "drt-run-0" / "spm.odb")
+    os.makedirs(tmp_path / "drt-run-0")
+    with open(completed_odb, "w") as f:
+        f.write("")
+    assert find_resume_point(checkpoint_dir) == (
+        completed_odb,
+        0,
+        None,
+    ), "checkpoint was preferred over the completed run it belongs to"
+
+    with open(os.path.join(checkpoint_dir, "checkpoint.json"), "w") as f:
+        json.dump({"run": 1, "iteration": 3}, f)
+    assert find_resume_point(checkpoint_dir) == (
+        os.path.join(checkpoint_dir, "checkpoint.odb"),
+        1,
+        3,
+    ), "checkpoint of a later run was not used"
+
+
+def test_remaining_iterations():
+    from librelane.steps.openroad import DetailedRouting
+
+    total = 64
+    first = 9
+    remaining = DetailedRouting.get_remaining_iterations(total, first)
+    assert remaining == 54, "wrong remaining iterations"
+
+    # Interrupted again after five iterations of the resumed run
+    second = first + 1 + 5
+    assert (first + 1) + 6 + DetailedRouting.get_remaining_iterations(
+        total, second
+    ) == total, "total iterations across resumptions exceed the budget"
+
+    assert (
+        DetailedRouting.get_remaining_iterations(total, 70) == 1
+    ), "at least one iteration must run"
+
+
+def test_remove_snapshots(detailed_routing, tmp_path):
+    checkpoint_dir = str(tmp_path / "checkpoints")
+    write_snapshots(checkpoint_dir, [4, 5])
+    write_snapshots(str(tmp_path), [7])
+    with open(os.path.join(checkpoint_dir, "checkpoint.odb"), "w") as f:
+        f.write("3")
+    detailed_routing._DetailedRouting__remove_snapshots(checkpoint_dir)
+    assert os.listdir(checkpoint_dir) == [
+        "checkpoint.odb"
+    ], "stale snapshots were not removed or the checkpoint was removed"
+    assert not os.path.exists(
+        tmp_path / "drt_iter7.odb"
+    ), "stale saved snapshots were not removed"
+
+    # A resumed run numbers its snapshots from zero again: with the stale
+    # snapshots removed, only its own completed snapshot is checkpointed
+    os.makedirs(tmp_path / "drt-run-0")
+    write_snapshots(checkpoint_dir, [0, 1])
+    detailed_routing._DetailedRouting__checkpoint(
+        checkpoint_dir, checkpoint_dir, (0, 4)
+    )
+    with open(os.path.join(checkpoint_dir, "checkpoint.json")) as f:
+        assert json.load(f) == {
+            "run": 0,
+            "iteration": 4,
+        }, "wrong snapshot was checkpointed after resuming"
+    with open(os.path.join(checkpoint_dir, "checkpoint.odb")) as f:
+        assert f.read() == "0", "wrong snapshot was checkpointed after resuming"
@@ -0,0 +1,81 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import textwrap
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+netlist = textwrap.dedent(
+    r"""
+    module \$paramod\adder\WIDTH=8 (a, b, y);
+      input [7:0] a;
+      input [7:0] b;
+      output [7:0] y;
+      sky130_fd_sc_hd__xor2_1 _0_ (.A(a[0]), .B(b[0]), .X(y[0]));
+    endmodule
+
+    module counter(clk, q);
+      input clk;
+      output [7:0] q;
+      \$paramod\adder\WIDTH=8  u_add (.a(q), .b(8'h01), .y(q));
+    endmodule
+
+    module top(clk, q);
+      input clk;
+      output [7:0] q;
+      counter u_counter (.clk(clk), .q(q));
+    endmodule
+    """
+)
+
+
+def get_partitions(tmp_path, mode: str):
+    from librelane.config import Config
+    from librelane.state import State
+    from librelane.steps.yosys import EQY
+
+    netlist_path = tmp_path / "top.nl.v"
+    netlist_path.write_text(netlist, encoding="utf8")
+    step = EQY(
+        config=Config({"DESIGN_NAME": "top", "EQY_PARTITION_MODE": mode}),
+        state_in=State(),
+        _no_filter_conf=True,
+    )
+    return step.get_partitions(str(netlist_path))
+
+
+def test_eqy_partitions_output(tmp_path):
+    partitions = get_partitions(tmp_path, "output")
+    assert list(partitions) == ["top"], "design was partitioned"
+    assert partitions["top"] == (netlist, []), "wrong partition"
+
+
+def test_eqy_partitions_module(tmp_path):
+    partitions = get_partitions(tmp_path, "module")
+    assert sorted(partitions) == [
+        "counter",
+        "top",
+    ], "derived module was made a partition"
+
+    top_text, top_blackboxes = partitions["top"]
+    assert top_blackboxes == ["counter"], "partition not blackboxed in parent"
+    assert "module counter" not in top_text, "blackboxed partition included"
+    assert "input clk;" in top_text, "blackboxed partition ports not included"
+
+    counter_text, counter_blackboxes = partitions["counter"]
+    assert counter_blackboxes == [], "derived module blackboxed"
+    assert (
+        "module \\$paramod\\adder\\WIDTH=8" in counter_text
+    ), "derived module not flattened into parent"
@@ -0,0 +1,236 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from librelane.flows import flow as flow_module, sequential as sequential_flow_module
+from librelane.steps import step as step_module
+
+pytestmark = pytest.mark.all
+
+mock_variables = pytest.mock_variables
+
+
+@pytest.fixture
+def MetricIncrementer():
+    from librelane.steps import Step
+
+    @Step.factory.register()
+    class MetricIncrementer(Step):
+        id = "Test.MetricIncrementer"
+        inputs = []
+        outputs = []
+
+        def run(self, state_in, **kwargs):
+            return {}, {"counter": state_in.metrics.get("counter", 0) + 1}
+
+    return MetricIncrementer
+
+
+@pytest.fixture
+def FailingStep():
+    from librelane.steps import Step, DeferredStepError
+
+    @Step.factory.register()
+    class FailingStep(Step):
+        id = "Test.FailingStep"
+        inputs = []
+        outputs = []
+
+        def run(self, state_in, **kwargs):
+            raise DeferredStepError("failed on purpose")
+
+    return FailingStep
+
+
+@pytest.fixture
+def in_process_executor(monkeypatch: pytest.MonkeyPatch):
+    from librelane.steps import ProcessStepExecutor, set_step_executor
+
+    executor = ProcessStepExecutor(["Test.MetricIncrementer-*", "Test.FailingStep"])
+    submitted = []
+
+    # Run "workers" in threads, which still only communicate through the step
+    # directory, so the mocked configuration variables apply
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool_submit = pool.submit
+
+    def submit(fn, step_dir, *args):
+        submitted.append(step_dir)
+        return pool_submit(fn, step_dir, *args)
+
+    monkeypatch.setattr(pool, "submit", submit)
+    monkeypatch.setattr(executor, "_ProcessStepExecutor__get_pool", lambda: pool)
+
+    set_step_executor(executor)
+    try:
+        yield submitted
+    finally:
+        set_step_executor(None)
+        pool.shutdown()
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([flow_module, sequential_flow_module, step_module])
+def test_process_step_executor(MetricIncrementer, FailingStep, in_process_executor):
+    from librelane.flows import SequentialFlow, FlowError
+
+    class Dummy(SequentialFlow):
+        Steps = [MetricIncrementer, MetricIncrementer, MetricIncrementer]
+
+    flow = Dummy(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+
+    state = flow.start(tag="executor")
+    assert state.metrics["counter"] == 3, "steps did not run properly"
+    assert [
+        step_dir.rsplit("-", maxsplit=1)[-1] for step_dir in in_process_executor
+    ] == ["1", "2"], "steps were not submitted to the executor according to its filter"
+    assert all(
+        step.state_out is not None for step in flow.step_objects
+    ), "output state was not set on submitted steps"
+
+    class Failing(SequentialFlow):
+        Steps = [FailingStep, MetricIncrementer]
+
+    flow = Failing(
+        {
+            "DESIGN_NAME": "WHATEVER",
+            "VERILOG_FILES": ["/cwd/src/a.v"],
+        },
+        design_dir="/cwd",
+        pdk="dummy",
+        scl="dummy_scl",
+        pdk_root="/pdk",
+    )
+    with pytest.raises(FlowError, match="failed on purpose"):
+        flow.start(tag="failing")
+
+
+def test_process_step_executor_workers(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    import os
+    import sys
+    import textwrap
+    from librelane.common import Toolbox
+    from librelane.config import Config
+    from librelane.state import State
+    from librelane.steps import DeferredStepError, ProcessStepExecutor
+
+    # Workers are spawned, so the step must be importable in them: plugins
+    # are discovered there on lookup of an unknown step
+    plugin_module = "librelane_plugin_executor_test"
+    (tmp_path / f"{plugin_module}.py").write_text(
+        textwrap.dedent(
+            """
+            import os
+
+            from librelane.steps import Step, DeferredStepError
+
+            @Step.factory.register()
+            class WorkerStep(Step):
+                id = "TestExecutor.WorkerStep"
+                inputs = []
+                outputs = []
+
+                def run(self, state_in, **kwargs):
+                    if state_in.metrics.get("fail"):
+                        raise DeferredStepError("failed in a worker")
+                    counter = state_in.metrics.get("counter", 0)
+                    return {}, {"counter": counter + 1, "pid": os.getpid()}
+            """
+        ),
+        encoding="utf8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv(
+        "PYTHONPATH",
+        os.pathsep.join([str(tmp_path), os.getenv("PYTHONPATH", "")]),
+    )
+    WorkerStep = __import__(plugin_module).WorkerStep
+    monkeypatch.delitem(sys.modules, plugin_module)
+
+    # Workers validate the configuration without the mocked PDK variables
+    dummy = str(tmp_path / "dummy")
+    open(dummy, "w").close()
+    config = Config(
+        {
+            "DESIGN_NAME": "whatever",
+            "DESIGN_DIR": str(tmp_path),
+            "PDK_ROOT": str(tmp_path),
+            "PDK": "dummy",
+            "STD_CELL_LIBRARY": "dummy_scl",
+            "VDD_PIN": "VPWR",
+            "GND_PIN": "VGND",
+            "TECH_LEFS": {"nom_*": dummy},
+            "PRIMARY_GDSII_STREAMOUT_TOOL": "klayout",
+            "DEFAULT_CORNER": "nom_tt",
+            "STA_CORNERS": ["nom_tt"],
+            "RT_MIN_LAYER": "met1",
+            "RT_MAX_LAYER": "met5",
+            "SCL_GROUND_PINS": ["VGND"],
+            "SCL_POWER_PINS": ["VPWR"],
+            "FILL_CELLS": ["fill"],
+            "DECAP_CELLS": ["decap"],
+            "LIB": {"*_tt": [dummy]},
+            "CELL_LEFS": [dummy],
+            "CELL_GDS": [dummy],
+            "SYNTH_EXCLUDED_CELL_FILE": dummy,
+            "PNR_EXCLUDED_CELL_FILE": dummy,
+            "OUTPUT_CAP_LOAD": 1,
+            "MAX_FANOUT_CONSTRAINT": 10,
+            "CLOCK_UNCERTAINTY_CONSTRAINT": 0.25,
+            "CLOCK_TRANSITION_CONSTRAINT": 0.15,
+            "TIME_DERATING_CONSTRAINT": 5,
+            "IO_DELAY_CONSTRAINT": 20,
+            "SYNTH_DRIVING_CELL": "buf/A",
+            "SYNTH_TIEHI_CELL": "conb/HI",
+            "SYNTH_TIELO_CELL": "conb/LO",
+            "SYNTH_BUFFER_CELL": "buf/A/X",
+            "PLACE_SITE": "unit",
+            "CELL_PAD_EXCLUDE": [],
+        }
+    )
+    toolbox = Toolbox(str(tmp_path / "tmp"))
+    executor = ProcessStepExecutor(max_workers=1)
+    try:
+        step = WorkerStep(
+            config=config,
+            state_in=State(metrics={"counter": 1}),
+            _no_filter_conf=True,
+        )
+        state_out = executor.submit(step, toolbox, str(tmp_path / "1-step")).result()
+        assert state_out.metrics["counter"] == 2, "step did not run in the worker"
+        assert (
+            state_out.metrics["pid"] != os.getpid()
+        ), "step did not run in a separate process"
+        assert step.state_out == state_out, "output state was not set on the step"
+
+        failing = WorkerStep(
+            config=config,
+            state_in=State(metrics={"fail": True}),
+            _no_filter_conf=True,
+        )
+        with pytest.raises(DeferredStepError, match="failed in a worker"):
+            executor.submit(failing, toolbox, str(tmp_path / "2-step")).result()
+    finally:
+        executor.shutdown()
@@ -0,0 +1,162 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+
+def test_merge_drc_reports(tmp_path):
+    rdb = pytest.importorskip("klayout.rdb")
+    kdb = pytest.importorskip("klayout.db")
+    from librelane.common import get_script_dir
+
+    inputs = []
+    # Rules run by both groups report the same violations
+    for name, violations in [
+        ("feol", [("poly.width", 0), ("diff.space", 0)]),
+        (
+            "beol",
+            [("poly.width", 0), ("poly.width", 1), ("m1.space", 0), ("m1.space", 1)],
+        ),
+    ]:
+        database = rdb.ReportDatabase(name)
+        database.top_cell_name = "top"
+        cell = database.create_cell("top")
+        for category_name, x in violations:
+            category = database.category_by_path(category_name)
+            if category is None:
+                category = database.create_category(category_name)
+            item = database.create_item(cell.rdb_id(), category.rdb_id())
+            item.add_value(kdb.DBox(x, 0, x + 1, 1))
+        path = str(tmp_path / f"{name}.lyrdb")
+        database.save(path)
+        inputs.append(path)
+
+    script_dir = os.path.join(get_script_dir(), "klayout")
+    merged = str(tmp_path / "drc.lyrdb")
+    json_report = str(tmp_path / "drc.json")
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            os.path.join(script_dir, "merge_drc_reports.py"),
+            f"--output={merged}",
+            *inputs,
+        ],
+        encoding="utf8",
+    )
+    assert "(1 duplicates skipped)" in output, "duplicate violation was not skipped"
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            os.path.join(script_dir, "xml_drc_report_to_json.py"),
+            f"--xml-file={merged}",
+            f"--json-file={json_report}",
+            "--metric=klayout__drc_error__count",
+        ],
+        encoding="utf8",
+    )
+    assert (
+        "%OL_METRIC_I klayout__drc_error__count 5" in output
+    ), "wrong total error count"
+    with open(json_report, encoding="utf8") as f:
+        assert json.load(f) == {
+            "diff.space": 1,
+            "poly.width": 2,
+            "m1.space": 2,
+            "total": 5,
+        }, "categories were not merged or duplicates were counted"
+
+
+def test_incremental_drc(tmp_path):
+    rdb = pytest.importorskip("klayout.rdb")
+    kdb = pytest.importorskip("klayout.db")
+    from librelane.common import get_script_dir
+
+    layout = kdb.Layout()
+    layout.dbu = 0.001
+    top = layout.create_cell("top")
+    layer = layout.layer(1, 0)
+    top.shapes(layer).insert(kdb.DBox(0, 0, 100, 100))
+    top.shapes(layer).insert(kdb.DBox(10, 10, 12, 12))
+    gds = str(tmp_path / "top.gds")
+    layout.write(gds)
+
+    xor = rdb.ReportDatabase("XOR")
+    xor.top_cell_name = "top"
+    cell = xor.create_cell("top")
+    category = xor.create_category("1/0")
+    xor.create_item(cell.rdb_id(), category.rdb_id()).add_value(
+        kdb.DBox(10, 10, 12, 12)
+    )
+    xor_report = str(tmp_path / "xor.xml")
+    xor.save(xor_report)
+
+    script = os.path.join(get_script_dir(), "klayout", "incremental_drc.py")
+    windows_gds = str(tmp_path / "windows.gds")
+    windows_json = str(tmp_path / "windows.json")
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            script,
+            "windows",
+            f"--xor-report={xor_report}",
+            f"--input={gds}",
+            "--top=top",
+            "--halo=1",
+            "--max-area=10",
+            f"--output-gds={windows_gds}",
+            f"--output-json={windows_json}",
+        ],
+        encoding="utf8",
+    )
+    assert "%OL_METRIC_I klayout__drc_window__count 1" in output, "wrong windows"
+    with open(windows_json, encoding="utf8") as f:
+        assert json.load(f)["incremental"], "small change not checked incrementally"
+
+    windowed = kdb.Layout()
+    windowed.read(windows_gds)
+    assert windowed.top_cell().name == "top", "windowed layout has wrong top cell"
+    assert windowed.top_cell().dbbox() == kdb.DBox(
+        8, 8, 14, 14
+    ), "layout not clipped to window"
+
+    drc = rdb.ReportDatabase("DRC")
+    drc.top_cell_name = "top"
+    cell = drc.create_cell("top")
+    category = drc.create_category("m1.space")
+    for box in [kdb.DBox(12.5, 12.5, 13, 13), kdb.DBox(13.5, 8, 14, 14)]:
+        drc.create_item(cell.rdb_id(), category.rdb_id()).add_value(box)
+    drc_report = str(tmp_path / "drc.windows.lyrdb")
+    drc.save(drc_report)
+
+    filtered = str(tmp_path / "drc.lyrdb")
+    subprocess.check_call(
+        [
+            sys.executable,
+            script,
+            "filter",
+            f"--input={drc_report}",
+            f"--windows={windows_json}",
+            "--top=top",
+            f"--output={filtered}",
+        ]
+    )
+    result = rdb.ReportDatabase("DRC")
+    result.load(filtered)
+    assert result.num_items() == 1, "violations outside of halo not filtered"
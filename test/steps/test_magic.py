@@ -0,0 +1,64 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import textwrap
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+
+def test_merge_macro_spice():
+    from librelane.steps.magic import merge_macro_spice
+
+    top = textwrap.dedent(
+        """
+        * SPICE3 file created from top.ext - technology: sky130A
+
+        * Black-box entry subcircuit for spm abstract view
+        .subckt spm clk a
+        .ends
+
+        .subckt sky130_fd_sc_hd__inv_1 A Y VPWR VGND
+        X0 Y A VPWR VPWR sky130_fd_pr__pfet_01v8 w=1
+        .ends
+
+        .subckt top clk a y
+        Xspm clk a spm
+        Xinv a y VPWR VGND sky130_fd_sc_hd__inv_1
+        .ends
+        """
+    )
+    spm = textwrap.dedent(
+        """
+        * SPICE3 file created from spm.ext - technology: sky130A
+
+        .subckt sky130_fd_sc_hd__inv_1 A Y VPWR VGND
+        X0 Y A VPWR VPWR sky130_fd_pr__pfet_01v8 w=1
+        .ends
+
+        .subckt spm clk a
+        Xinv a b VPWR VGND sky130_fd_sc_hd__inv_1
+        .ends
+        """
+    )
+    merged = merge_macro_spice(top, {"spm": spm})
+    assert "Black-box entry" not in merged, "black-box entry comment not removed"
+    assert merged.count(".subckt spm ") == 1, "macro defined more than once"
+    assert (
+        ".subckt spm clk a\nXinv a b VPWR VGND" in merged
+    ), "macro subcircuit not merged"
+    assert (
+        merged.count(".subckt sky130_fd_sc_hd__inv_1 ") == 1
+    ), "shared subcircuit defined more than once"
+    assert ".subckt top clk a y" in merged, "top subcircuit lost"
@@ -0,0 +1,153 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+pytestmark = pytest.mark.all
+
+
+DESIGN_SPICE = """* Extracted design
+.subckt inv A Y VPWR VGND
+X0 Y A VGND VGND nfet w=1 l=0.15
+.ends
+.subckt unused A
+.ends
+.subckt abstract A Y VPWR VGND
+.ends
+.subckt spm a b
++ VPWR VGND
+Xinv a b VPWR VGND inv
+.ends
+.subckt top in out VPWR VGND
+Xspm in out VPWR VGND spm
+Xabstract in out VPWR VGND abstract
+.ends
+"""
+
+
+def test_extract_subcircuit():
+    from librelane.steps.netgen import extract_subcircuit
+
+    assert extract_subcircuit(DESIGN_SPICE, "spm") == (
+        ".subckt inv A Y VPWR VGND\n"
+        "X0 Y A VGND VGND nfet w=1 l=0.15\n"
+        ".ends\n"
+        ".subckt spm a b VPWR VGND\n"
+        "Xinv a b VPWR VGND inv\n"
+        ".ends\n"
+    ), "wrong subcircuit hierarchy extracted"
+    assert extract_subcircuit(DESIGN_SPICE, "SPM") == extract_subcircuit(
+        DESIGN_SPICE, "spm"
+    ), "subcircuit names are not case-insensitive"
+    assert extract_subcircuit(DESIGN_SPICE, "analog") is None, "missing subcircuit"
+    assert (
+        extract_subcircuit(DESIGN_SPICE, "abstract") is None
+    ), "black-box subcircuit extracted"
+
+
+def test_hierarchical_lvs_cache(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    from librelane.common import Path
+    from librelane.config import Config, Macro
+    from librelane.state import State
+    from librelane.steps.netgen import LVS
+
+    files = {}
+    for name in ["spm.pnl.v", "cells.spice", "setup.tcl", "spm.gds"]:
+        files[name] = tmp_path / name
+        files[name].write_text(name, encoding="utf8")
+    design_spice = tmp_path / "top.spice"
+    design_spice.write_text(DESIGN_SPICE, encoding="utf8")
+
+    def make_step():
+        step = LVS(
+            config=Config(
+                {
+                    "DESIGN_NAME": "top",
+                    "NETGEN_SETUP": Path(files["setup.tcl"]),
+                    "LVS_FLATTEN_CELLS": None,
+                    "LVS_IGNORE_CELLS": None,
+                    "LVS_CACHE_DIR": str(tmp_path / "cache"),
+                    "MACROS": {
+                        "spm": Macro(
+                            gds=[Path(files["spm.gds"])],
+                            lef=[Path(files["spm.gds"])],
+                            pnl=[Path(files["spm.pnl.v"])],
+                        ),
+                        "analog": Macro(
+                            gds=[Path(files["spm.gds"])],
+                            lef=[Path(files["spm.gds"])],
+                        ),
+                        "abstract": Macro(
+                            gds=[Path(files["spm.gds"])],
+                            lef=[Path(files["spm.gds"])],
+                            pnl=[Path(files["spm.pnl.v"])],
+                        ),
+                        "absent": Macro(
+                            gds=[Path(files["spm.gds"])],
+                            lef=[Path(files["spm.gds"])],
+                            pnl=[Path(files["spm.pnl.v"])],
+                        ),
+                    },
+                }
+            ),
+            state_in=State(),
+            _no_filter_conf=True,
+        )
+        step.step_dir = str(tmp_path / "step")
+        return step
+
+    compared = []
+
+    def verify_macro(self, module, macro_spice, macro_netlists, spice_files, env):
+        with open(macro_spice, encoding="utf8") as f:
+            compared.append((module, f.read()))
+        return {"design__lvs_error__count": 0}
+
+    monkeypatch.setattr(LVS, "verify_macro", verify_macro)
+
+    def verify_macros():
+        return make_step().verify_macros(
+            str(design_spice), [str(files["cells.spice"])], {}
+        )
+
+    verified, metrics = verify_macros()
+    assert [module for module, _ in compared] == [
+        "spm"
+    ], "macros without netlists or extracted devices were compared"
+    assert (
+        "Xinv a b VPWR VGND inv" in compared[0][1]
+    ), "macro was not compared using its subcircuit in the extracted netlist"
+    assert "Xspm" not in compared[0][1], "top level was compared with the macro"
+    assert verified == ["spm"], "passing macro was not verified"
+    assert metrics["design__lvs_macro_cached__count"] == 0, "wrong cached count"
+
+    verified, metrics = verify_macros()
+    assert len(compared) == 1, "cached result was not reused"
+    assert verified == ["spm"], "cached passing macro was not verified"
+    assert metrics["design__lvs_macro_cached__count"] == 1, "wrong cached count"
+
+    design_spice.write_text(
+        DESIGN_SPICE.replace("Xspm in out", "Xspm out in"), encoding="utf8"
+    )
+    verify_macros()
+    assert len(compared) == 1, "top-level change invalidated the macro result"
+
+    design_spice.write_text(
+        DESIGN_SPICE.replace("Xinv a b", "Xinv b a"), encoding="utf8"
+    )
+    verify_macros()
+    assert len(compared) == 2, "changed extracted macro was not compared again"
+
+    files["spm.pnl.v"].write_text("changed", encoding="utf8")
+    verify_macros()
+    assert len(compared) == 3, "changed macro netlist was not compared again"
@@ -0,0 +1,79 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+pytestmark = pytest.mark.all
+
+
+def test_net_statistics_metrics():
+    from librelane.common import aggregate_metrics, parse_metric_modifiers
+    from librelane.common.metrics import Metric
+    from librelane.scripts.odbpy.net_statistics_utils import get_metrics
+
+    dbunits = 1000
+    metrics = dict(
+        get_metrics(
+            fanouts=[0, 1, 2, 5],
+            hpwls=[0, 4000, 12000, 150000],
+            wire_lengths=[0, 5000, 15000, 160000],
+            routed=[0, 1, 1, 1],
+            dbunits=dbunits,
+        )
+    )
+    assert metrics["route__net__count"] == 4, "wrong net count"
+    assert metrics["route__net__routed__count"] == 3, "unrouted net was counted"
+    assert metrics["route__wirelength__p50"] == 15.0, "wrong median wire length"
+    assert metrics["route__wirelength__p99"] == 160.0, "wrong p99 wire length"
+    assert metrics["route__net__hpwl"] == 166.0, "wrong total HPWL"
+    assert metrics["route__net__hpwl__max"] == 150.0, "wrong maximum HPWL"
+    assert metrics["route__net__fanout__p50"] == 1, "wrong median fanout"
+    assert metrics["route__net__fanout__max"] == 5, "wrong maximum fanout"
+    assert {
+        name: value
+        for name, value in metrics.items()
+        if name.startswith("route__net__count__fanout:")
+    } == {
+        "route__net__count__fanout:0": 1,
+        "route__net__count__fanout:1": 1,
+        "route__net__count__fanout:2-3": 1,
+        "route__net__count__fanout:4-7": 1,
+    }, "wrong fanout histogram"
+    assert {
+        name: value
+        for name, value in metrics.items()
+        if name.startswith("route__net__count__wirelength_um:")
+    } == {
+        "route__net__count__wirelength_um:0-10": 1,
+        "route__net__count__wirelength_um:10-100": 1,
+        "route__net__count__wirelength_um:100-1000": 1,
+    }, "wrong wire length histogram"
+
+    for name in metrics:
+        base, _ = parse_metric_modifiers(name)
+        assert base in Metric.by_name, f"metric '{base}' is not registered"
+
+    assert (
+        aggregate_metrics(metrics) == metrics
+    ), "histograms were aggregated into the net count"
+
+
+def test_net_statistics_gate():
+    from librelane.flows.classic import Classic
+
+    assert Classic.gating_config_vars["Odb.ReportNetStatistics"] == [
+        "RUN_NET_STATISTICS"
+    ], "net statistics step is not gated"
+    assert "RUN_NET_STATISTICS" in [
+        variable.name for variable in Classic.config_vars
+    ], "gating variable is not declared"
@@ -0,0 +1,146 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import json
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+
+@pytest.fixture
+def json_header(tmp_path, monkeypatch):
+    from librelane.config import Config
+    from librelane.state import State
+    from librelane.steps.pyosys import JsonHeader
+
+    excluded_cell_file = tmp_path / "excluded_cells.txt"
+    excluded_cell_file.write_text("")
+    step = JsonHeader(
+        config=Config(
+            {
+                "DESIGN_NAME": "spm",
+                "YOSYS_LOG_LEVEL": "ALL",
+                "YOSYS_ELABORATION_CHECKPOINT": True,
+                "LIB": {"*": []},
+                "SYNTH_CORNER": None,
+                "DEFAULT_CORNER": "nom_tt_025C_1v80",
+                "MACROS": None,
+                "CELL_VERILOG_MODELS": None,
+                "PAD_VERILOG_MODELS": None,
+                "EXTRA_LIBS": None,
+                "EXTRA_VERILOG_MODELS": None,
+                "EXTRA_EXCLUDED_CELLS": None,
+                "SYNTH_EXCLUDED_CELL_FILE": str(excluded_cell_file),
+                "PNR_EXCLUDED_CELL_FILE": str(excluded_cell_file),
+            }
+        ),
+        state_in=State(),
+        _no_filter_conf=True,
+    )
+    step.step_dir = str(tmp_path)
+    monkeypatch.setattr(step, "get_elaboration_key", lambda blackbox_models: "key")
+    return step
+
+
+def write_checkpoint(path, first_line):
+    with open(path, "w") as f:
+        f.write(f"{first_line}\n")
+        f.write("autoidx 1\n")
+    return path
+
+
+def read_extra(step):
+    with open(os.path.join(step.step_dir, "extra.json")) as f:
+        return json.load(f)
+
+
+def test_get_checkpoint_key(tmp_path):
+    from librelane.steps.pyosys import get_checkpoint_key, checkpoint_key_prefix
+
+    keyed = write_checkpoint(tmp_path / "keyed.il", f"{checkpoint_key_prefix}abc")
+    assert get_checkpoint_key(str(keyed)) == "abc", "wrong key read"
+
+    unkeyed = write_checkpoint(tmp_path / "unkeyed.il", "# Generated by Yosys")
+    assert get_checkpoint_key(str(unkeyed)) is None, "key read without prefix"
+
+
+def test_checkpoint_in(json_header, tmp_path):
+    from librelane.state import State
+    from librelane.common import Path
+    from librelane.state import DesignFormat
+    from librelane.steps.pyosys import checkpoint_key_prefix
+
+    checkpoint = write_checkpoint(
+        tmp_path / "checkpoint.il", f"{checkpoint_key_prefix}key"
+    )
+    json_header.get_command(State({DesignFormat.RTLIL: Path(checkpoint)}))
+    extra = read_extra(json_header)
+    assert extra["checkpoint_in"] == str(checkpoint), "checkpoint not read"
+    assert "checkpoint_out" not in extra, "matching checkpoint rewritten"
+    assert "checkpoint_key" not in extra, "matching checkpoint rewritten"
+
+
+@pytest.mark.parametrize(
+    "first_line",
+    [None, "# Generated by Yosys", "{prefix}other"],
+    ids=["missing", "unkeyed", "mismatched"],
+)
+def test_checkpoint_out(json_header, tmp_path, first_line):
+    from librelane.state import State
+    from librelane.common import Path
+    from librelane.state import DesignFormat
+    from librelane.steps.pyosys import checkpoint_key_prefix
+
+    state_in = State()
+    if first_line is not None:
+        checkpoint = write_checkpoint(
+            tmp_path / "checkpoint.il",
+            first_line.format(prefix=checkpoint_key_prefix),
+        )
+        state_in = State({DesignFormat.RTLIL: Path(checkpoint)})
+
+    json_header.get_command(state_in)
+    extra = read_extra(json_header)
+    assert "checkpoint_in" not in extra, "stale or missing checkpoint read"
+    assert extra["checkpoint_out"] == os.path.join(
+        json_header.step_dir, "spm.il"
+    ), "wrong checkpoint output path"
+    assert extra["checkpoint_key"] == "key", "wrong checkpoint key"
+
+
+def test_checkpoint_disabled(json_header):
+    from librelane.state import State
+
+    json_header.config = json_header.config.copy(YOSYS_ELABORATION_CHECKPOINT=False)
+    json_header.get_command(State())
+    extra = read_extra(json_header)
+    for key in ["checkpoint_in", "checkpoint_out", "checkpoint_key"]:
+        assert key not in extra, f"{key} set with checkpoints disabled"
+
+
+def test_run_adds_checkpoint(json_header, monkeypatch):
+    from librelane.state import State
+    from librelane.state import DesignFormat
+    from librelane.steps.pyosys import PyosysStep
+
+    monkeypatch.setattr(PyosysStep, "run", lambda self, state_in, **kwargs: ({}, {}))
+
+    views_updates, _ = json_header.run(State())
+    assert DesignFormat.RTLIL not in views_updates, "missing checkpoint added"
+
+    checkpoint = json_header.get_checkpoint_path()
+    write_checkpoint(checkpoint, "# Generated by Yosys")
+    views_updates, _ = json_header.run(State())
+    assert views_updates[DesignFormat.RTLIL] == checkpoint, "checkpoint not added"
@@ -0,0 +1,181 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import textwrap
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+RTLIL = textwrap.dedent(
+    r"""
+    # Generated by Yosys
+    autoidx 12
+    attribute \blackbox 1
+    module \sky130_fd_sc_hd__buf_1
+      wire input 1 \A
+      wire output 2 \X
+    end
+    attribute \src "adder.v:1.1-5.10"
+    module \adder
+      wire width 8 input 1 \a
+      wire width 8 input 2 \b
+      attribute \src "adder.v:4.8-4.9"
+      wire width 8 output 3 \y
+      wire width 8 $add$1_Y
+      cell $add $add$1
+        connect \A \a
+        connect \B \b
+        connect \Y \y
+      end
+    end
+    attribute \top 1
+    module \top
+      wire width 8 input 1 \a
+      wire width 8 output 2 \y
+      cell \adder u_adder
+        connect \a \a
+        connect \b \a
+        connect \y \y
+      end
+    end
+    """
+).lstrip()
+
+
+def test_split_join_rtlil():
+    from librelane.scripts.pyosys.incremental import split_rtlil, join_rtlil
+
+    header, modules = split_rtlil(RTLIL)
+    assert header == ["# Generated by Yosys", "autoidx 12"], "wrong header"
+    assert list(modules) == [
+        "\\sky130_fd_sc_hd__buf_1",
+        "\\adder",
+        "\\top",
+    ], "wrong modules"
+    assert modules["\\sky130_fd_sc_hd__buf_1"].is_library, "blackbox not detected"
+    assert not modules["\\adder"].is_library, "module detected as blackbox"
+    assert modules["\\top"].get_cell_types() == ["\\adder"], "wrong cell types"
+    assert join_rtlil(header, modules.values()) == RTLIL, "round trip failed"
+
+
+def test_stub():
+    from librelane.scripts.pyosys.incremental import split_rtlil
+
+    _, modules = split_rtlil(RTLIL)
+    assert modules["\\adder"].get_stub().lines == [
+        'attribute \\src "adder.v:1.1-5.10"',
+        "attribute \\blackbox 1",
+        "module \\adder",
+        "  wire width 8 input 1 \\a",
+        "  wire width 8 input 2 \\b",
+        "  wire width 8 output 3 \\y",
+        "end",
+    ], "wrong stub"
+
+
+def test_module_hashes(tmp_path):
+    from librelane.scripts.pyosys.incremental import (
+        IncrementalSynthesis,
+        split_rtlil,
+    )
+
+    incremental = IncrementalSynthesis(str(tmp_path), "key", str(tmp_path))
+    _, modules = split_rtlil(RTLIL)
+    hashes = incremental.get_module_hashes(modules)
+    assert set(hashes) == {"\\adder", "\\top"}, "library cells were hashed"
+
+    _, body_changed = split_rtlil(RTLIL.replace("cell $add $add$1", "cell $sub $sub$1"))
+    changed_hashes = incremental.get_module_hashes(body_changed)
+    assert changed_hashes["\\adder"] != hashes["\\adder"], "module change missed"
+    assert (
+        changed_hashes["\\top"] == hashes["\\top"]
+    ), "parent affected by child implementation"
+
+    _, port_changed = split_rtlil(
+        RTLIL.replace("width 8 input 2 \\b", "width 4 input 2 \\b")
+    )
+    changed_hashes = incremental.get_module_hashes(port_changed)
+    assert (
+        changed_hashes["\\top"] != hashes["\\top"]
+    ), "parent unaffected by child interface"
+
+    other_key = IncrementalSynthesis(str(tmp_path), "other", str(tmp_path))
+    assert (
+        other_key.get_module_hashes(modules)["\\adder"] != hashes["\\adder"]
+    ), "synthesis key ignored"
+
+
+def make_auto_index_rtlil(adder_cells: int) -> str:
+    adder = "".join(
+        f"""
+          wire width 8 $add$adder.v:4${i}_Y
+          cell $add $add$adder.v:4${i}
+            connect \\A \\a
+            connect \\B \\b
+            connect \\Y $add$adder.v:4${i}_Y
+          end"""
+        for i in range(1, adder_cells + 1)
+    )
+    i = adder_cells + 1
+    return textwrap.dedent(
+        f"""
+        autoidx {i + 1}
+        module \\adder
+          wire width 8 input 1 \\a
+          wire width 8 input 2 \\b{adder}
+        end
+        module \\counter
+          wire width 8 input 1 \\q
+          wire width 8 $add$counter.v:3${i}_Y
+          cell $add $add$counter.v:3${i}
+            connect \\A \\q
+            connect \\B 8'00000001
+            connect \\Y $add$counter.v:3${i}_Y
+          end
+          cell $dff $procdff${i + 1}
+            connect \\D $add$counter.v:3${i}_Y [7:0]
+            connect \\Q \\q
+          end
+        end
+        """
+    ).lstrip()
+
+
+def test_module_hashes_auto_index(tmp_path):
+    from librelane.scripts.pyosys.incremental import (
+        IncrementalSynthesis,
+        split_rtlil,
+    )
+
+    incremental = IncrementalSynthesis(str(tmp_path), "key", str(tmp_path))
+    _, modules = split_rtlil(make_auto_index_rtlil(1))
+    _, edited = split_rtlil(make_auto_index_rtlil(2))
+    assert (
+        "$add$counter.v:3$3_Y" in edited["\\counter"].text
+    ), "editing the adder did not shift the indices of the counter"
+
+    hashes = incremental.get_module_hashes(modules)
+    edited_hashes = incremental.get_module_hashes(edited)
+    assert edited_hashes["\\adder"] != hashes["\\adder"], "module change missed"
+    assert (
+        edited_hashes["\\counter"] == hashes["\\counter"]
+    ), "unchanged module affected by auto-generated names of another"
+
+    assert (
+        edited["\\counter"].normalized_text
+        == modules["\\counter"].normalized_text
+        == edited["\\counter"]
+        .text.replace("$3", "$1")
+        .replace("$procdff$4", "$procdff$2")
+    ), "auto-generated names were not renumbered in order of appearance"
@@ -454,3 +454,214 @@ def test_run_subprocess(mock_run):
 
     with pytest.raises(StepException, match="non-UTF-8"):
         step.start(step_dir=".")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 65536])
+def test_read_line_batches(chunk_size):
+    import io
+    from librelane.steps.step import _read_line_batches
+
+    raw = "first\r\nsecond ✓\rthird\n\nlast without newline".encode("utf8")
+    log_file = io.BytesIO()
+
+    lines = []
+    for batch in _read_line_batches(io.BytesIO(raw), log_file, chunk_size):
+        lines += batch
+
+    assert lines == [
+        "first\n",
+        "second ✓\n",
+        "third\n",
+        "\n",
+        "last without newline",
+    ], "Lines were not split identically to a text-mode pipe"
+    assert log_file.getvalue() == raw, "Log file does not match the raw output"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_output_processor_prefixes(mock_run):
+    from librelane.config import Config
+    from librelane.steps import Step, OutputProcessor
+    from librelane.state import State
+
+    class PrefixProcessor(OutputProcessor):
+        key = "prefixed"
+        prefixes = ("[ERROR",)
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.seen = []
+
+        def process_line(self, line: str) -> bool:
+            self.seen.append(line)
+            return True
+
+        def result(self):
+            return self.seen
+
+    class StepTest(Step):
+        inputs = []
+        outputs = []
+        id = "Test.PrefixStep"
+        run = mock_run
+
+    step_object = StepTest(
+        config=Config({"DESIGN_NAME": "whatever"}),
+        state_in=State(),
+        _no_filter_conf=True,
+    )
+    step_object.step_dir = os.getcwd()
+    result = step_object.run_subprocess(
+        ["printf", "a\\n[ERROR X-1] bad\\n%%OL_METRIC_I m 4\\n"],
+        silent=True,
+        log_to="prefix.log",
+        output_processing=[PrefixProcessor, step.DefaultOutputProcessor],
+    )
+    assert result["prefixed"] == [
+        "[ERROR X-1] bad\n"
+    ], "Prefix-filtered output processor received unrelated lines"
+    assert result["generated_metrics"] == {
+        "m": 4
+    }, "Unmatched lines were not passed on to later output processors"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_process_stats_tree(mock_run):
+    import csv
+    import json
+    from librelane.config import Config
+    from librelane.steps import Step
+    from librelane.state import State
+
+    class StepTest(Step):
+        inputs = []
+        outputs = []
+        id = "Test.StatsStep"
+        run = mock_run
+
+    step_object = StepTest(
+        config=Config({"DESIGN_NAME": "whatever"}),
+        state_in=State(),
+        _no_filter_conf=True,
+    )
+    step_object.step_dir = os.getcwd()
+    step_object.run_subprocess(
+        [
+            "python3",
+            "-c",
+            "import subprocess, sys; subprocess.check_call([sys.executable, '-c', 'import time; time.sleep(0.5)'])",
+        ],
+        silent=True,
+        log_to="stats.log",
+    )
+
+    with open("stats.process_stats.json") as f:
+        stats = json.load(f)
+    summary = stats["summary"]
+    assert (
+        summary["peak_processes"] >= 2
+    ), "Child processes were not included in the resource statistics"
+    assert summary["runtime"] > 0, "Runtime was not recorded"
+
+    with open("stats.process_stats.csv") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == list(
+        step.ProcessStatsThread.series_columns
+    ), "Time series header mismatch"
+    assert len(rows) > 1, "No samples were recorded in the time series"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_step_resource_metrics():
+    import sys
+    from librelane.config import Config
+    from librelane.steps import Step
+    from librelane.state import State
+
+    class StepTest(Step):
+        inputs = []
+        outputs = []
+        id = "Test.ResourceStep"
+
+        def run(self, state_in, **kwargs):
+            for _ in range(2):
+                self.run_subprocess([sys.executable, "-c", "pass"], silent=True)
+            return {}, {}
+
+    state_in = State(
+        metrics={
+            "resource__cpu_time__step:Test.Other": 1000.0,
+            "resource__runtime__step:Test.Other": 2000.0,
+            "resource__cpu_time": 1000.0,
+            "resource__runtime": 2000.0,
+        }
+    )
+    step_object = StepTest(
+        config=Config({"DESIGN_NAME": "whatever"}),
+        state_in=state_in,
+        _no_filter_conf=True,
+    )
+    metrics = step_object.start(step_dir=os.getcwd()).metrics
+    profiles = step_object.subprocess_profiles
+    step_cpu_time = metrics["resource__cpu_time__step:Test.ResourceStep"]
+    assert step_cpu_time == sum(
+        profile["cpu_time"] for profile in profiles
+    ), "Step CPU time is not the sum of its subprocesses'"
+    assert (
+        metrics["resource__peak_memory_rss__step:Test.ResourceStep"] > 0
+    ), "Peak memory was not recorded"
+    assert (
+        metrics["resource__cpu_time"] == 1000.0 + step_cpu_time
+    ), "Flow-level CPU time does not include earlier steps"
+    assert metrics["resource__cpu_utilization"] == metrics["resource__cpu_time"] / (
+        metrics["resource__runtime"]
+    ), "Flow-level CPU utilization was aggregated from steps"
+
+    rerun = StepTest(
+        config=Config({"DESIGN_NAME": "whatever"}),
+        state_in=State(metrics=metrics),
+        _no_filter_conf=True,
+    )
+    rerun_metrics = rerun.start(step_dir=os.getcwd()).metrics
+    assert rerun_metrics["resource__runtime__step:Test.ResourceStep"] == metrics[
+        "resource__runtime__step:Test.ResourceStep"
+    ] + sum(
+        profile["runtime"] for profile in rerun.subprocess_profiles
+    ), "Repeated runs of a step were not added up"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+def test_step_cancel():
+    import sys
+    import time
+    import threading
+    from librelane.config import Config
+    from librelane.steps import Step, StepCancelled
+    from librelane.state import State
+
+    class StepTest(Step):
+        inputs = []
+        outputs = []
+        id = "Test.SleepStep"
+
+        def run(self, state_in, **kwargs):
+            self.run_subprocess(
+                [sys.executable, "-c", "import time; time.sleep(60)"],
+                silent=True,
+            )
+            return {}, {}
+
+    step_object = StepTest(
+        config=Config({"DESIGN_NAME": "whatever"}),
+        state_in=State(),
+        _no_filter_conf=True,
+    )
+    threading.Timer(0.5, step_object.cancel).start()
+    start = time.time()
+    with pytest.raises(StepCancelled):
+        step_object.start(step_dir=os.getcwd())
+    assert time.time() - start < 30, "Subprocess was not terminated on cancellation"
+    assert step_object.cancelled, "Step was not marked as cancelled"
+
+    with pytest.raises(StepCancelled):
+        step_object.start(step_dir=os.getcwd())
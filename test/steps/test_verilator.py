@@ -0,0 +1,126 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import sys
+import stat
+
+import pytest
+
+pytestmark = pytest.mark.all
+
+FAKE_VERILATOR = """
+import sys
+
+if sys.argv[1:] == ["--version"]:
+    print("Verilator 5.000")
+    sys.exit(0)
+with open(sys.argv[sys.argv.index("--waiver-output") + 1], "w") as f:
+    f.write("`verilator_config\\n")
+print("%Warning-UNUSEDSIGNAL: spm.v:1:1: Signal is not used")
+"""
+
+
+@pytest.fixture
+def fake_verilator(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = tmp_path / "verilator.py"
+    script.write_text(FAKE_VERILATOR, encoding="utf8")
+    verilator = bin_dir / "verilator"
+    verilator.write_text(
+        f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n', encoding="utf8"
+    )
+    verilator.chmod(verilator.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return script
+
+
+def make_lint_step(tmp_path):
+    from librelane.common import Path
+    from librelane.config import Config
+    from librelane.state import State
+    from librelane.steps.verilator import Lint
+
+    source = tmp_path / "spm.v"
+    if not source.exists():
+        source.write_text("module spm; endmodule\n", encoding="utf8")
+    config = {
+        variable.name: variable.default for variable in Lint.get_all_config_variables()
+    }
+    config.update(
+        {
+            "DESIGN_NAME": "spm",
+            "PDK": "dummy",
+            "STD_CELL_LIBRARY": "dummy_scl",
+            "VERILOG_FILES": [Path(source)],
+            "LINTER_CACHE_DIR": str(tmp_path / "cache"),
+            "MACROS": None,
+        }
+    )
+    return Lint(
+        config=Config(config),
+        state_in=State(),
+        _no_filter_conf=True,
+    )
+
+
+def run_lint(tmp_path, name):
+    step_dir = tmp_path / name
+    step_dir.mkdir()
+    state_out = make_lint_step(tmp_path).start(step_dir=str(step_dir))
+    return step_dir, state_out
+
+
+def test_lint_cache(tmp_path, fake_verilator):
+    from librelane.steps import StepException
+
+    _, state_out = run_lint(tmp_path, "miss")
+    assert (
+        state_out.metrics["design__lint_warning__count"] == 1
+    ), "lint warnings were not counted"
+    entries = os.listdir(tmp_path / "cache")
+    assert len(entries) == 1, "lint results were not stored"
+
+    # A broken linter shows that the results are restored instead of re-linted
+    fake_verilator.write_text(
+        'import sys\nif sys.argv[1:] == ["--version"]:\n'
+        '    print("Verilator 5.000")\n'
+        "    sys.exit(0)\n"
+        "sys.exit(1)\n",
+        encoding="utf8",
+    )
+    step_dir, state_out = run_lint(tmp_path, "hit")
+    assert (
+        state_out.metrics["design__lint_warning__count"] == 1
+    ), "cached lint metrics were not restored"
+    assert os.path.isfile(
+        step_dir / "_waivers_output.vlt"
+    ), "cached waivers were not restored"
+    with open(step_dir / "verilator-lint.log", encoding="utf8") as f:
+        assert "%Warning-UNUSEDSIGNAL" in f.read(), "cached log was not restored"
+
+    (tmp_path / "spm.v").write_text("module spm(); endmodule\n", encoding="utf8")
+    with pytest.raises(StepException, match="exited unexpectedly"):
+        run_lint(tmp_path, "changed")
+
+
+def test_lint_cache_no_version(tmp_path, fake_verilator):
+    from librelane.steps import StepException
+
+    fake_verilator.write_text("import sys\nsys.exit(1)\n", encoding="utf8")
+    with pytest.raises(StepException, match="exited unexpectedly"):
+        run_lint(tmp_path, "broken")
+    assert not os.path.exists(
+        tmp_path / "cache"
+    ), "results were cached without a linter version"